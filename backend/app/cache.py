@@ -0,0 +1,271 @@
+"""cache ในโปรเซสสำหรับ response ที่ไม่เปลี่ยนระหว่างรอบ ETL (มี TTL และล้างเมื่อ data version เปลี่ยน)"""
+import json
+import threading
+from contextvars import ContextVar
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+import anyio
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from sqlalchemy import text
+from starlette.datastructures import Headers
+from starlette.types import Receive, Scope, Send
+
+try:  # orjson เป็น dependency เสริม: ไม่มีก็ใช้ json มาตรฐานแบบเดิม
+    import orjson
+except ImportError:
+    orjson = None
+
+from .compression import ENCODINGS, compress_max, mark_compressed, negotiate
+from .config import RESPONSE_CACHE_TTL, RESPONSE_CACHE_MAXSIZE, DATA_VERSION_POLL_SEC, FALLBACK_CACHE_TTL, COMPRESS_MIN_SIZE
+
+
+class TTLCache:
+    """dict ที่มีอายุ (TTL) และขนาดสูงสุด เมื่อเต็มจะตัดตัวที่ใช้ล่าสุดนานที่สุดทิ้ง"""
+
+    def __init__(self, ttl: float = RESPONSE_CACHE_TTL, maxsize: int = RESPONSE_CACHE_MAXSIZE):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: 'OrderedDict[Hashable, tuple]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            hit = self._data.get(key)
+            if hit is None:
+                return None
+            expires, value = hit
+            if expires < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """เก็บค่า (ttl ระบุอายุเฉพาะรายการนี้ ไม่ระบุใช้ค่าของ cache)"""
+        with self._lock:
+            self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+# cache ทุกตัวที่ต้องล้างเมื่อ ETL นำเข้าข้อมูลรอบใหม่
+_REGISTRY: List[TTLCache] = []
+_VERSION_STATE: Dict[str, Any] = {
+    'value': None,
+    'checked': 0.0,
+}
+_VERSION_LOCK = threading.Lock()
+# builder ของ cached_json ตั้งค่านี้เมื่อคืนข้อมูล demo แทนผลจาก DB
+_FALLBACK: ContextVar[bool] = ContextVar('cache_fallback', default=False)
+
+
+def register(cache: TTLCache) -> TTLCache:
+    """ผูก cache เข้ากับ data version (จะถูกล้างเมื่อ version เปลี่ยน)"""
+    _REGISTRY.append(cache)
+    return cache
+
+
+def invalidate() -> None:
+    """ล้าง cache ทั้งหมดและบังคับให้อ่าน data version ใหม่ในคำร้องถัดไป"""
+    for c in _REGISTRY:
+        c.clear()
+    with _VERSION_LOCK:
+        _VERSION_STATE['checked'] = 0.0
+
+
+_VERSION_SQL = text('SELECT version FROM data_version WHERE id = 1')
+
+
+def _poll_due() -> Tuple[bool, Optional[int]]:
+    """(ถึงเวลาถาม DB ใหม่ไหม, version ล่าสุดที่รู้)"""
+    now = time.monotonic()
+    with _VERSION_LOCK:
+        if now - _VERSION_STATE['checked'] < DATA_VERSION_POLL_SEC:
+            return False, _VERSION_STATE['value']
+        _VERSION_STATE['checked'] = now
+        return True, _VERSION_STATE['value']
+
+
+def _record_version(version: Optional[int], previous: Optional[int]) -> Optional[int]:
+    if version != previous:
+        for c in _REGISTRY:
+            c.clear()
+    with _VERSION_LOCK:
+        _VERSION_STATE['value'] = version
+    return version
+
+
+def data_version(db) -> Optional[int]:
+    """อ่านเลข version จากตาราง data_version (ถามฐานข้อมูลไม่เกินทุก DATA_VERSION_POLL_SEC วินาที)"""
+    due, previous = _poll_due()
+    if not due:
+        return previous
+    try:
+        version = db.execute(_VERSION_SQL).scalar()
+    except Exception:
+        # DB ล่มหรือยังไม่มีตาราง: ถือว่า version = None แล้วคืน session ให้ใช้ต่อได้
+        try:
+            db.rollback()
+        except Exception:
+            pass
+        version = None
+    return _record_version(version, previous)
+
+
+async def data_version_async(db) -> Optional[int]:
+    """data_version สำหรับ AsyncSession"""
+    due, previous = _poll_due()
+    if not due:
+        return previous
+    try:
+        version = (await db.execute(_VERSION_SQL)).scalar()
+    except Exception:
+        try:
+            await db.rollback()
+        except Exception:
+            pass
+        version = None
+    return _record_version(version, previous)
+
+
+def mark_fallback() -> None:
+    """
+    ให้ builder เรียกเมื่อ query ล้มแล้วคืนข้อมูล demo แทน: cached_json จะเก็บผลนี้ไว้แค่ FALLBACK_CACHE_TTL
+    (version ไม่เปลี่ยนตอน DB กลับมา ถ้าเก็บเต็ม TTL จะส่งข้อมูล demo ค้างไว้ทั้งที่ DB ใช้ได้แล้ว)
+    """
+    _FALLBACK.set(True)
+
+
+def bump_data_version(conn) -> None:
+    """ให้สคริปต์ ETL เรียกตอนนำเข้าเสร็จ เพื่อให้ API ทุกโปรเซสล้าง cache"""
+    conn.execute(text("""
+        INSERT INTO data_version(id, version, updated_at) VALUES (1, 1, now())
+        ON CONFLICT (id) DO UPDATE SET version = data_version.version + 1, updated_at = now()
+    """))
+
+
+def _orjson_default(obj: Any) -> Any:
+    """ชนิดที่ orjson ไม่รู้จัก: pydantic model ให้ dump ทั้งก้อนใน pydantic-core ที่เหลือ (Decimal ฯลฯ) ใช้ jsonable_encoder"""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode='json')
+    return jsonable_encoder(obj)
+
+
+def dumps(data: Any) -> bytes:
+    """serialize เป็น JSON bytes แบบเดียวกับ JSONResponse ของ FastAPI (ใช้ orjson ถ้าติดตั้งไว้ ไม่ต้องแปลงทั้งก้อนด้วย jsonable_encoder ก่อน)"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(
+        jsonable_encoder(data),
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(',', ':'),
+    ).encode('utf-8')
+
+
+class FastJSONResponse(JSONResponse):
+    """response class เริ่มต้นของแอป: render ด้วย dumps (orjson ถ้ามี) แทน json.dumps"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+JSON_CACHE = register(TTLCache())
+# body ที่บีบแล้วของ JSON_CACHE แยกตาม encoding: key = (data version, endpoint, params..., encoding)
+COMPRESSED_CACHE = register(TTLCache(maxsize=RESPONSE_CACHE_MAXSIZE * len(ENCODINGS)))
+
+
+class CachedJSONResponse(Response):
+    """
+    body จาก JSON_CACHE: ตอนส่งจะเลือก encoding จาก Accept-Encoding แล้วใช้ bytes ที่บีบไว้ใน COMPRESSED_CACHE
+    (ถ้ายังไม่มีจะบีบระดับสูงใน thread ครั้งเดียว) ตั้ง Content-Encoding ไว้แล้ว middleware จึงส่งผ่านโดยไม่บีบซ้ำ
+    """
+
+    media_type = 'application/json'
+
+    def __init__(self, content: bytes, key: tuple, headers: Optional[Dict[str, str]] = None, ttl: Optional[float] = None):
+        super().__init__(content=content, headers=headers)
+        self.cache_key = key
+        self.ttl = ttl
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        encoding = negotiate(Headers(scope=scope).get('accept-encoding'))
+        if encoding and len(self.body) >= COMPRESS_MIN_SIZE:
+            key = self.cache_key + (encoding,)
+            body = COMPRESSED_CACHE.get(key)
+            if body is None:
+                body = await anyio.to_thread.run_sync(compress_max, self.body, encoding)
+                COMPRESSED_CACHE.set(key, body, self.ttl)
+            self.body = body
+            mark_compressed(self.headers, encoding, len(body))
+        await super().__call__(scope, receive, send)
+
+
+def json_response(data: Any, headers: Optional[Dict[str, str]] = None) -> Response:
+    return Response(content=dumps(data), media_type='application/json', headers=headers)
+
+
+async def json_response_async(data: Any, headers: Optional[Dict[str, str]] = None) -> Response:
+    """json_response สำหรับ handler แบบ async: serialize ใน thread ไม่ให้ผลก้อนใหญ่ถือ event loop"""
+    body = await anyio.to_thread.run_sync(dumps, data)
+    return Response(content=body, media_type='application/json', headers=headers)
+
+
+def cached_json(db, key: tuple, build: Callable[[], Any], headers: Optional[Callable[[Any], Dict[str, str]]] = None) -> Response:
+    """
+    คืน response จาก cache แบบ bytes; ถ้าไม่เจอจะเรียก build() แล้วเก็บผล serialize ไว้ (headers คำนวณจากผลแล้ว cache คู่กัน)
+    ผลที่ builder เรียก mark_fallback() เก็บแค่ FALLBACK_CACHE_TTL และแยก key บีบอัดจากผลจริง
+    """
+    full_key = (data_version(db),) + key
+    hit = JSON_CACHE.get(full_key)
+    if hit is None:
+        token = _FALLBACK.set(False)
+        try:
+            data = build()
+            ttl = FALLBACK_CACHE_TTL if _FALLBACK.get() else None
+        finally:
+            _FALLBACK.reset(token)
+        hit = (dumps(data), headers(data) if headers else None, ttl)
+        JSON_CACHE.set(full_key, hit, ttl)
+    return _cached_response(full_key, hit)
+
+
+async def cached_json_async(db, key: tuple, build: Callable[[], Awaitable[Any]], headers: Optional[Callable[[Any], Dict[str, str]]] = None) -> Response:
+    """
+    cached_json สำหรับ AsyncSession: build เป็น coroutine (query ด้วย await db.execute บน event loop)
+    งาน CPU ของ builder (เช่น fallback demo) ต้องส่งไป thread เอง ส่วน serialize ทำใน thread ที่นี่
+    """
+    full_key = (await data_version_async(db),) + key
+    hit = JSON_CACHE.get(full_key)
+    if hit is None:
+        token = _FALLBACK.set(False)
+        try:
+            data = await build()
+            ttl = FALLBACK_CACHE_TTL if _FALLBACK.get() else None
+        finally:
+            _FALLBACK.reset(token)
+        body = await anyio.to_thread.run_sync(dumps, data)
+        hit = (body, headers(data) if headers else None, ttl)
+        JSON_CACHE.set(full_key, hit, ttl)
+    return _cached_response(full_key, hit)
+
+
+def _cached_response(full_key: tuple, hit: tuple) -> Response:
+    body, extra, ttl = hit
+    return CachedJSONResponse(content=body, key=full_key + (ttl is not None,), headers=extra, ttl=ttl)
@@ -0,0 +1,181 @@
+"""
+บีบอัด response ตาม Accept-Encoding (br > zstd > gzip ตามที่ติดตั้งไว้) แทน GZipMiddleware
+response ทั่วไปบีบด้วยระดับเร็วทุกครั้ง ส่วน body ที่ cache ไว้แล้ว (cache.cached_json) บีบระดับสูงครั้งเดียวแล้วเก็บ bytes ไว้ส่งซ้ำ
+"""
+import gzip
+import zlib
+from typing import Dict, List, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:  # brotli/zstandard เป็น dependency เสริม: ไม่มีก็เหลือ gzip อย่างเดียวแบบเดิม
+    import brotli
+except ImportError:
+    try:
+        import brotlicffi as brotli
+    except ImportError:
+        brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+from .config import COMPRESS_MIN_SIZE, COMPRESS_FAST_LEVELS, COMPRESS_MAX_LEVELS
+
+# ลำดับที่เลือกเมื่อ client ให้ q เท่ากัน (อัตราส่วนดีสุดก่อน)
+ENCODINGS: List[str] = [e for e, mod in (('br', brotli), ('zstd', zstandard), ('gzip', gzip)) if mod is not None]
+
+
+def negotiate(accept_encoding: Optional[str]) -> Optional[str]:
+    """เลือก encoding จาก header Accept-Encoding (รองรับ q=, * และ q=0) None ถ้าควรส่งแบบไม่บีบ"""
+    if not accept_encoding:
+        return None
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.split(','):
+        name, _, params = part.strip().partition(';')
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        for param in params.split(';'):
+            key, _, value = param.strip().partition('=')
+            if key.strip().lower() == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        weights[name] = q
+    best, best_q = None, 0.0
+    for encoding in ENCODINGS:
+        q = weights.get(encoding, weights.get('*', 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def compress(body: bytes, encoding: str, level: int) -> bytes:
+    """บีบ body ทั้งก้อนครั้งเดียว"""
+    if encoding == 'br':
+        return brotli.compress(body, quality=level)
+    if encoding == 'zstd':
+        return zstandard.ZstdCompressor(level=level).compress(body)
+    return gzip.compress(body, compresslevel=level, mtime=0)
+
+
+def compress_max(body: bytes, encoding: str) -> bytes:
+    """บีบระดับสูง (COMPRESS_MAX_LEVELS) สำหรับ body ที่ cache ไว้ส่งซ้ำ"""
+    return compress(body, encoding, COMPRESS_MAX_LEVELS[encoding])
+
+
+class _Stream:
+    """ตัวบีบแบบต่อเนื่องของแต่ละ encoding: feed() คืน bytes ที่พร้อมส่ง, finish() ปิดท้าย stream"""
+
+    def __init__(self, encoding: str, level: int):
+        if encoding == 'br':
+            self._c = brotli.Compressor(quality=level)
+            self._feed, self._finish = self._c.process, self._c.finish
+        elif encoding == 'zstd':
+            self._c = zstandard.ZstdCompressor(level=level).compressobj()
+            self._feed, self._finish = self._c.compress, self._c.flush
+        else:
+            self._c = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+            self._feed, self._finish = self._c.compress, self._c.flush
+
+    def feed(self, data: bytes) -> bytes:
+        return self._feed(data)
+
+    def finish(self) -> bytes:
+        return self._finish()
+
+
+def mark_compressed(headers: MutableHeaders, encoding: str, length: int) -> None:
+    headers['Content-Encoding'] = encoding
+    headers['Content-Length'] = str(length)
+    headers.add_vary_header('Accept-Encoding')
+
+
+class CompressionMiddleware:
+    """
+    บีบ response ที่ใหญ่กว่า minimum_size ด้วยระดับเร็ว (COMPRESS_FAST_LEVELS) โครงเดียวกับ GZipResponder ของ Starlette
+    ข้าม response ที่มี Content-Encoding อยู่แล้ว (เช่น body ที่บีบไว้ล่วงหน้า) และ text/event-stream
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = COMPRESS_MIN_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] == 'http':
+            encoding = negotiate(Headers(scope=scope).get('accept-encoding'))
+            if encoding:
+                await _Responder(self.app, encoding, self.minimum_size)(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
+
+
+class _Responder:
+    def __init__(self, app: ASGIApp, encoding: str, minimum_size: int):
+        self.app = app
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.send: Send = _unattached_send
+        self.initial_message: Message = {}
+        self.started = False
+        self.passthrough = False
+        self.stream: Optional[_Stream] = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.app(scope, receive, self.send_with_compression)
+
+    async def send_with_compression(self, message: Message) -> None:
+        message_type = message['type']
+        if message_type == 'http.response.start':
+            # เก็บ header ไว้ก่อน รอดู body ก้อนแรกว่าควรบีบไหม
+            self.initial_message = message
+            headers = Headers(raw=self.initial_message['headers'])
+            self.passthrough = 'content-encoding' in headers or headers.get('content-type', '').startswith('text/event-stream')
+        elif message_type == 'http.response.body' and self.passthrough:
+            if not self.started:
+                self.started = True
+                await self.send(self.initial_message)
+            await self.send(message)
+        elif message_type == 'http.response.body' and not self.started:
+            self.started = True
+            body = message.get('body', b'')
+            more_body = message.get('more_body', False)
+            if len(body) < self.minimum_size and not more_body:
+                # body เล็ก ส่งแบบเดิม
+                await self.send(self.initial_message)
+                await self.send(message)
+            elif not more_body:
+                # body ก้อนเดียว
+                level = COMPRESS_FAST_LEVELS[self.encoding]
+                body = compress(body, self.encoding, level)
+                mark_compressed(MutableHeaders(raw=self.initial_message['headers']), self.encoding, len(body))
+                message['body'] = body
+                await self.send(self.initial_message)
+                await self.send(message)
+            else:
+                # streaming: ไม่รู้ความยาวล่วงหน้า
+                self.stream = _Stream(self.encoding, COMPRESS_FAST_LEVELS[self.encoding])
+                headers = MutableHeaders(raw=self.initial_message['headers'])
+                headers['Content-Encoding'] = self.encoding
+                headers.add_vary_header('Accept-Encoding')
+                del headers['Content-Length']
+                message['body'] = self.stream.feed(body)
+                await self.send(self.initial_message)
+                await self.send(message)
+        elif message_type == 'http.response.body':
+            body = message.get('body', b'')
+            more_body = message.get('more_body', False)
+            message['body'] = self.stream.feed(body) + (b'' if more_body else self.stream.finish())
+            await self.send(message)
+        else:
+            await self.send(message)
+
+
+async def _unattached_send(message: Message) -> None:
+    raise RuntimeError('send awaitable not set')  # pragma: no cover
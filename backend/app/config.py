@@ -1,6 +1,7 @@
 """ดึงค่า env และตั้งค่าพื้นฐานของแอป FastAPI/ETL"""
 from dotenv import load_dotenv
 import os
+import tempfile
 
 load_dotenv()
 
@@ -16,6 +17,39 @@ DATABASE_URL = _normalize_db_url(os.getenv('DATABASE_URL', 'postgresql+psycopg:/
 # Default CSV base inside containers -> /data (mounted by docker-compose)
 CSV_BASE_DIR = os.getenv('CSV_BASE_DIR', '/data')
 PORT = int(os.getenv('PORT', '8000'))
+# pool ของ async engine (endpoint อ่านที่เป็น async def): จำนวน connection ค้างไว้ และที่เปิดเพิ่มได้ตอนโหลดสูง
+ASYNC_DB_POOL_SIZE = int(os.getenv('ASYNC_DB_POOL_SIZE', '10'))
+ASYNC_DB_MAX_OVERFLOW = int(os.getenv('ASYNC_DB_MAX_OVERFLOW', '20'))
+
+# cache response ในโปรเซส: อายุ (วินาที), จำนวน key สูงสุด และความถี่ที่เช็ก data version จาก DB
+RESPONSE_CACHE_TTL = float(os.getenv('RESPONSE_CACHE_TTL', '300'))
+RESPONSE_CACHE_MAXSIZE = int(os.getenv('RESPONSE_CACHE_MAXSIZE', '512'))
+DATA_VERSION_POLL_SEC = float(os.getenv('DATA_VERSION_POLL_SEC', '5'))
+# อายุ cache ของผลที่เป็นข้อมูล demo (query ล้ม) ให้กลับไปใช้ DB ได้เร็วเมื่อ DB กลับมา
+FALLBACK_CACHE_TTL = float(os.getenv('FALLBACK_CACHE_TTL', '5'))
+
+# vector tile: โฟลเดอร์ cache บนดิสก์ และซูมสูงสุดที่ seed ล่วงหน้าหลัง ETL
+TILE_CACHE_DIR = os.getenv('TILE_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'evjourney-tiles'))
+TILE_SEED_MAX_ZOOM = int(os.getenv('TILE_SEED_MAX_ZOOM', '8'))
+
+# process pool ของงานเส้นทางที่กิน CPU (parse ไฟล์ใหญ่/สร้าง graph/ค้นเส้นทาง): จำนวนโปรเซสต่อ worker (0 = รันใน threadpool เดิม)
+# จำนวนงานค้างสูงสุดก่อนตอบ 503 และเวลารอผลต่องานก่อนตอบ 504
+ROUTE_POOL_WORKERS = int(os.getenv('ROUTE_POOL_WORKERS', '2'))
+ROUTE_POOL_MAX_PENDING = int(os.getenv('ROUTE_POOL_MAX_PENDING', '8'))
+ROUTE_TASK_TIMEOUT_SEC = float(os.getenv('ROUTE_TASK_TIMEOUT_SEC', '30'))
+
+# บีบอัด response: ขนาดขั้นต่ำที่จะบีบ, ระดับเร็วสำหรับ response ทั่วไป และระดับสูงสำหรับ body ใน cache ที่บีบครั้งเดียวแล้วส่งซ้ำ
+COMPRESS_MIN_SIZE = int(os.getenv('COMPRESS_MIN_SIZE', '1024'))
+COMPRESS_FAST_LEVELS = {
+    'br': int(os.getenv('COMPRESS_BR_FAST_LEVEL', '4')),
+    'zstd': int(os.getenv('COMPRESS_ZSTD_FAST_LEVEL', '3')),
+    'gzip': int(os.getenv('COMPRESS_GZIP_FAST_LEVEL', '6')),
+}
+COMPRESS_MAX_LEVELS = {
+    'br': int(os.getenv('COMPRESS_BR_MAX_LEVEL', '11')),
+    'zstd': int(os.getenv('COMPRESS_ZSTD_MAX_LEVEL', '19')),
+    'gzip': int(os.getenv('COMPRESS_GZIP_MAX_LEVEL', '9')),
+}
 
 PROVINCE_SEED = [
     ('chiang-mai','เชียงใหม่'),
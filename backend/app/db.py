@@ -1,13 +1,18 @@
 """ตั้งค่าเชื่อมต่อฐานข้อมูลและ dependency ของ FastAPI"""
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from .config import DATABASE_URL
+from .config import DATABASE_URL, ASYNC_DB_POOL_SIZE, ASYNC_DB_MAX_OVERFLOW
 
 # สร้าง engine เชื่อม PostgreSQL โดยเปิด pre_ping เพื่อตรวจสอบ connection
 engine = create_engine(DATABASE_URL, pool_pre_ping=True)
 # Factory สำหรับสร้าง session ต่อคำร้อง
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# engine แบบ async (psycopg async, URL เดียวกัน) สำหรับ endpoint อ่านที่ใช้บ่อย: ไม่กิน thread ของ threadpool ระหว่างรอ DB
+async_engine = create_async_engine(DATABASE_URL, pool_pre_ping=True, pool_size=ASYNC_DB_POOL_SIZE, max_overflow=ASYNC_DB_MAX_OVERFLOW)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 def get_db():
     """dependency ให้ FastAPI เอา session ไปใช้และปิดเมื่อจบ request"""
     db = SessionLocal()
@@ -15,3 +20,11 @@ def get_db():
         yield db
     finally:
         db.close()
+
+async def get_async_db():
+    """
+    dependency แบบ async: handler ต้อง await db.execute(...) เอง ส่วนงาน CPU (แปลงแถว, fallback demo)
+    ส่งไป run_in_threadpool ห้ามใช้ db.run_sync กับโค้ด sync ทั้งก้อนเพราะจะวิ่งบน event loop
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -1,8 +1,11 @@
 from typing import List, Dict, Optional
+import gzip
 import os
 import json
 import re
-from functools import lru_cache
+from functools import lru_cache, partial
+
+from .name_index import NameIndex
 
 # Base paths
 HERE = os.path.dirname(__file__)
@@ -235,6066 +238,26 @@ HOTELS: List[Dict] = [
     {'id': 'demo-hotel-mhs-hern-tai', 'name_th': 'เฮินไต ดาบหาญ', 'name_en': 'Hern Tai Dab Harn', 'stars': 3, 'phone': None, 'address': 'แม่สะเรียง', 'lat': 18.844313, 'lon': 97.956187, 'province': 'mae-hong-son'},
     {'id': 'demo-hotel-mhs-homestay', 'name_th': 'โฮมสเตย์บ้านเมืองปอน', 'name_en': 'Ban Muang Pon Homestay', 'stars': 3, 'phone': None, 'address': 'ขุนยวม', 'lat': 18.7406382, 'lon': 97.92637466, 'province': 'mae-hong-son'},
 ]
-AGENTS: List[Dict] = []
-# --- Embedded route data (auto-generated from data/routes/*) ---
-ROUTE_JSON_DATA: Dict[str, object] = {'chiang-mai': [{'seed': 1765822969,
-                 'agent_id': 0,
-                 'tourist_type': 'RELAX',
-                 'stereotype': 'mix',
-                 'policy_main': 'nature',
-                 'start_soc_pct': 42.1,
-                 'start_range_km': 168.6,
-                 'max_range_km': 400.2,
-                 'batt_kwh_max': 60.0,
-                 'cons_Wh_per_km': 150.0,
-                 'visited_pois': ['โรงแรมเชียงใหม่ออร์คิด',
-                                  'ร้านข้าวซอยแม่สาย',
-                                  'อ่างแก้ว',
-                                  'สวนรุกขชาติห้วยแก้ว',
-                                  'ศูนย์ธรรมชาติวิทยาดอยสุเทพเฉลิมพระเกียรติฯ',
-                                  'Cloud Coffee',
-                                  'สถานีชาร์จ EleXA ถ.ห้วยแก้ว ตำบลสุเทพ',
-                                  'เมญ่า ไลฟ์สไตล์ ช้อปปิ้ง เซ็นเตอร์',
-                                  'คลองแม่ข่า',
-                                  'โรงแรมเชียงใหม่ออร์คิด'],
-                 'log': ['[D1 10:30] เริ่มทริป: เริ่มจากโรงแรม: โรงแรมเชียงใหม่ออร์คิด แบต 42% (~169 กม. จากสูงสุด '
-                         '~400 กม.)',
-                         '[D1 10:31] ขับไป -> ร้านข้าวซอยแม่สาย (ระยะทาง=0.33 กม.) เหลือวิ่งได้ 168.27 กม. (~42.0%)',
-                         '[D1 11:16] แวะทานอาหารที่ ร้านข้าวซอยแม่สาย (45 นาที)',
-                         '[D1 11:19] ขับไป -> อ่างแก้ว (ระยะทาง=2.71 กม.) เหลือวิ่งได้ 165.55 กม. (~41.4%)',
-                         '[D1 12:31] เที่ยว อ่างแก้ว (72 นาที)',
-                         '[D1 12:32] ขับไป -> สวนรุกขชาติห้วยแก้ว (ระยะทาง=0.35 กม.) เหลือวิ่งได้ 165.2 กม. (~41.3%)',
-                         '[D1 13:37] เที่ยว สวนรุกขชาติห้วยแก้ว (65 นาที)',
-                         '[D1 13:38] ขับไป -> ศูนย์ธรรมชาติวิทยาดอยสุเทพเฉลิมพระเกียรติฯ (ระยะทาง=0.13 กม.) '
-                         'เหลือวิ่งได้ 165.07 กม. (~41.2%)',
-                         '[D1 14:38] เที่ยว ศูนย์ธรรมชาติวิทยาดอยสุเทพเฉลิมพระเกียรติฯ (60 นาที)',
-                         '[D1 14:40] ขับไป -> Cloud Coffee (ระยะทาง=1.61 กม.) เหลือวิ่งได้ 163.46 กม. (~40.8%)',
-                         '[D1 15:25] แวะคาเฟ่ Cloud Coffee (45 นาที)',
-                         '[D1 15:26] ขับไป -> สถานีชาร์จ EleXA ถ.ห้วยแก้ว ตำบลสุเทพ (ระยะทาง=0.63 กม.) เหลือวิ่งได้ '
-                         '162.83 กม. (~40.7%)',
-                         '[D1 15:51] ชาร์จที่ สถานีชาร์จ EleXA ถ.ห้วยแก้ว ตำบลสุเทพ (DC 50 kW เติม ~20.4 kWh (~136 '
-                         'กม.) ใช้เวลา ~25 นาที)',
-                         '[D1 15:52] ขับไป -> เมญ่า ไลฟ์สไตล์ ช้อปปิ้ง เซ็นเตอร์ (ระยะทาง=0.54 กม.) เหลือวิ่งได้ '
-                         '298.01 กม. (~74.5%)',
-                         '[D1 17:02] เที่ยว เมญ่า ไลฟ์สไตล์ ช้อปปิ้ง เซ็นเตอร์ (70 นาที)',
-                         '[D1 17:06] ขับไป -> คลองแม่ข่า (ระยะทาง=4.82 กม.) เหลือวิ่งได้ 293.2 กม. (~73.3%)',
-                         '[D1 18:16] เที่ยว คลองแม่ข่า (70 นาที)',
-                         '[D1 18:19] ขับไป -> โรงแรมเชียงใหม่ออร์คิด (ระยะทาง=3.90 กม.) เหลือวิ่งได้ 289.29 กม. '
-                         '(~72.3%)',
-                         '[D1 18:19] จบทริปที่โรงแรม: โรงแรมเชียงใหม่ออร์คิด'],
-                 'total_distance_km': 15.03,
-                 'total_travel_time_min': 444,
-                 'total_energy_kwh': 2.25,
-                 'total_ev_cost_thb': 16.88}],
- 'lampang': [{'seed': 1273336817,
-              'agent_id': 4433,
-              'tourist_type': 'HOTEL_ENJOY',
-              'stereotype': 'mix',
-              'policy_main': 'culture',
-              'start_soc_pct': 56.2,
-              'start_range_km': 221.0,
-              'max_range_km': 393.4,
-              'batt_kwh_max': 59.0,
-              'cons_Wh_per_km': 150.0,
-              'visited_pois': ['บ้านดีรีสอร์ทลำปาง',
-                               'ร้านนุ่นอาหารพื้นเมือง',
-                               'พิพิธภัณฑ์ธนาคารไทยลำปาง',
-                               'วัดศรีรองเมือง',
-                               'หอศิลป์ ลำปาง',
-                               'Full Flavor Coffee Bar',
-                               'บิ๊กซี ลำปาง (EV Station PluZ)',
-                               'สถานีรถไฟนครลำปาง',
-                               'Baan Phraya Suren by Madame Musur',
-                               'สะพานดำ',
-                               'กาดกองต้า',
-                               'บ้านดีรีสอร์ทลำปาง'],
-              'log': ['[D1 09:15] เริ่มทริป: เริ่มจากโรงแรม: บ้านดีรีสอร์ทลำปาง แบต 56% (~221 กม. จากสูงสุด ~393 กม.)',
-                      '[D1 09:17] ขับไป -> ร้านนุ่นอาหารพื้นเมือง (ระยะทาง=1.52 กม.) เหลือวิ่งได้ 219.44 กม. (~55.8%)',
-                      '[D1 10:02] แวะทานอาหารที่ ร้านนุ่นอาหารพื้นเมือง (45 นาที)',
-                      '[D1 10:05] ขับไป -> พิพิธภัณฑ์ธนาคารไทยลำปาง (ระยะทาง=3.82 กม.) เหลือวิ่งได้ 215.63 กม. '
-                      '(~54.8%)',
-                      '[D1 11:13] เที่ยว พิพิธภัณฑ์ธนาคารไทยลำปาง (68 นาที)',
-                      '[D1 11:14] ขับไป -> วัดศรีรองเมือง (ระยะทาง=1.06 กม.) เหลือวิ่งได้ 214.57 กม. (~54.5%)',
-                      '[D1 12:18] เที่ยว วัดศรีรองเมือง (64 นาที)',
-                      '[D1 12:20] ขับไป -> หอศิลป์ ลำปาง (ระยะทาง=1.80 กม.) เหลือวิ่งได้ 212.77 กม. (~54.1%)',
-                      '[D1 13:30] เที่ยว หอศิลป์ ลำปาง (70 นาที)',
-                      '[D1 13:31] ขับไป -> Full Flavor Coffee Bar (ระยะทาง=0.26 กม.) เหลือวิ่งได้ 212.51 กม. (~54.0%)',
-                      '[D1 14:16] แวะคาเฟ่ Full Flavor Coffee Bar (45 นาที)',
-                      '[D1 14:18] ขับไป -> บิ๊กซี ลำปาง (EV Station PluZ) (ระยะทาง=2.38 กม.) เหลือวิ่งได้ 210.13 กม. '
-                      '(~53.4%)',
-                      '[D1 14:26] ชาร์จที่ บิ๊กซี ลำปาง (EV Station PluZ) (DC 120 kW เติม ~14.3 kWh (~95 กม.) ใช้เวลา '
-                      '~8 นาที)',
-                      '[D1 14:28] ขับไป -> สถานีรถไฟนครลำปาง (ระยะทาง=1.67 กม.) เหลือวิ่งได้ 303.94 กม. (~77.3%)',
-                      '[D1 15:41] เที่ยว สถานีรถไฟนครลำปาง (73 นาที)',
-                      '[D1 15:42] ขับไป -> Baan Phraya Suren by Madame Musur (ระยะทาง=0.37 กม.) เหลือวิ่งได้ 303.57 '
-                      'กม. (~77.2%)',
-                      '[D1 16:42] แวะทานอาหารที่ Baan Phraya Suren by Madame Musur (60 นาที)',
-                      '[D1 16:43] ขับไป -> สะพานดำ (ระยะทาง=1.25 กม.) เหลือวิ่งได้ 302.32 กม. (~76.9%)',
-                      '[D1 17:53] เที่ยว สะพานดำ (70 นาที)',
-                      '[D1 17:56] ขับไป -> กาดกองต้า (ระยะทาง=3.92 กม.) เหลือวิ่งได้ 298.4 กม. (~75.9%)',
-                      '[D1 19:05] เที่ยว กาดกองต้า (69 นาที)',
-                      '[D1 19:09] ขับไป -> บ้านดีรีสอร์ทลำปาง (ระยะทาง=5.02 กม.) เหลือวิ่งได้ 293.38 กม. (~74.6%)',
-                      '[D1 19:09] จบทริปที่โรงแรม: บ้านดีรีสอร์ทลำปาง'],
-              'total_distance_km': 23.07,
-              'total_travel_time_min': 586,
-              'total_energy_kwh': 3.46,
-              'total_ev_cost_thb': 25.95}],
- 'lamphun': [{'seed': 2206392697,
-              'agent_id': 4709,
-              'tourist_type': 'HOTEL_ENJOY',
-              'stereotype': 'strict',
-              'policy_main': 'nature',
-              'start_soc_pct': 68.0,
-              'start_range_km': 273.5,
-              'max_range_km': 402.0,
-              'batt_kwh_max': 60.3,
-              'cons_Wh_per_km': 150.0,
-              'visited_pois': ['โรงแรมพญาอิน ลำพูน Phaya Inn',
-                               'อ่างเก็บน้ำแม่วังส้าน',
-                               'ถ้ำจำหม่าฟ้า',
-                               'ถ้ำเอราวัณ',
-                               'ร้านอาหารถุงทอง',
-                               'พีทีที สเตชั่น สาขาลำพูน-ดอยติ',
-                               'เพ็ญศิริไหมไทยลำพูน',
-                               "Chef's House Nakorn Lamphun",
-                               'โรงแรมพญาอิน ลำพูน Phaya Inn'],
-              'log': ['[D1 09:15] เริ่มทริป: เริ่มจากโรงแรม: โรงแรมพญาอิน ลำพูน Phaya Inn แบต 68% (~274 กม. จากสูงสุด '
-                      '~402 กม.)',
-                      '[D1 09:36] ขับไป -> อ่างเก็บน้ำแม่วังส้าน (ระยะทาง=27.65 กม.) เหลือวิ่งได้ 245.88 กม. (~61.2%)',
-                      '[D1 11:06] เที่ยว อ่างเก็บน้ำแม่วังส้าน (90 นาที)',
-                      '[D1 11:20] ขับไป -> ถ้ำจำหม่าฟ้า (ระยะทาง=18.44 กม.) เหลือวิ่งได้ 227.43 กม. (~56.6%)',
-                      '[D1 12:50] เที่ยว ถ้ำจำหม่าฟ้า (90 นาที)',
-                      '[D1 13:13] ขับไป -> ถ้ำเอราวัณ (ระยะทาง=30.19 กม.) เหลือวิ่งได้ 197.24 กม. (~49.1%)',
-                      '[D1 14:43] เที่ยว ถ้ำเอราวัณ (90 นาที)',
-                      '[D1 14:56] ขับไป -> ร้านอาหารถุงทอง (ระยะทาง=16.41 กม.) เหลือวิ่งได้ 180.83 กม. (~45.0%)',
-                      '[D1 15:41] แวะคาเฟ่ ร้านอาหารถุงทอง (45 นาที)',
-                      '[D1 16:11] ขับไป -> พีทีที สเตชั่น สาขาลำพูน-ดอยติ (ระยะทาง=38.74 กม.) เหลือวิ่งได้ 142.09 กม. '
-                      '(~35.3%)',
-                      '[D1 16:24] ชาร์จที่ พีทีที สเตชั่น สาขาลำพูน-ดอยติ (DC 120 kW เติม ~25.6 kWh (~171 กม.) ใช้เวลา '
-                      '~13 นาที)',
-                      '[D1 16:25] ขับไป -> เพ็ญศิริไหมไทยลำพูน (ระยะทาง=1.01 กม.) เหลือวิ่งได้ 311.85 กม. (~77.6%)',
-                      '[D1 17:55] เที่ยว เพ็ญศิริไหมไทยลำพูน (90 นาที)',
-                      "[D1 17:56] ขับไป -> Chef's House Nakorn Lamphun (ระยะทาง=1.21 กม.) เหลือวิ่งได้ 310.65 กม. "
-                      '(~77.3%)',
-                      "[D1 18:56] แวะทานอาหารที่ Chef's House Nakorn Lamphun (60 นาที)",
-                      '[D1 18:59] ขับไป -> โรงแรมพญาอิน ลำพูน Phaya Inn (ระยะทาง=2.99 กม.) เหลือวิ่งได้ 307.66 กม. '
-                      '(~76.5%)',
-                      '[D1 18:59] จบทริปที่โรงแรม: โรงแรมพญาอิน ลำพูน Phaya Inn'],
-              'total_distance_km': 136.64,
-              'total_travel_time_min': 571,
-              'total_energy_kwh': 20.5,
-              'total_ev_cost_thb': 153.75}],
- 'mae-hong-son': [{'seed': 42,
-                   'agent_id': 4,
-                   'tourist_type': 'HOTEL_ENJOY',
-                   'stereotype': 'mix',
-                   'policy_main': 'activity',
-                   'start_soc_pct': 38.9,
-                   'start_range_km': 167.3,
-                   'max_range_km': 430.5,
-                   'batt_kwh_max': 64.6,
-                   'cons_Wh_per_km': 150.0,
-                   'visited_pois': ['ตาลเจ็ดต้นปายรีสอร์ท',
-                                    'ข้าวซอยพี่น้อง',
-                                    'สัปปายยะ สปา',
-                                    'ร้านกาแฟ คอฟฟี่ อิน เลิฟ',
-                                    'ปางช้างบ้านท่าปาย',
-                                    'กาแฟที่สะพานปาย',
-                                    'สถานี EleXA ปาย',
-                                    'วัดหลวง',
-                                    'วัดพระธาตุแม่เย็น',
-                                    'ถนนคนเดินปาย',
-                                    'บ้านเนินเขาวิวปาย รีสอร์ท'],
-                   'log': ['[D1 09:45] เริ่มทริป: เริ่มจากโรงแรม: ตาลเจ็ดต้นปายรีสอร์ท แบต 39% (~167 กม. จากสูงสุด '
-                           '~430 กม.)',
-                           '[D1 09:49] ขับไป -> ข้าวซอยพี่น้อง (ระยะทาง=4.74 กม.) เหลือวิ่งได้ 162.58 กม. (~37.8%)',
-                           '[D1 10:34] แวะทานอาหารที่ ข้าวซอยพี่น้อง (45 นาที)',
-                           '[D1 10:36] ขับไป -> สัปปายยะ สปา (ระยะทาง=2.01 กม.) เหลือวิ่งได้ 160.57 กม. (~37.3%)',
-                           '[D1 11:46] เที่ยว สัปปายยะ สปา (70 นาที)',
-                           '[D1 11:48] ขับไป -> ร้านกาแฟ คอฟฟี่ อิน เลิฟ (ระยะทาง=1.92 กม.) เหลือวิ่งได้ 158.66 กม. '
-                           '(~36.9%)',
-                           '[D1 12:52] เที่ยว ร้านกาแฟ คอฟฟี่ อิน เลิฟ (64 นาที)',
-                           '[D1 12:58] ขับไป -> ปางช้างบ้านท่าปาย (ระยะทาง=7.41 กม.) เหลือวิ่งได้ 151.25 กม. (~35.1%)',
-                           '[D1 14:12] เที่ยว ปางช้างบ้านท่าปาย (74 นาที)',
-                           '[D1 14:13] ขับไป -> กาแฟที่สะพานปาย (ระยะทาง=0.29 กม.) เหลือวิ่งได้ 150.96 กม. (~35.1%)',
-                           '[D1 14:58] แวะคาเฟ่ กาแฟที่สะพานปาย (45 นาที)',
-                           '[D1 15:04] ขับไป -> สถานี EleXA ปาย (ระยะทาง=7.33 กม.) เหลือวิ่งได้ 143.63 กม. (~33.4%)',
-                           '[D1 15:18] ชาร์จที่ สถานี EleXA ปาย (DC 120 kW เติม ~27.1 kWh (~181 กม.) ใช้เวลา ~14 นาที)',
-                           '[D1 15:20] ขับไป -> วัดหลวง (ระยะทาง=1.45 กม.) เหลือวิ่งได้ 322.74 กม. (~75.0%)',
-                           '[D1 16:26] เที่ยว วัดหลวง (66 นาที)',
-                           '[D1 16:28] ขับไป -> วัดพระธาตุแม่เย็น (ระยะทาง=2.01 กม.) เหลือวิ่งได้ 320.72 กม. (~74.5%)',
-                           '[D1 17:31] เที่ยว วัดพระธาตุแม่เย็น (63 นาที)',
-                           '[D1 17:33] ขับไป -> ถนนคนเดินปาย (ระยะทาง=1.94 กม.) เหลือวิ่งได้ 318.78 กม. (~74.1%)',
-                           '[D1 18:34] เที่ยว ถนนคนเดินปาย (61 นาที)',
-                           '[D1 18:34] จบทริปที่โรงแรม: บ้านเนินเขาวิวปาย รีสอร์ท'],
-                   'total_distance_km': 29.1,
-                   'total_travel_time_min': 27,
-                   'total_energy_kwh': 4.37,
-                   'total_ev_cost_thb': 32.77}]}
-ROUTE_GEOJSON_DATA: Dict[str, object] = {'chiang-mai': {'type': 'FeatureCollection',
-                'features': [{'type': 'Feature',
-                              'properties': {'agent_id': 0,
-                                             'segment': 1,
-                                             'from': 'โรงแรมเชียงใหม่ออร์คิด',
-                                             'to': 'ร้านข้าวซอยแม่สาย',
-                                             'distance_m': 510.3,
-                                             'distance_km': 0.5103,
-                                             'from_source': 'graph',
-                                             'to_source': 'graph'},
-                              'geometry': {'type': 'LineString',
-                                           'coordinates': [[98.975373, 18.796935],
-                                                           [98.975283, 18.796974],
-                                                           [98.975276, 18.796983],
-                                                           [98.975273, 18.796994],
-                                                           [98.975273, 18.797006],
-                                                           [98.975273, 18.797018],
-                                                           [98.975276, 18.797031],
-                                                           [98.975356, 18.797197],
-                                                           [98.975358, 18.797201],
-                                                           [98.975359, 18.797205],
-                                                           [98.975359, 18.797209],
-                                                           [98.975357, 18.797213],
-                                                           [98.975318, 18.797349],
-                                                           [98.975005, 18.797514],
-                                                           [98.974646, 18.797704],
-                                                           [98.97428, 18.797904],
-                                                           [98.974196, 18.79795],
-                                                           [98.974088, 18.798009],
-                                                           [98.973977, 18.798068],
-                                                           [98.973932, 18.798093],
-                                                           [98.973867, 18.798127],
-                                                           [98.973908, 18.798194],
-                                                           [98.974405, 18.799161],
-                                                           [98.974995, 18.798886],
-                                                           [98.975229, 18.799363],
-                                                           [98.975294, 18.799577]]}},
-                             {'type': 'Feature',
-                              'properties': {'agent_id': 0,
-                                             'segment': 2,
-                                             'from': 'ร้านข้าวซอยแม่สาย',
-                                             'to': 'อ่างแก้ว',
-                                             'distance_m': 3190.7,
-                                             'distance_km': 3.1906999999999996,
-                                             'from_source': 'graph',
-                                             'to_source': 'manual'},
-                              'geometry': {'type': 'LineString',
-                                           'coordinates': [[98.975294, 18.799577],
-                                                           [98.975229, 18.799363],
-                                                           [98.974995, 18.798886],
-                                                           [98.974405, 18.799161],
-                                                           [98.973908, 18.798194],
-                                                           [98.973867, 18.798127],
-                                                           [98.973704, 18.798212],
-                                                           [98.973548, 18.798293],
-                                                           [98.973204, 18.798471],
-                                                           [98.972268, 18.798973],
-                                                           [98.972083, 18.799073],
-                                                           [98.97184, 18.799201],
-                                                           [98.971523, 18.799368],
-                                                           [98.971326, 18.799473],
-                                                           [98.971067, 18.799616],
-                                                           [98.971003, 18.79965],
-                                                           [98.970572, 18.799885],
-                                                           [98.970495, 18.799927],
-                                                           [98.970284, 18.80004],
-                                                           [98.969615, 18.800391],
-                                                           [98.96933, 18.80054],
-                                                           [98.96916, 18.800633],
-                                                           [98.968547, 18.80096],
-                                                           [98.968043, 18.801211],
-                                                           [98.968001, 18.801229],
-                                                           [98.967973, 18.801241],
-                                                           [98.967923, 18.801264],
-                                                           [98.967805, 18.801322],
-                                                           [98.967743, 18.801354],
-                                                           [98.967685, 18.801386],
-                                                           [98.967639, 18.801411],
-                                                           [98.967467, 18.801503],
-                                                           [98.967187, 18.801653],
-                                                           [98.967171, 18.801661],
-                                                           [98.967161, 18.801666],
-                                                           [98.966448, 18.802047],
-                                                           [98.965888, 18.802347],
-                                                           [98.965673, 18.802461],
-                                                           [98.965405, 18.802605],
-                                                           [98.965184, 18.802723],
-                                                           [98.964857, 18.802898],
-                                                           [98.964722, 18.802972],
-                                                           [98.963192, 18.803813],
-                                                           [98.963037, 18.803898],
-                                                           [98.962207, 18.804351],
-                                                           [98.961592, 18.804687],
-                                                           [98.960868, 18.805082],
-                                                           [98.960307, 18.805388],
-                                                           [98.960084, 18.805508],
-                                                           [98.960012, 18.805546],
-                                                           [98.959803, 18.805655],
-                                                           [98.959599, 18.805762],
-                                                           [98.958992, 18.80608],
-                                                           [98.958942, 18.806106],
-                                                           [98.958797, 18.806182],
-                                                           [98.958438, 18.806371],
-                                                           [98.958102, 18.806546],
-                                                           [98.95786, 18.806673],
-                                                           [98.957277, 18.806979],
-                                                           [98.95726, 18.806988],
-                                                           [98.957159, 18.807041],
-                                                           [98.956901, 18.807166],
-                                                           [98.956116, 18.807587],
-                                                           [98.955993, 18.807652],
-                                                           [98.955002, 18.808171],
-                                                           [98.954861, 18.808245],
-                                                           [98.954794, 18.80828],
-                                                           [98.95474, 18.808185],
-                                                           [98.954563, 18.807873],
-                                                           [98.95453, 18.807815],
-                                                           [98.954238, 18.807283],
-                                                           [98.953687, 18.806324],
-                                                           [98.953464, 18.805926],
-                                                           [98.953441, 18.805886],
-                                                           [98.95332, 18.805945],
-                                                           [98.953267, 18.80597],
-                                                           [98.953199, 18.806003],
-                                                           [98.953008, 18.806095],
-                                                           [98.952787, 18.806201],
-                                                           [98.952403, 18.806385],
-                                                           [98.9522, 18.806482],
-                                                           [98.951948, 18.806603],
-                                                           [98.951499, 18.806083],
-                                                           [98.95135, 18.805911],
-                                                           [98.951327, 18.805889],
-                                                           [98.951142, 18.805713]]}},
-                             {'type': 'Feature',
-                              'properties': {'agent_id': 0,
-                                             'segment': 3,
-                                             'from': 'อ่างแก้ว',
-                                             'to': 'สวนรุกขชาติห้วยแก้ว',
-                                             'distance_m': 1181.1,
-                                             'distance_km': 1.1810999999999998,
-                                             'from_source': 'manual',
-                                             'to_source': 'graph'},
-                              'geometry': {'type': 'LineString',
-                                           'coordinates': [[98.951142, 18.805713],
-                                                           [98.951327, 18.805889],
-                                                           [98.95135, 18.805911],
-                                                           [98.951499, 18.806083],
-                                                           [98.951948, 18.806603],
-                                                           [98.9522, 18.806482],
-                                                           [98.952403, 18.806385],
-                                                           [98.952787, 18.806201],
-                                                           [98.953008, 18.806095],
-                                                           [98.953199, 18.806003],
-                                                           [98.953267, 18.80597],
-                                                           [98.953425, 18.806248],
-                                                           [98.95352, 18.806417],
-                                                           [98.953798, 18.806919],
-                                                           [98.954042, 18.807336],
-                                                           [98.954058, 18.807366],
-                                                           [98.954554, 18.808237],
-                                                           [98.954571, 18.808268],
-                                                           [98.954604, 18.808327],
-                                                           [98.954627, 18.808367],
-                                                           [98.953006, 18.809201],
-                                                           [98.952909, 18.809251],
-                                                           [98.952607, 18.809398],
-                                                           [98.952513, 18.809443],
-                                                           [98.952462, 18.809467],
-                                                           [98.952005, 18.809681],
-                                                           [98.951527, 18.809853],
-                                                           [98.950834, 18.810061],
-                                                           [98.950393, 18.810258],
-                                                           [98.950147, 18.810338],
-                                                           [98.949971, 18.810393],
-                                                           [98.949496, 18.810538]]}},
-                             {'type': 'Feature',
-                              'properties': {'agent_id': 0,
-                                             'segment': 4,
-                                             'from': 'สวนรุกขชาติห้วยแก้ว',
-                                             'to': 'ศูนย์ธรรมชาติวิทยาดอยสุเทพเฉลิมพระเกียรติฯ',
-                                             'distance_m': 98.3,
-                                             'distance_km': 0.0983,
-                                             'from_source': 'graph',
-                                             'to_source': 'graph'},
-                              'geometry': {'type': 'LineString',
-                                           'coordinates': [[98.949496, 18.810538],
-                                                           [98.949159, 18.810641],
-                                                           [98.948982, 18.810684],
-                                                           [98.948779, 18.810712],
-                                                           [98.948588, 18.810714]]}},
-                             {'type': 'Feature',
-                              'properties': {'agent_id': 0,
-                                             'segment': 5,
-                                             'from': 'ศูนย์ธรรมชาติวิทยาดอยสุเทพเฉลิมพระเกียรติฯ',
-                                             'to': 'Cloud Coffee',
-                                             'distance_m': 3499.4,
-                                             'distance_km': 3.4994,
-                                             'from_source': 'graph',
-                                             'to_source': 'graph'},
-                              'geometry': {'type': 'LineString',
-                                           'coordinates': [[98.948588, 18.810714],
-                                                           [98.948779, 18.810712],
-                                                           [98.948982, 18.810684],
-                                                           [98.949159, 18.810641],
-                                                           [98.949971, 18.810393],
-                                                           [98.950147, 18.810338],
-                                                           [98.950393, 18.810258],
-                                                           [98.950669, 18.810199],
-                                                           [98.950863, 18.810158],
-                                                           [98.951458, 18.809971],
-                                                           [98.951552, 18.809942],
-                                                           [98.951797, 18.809853],
-                                                           [98.95204, 18.809765],
-                                                           [98.952513, 18.809547],
-                                                           [98.952548, 18.809531],
-                                                           [98.95261, 18.8095],
-                                                           [98.952649, 18.809481],
-                                                           [98.953072, 18.809268],
-                                                           [98.954361, 18.808611],
-                                                           [98.954675, 18.808451],
-                                                           [98.954843, 18.808365],
-                                                           [98.954984, 18.808294],
-                                                           [98.955058, 18.808254],
-                                                           [98.955507, 18.808012],
-                                                           [98.955946, 18.807782],
-                                                           [98.956167, 18.807665],
-                                                           [98.956243, 18.807625],
-                                                           [98.956761, 18.80735],
-                                                           [98.957204, 18.807118],
-                                                           [98.957317, 18.807058],
-                                                           [98.957323, 18.807054],
-                                                           [98.958106, 18.806641],
-                                                           [98.958997, 18.80617],
-                                                           [98.959647, 18.805826],
-                                                           [98.959737, 18.805779],
-                                                           [98.960053, 18.805611],
-                                                           [98.960122, 18.805575],
-                                                           [98.960345, 18.805452],
-                                                           [98.960307, 18.805388],
-                                                           [98.959845, 18.804561],
-                                                           [98.959757, 18.80441],
-                                                           [98.95959, 18.804116],
-                                                           [98.95956, 18.804062],
-                                                           [98.9595, 18.803926],
-                                                           [98.959472, 18.803815],
-                                                           [98.959464, 18.803698],
-                                                           [98.959474, 18.803614],
-                                                           [98.959479, 18.803568],
-                                                           [98.959539, 18.80332],
-                                                           [98.959593, 18.803157],
-                                                           [98.959724, 18.802758],
-                                                           [98.959791, 18.802556],
-                                                           [98.96007, 18.80167],
-                                                           [98.96008, 18.801633],
-                                                           [98.960421, 18.800641],
-                                                           [98.96052, 18.800355],
-                                                           [98.960929, 18.799125],
-                                                           [98.96103, 18.79882],
-                                                           [98.961102, 18.79861],
-                                                           [98.961281, 18.798039],
-                                                           [98.961603, 18.797001],
-                                                           [98.96162, 18.796946],
-                                                           [98.961628, 18.796922],
-                                                           [98.961636, 18.796895],
-                                                           [98.961642, 18.796879],
-                                                           [98.961847, 18.796287],
-                                                           [98.962125, 18.795453],
-                                                           [98.962178, 18.795235],
-                                                           [98.962094, 18.795259],
-                                                           [98.961909, 18.79531],
-                                                           [98.961881, 18.795318],
-                                                           [98.961759, 18.795662],
-                                                           [98.961714, 18.795801],
-                                                           [98.961681, 18.795902],
-                                                           [98.96165, 18.795995],
-                                                           [98.961604, 18.796141],
-                                                           [98.961463, 18.79658],
-                                                           [98.961418, 18.796719],
-                                                           [98.961362, 18.796886],
-                                                           [98.961344, 18.796937],
-                                                           [98.960389, 18.799883],
-                                                           [98.960259, 18.800285],
-                                                           [98.959826, 18.801619],
-                                                           [98.959644, 18.80218],
-                                                           [98.95954, 18.802511],
-                                                           [98.959534, 18.802533],
-                                                           [98.95938, 18.803025]]}},
-                             {'type': 'Feature',
-                              'properties': {'agent_id': 0,
-                                             'segment': 6,
-                                             'from': 'Cloud Coffee',
-                                             'to': 'สถานีชาร์จ EleXA ถ.ห้วยแก้ว ตำบลสุเทพ',
-                                             'distance_m': 754.9,
-                                             'distance_km': 0.7549,
-                                             'from_source': 'graph',
-                                             'to_source': 'graph'},
-                              'geometry': {'type': 'LineString',
-                                           'coordinates': [[98.95938, 18.803025],
-                                                           [98.959377, 18.803034],
-                                                           [98.959314, 18.803261],
-                                                           [98.959256, 18.803446],
-                                                           [98.959223, 18.803553],
-                                                           [98.95921, 18.803687],
-                                                           [98.959209, 18.803807],
-                                                           [98.959224, 18.80391],
-                                                           [98.959242, 18.803984],
-                                                           [98.959256, 18.804045],
-                                                           [98.959346, 18.804238],
-                                                           [98.959613, 18.804682],
-                                                           [98.959912, 18.805206],
-                                                           [98.960084, 18.805508],
-                                                           [98.960122, 18.805575],
-                                                           [98.960345, 18.805452],
-                                                           [98.963082, 18.80398],
-                                                           [98.96325, 18.803889],
-                                                           [98.963704, 18.803642],
-                                                           [98.963729, 18.803754]]}},
-                             {'type': 'Feature',
-                              'properties': {'agent_id': 0,
-                                             'segment': 7,
-                                             'from': 'สถานีชาร์จ EleXA ถ.ห้วยแก้ว ตำบลสุเทพ',
-                                             'to': 'เมญ่า ไลฟ์สไตล์ ช้อปปิ้ง เซ็นเตอร์ ',
-                                             'distance_m': 415.5,
-                                             'distance_km': 0.4155,
-                                             'from_source': 'graph',
-                                             'to_source': 'graph'},
-                              'geometry': {'type': 'LineString',
-                                           'coordinates': [[98.963729, 18.803754],
-                                                           [98.963704, 18.803642],
-                                                           [98.964758, 18.80307],
-                                                           [98.964913, 18.802986],
-                                                           [98.965009, 18.802935],
-                                                           [98.965155, 18.802858],
-                                                           [98.965234, 18.802815],
-                                                           [98.965686, 18.802576],
-                                                           [98.965907, 18.802459],
-                                                           [98.966183, 18.802312],
-                                                           [98.966478, 18.802155],
-                                                           [98.966855, 18.801955],
-                                                           [98.967028, 18.801864],
-                                                           [98.967036, 18.80186]]}},
-                             {'type': 'Feature',
-                              'properties': {'agent_id': 0,
-                                             'segment': 8,
-                                             'from': 'เมญ่า ไลฟ์สไตล์ ช้อปปิ้ง เซ็นเตอร์ ',
-                                             'to': 'คลองแม่ข่า',
-                                             'distance_m': 5384.3,
-                                             'distance_km': 5.3843000000000005,
-                                             'from_source': 'graph',
-                                             'to_source': 'graph'},
-                              'geometry': {'type': 'LineString',
-                                           'coordinates': [[98.967036, 18.80186],
-                                                           [98.96733, 18.801707],
-                                                           [98.967685, 18.801522],
-                                                           [98.967744, 18.80149],
-                                                           [98.967793, 18.801464],
-                                                           [98.967854, 18.801431],
-                                                           [98.967976, 18.801366],
-                                                           [98.968019, 18.801343],
-                                                           [98.968097, 18.801301],
-                                                           [98.969225, 18.800692],
-                                                           [98.969624, 18.800478],
-                                                           [98.969663, 18.800456],
-                                                           [98.970038, 18.800254],
-                                                           [98.970328, 18.800098],
-                                                           [98.97054, 18.799984],
-                                                           [98.971098, 18.799683],
-                                                           [98.971305, 18.79957],
-                                                           [98.971366, 18.799537],
-                                                           [98.971559, 18.799436],
-                                                           [98.971998, 18.799204],
-                                                           [98.972889, 18.798732],
-                                                           [98.973091, 18.798624],
-                                                           [98.973248, 18.79854],
-                                                           [98.973512, 18.798403],
-                                                           [98.973796, 18.798253],
-                                                           [98.973908, 18.798194],
-                                                           [98.974126, 18.798078],
-                                                           [98.974796, 18.797718],
-                                                           [98.975333, 18.797429],
-                                                           [98.975475, 18.797353],
-                                                           [98.975587, 18.797293],
-                                                           [98.975898, 18.797125],
-                                                           [98.976054, 18.797041],
-                                                           [98.976751, 18.796667],
-                                                           [98.977161, 18.796447],
-                                                           [98.9774, 18.796326],
-                                                           [98.977461, 18.796278],
-                                                           [98.977503, 18.796245],
-                                                           [98.977656, 18.796182],
-                                                           [98.977837, 18.796115],
-                                                           [98.978015, 18.796069],
-                                                           [98.978163, 18.796043],
-                                                           [98.978262, 18.796027],
-                                                           [98.978562, 18.795991],
-                                                           [98.979005, 18.795967],
-                                                           [98.979122, 18.795962],
-                                                           [98.979251, 18.795957],
-                                                           [98.979571, 18.795947],
-                                                           [98.980056, 18.795931],
-                                                           [98.98069, 18.795908],
-                                                           [98.98072, 18.795907],
-                                                           [98.981018, 18.795895],
-                                                           [98.981134, 18.795891],
-                                                           [98.981211, 18.795889],
-                                                           [98.98134, 18.795886],
-                                                           [98.981552, 18.79588],
-                                                           [98.981699, 18.795876],
-                                                           [98.98175, 18.795875],
-                                                           [98.981866, 18.795871],
-                                                           [98.982223, 18.795859],
-                                                           [98.98226, 18.795858],
-                                                           [98.982294, 18.795857],
-                                                           [98.982547, 18.795848],
-                                                           [98.982646, 18.795845],
-                                                           [98.98279, 18.79584],
-                                                           [98.982851, 18.795838],
-                                                           [98.982904, 18.795837],
-                                                           [98.983128, 18.795829],
-                                                           [98.983361, 18.795822],
-                                                           [98.983388, 18.795821],
-                                                           [98.983856, 18.795805],
-                                                           [98.983985, 18.7958],
-                                                           [98.98407, 18.795797],
-                                                           [98.984224, 18.795792],
-                                                           [98.984266, 18.795791],
-                                                           [98.984414, 18.795786],
-                                                           [98.985033, 18.795766],
-                                                           [98.985135, 18.795765],
-                                                           [98.985409, 18.795761],
-                                                           [98.986118, 18.79575],
-                                                           [98.986153, 18.795749],
-                                                           [98.986199, 18.795748],
-                                                           [98.986298, 18.795806],
-                                                           [98.986376, 18.795863],
-                                                           [98.986409, 18.795905],
-                                                           [98.986435, 18.795956],
-                                                           [98.986465, 18.795909],
-                                                           [98.986505, 18.795866],
-                                                           [98.986554, 18.795839],
-                                                           [98.98661, 18.795821],
-                                                           [98.986862, 18.795766],
-                                                           [98.986956, 18.795763],
-                                                           [98.987018, 18.795761],
-                                                           [98.988615, 18.795702],
-                                                           [98.989579, 18.795665],
-                                                           [98.989964, 18.795647],
-                                                           [98.990139, 18.795638],
-                                                           [98.990215, 18.795635],
-                                                           [98.99086, 18.795608],
-                                                           [98.991633, 18.795578],
-                                                           [98.991746, 18.795573],
-                                                           [98.991947, 18.795566],
-                                                           [98.992263, 18.795556],
-                                                           [98.992336, 18.795554],
-                                                           [98.992856, 18.795533],
-                                                           [98.993223, 18.79552],
-                                                           [98.993664, 18.795495],
-                                                           [98.993767, 18.795462],
-                                                           [98.993839, 18.795425],
-                                                           [98.993879, 18.795389],
-                                                           [98.993901, 18.795351],
-                                                           [98.993924, 18.795275],
-                                                           [98.993926, 18.795124],
-                                                           [98.993927, 18.795024],
-                                                           [98.993904, 18.794529],
-                                                           [98.993903, 18.794506],
-                                                           [98.993866, 18.793681],
-                                                           [98.993862, 18.793595],
-                                                           [98.993827, 18.792774],
-                                                           [98.993818, 18.792641],
-                                                           [98.993813, 18.792546],
-                                                           [98.993801, 18.792447],
-                                                           [98.993765, 18.791704],
-                                                           [98.993756, 18.791534],
-                                                           [98.993754, 18.791499],
-                                                           [98.993749, 18.791376],
-                                                           [98.993746, 18.79129],
-                                                           [98.99374, 18.791124],
-                                                           [98.993732, 18.790974],
-                                                           [98.993707, 18.790612],
-                                                           [98.993702, 18.790523],
-                                                           [98.993692, 18.790415],
-                                                           [98.993682, 18.790264],
-                                                           [98.993679, 18.790219],
-                                                           [98.99365, 18.78969],
-                                                           [98.993649, 18.789667],
-                                                           [98.993646, 18.789627],
-                                                           [98.993626, 18.789307],
-                                                           [98.993625, 18.78929],
-                                                           [98.993621, 18.789234],
-                                                           [98.993612, 18.789092],
-                                                           [98.99361, 18.789058],
-                                                           [98.993576, 18.788437],
-                                                           [98.993575, 18.78841],
-                                                           [98.993569, 18.788087],
-                                                           [98.993577, 18.788013],
-                                                           [98.993609, 18.78792],
-                                                           [98.993698, 18.787721],
-                                                           [98.993716, 18.787676],
-                                                           [98.993739, 18.787582],
-                                                           [98.99364, 18.787252],
-                                                           [98.993617, 18.787173],
-                                                           [98.993582, 18.787063],
-                                                           [98.993545, 18.786955],
-                                                           [98.993501, 18.786842],
-                                                           [98.993484, 18.786786],
-                                                           [98.993472, 18.786733],
-                                                           [98.993463, 18.786679],
-                                                           [98.993454, 18.786607],
-                                                           [98.993431, 18.786304],
-                                                           [98.99338, 18.785675],
-                                                           [98.993355, 18.78534],
-                                                           [98.993344, 18.785205],
-                                                           [98.993341, 18.785182],
-                                                           [98.993335, 18.785089],
-                                                           [98.993324, 18.784952],
-                                                           [98.99331, 18.784719],
-                                                           [98.993308, 18.784689],
-                                                           [98.993293, 18.784459],
-                                                           [98.993278, 18.784235],
-                                                           [98.993269, 18.784095],
-                                                           [98.993252, 18.783838],
-                                                           [98.993251, 18.783813],
-                                                           [98.993246, 18.783697],
-                                                           [98.993243, 18.783636],
-                                                           [98.993237, 18.783507],
-                                                           [98.99319, 18.78277],
-                                                           [98.993188, 18.782744],
-                                                           [98.993182, 18.7825],
-                                                           [98.993168, 18.782302],
-                                                           [98.993604, 18.782346],
-                                                           [98.993765, 18.782335],
-                                                           [98.994035, 18.782219],
-                                                           [98.994191, 18.782182],
-                                                           [98.994407, 18.782171],
-                                                           [98.994328, 18.782019],
-                                                           [98.993703, 18.781396],
-                                                           [98.993653, 18.781349],
-                                                           [98.993616, 18.781251],
-                                                           [98.993609, 18.781096],
-                                                           [98.993608, 18.781052],
-                                                           [98.993507, 18.781047],
-                                                           [98.993426, 18.781043],
-                                                           [98.993261, 18.781038],
-                                                           [98.993007, 18.781025],
-                                                           [98.992998, 18.780923],
-                                                           [98.992975, 18.780645],
-                                                           [98.99297, 18.780601],
-                                                           [98.992985, 18.780543],
-                                                           [98.993001, 18.780514],
-                                                           [98.993028, 18.780481],
-                                                           [98.993082, 18.780453],
-                                                           [98.99326, 18.780408],
-                                                           [98.993374, 18.780364],
-                                                           [98.99345, 18.780327],
-                                                           [98.993538, 18.780283],
-                                                           [98.993593, 18.780238],
-                                                           [98.993627, 18.780187],
-                                                           [98.993816, 18.779809],
-                                                           [98.993844, 18.779753],
-                                                           [98.993935, 18.779557],
-                                                           [98.994233, 18.779089],
-                                                           [98.994394, 18.77887],
-                                                           [98.994503, 18.778734],
-                                                           [98.994681, 18.778521],
-                                                           [98.994829, 18.778345],
-                                                           [98.995113, 18.77807],
-                                                           [98.995326, 18.777834],
-                                                           [98.995421, 18.777728],
-                                                           [98.995506, 18.777627],
-                                                           [98.995518, 18.777582],
-                                                           [98.995514, 18.777532],
-                                                           [98.995452, 18.777445],
-                                                           [98.995385, 18.777354],
-                                                           [98.995446, 18.77726],
-                                                           [98.995568, 18.777144],
-                                                           [98.995609, 18.777102]]}},
-                             {'type': 'Feature',
-                              'properties': {'agent_id': 0,
-                                             'segment': 9,
-                                             'from': 'คลองแม่ข่า',
-                                             'to': 'โรงแรมเชียงใหม่ออร์คิด',
-                                             'distance_m': 4131.4,
-                                             'distance_km': 4.131399999999999,
-                                             'from_source': 'graph',
-                                             'to_source': 'graph'},
-                              'geometry': {'type': 'LineString',
-                                           'coordinates': [[98.995609, 18.777102],
-                                                           [98.995568, 18.777144],
-                                                           [98.995446, 18.77726],
-                                                           [98.995385, 18.777354],
-                                                           [98.995452, 18.777445],
-                                                           [98.995514, 18.777532],
-                                                           [98.995518, 18.777582],
-                                                           [98.995506, 18.777627],
-                                                           [98.995421, 18.777728],
-                                                           [98.995326, 18.777834],
-                                                           [98.995113, 18.77807],
-                                                           [98.994829, 18.778345],
-                                                           [98.994681, 18.778521],
-                                                           [98.994503, 18.778734],
-                                                           [98.994394, 18.77887],
-                                                           [98.994233, 18.779089],
-                                                           [98.993935, 18.779557],
-                                                           [98.993844, 18.779753],
-                                                           [98.993816, 18.779809],
-                                                           [98.993627, 18.780187],
-                                                           [98.993593, 18.780238],
-                                                           [98.993538, 18.780283],
-                                                           [98.99345, 18.780327],
-                                                           [98.993374, 18.780364],
-                                                           [98.99326, 18.780408],
-                                                           [98.993082, 18.780453],
-                                                           [98.993028, 18.780481],
-                                                           [98.993001, 18.780514],
-                                                           [98.992985, 18.780543],
-                                                           [98.99297, 18.780601],
-                                                           [98.992975, 18.780645],
-                                                           [98.992998, 18.780923],
-                                                           [98.993007, 18.781025],
-                                                           [98.992642, 18.781005],
-                                                           [98.992386, 18.781008],
-                                                           [98.992349, 18.781009],
-                                                           [98.992214, 18.78101],
-                                                           [98.991987, 18.781012],
-                                                           [98.991925, 18.781012],
-                                                           [98.991815, 18.781014],
-                                                           [98.99133, 18.78102],
-                                                           [98.991082, 18.781023],
-                                                           [98.990832, 18.781028],
-                                                           [98.989883, 18.781053],
-                                                           [98.989428, 18.781064],
-                                                           [98.989346, 18.781068],
-                                                           [98.989284, 18.78107],
-                                                           [98.988915, 18.781088],
-                                                           [98.988643, 18.781109],
-                                                           [98.988342, 18.781086],
-                                                           [98.98829, 18.781083],
-                                                           [98.988157, 18.781086],
-                                                           [98.987727, 18.781111],
-                                                           [98.986869, 18.781138],
-                                                           [98.985597, 18.781169],
-                                                           [98.985568, 18.78117],
-                                                           [98.985287, 18.781179],
-                                                           [98.98483, 18.781189],
-                                                           [98.984124, 18.781207],
-                                                           [98.984022, 18.781209],
-                                                           [98.983339, 18.78122],
-                                                           [98.983234, 18.781221],
-                                                           [98.981841, 18.781252],
-                                                           [98.981497, 18.781265],
-                                                           [98.981325, 18.781275],
-                                                           [98.980559, 18.7813],
-                                                           [98.979586, 18.781327],
-                                                           [98.97954, 18.781329],
-                                                           [98.979378, 18.781334],
-                                                           [98.979085, 18.781343],
-                                                           [98.978038, 18.781373],
-                                                           [98.977926, 18.781377],
-                                                           [98.977847, 18.781389],
-                                                           [98.977771, 18.781422],
-                                                           [98.97771, 18.781466],
-                                                           [98.977649, 18.781522],
-                                                           [98.977601, 18.781588],
-                                                           [98.977556, 18.781671],
-                                                           [98.97753, 18.781735],
-                                                           [98.977509, 18.781809],
-                                                           [98.977492, 18.78204],
-                                                           [98.977523, 18.782362],
-                                                           [98.977549, 18.782902],
-                                                           [98.977555, 18.783026],
-                                                           [98.977574, 18.78341],
-                                                           [98.977659, 18.785055],
-                                                           [98.977686, 18.785569],
-                                                           [98.977698, 18.785794],
-                                                           [98.977704, 18.785922],
-                                                           [98.977728, 18.786363],
-                                                           [98.977784, 18.787447],
-                                                           [98.977806, 18.787851],
-                                                           [98.977834, 18.788293],
-                                                           [98.977869, 18.788525],
-                                                           [98.977879, 18.788713],
-                                                           [98.97788, 18.78873],
-                                                           [98.977881, 18.788953],
-                                                           [98.977878, 18.789443],
-                                                           [98.977911, 18.790007],
-                                                           [98.977928, 18.790291],
-                                                           [98.977933, 18.790386],
-                                                           [98.977944, 18.790579],
-                                                           [98.977988, 18.791326],
-                                                           [98.978015, 18.791891],
-                                                           [98.978028, 18.792153],
-                                                           [98.97803, 18.792183],
-                                                           [98.978047, 18.792542],
-                                                           [98.978056, 18.792713],
-                                                           [98.97806, 18.792792],
-                                                           [98.978074, 18.793081],
-                                                           [98.978083, 18.793265],
-                                                           [98.978086, 18.793336],
-                                                           [98.978137, 18.794394],
-                                                           [98.978146, 18.794559],
-                                                           [98.978161, 18.79486],
-                                                           [98.978169, 18.79501],
-                                                           [98.978179, 18.795209],
-                                                           [98.978179, 18.795223],
-                                                           [98.978181, 18.795261],
-                                                           [98.97819, 18.795439],
-                                                           [98.978193, 18.795495],
-                                                           [98.978202, 18.795579],
-                                                           [98.978218, 18.795723],
-                                                           [98.978205, 18.79585],
-                                                           [98.978198, 18.795907],
-                                                           [98.978174, 18.795947],
-                                                           [98.978146, 18.795977],
-                                                           [98.978015, 18.796069],
-                                                           [98.977837, 18.796115],
-                                                           [98.977656, 18.796182],
-                                                           [98.977503, 18.796245],
-                                                           [98.977371, 18.796273],
-                                                           [98.977163, 18.796372],
-                                                           [98.977107, 18.796401],
-                                                           [98.976561, 18.79669],
-                                                           [98.975968, 18.797004],
-                                                           [98.975862, 18.79706],
-                                                           [98.975822, 18.797082],
-                                                           [98.975724, 18.797133],
-                                                           [98.975595, 18.796878],
-                                                           [98.975586, 18.796868],
-                                                           [98.975574, 18.796861],
-                                                           [98.97556, 18.796858],
-                                                           [98.975542, 18.796859],
-                                                           [98.975417, 18.796915],
-                                                           [98.975373, 18.796935]]}}]},
- 'lampang': {'type': 'FeatureCollection',
-             'features': [{'type': 'Feature',
-                           'properties': {'agent_id': 4433,
-                                          'segment': 1,
-                                          'from': 'บ้านดีรีสอร์ทลำปาง',
-                                          'to': 'ร้านนุ่นอาหารพื้นเมือง',
-                                          'distance_m': 4918.7,
-                                          'distance_km': 4.918699999999999,
-                                          'from_source': 'csv',
-                                          'to_source': 'csv'},
-                           'geometry': {'type': 'LineString',
-                                        'coordinates': [[99.463176, 18.263496],
-                                                        [99.463107, 18.263573],
-                                                        [99.462946, 18.263399],
-                                                        [99.462866, 18.263403],
-                                                        [99.462099, 18.262417],
-                                                        [99.461673, 18.26187],
-                                                        [99.46159, 18.26193],
-                                                        [99.461979, 18.262426],
-                                                        [99.462193, 18.262699],
-                                                        [99.462348, 18.262897],
-                                                        [99.462595, 18.263213],
-                                                        [99.462731, 18.263388],
-                                                        [99.463192, 18.263978],
-                                                        [99.463658, 18.264574],
-                                                        [99.464396, 18.265505],
-                                                        [99.464669, 18.265855],
-                                                        [99.465035, 18.266318],
-                                                        [99.465242, 18.266583],
-                                                        [99.465311, 18.266731],
-                                                        [99.465332, 18.266836],
-                                                        [99.465321, 18.266924],
-                                                        [99.465281, 18.267082],
-                                                        [99.465168, 18.26724],
-                                                        [99.464691, 18.267906],
-                                                        [99.464425, 18.268318],
-                                                        [99.464131, 18.268768],
-                                                        [99.464003, 18.269018],
-                                                        [99.463859, 18.269293],
-                                                        [99.4638, 18.269498],
-                                                        [99.463296, 18.270252],
-                                                        [99.463037, 18.270654],
-                                                        [99.462664, 18.27111],
-                                                        [99.462335, 18.271468],
-                                                        [99.462018, 18.271726],
-                                                        [99.46149, 18.272095],
-                                                        [99.461365, 18.272113],
-                                                        [99.461142, 18.272156],
-                                                        [99.46157, 18.271864],
-                                                        [99.461656, 18.271806],
-                                                        [99.462138, 18.271418],
-                                                        [99.462534, 18.271038],
-                                                        [99.462922, 18.270531],
-                                                        [99.463136, 18.270197],
-                                                        [99.46321, 18.270151],
-                                                        [99.463274, 18.27014],
-                                                        [99.463421, 18.270192],
-                                                        [99.463516, 18.270287],
-                                                        [99.463524, 18.270349],
-                                                        [99.463501, 18.270463],
-                                                        [99.463263, 18.270856],
-                                                        [99.46312, 18.271061],
-                                                        [99.462843, 18.271353],
-                                                        [99.462643, 18.271578],
-                                                        [99.461434, 18.272494],
-                                                        [99.460621, 18.273061],
-                                                        [99.460715, 18.272772],
-                                                        [99.460861, 18.272675],
-                                                        [99.461257, 18.272418],
-                                                        [99.461571, 18.27221],
-                                                        [99.461988, 18.271904],
-                                                        [99.462413, 18.271552],
-                                                        [99.462744, 18.271211],
-                                                        [99.463086, 18.270816],
-                                                        [99.463421, 18.270317],
-                                                        [99.463998, 18.26945],
-                                                        [99.46415, 18.269196],
-                                                        [99.464317, 18.268945],
-                                                        [99.464544, 18.2686],
-                                                        [99.46781, 18.264014],
-                                                        [99.468097, 18.263666],
-                                                        [99.46842, 18.263283],
-                                                        [99.468752, 18.262906],
-                                                        [99.469006, 18.262687],
-                                                        [99.469205, 18.262536],
-                                                        [99.46933, 18.26245],
-                                                        [99.470192, 18.261965],
-                                                        [99.472179, 18.260936],
-                                                        [99.473924, 18.260057],
-                                                        [99.474993, 18.2595],
-                                                        [99.474924, 18.259383],
-                                                        [99.474724, 18.259484],
-                                                        [99.473863, 18.259938],
-                                                        [99.473653, 18.259988],
-                                                        [99.473681, 18.259813],
-                                                        [99.473735, 18.25965],
-                                                        [99.473857, 18.259441],
-                                                        [99.473879, 18.25942]]}},
-                          {'type': 'Feature',
-                           'properties': {'agent_id': 4433,
-                                          'segment': 2,
-                                          'from': 'ร้านนุ่นอาหารพื้นเมือง',
-                                          'to': 'พิพิธภัณฑ์ธนาคารไทยลำปาง',
-                                          'distance_m': 6343.1,
-                                          'distance_km': 6.343100000000001,
-                                          'from_source': 'csv',
-                                          'to_source': 'csv'},
-                           'geometry': {'type': 'LineString',
-                                        'coordinates': [[99.473879, 18.25942],
-                                                        [99.473857, 18.259441],
-                                                        [99.473735, 18.25965],
-                                                        [99.473681, 18.259813],
-                                                        [99.473653, 18.259988],
-                                                        [99.473514, 18.260021],
-                                                        [99.473015, 18.260236],
-                                                        [99.472652, 18.260396],
-                                                        [99.472062, 18.260676],
-                                                        [99.469183, 18.262278],
-                                                        [99.468852, 18.262499],
-                                                        [99.468689, 18.262636],
-                                                        [99.46843, 18.262867],
-                                                        [99.468214, 18.263119],
-                                                        [99.468082, 18.263268],
-                                                        [99.467934, 18.263368],
-                                                        [99.467786, 18.26342],
-                                                        [99.46762, 18.263432],
-                                                        [99.467441, 18.263397],
-                                                        [99.46721, 18.263259],
-                                                        [99.466885, 18.262983],
-                                                        [99.466686, 18.262825],
-                                                        [99.466372, 18.262527],
-                                                        [99.466085, 18.262248],
-                                                        [99.465754, 18.261915],
-                                                        [99.465558, 18.261718],
-                                                        [99.465324, 18.261483],
-                                                        [99.465198, 18.261441],
-                                                        [99.465008, 18.261376],
-                                                        [99.463561, 18.259994],
-                                                        [99.463244, 18.259703],
-                                                        [99.462921, 18.259398],
-                                                        [99.462433, 18.258949],
-                                                        [99.461614, 18.258246],
-                                                        [99.461468, 18.258376],
-                                                        [99.462775, 18.259536],
-                                                        [99.463175, 18.259906],
-                                                        [99.465493, 18.262072],
-                                                        [99.467178, 18.26365],
-                                                        [99.467496, 18.263956],
-                                                        [99.468081, 18.264519],
-                                                        [99.469333, 18.265723],
-                                                        [99.469644, 18.266015],
-                                                        [99.47018, 18.266445],
-                                                        [99.470903, 18.266986],
-                                                        [99.472053, 18.267825],
-                                                        [99.474121, 18.269332],
-                                                        [99.475464, 18.270296],
-                                                        [99.479068, 18.272891],
-                                                        [99.480162, 18.273654],
-                                                        [99.482559, 18.27537],
-                                                        [99.483272, 18.27588],
-                                                        [99.483377, 18.275956],
-                                                        [99.48378, 18.276245],
-                                                        [99.48395, 18.276369],
-                                                        [99.484521, 18.276797],
-                                                        [99.486141, 18.277965],
-                                                        [99.486434, 18.278177],
-                                                        [99.487656, 18.279061],
-                                                        [99.487931, 18.279259],
-                                                        [99.488313, 18.279536],
-                                                        [99.48847, 18.279649],
-                                                        [99.488558, 18.279713],
-                                                        [99.488572, 18.279723],
-                                                        [99.488434, 18.280026],
-                                                        [99.488052, 18.280861],
-                                                        [99.487578, 18.28191],
-                                                        [99.486837, 18.283564],
-                                                        [99.486139, 18.285118],
-                                                        [99.486162, 18.285305],
-                                                        [99.486189, 18.285495],
-                                                        [99.486132, 18.285653],
-                                                        [99.486004, 18.285944],
-                                                        [99.48556, 18.285775],
-                                                        [99.485298, 18.285677],
-                                                        [99.485148, 18.285615],
-                                                        [99.485049, 18.285549],
-                                                        [99.48483, 18.285373],
-                                                        [99.4846, 18.285183]]}},
-                          {'type': 'Feature',
-                           'properties': {'agent_id': 4433,
-                                          'segment': 3,
-                                          'from': 'พิพิธภัณฑ์ธนาคารไทยลำปาง',
-                                          'to': 'วัดศรีรองเมือง',
-                                          'distance_m': 1053.5,
-                                          'distance_km': 1.0535,
-                                          'from_source': 'csv',
-                                          'to_source': 'csv'},
-                           'geometry': {'type': 'LineString',
-                                        'coordinates': [[99.4846, 18.285183],
-                                                        [99.48483, 18.285373],
-                                                        [99.485049, 18.285549],
-                                                        [99.485148, 18.285615],
-                                                        [99.485298, 18.285677],
-                                                        [99.48556, 18.285775],
-                                                        [99.486004, 18.285944],
-                                                        [99.485712, 18.286609],
-                                                        [99.48555, 18.28699],
-                                                        [99.485447, 18.287367],
-                                                        [99.485388, 18.287572],
-                                                        [99.485204, 18.288209],
-                                                        [99.485096, 18.288577],
-                                                        [99.484849, 18.289427],
-                                                        [99.483936, 18.289514],
-                                                        [99.483219, 18.289569],
-                                                        [99.482751, 18.28961],
-                                                        [99.482533, 18.289629],
-                                                        [99.482186, 18.289655],
-                                                        [99.481867, 18.289679],
-                                                        [99.481553, 18.289707],
-                                                        [99.48129, 18.28973],
-                                                        [99.480868, 18.289833],
-                                                        [99.480758, 18.289847],
-                                                        [99.480763, 18.290036],
-                                                        [99.480768, 18.290209]]}},
-                          {'type': 'Feature',
-                           'properties': {'agent_id': 4433,
-                                          'segment': 4,
-                                          'from': 'วัดศรีรองเมือง',
-                                          'to': 'หอศิลป์ ลำปาง',
-                                          'distance_m': 1882.1,
-                                          'distance_km': 1.8820999999999999,
-                                          'from_source': 'csv',
-                                          'to_source': 'csv'},
-                           'geometry': {'type': 'LineString',
-                                        'coordinates': [[99.480768, 18.290209],
-                                                        [99.480763, 18.290036],
-                                                        [99.480758, 18.289847],
-                                                        [99.480868, 18.289833],
-                                                        [99.48129, 18.28973],
-                                                        [99.481553, 18.289707],
-                                                        [99.481867, 18.289679],
-                                                        [99.482186, 18.289655],
-                                                        [99.482533, 18.289629],
-                                                        [99.482751, 18.28961],
-                                                        [99.483219, 18.289569],
-                                                        [99.483936, 18.289514],
-                                                        [99.484849, 18.289427],
-                                                        [99.486332, 18.289297],
-                                                        [99.487224, 18.289219],
-                                                        [99.487763, 18.289172],
-                                                        [99.488081, 18.289144],
-                                                        [99.488715, 18.289089],
-                                                        [99.489299, 18.289037],
-                                                        [99.489808, 18.288993],
-                                                        [99.490278, 18.288952],
-                                                        [99.490702, 18.288953],
-                                                        [99.490823, 18.288977],
-                                                        [99.490859, 18.288996],
-                                                        [99.49089, 18.289004],
-                                                        [99.490917, 18.289006],
-                                                        [99.490934, 18.289005],
-                                                        [99.490943, 18.289003],
-                                                        [99.49097, 18.288996],
-                                                        [99.491001, 18.28898],
-                                                        [99.491025, 18.28896],
-                                                        [99.491048, 18.288931],
-                                                        [99.491054, 18.28892],
-                                                        [99.491451, 18.288866],
-                                                        [99.492629, 18.288796],
-                                                        [99.49305, 18.288739],
-                                                        [99.493502, 18.288699],
-                                                        [99.494188, 18.288648],
-                                                        [99.494691, 18.288624],
-                                                        [99.495296, 18.288614],
-                                                        [99.495526, 18.288592],
-                                                        [99.495703, 18.288575],
-                                                        [99.495705, 18.288589],
-                                                        [99.4958, 18.289053],
-                                                        [99.495964, 18.289855],
-                                                        [99.496099, 18.290428],
-                                                        [99.496453, 18.29045],
-                                                        [99.49648, 18.290454]]}},
-                          {'type': 'Feature',
-                           'properties': {'agent_id': 4433,
-                                          'segment': 5,
-                                          'from': 'หอศิลป์ ลำปาง',
-                                          'to': 'Full Flavor Coffee Bar',
-                                          'distance_m': 810.9,
-                                          'distance_km': 0.8109,
-                                          'from_source': 'csv',
-                                          'to_source': 'csv'},
-                           'geometry': {'type': 'LineString',
-                                        'coordinates': [[99.49648, 18.290454],
-                                                        [99.496453, 18.29045],
-                                                        [99.496099, 18.290428],
-                                                        [99.495964, 18.289855],
-                                                        [99.4958, 18.289053],
-                                                        [99.495705, 18.288589],
-                                                        [99.495703, 18.288575],
-                                                        [99.496109, 18.288535],
-                                                        [99.496194, 18.288527],
-                                                        [99.496382, 18.288508],
-                                                        [99.496837, 18.288567],
-                                                        [99.496851, 18.288484],
-                                                        [99.496924, 18.28822],
-                                                        [99.496964, 18.288098],
-                                                        [99.497164, 18.288067],
-                                                        [99.497276, 18.287516],
-                                                        [99.497275, 18.287262],
-                                                        [99.496986, 18.287235],
-                                                        [99.49641, 18.287198],
-                                                        [99.495892, 18.287186],
-                                                        [99.495838, 18.287192],
-                                                        [99.495797, 18.287464],
-                                                        [99.495752, 18.287744],
-                                                        [99.495723, 18.287926],
-                                                        [99.495716, 18.288155],
-                                                        [99.495572, 18.288142],
-                                                        [99.495572, 18.288142]]}},
-                          {'type': 'Feature',
-                           'properties': {'agent_id': 4433,
-                                          'segment': 6,
-                                          'from': 'Full Flavor Coffee Bar',
-                                          'to': 'บิ๊กซี ลำปาง (EV Station PluZ)',
-                                          'distance_m': 3556.9,
-                                          'distance_km': 3.5569,
-                                          'from_source': 'csv',
-                                          'to_source': 'csv'},
-                           'geometry': {'type': 'LineString',
-                                        'coordinates': [[99.495572, 18.288142],
-                                                        [99.495572, 18.288142],
-                                                        [99.495716, 18.288155],
-                                                        [99.495709, 18.288372],
-                                                        [99.495703, 18.288551],
-                                                        [99.495703, 18.288575],
-                                                        [99.496109, 18.288535],
-                                                        [99.496194, 18.288527],
-                                                        [99.496382, 18.288508],
-                                                        [99.496837, 18.288567],
-                                                        [99.496851, 18.288484],
-                                                        [99.496924, 18.28822],
-                                                        [99.496964, 18.288098],
-                                                        [99.497164, 18.288067],
-                                                        [99.497276, 18.287516],
-                                                        [99.497275, 18.287262],
-                                                        [99.497286, 18.287019],
-                                                        [99.497337, 18.286518],
-                                                        [99.497407, 18.285629],
-                                                        [99.496557, 18.285319],
-                                                        [99.496418, 18.285268],
-                                                        [99.496254, 18.285206],
-                                                        [99.49578, 18.285028],
-                                                        [99.495666, 18.284985],
-                                                        [99.495286, 18.284842],
-                                                        [99.494822, 18.284671],
-                                                        [99.494715, 18.284626],
-                                                        [99.493171, 18.284045],
-                                                        [99.493113, 18.28402],
-                                                        [99.492601, 18.283827],
-                                                        [99.492519, 18.283796],
-                                                        [99.491976, 18.283588],
-                                                        [99.491895, 18.283557],
-                                                        [99.491434, 18.283382],
-                                                        [99.49114, 18.28327],
-                                                        [99.490884, 18.283171],
-                                                        [99.490305, 18.282951],
-                                                        [99.49024, 18.282926],
-                                                        [99.489347, 18.282585],
-                                                        [99.489072, 18.28248],
-                                                        [99.488625, 18.282311],
-                                                        [99.488274, 18.282175],
-                                                        [99.487866, 18.282021],
-                                                        [99.487837, 18.282011],
-                                                        [99.487702, 18.281959],
-                                                        [99.488168, 18.280908],
-                                                        [99.488536, 18.280083],
-                                                        [99.488655, 18.279814],
-                                                        [99.488666, 18.279789],
-                                                        [99.488714, 18.279667],
-                                                        [99.488536, 18.279534],
-                                                        [99.488295, 18.279356],
-                                                        [99.487813, 18.279008],
-                                                        [99.486621, 18.278149],
-                                                        [99.486075, 18.277755],
-                                                        [99.485463, 18.277314],
-                                                        [99.485133, 18.277078],
-                                                        [99.484958, 18.276953],
-                                                        [99.484736, 18.276793],
-                                                        [99.484708, 18.276773],
-                                                        [99.484023, 18.276283],
-                                                        [99.483613, 18.275984],
-                                                        [99.483282, 18.275508],
-                                                        [99.483147, 18.275413],
-                                                        [99.482975, 18.27529],
-                                                        [99.482611, 18.275033],
-                                                        [99.482345, 18.274846],
-                                                        [99.482231, 18.274766],
-                                                        [99.482168, 18.274722],
-                                                        [99.482068, 18.274651],
-                                                        [99.481906, 18.274538],
-                                                        [99.481247, 18.274073],
-                                                        [99.481017, 18.27391],
-                                                        [99.480955, 18.273868],
-                                                        [99.479938, 18.27311],
-                                                        [99.479852, 18.273074],
-                                                        [99.479777, 18.273094],
-                                                        [99.479637, 18.273227],
-                                                        [99.47957, 18.273352],
-                                                        [99.479573, 18.273441],
-                                                        [99.479628, 18.273509],
-                                                        [99.481608, 18.274916],
-                                                        [99.482014, 18.275205],
-                                                        [99.482421, 18.275499],
-                                                        [99.482605, 18.275638]]}},
-                          {'type': 'Feature',
-                           'properties': {'agent_id': 4433,
-                                          'segment': 7,
-                                          'from': 'บิ๊กซี ลำปาง (EV Station PluZ)',
-                                          'to': 'สถานีรถไฟนครลำปาง',
-                                          'distance_m': 1331.2,
-                                          'distance_km': 1.3312,
-                                          'from_source': 'csv',
-                                          'to_source': 'csv'},
-                           'geometry': {'type': 'LineString',
-                                        'coordinates': [[99.482605, 18.275638],
-                                                        [99.482421, 18.275499],
-                                                        [99.48233, 18.275569],
-                                                        [99.482241, 18.275685],
-                                                        [99.48219, 18.27575],
-                                                        [99.482072, 18.275952],
-                                                        [99.481931, 18.276135],
-                                                        [99.481839, 18.276255],
-                                                        [99.481774, 18.27634],
-                                                        [99.481509, 18.276598],
-                                                        [99.481411, 18.276679],
-                                                        [99.481133, 18.276909],
-                                                        [99.48108, 18.276961],
-                                                        [99.481011, 18.27705],
-                                                        [99.480815, 18.277324],
-                                                        [99.480677, 18.27756],
-                                                        [99.480476, 18.277965],
-                                                        [99.480051, 18.279053],
-                                                        [99.479113, 18.278726],
-                                                        [99.47876, 18.278641],
-                                                        [99.478451, 18.2786],
-                                                        [99.478394, 18.2786],
-                                                        [99.47815, 18.2786],
-                                                        [99.477907, 18.278629],
-                                                        [99.477142, 18.278842],
-                                                        [99.477108, 18.278851],
-                                                        [99.47682, 18.278943],
-                                                        [99.47626, 18.279121],
-                                                        [99.47548, 18.279433],
-                                                        [99.475445, 18.279447],
-                                                        [99.474458, 18.279885],
-                                                        [99.473904, 18.280155],
-                                                        [99.473355, 18.280422],
-                                                        [99.473339, 18.280405],
-                                                        [99.47332, 18.28039],
-                                                        [99.473298, 18.280379],
-                                                        [99.473274, 18.280373],
-                                                        [99.47325, 18.280372],
-                                                        [99.473069, 18.280092],
-                                                        [99.472974, 18.279944],
-                                                        [99.473033, 18.27991]]}},
-                          {'type': 'Feature',
-                           'properties': {'agent_id': 4433,
-                                          'segment': 8,
-                                          'from': 'สถานีรถไฟนครลำปาง',
-                                          'to': 'Baan Phraya Suren by Madame Musur',
-                                          'distance_m': 559.7,
-                                          'distance_km': 0.5597000000000001,
-                                          'from_source': 'csv',
-                                          'to_source': 'csv'},
-                           'geometry': {'type': 'LineString',
-                                        'coordinates': [[99.473033, 18.27991],
-                                                        [99.472974, 18.279944],
-                                                        [99.472856, 18.280014],
-                                                        [99.473142, 18.280441],
-                                                        [99.473133, 18.280469],
-                                                        [99.473132, 18.280498],
-                                                        [99.473138, 18.280526],
-                                                        [99.473153, 18.280553],
-                                                        [99.473174, 18.280576],
-                                                        [99.4732, 18.280593],
-                                                        [99.473231, 18.280602],
-                                                        [99.473263, 18.280604],
-                                                        [99.473294, 18.280598],
-                                                        [99.473322, 18.280584],
-                                                        [99.473633, 18.280982],
-                                                        [99.473789, 18.281159],
-                                                        [99.474055, 18.28155],
-                                                        [99.474151, 18.28169],
-                                                        [99.474212, 18.281765],
-                                                        [99.474451, 18.282107],
-                                                        [99.474569, 18.282273],
-                                                        [99.474698, 18.282453],
-                                                        [99.474914, 18.282743],
-                                                        [99.474923, 18.282758],
-                                                        [99.475216, 18.28315],
-                                                        [99.474835, 18.283415],
-                                                        [99.474446, 18.283685]]}},
-                          {'type': 'Feature',
-                           'properties': {'agent_id': 4433,
-                                          'segment': 9,
-                                          'from': 'Baan Phraya Suren by Madame Musur',
-                                          'to': 'สะพานดำ',
-                                          'distance_m': 1606.8,
-                                          'distance_km': 1.6068,
-                                          'from_source': 'csv',
-                                          'to_source': 'csv'},
-                           'geometry': {'type': 'LineString',
-                                        'coordinates': [[99.474446, 18.283685],
-                                                        [99.474147, 18.283893],
-                                                        [99.473875, 18.284083],
-                                                        [99.473518, 18.284331],
-                                                        [99.473486, 18.284353],
-                                                        [99.473319, 18.284469],
-                                                        [99.472979, 18.284705],
-                                                        [99.472083, 18.285329],
-                                                        [99.470955, 18.286113],
-                                                        [99.470902, 18.28615],
-                                                        [99.470144, 18.286677],
-                                                        [99.46995, 18.286826],
-                                                        [99.469624, 18.287076],
-                                                        [99.468937, 18.287603],
-                                                        [99.468724, 18.287462],
-                                                        [99.468424, 18.287268],
-                                                        [99.468303, 18.287172],
-                                                        [99.468169, 18.287014],
-                                                        [99.468083, 18.28689],
-                                                        [99.467855, 18.286466],
-                                                        [99.467788, 18.286282],
-                                                        [99.467681, 18.286018],
-                                                        [99.467666, 18.28598],
-                                                        [99.467487, 18.285593],
-                                                        [99.467214, 18.285139],
-                                                        [99.467122, 18.285038],
-                                                        [99.466963, 18.284864],
-                                                        [99.466746, 18.284634],
-                                                        [99.466618, 18.284475],
-                                                        [99.46642, 18.28421],
-                                                        [99.466178, 18.283904],
-                                                        [99.465926, 18.28349],
-                                                        [99.465801, 18.283271],
-                                                        [99.4658, 18.282913],
-                                                        [99.465448, 18.282895],
-                                                        [99.465309, 18.282919],
-                                                        [99.465134, 18.283031],
-                                                        [99.464625, 18.283354],
-                                                        [99.464185, 18.283672],
-                                                        [99.464476, 18.284041]]}},
-                          {'type': 'Feature',
-                           'properties': {'agent_id': 4433,
-                                          'segment': 10,
-                                          'from': 'สะพานดำ',
-                                          'to': 'กาดกองต้า',
-                                          'distance_m': 4873.4,
-                                          'distance_km': 4.873399999999999,
-                                          'from_source': 'csv',
-                                          'to_source': 'csv'},
-                           'geometry': {'type': 'LineString',
-                                        'coordinates': [[99.464476, 18.284041],
-                                                        [99.464185, 18.283672],
-                                                        [99.464625, 18.283354],
-                                                        [99.465134, 18.283031],
-                                                        [99.465309, 18.282919],
-                                                        [99.465448, 18.282895],
-                                                        [99.4658, 18.282913],
-                                                        [99.465801, 18.283271],
-                                                        [99.465926, 18.28349],
-                                                        [99.466178, 18.283904],
-                                                        [99.46642, 18.28421],
-                                                        [99.467547, 18.283548],
-                                                        [99.46765, 18.283491],
-                                                        [99.467982, 18.283319],
-                                                        [99.468805, 18.282878],
-                                                        [99.468838, 18.28286],
-                                                        [99.469216, 18.282662],
-                                                        [99.469497, 18.282507],
-                                                        [99.470676, 18.281882],
-                                                        [99.470963, 18.281721],
-                                                        [99.471385, 18.2815],
-                                                        [99.471739, 18.281303],
-                                                        [99.472249, 18.28102],
-                                                        [99.473138, 18.280526],
-                                                        [99.473153, 18.280553],
-                                                        [99.473174, 18.280576],
-                                                        [99.4732, 18.280593],
-                                                        [99.473231, 18.280602],
-                                                        [99.473263, 18.280604],
-                                                        [99.473294, 18.280598],
-                                                        [99.473322, 18.280584],
-                                                        [99.473343, 18.280568],
-                                                        [99.47336, 18.280547],
-                                                        [99.473371, 18.280523],
-                                                        [99.473376, 18.280497],
-                                                        [99.473375, 18.280471],
-                                                        [99.473368, 18.280446],
-                                                        [99.473355, 18.280422],
-                                                        [99.473904, 18.280155],
-                                                        [99.474458, 18.279885],
-                                                        [99.475445, 18.279447],
-                                                        [99.47548, 18.279433],
-                                                        [99.47626, 18.279121],
-                                                        [99.47682, 18.278943],
-                                                        [99.477108, 18.278851],
-                                                        [99.477142, 18.278842],
-                                                        [99.477907, 18.278629],
-                                                        [99.47815, 18.2786],
-                                                        [99.478394, 18.2786],
-                                                        [99.478451, 18.2786],
-                                                        [99.47876, 18.278641],
-                                                        [99.479113, 18.278726],
-                                                        [99.480051, 18.279053],
-                                                        [99.480307, 18.279124],
-                                                        [99.480798, 18.279312],
-                                                        [99.481413, 18.279548],
-                                                        [99.481808, 18.2797],
-                                                        [99.482287, 18.279884],
-                                                        [99.482372, 18.279917],
-                                                        [99.482607, 18.280007],
-                                                        [99.482679, 18.280034],
-                                                        [99.483158, 18.280218],
-                                                        [99.483206, 18.280237],
-                                                        [99.484351, 18.280676],
-                                                        [99.484725, 18.280813],
-                                                        [99.485181, 18.280992],
-                                                        [99.485237, 18.28101],
-                                                        [99.485935, 18.281281],
-                                                        [99.486176, 18.281376],
-                                                        [99.486312, 18.281425],
-                                                        [99.486438, 18.281473],
-                                                        [99.486728, 18.281584],
-                                                        [99.487447, 18.281859],
-                                                        [99.487578, 18.28191],
-                                                        [99.487702, 18.281959],
-                                                        [99.487837, 18.282011],
-                                                        [99.487866, 18.282021],
-                                                        [99.488274, 18.282175],
-                                                        [99.488625, 18.282311],
-                                                        [99.489072, 18.28248],
-                                                        [99.489347, 18.282585],
-                                                        [99.49024, 18.282926],
-                                                        [99.490305, 18.282951],
-                                                        [99.490884, 18.283171],
-                                                        [99.49114, 18.28327],
-                                                        [99.491434, 18.283382],
-                                                        [99.491895, 18.283557],
-                                                        [99.491976, 18.283588],
-                                                        [99.492519, 18.283796],
-                                                        [99.492601, 18.283827],
-                                                        [99.493113, 18.28402],
-                                                        [99.493171, 18.284045],
-                                                        [99.494715, 18.284626],
-                                                        [99.494822, 18.284671],
-                                                        [99.495286, 18.284842],
-                                                        [99.495666, 18.284985],
-                                                        [99.49578, 18.285028],
-                                                        [99.496254, 18.285206],
-                                                        [99.496418, 18.285268],
-                                                        [99.496557, 18.285319],
-                                                        [99.497407, 18.285629],
-                                                        [99.497889, 18.285805],
-                                                        [99.498171, 18.285908],
-                                                        [99.498345, 18.285971],
-                                                        [99.498504, 18.286029],
-                                                        [99.49914, 18.286261],
-                                                        [99.499421, 18.286363],
-                                                        [99.50006, 18.286597],
-                                                        [99.500104, 18.286613],
-                                                        [99.500013, 18.287196],
-                                                        [99.499989, 18.287332],
-                                                        [99.499982, 18.287371],
-                                                        [99.499968, 18.28742],
-                                                        [99.499893, 18.28769],
-                                                        [99.49984, 18.287914],
-                                                        [99.499773, 18.28823],
-                                                        [99.499559, 18.288815],
-                                                        [99.49954, 18.288869],
-                                                        [99.499521, 18.288916],
-                                                        [99.499341, 18.289369],
-                                                        [99.499231, 18.289657],
-                                                        [99.499149, 18.289885],
-                                                        [99.499071, 18.290101],
-                                                        [99.499054, 18.290148],
-                                                        [99.498874, 18.290856],
-                                                        [99.498757, 18.291196],
-                                                        [99.498638, 18.291484]]}}]},
- 'lamphun': {'type': 'FeatureCollection',
-             'features': [{'type': 'Feature',
-                           'properties': {'agent_id': 4709,
-                                          'segment': 1,
-                                          'from': 'โรงแรมพญาอิน ลำพูน Phaya Inn',
-                                          'to': 'อ่างเก็บน้ำแม่วังส้าน',
-                                          'distance_m': 31152.2,
-                                          'distance_km': 31.1522,
-                                          'from_source': 'csv',
-                                          'to_source': 'csv'},
-                           'geometry': {'type': 'LineString',
-                                        'coordinates': [[99.015772, 18.582782],
-                                                        [99.014972, 18.582571],
-                                                        [99.014593, 18.582473],
-                                                        [99.014091, 18.582344],
-                                                        [99.013529, 18.582318],
-                                                        [99.013492, 18.582311],
-                                                        [99.013065, 18.582234],
-                                                        [99.012569, 18.582074],
-                                                        [99.011906, 18.581823],
-                                                        [99.011082, 18.581622],
-                                                        [99.011009, 18.581592],
-                                                        [99.010953, 18.581569],
-                                                        [99.010844, 18.581523],
-                                                        [99.010131, 18.580829],
-                                                        [99.010008, 18.580697],
-                                                        [99.009824, 18.580566],
-                                                        [99.009583, 18.580423],
-                                                        [99.009592, 18.580366],
-                                                        [99.009617, 18.580271],
-                                                        [99.009358, 18.579233],
-                                                        [99.009236, 18.578603],
-                                                        [99.009207, 18.578268],
-                                                        [99.009324, 18.576963],
-                                                        [99.009324, 18.576384],
-                                                        [99.009307, 18.576237],
-                                                        [99.009257, 18.576042],
-                                                        [99.009235, 18.575937],
-                                                        [99.00896, 18.575021],
-                                                        [99.008872, 18.574731],
-                                                        [99.008794, 18.574468],
-                                                        [99.008763, 18.574367],
-                                                        [99.008709, 18.574189],
-                                                        [99.008671, 18.574073],
-                                                        [99.008459, 18.573365],
-                                                        [99.008369, 18.573057],
-                                                        [99.008316, 18.572931],
-                                                        [99.008234, 18.572803],
-                                                        [99.008156, 18.572692],
-                                                        [99.008036, 18.572586],
-                                                        [99.00788, 18.572497],
-                                                        [99.007768, 18.572441],
-                                                        [99.007639, 18.572395],
-                                                        [99.007525, 18.572372],
-                                                        [99.007416, 18.572367],
-                                                        [99.007319, 18.57237],
-                                                        [99.007246, 18.572381],
-                                                        [99.007141, 18.572394],
-                                                        [99.007038, 18.572426],
-                                                        [99.006849, 18.572491],
-                                                        [99.006111, 18.57277],
-                                                        [99.005303, 18.573067],
-                                                        [99.005125, 18.573152],
-                                                        [99.004894, 18.573293],
-                                                        [99.004702, 18.573418],
-                                                        [99.00428, 18.573731],
-                                                        [99.004067, 18.573916],
-                                                        [99.003845, 18.574105],
-                                                        [99.003701, 18.574269],
-                                                        [99.003491, 18.574254],
-                                                        [99.003366, 18.574276],
-                                                        [99.002892, 18.574336],
-                                                        [99.00269, 18.574329],
-                                                        [99.002599, 18.574317],
-                                                        [99.002508, 18.574286],
-                                                        [99.002423, 18.574224],
-                                                        [99.002051, 18.573848],
-                                                        [99.001829, 18.573596],
-                                                        [99.001766, 18.573524],
-                                                        [99.00144, 18.57318],
-                                                        [99.00122, 18.572967],
-                                                        [99.001033, 18.572781],
-                                                        [99.000882, 18.572628],
-                                                        [99.000767, 18.572526],
-                                                        [99.000692, 18.572459],
-                                                        [99.000368, 18.572208],
-                                                        [99.000068, 18.571997],
-                                                        [98.999944, 18.571923],
-                                                        [98.999923, 18.571909],
-                                                        [98.999806, 18.571838],
-                                                        [98.999668, 18.57175],
-                                                        [98.999507, 18.571644],
-                                                        [98.999261, 18.571468],
-                                                        [98.999032, 18.57129],
-                                                        [98.998816, 18.5711],
-                                                        [98.998534, 18.570866],
-                                                        [98.998136, 18.570557],
-                                                        [98.998045, 18.570494],
-                                                        [98.997998, 18.570457],
-                                                        [98.997724, 18.57024],
-                                                        [98.997387, 18.569973],
-                                                        [98.997282, 18.569888],
-                                                        [98.996529, 18.569235],
-                                                        [98.996248, 18.56899],
-                                                        [98.99619, 18.568938],
-                                                        [98.99586, 18.568638],
-                                                        [98.99572, 18.568504],
-                                                        [98.99568, 18.568465],
-                                                        [98.995462, 18.568231],
-                                                        [98.995375, 18.568147],
-                                                        [98.99519, 18.567951],
-                                                        [98.995104, 18.567862],
-                                                        [98.994946, 18.567675],
-                                                        [98.994856, 18.56757],
-                                                        [98.994756, 18.567451],
-                                                        [98.994585, 18.567249],
-                                                        [98.994389, 18.567004],
-                                                        [98.993952, 18.566399],
-                                                        [98.993898, 18.566325],
-                                                        [98.993746, 18.566075],
-                                                        [98.992996, 18.56509],
-                                                        [98.992901, 18.564953],
-                                                        [98.992659, 18.56468],
-                                                        [98.992624, 18.564642],
-                                                        [98.992195, 18.564067],
-                                                        [98.991822, 18.563531],
-                                                        [98.991687, 18.563275],
-                                                        [98.991495, 18.562904],
-                                                        [98.991361, 18.562701],
-                                                        [98.991243, 18.562533],
-                                                        [98.991211, 18.562497],
-                                                        [98.991109, 18.562385],
-                                                        [98.990927, 18.562253],
-                                                        [98.990634, 18.562088],
-                                                        [98.990456, 18.561988],
-                                                        [98.990435, 18.561978],
-                                                        [98.990252, 18.561891],
-                                                        [98.990207, 18.561866],
-                                                        [98.989419, 18.561403],
-                                                        [98.988829, 18.561039],
-                                                        [98.988406, 18.560775],
-                                                        [98.988288, 18.560697],
-                                                        [98.987669, 18.560278],
-                                                        [98.985545, 18.558887],
-                                                        [98.984691, 18.558308],
-                                                        [98.984434, 18.558139],
-                                                        [98.983695, 18.557652],
-                                                        [98.983239, 18.55735],
-                                                        [98.983175, 18.557319],
-                                                        [98.982379, 18.5568],
-                                                        [98.982224, 18.556671],
-                                                        [98.981982, 18.55647],
-                                                        [98.981334, 18.555839],
-                                                        [98.98109, 18.555612],
-                                                        [98.981053, 18.555564],
-                                                        [98.980736, 18.555261],
-                                                        [98.980591, 18.555124],
-                                                        [98.980514, 18.55505],
-                                                        [98.98029, 18.554837],
-                                                        [98.980075, 18.554619],
-                                                        [98.979884, 18.554434],
-                                                        [98.979399, 18.553966],
-                                                        [98.978879, 18.55346],
-                                                        [98.978361, 18.552919],
-                                                        [98.978166, 18.552707],
-                                                        [98.977989, 18.552497],
-                                                        [98.977914, 18.552397],
-                                                        [98.977833, 18.55227],
-                                                        [98.977793, 18.552207],
-                                                        [98.977607, 18.551946],
-                                                        [98.977495, 18.551789],
-                                                        [98.97746, 18.55174],
-                                                        [98.977239, 18.551431],
-                                                        [98.977199, 18.551368],
-                                                        [98.977046, 18.551132],
-                                                        [98.976883, 18.550881],
-                                                        [98.976436, 18.550191],
-                                                        [98.976249, 18.549907],
-                                                        [98.976054, 18.549611],
-                                                        [98.975966, 18.54948],
-                                                        [98.975821, 18.549266],
-                                                        [98.975257, 18.548503],
-                                                        [98.974881, 18.548013],
-                                                        [98.973878, 18.546918],
-                                                        [98.973766, 18.546803],
-                                                        [98.973342, 18.54641],
-                                                        [98.972818, 18.546025],
-                                                        [98.972419, 18.545749],
-                                                        [98.972032, 18.545491],
-                                                        [98.97183, 18.545298],
-                                                        [98.971563, 18.545044],
-                                                        [98.971251, 18.544807],
-                                                        [98.970952, 18.544621],
-                                                        [98.970745, 18.544474],
-                                                        [98.970452, 18.544358],
-                                                        [98.970259, 18.544296],
-                                                        [98.96994, 18.544232],
-                                                        [98.969094, 18.544058],
-                                                        [98.968685, 18.543978],
-                                                        [98.968564, 18.543951],
-                                                        [98.968171, 18.543859],
-                                                        [98.967042, 18.543636],
-                                                        [98.966767, 18.543589],
-                                                        [98.966481, 18.543578],
-                                                        [98.966114, 18.543539],
-                                                        [98.964634, 18.543573],
-                                                        [98.964364, 18.543576],
-                                                        [98.963311, 18.543563],
-                                                        [98.962294, 18.543399],
-                                                        [98.961795, 18.543276],
-                                                        [98.961037, 18.542977],
-                                                        [98.960726, 18.542937],
-                                                        [98.960455, 18.542947],
-                                                        [98.959973, 18.542954],
-                                                        [98.959027, 18.542777],
-                                                        [98.958958, 18.542764],
-                                                        [98.957407, 18.542438],
-                                                        [98.956909, 18.542312],
-                                                        [98.956517, 18.542214],
-                                                        [98.955634, 18.541926],
-                                                        [98.955099, 18.541823],
-                                                        [98.954917, 18.541807],
-                                                        [98.953795, 18.54165],
-                                                        [98.953597, 18.541592],
-                                                        [98.953274, 18.541488],
-                                                        [98.952612, 18.541247],
-                                                        [98.951643, 18.540893],
-                                                        [98.950963, 18.540717],
-                                                        [98.950759, 18.540668],
-                                                        [98.948818, 18.540253],
-                                                        [98.948289, 18.540269],
-                                                        [98.946853, 18.540592],
-                                                        [98.945579, 18.540878],
-                                                        [98.944226, 18.541183],
-                                                        [98.943401, 18.541369],
-                                                        [98.942602, 18.541586],
-                                                        [98.942329, 18.541704],
-                                                        [98.942068, 18.541896],
-                                                        [98.94186, 18.542109],
-                                                        [98.941471, 18.542598],
-                                                        [98.941087, 18.543108],
-                                                        [98.940891, 18.543286],
-                                                        [98.940702, 18.543394],
-                                                        [98.940425, 18.543441],
-                                                        [98.940055, 18.5434],
-                                                        [98.939793, 18.543279],
-                                                        [98.939655, 18.543178],
-                                                        [98.939544, 18.543049],
-                                                        [98.939399, 18.542744],
-                                                        [98.939206, 18.542281],
-                                                        [98.938877, 18.541464],
-                                                        [98.938795, 18.541275],
-                                                        [98.938617, 18.540825],
-                                                        [98.938597, 18.540725],
-                                                        [98.938583, 18.540626],
-                                                        [98.938584, 18.540548],
-                                                        [98.938615, 18.540341],
-                                                        [98.938649, 18.540098],
-                                                        [98.938755, 18.53938],
-                                                        [98.939217, 18.537389],
-                                                        [98.939503, 18.536033],
-                                                        [98.939653, 18.535258],
-                                                        [98.93972, 18.53491],
-                                                        [98.939761, 18.5347],
-                                                        [98.94027, 18.532584],
-                                                        [98.940364, 18.531931],
-                                                        [98.94046, 18.531361],
-                                                        [98.940472, 18.531069],
-                                                        [98.940476, 18.530815],
-                                                        [98.94049, 18.529821],
-                                                        [98.94049, 18.528966],
-                                                        [98.940493, 18.528809],
-                                                        [98.940488, 18.528636],
-                                                        [98.940452, 18.528473],
-                                                        [98.940329, 18.528081],
-                                                        [98.940201, 18.527666],
-                                                        [98.939971, 18.526921],
-                                                        [98.939864, 18.526584],
-                                                        [98.939741, 18.526113],
-                                                        [98.9397, 18.525965],
-                                                        [98.939648, 18.52564],
-                                                        [98.939637, 18.525455],
-                                                        [98.939619, 18.525202],
-                                                        [98.939616, 18.525111],
-                                                        [98.93963, 18.524562],
-                                                        [98.939632, 18.524205],
-                                                        [98.939627, 18.524056],
-                                                        [98.939631, 18.523917],
-                                                        [98.939667, 18.523734],
-                                                        [98.939779, 18.523361],
-                                                        [98.939905, 18.522992],
-                                                        [98.940181, 18.521955],
-                                                        [98.940278, 18.521512],
-                                                        [98.940365, 18.520969],
-                                                        [98.940424, 18.520696],
-                                                        [98.940463, 18.520589],
-                                                        [98.940589, 18.520254],
-                                                        [98.940806, 18.519769],
-                                                        [98.941144, 18.519091],
-                                                        [98.941288, 18.518799],
-                                                        [98.941453, 18.518443],
-                                                        [98.941529, 18.518254],
-                                                        [98.941629, 18.517895],
-                                                        [98.941681, 18.517708],
-                                                        [98.941707, 18.517593],
-                                                        [98.941769, 18.517369],
-                                                        [98.941787, 18.516918],
-                                                        [98.94179, 18.516117],
-                                                        [98.941783, 18.515654],
-                                                        [98.941788, 18.513999],
-                                                        [98.941799, 18.512557],
-                                                        [98.941799, 18.512205],
-                                                        [98.941799, 18.511946],
-                                                        [98.941805, 18.511859],
-                                                        [98.941853, 18.511621],
-                                                        [98.941898, 18.511477],
-                                                        [98.942169, 18.510965],
-                                                        [98.942405, 18.510593],
-                                                        [98.94253, 18.510417],
-                                                        [98.94257, 18.510368],
-                                                        [98.942979, 18.509601],
-                                                        [98.943095, 18.509316],
-                                                        [98.943323, 18.508737],
-                                                        [98.943499, 18.508242],
-                                                        [98.943521, 18.508136],
-                                                        [98.943605, 18.50773],
-                                                        [98.943643, 18.507399],
-                                                        [98.943654, 18.507297],
-                                                        [98.943711, 18.50667],
-                                                        [98.943702, 18.506311],
-                                                        [98.943659, 18.505964],
-                                                        [98.943521, 18.505476],
-                                                        [98.943428, 18.50529],
-                                                        [98.943308, 18.505095],
-                                                        [98.943119, 18.504825],
-                                                        [98.942514, 18.504295],
-                                                        [98.942132, 18.50396],
-                                                        [98.941638, 18.503522],
-                                                        [98.941539, 18.503397],
-                                                        [98.94151, 18.50336],
-                                                        [98.941456, 18.503197],
-                                                        [98.941477, 18.502006],
-                                                        [98.941492, 18.501851],
-                                                        [98.94151, 18.501671],
-                                                        [98.941617, 18.501416],
-                                                        [98.941907, 18.501081],
-                                                        [98.942027, 18.500976],
-                                                        [98.94255, 18.500511],
-                                                        [98.942679, 18.500287],
-                                                        [98.942692, 18.500178],
-                                                        [98.942705, 18.500021],
-                                                        [98.94269, 18.499615],
-                                                        [98.942665, 18.499379],
-                                                        [98.942647, 18.499137],
-                                                        [98.94269, 18.498649],
-                                                        [98.942733, 18.498293],
-                                                        [98.942668, 18.498018],
-                                                        [98.942505, 18.497804],
-                                                        [98.942313, 18.497553],
-                                                        [98.941848, 18.497009],
-                                                        [98.941703, 18.496828],
-                                                        [98.941381, 18.496258],
-                                                        [98.94122, 18.49579],
-                                                        [98.941166, 18.49543],
-                                                        [98.941156, 18.495312],
-                                                        [98.941145, 18.494365],
-                                                        [98.941048, 18.493785],
-                                                        [98.940798, 18.493047],
-                                                        [98.94065, 18.492609],
-                                                        [98.940566, 18.492361],
-                                                        [98.940163, 18.491363],
-                                                        [98.939836, 18.490763],
-                                                        [98.939692, 18.490535],
-                                                        [98.939289, 18.489896],
-                                                        [98.939181, 18.489726],
-                                                        [98.939071, 18.48947],
-                                                        [98.938988, 18.489278],
-                                                        [98.938706, 18.488406],
-                                                        [98.938529, 18.487819],
-                                                        [98.938483, 18.487695],
-                                                        [98.93843, 18.487408],
-                                                        [98.938217, 18.486724],
-                                                        [98.938096, 18.486326],
-                                                        [98.938067, 18.486223],
-                                                        [98.937918, 18.485737],
-                                                        [98.937733, 18.485128],
-                                                        [98.93765, 18.484953],
-                                                        [98.937611, 18.484872],
-                                                        [98.937463, 18.484204],
-                                                        [98.937197, 18.483187],
-                                                        [98.937057, 18.48268],
-                                                        [98.937029, 18.482579],
-                                                        [98.937012, 18.482519],
-                                                        [98.936852, 18.481985],
-                                                        [98.936697, 18.481592],
-                                                        [98.93662, 18.481436],
-                                                        [98.936531, 18.481255],
-                                                        [98.935809, 18.480235],
-                                                        [98.935644, 18.480037],
-                                                        [98.935513, 18.47988],
-                                                        [98.935033, 18.4795],
-                                                        [98.934826, 18.479323],
-                                                        [98.934718, 18.479176],
-                                                        [98.934637, 18.479035],
-                                                        [98.93455, 18.478808],
-                                                        [98.934421, 18.478167],
-                                                        [98.934387, 18.478024],
-                                                        [98.934314, 18.477872],
-                                                        [98.934196, 18.477769],
-                                                        [98.933593, 18.477238],
-                                                        [98.932144, 18.475944],
-                                                        [98.932066, 18.475882],
-                                                        [98.931781, 18.475629],
-                                                        [98.92852, 18.472693],
-                                                        [98.927777, 18.472057],
-                                                        [98.926703, 18.471108],
-                                                        [98.926377, 18.470804],
-                                                        [98.925596, 18.470114],
-                                                        [98.924751, 18.469384],
-                                                        [98.924432, 18.469083],
-                                                        [98.923898, 18.468605],
-                                                        [98.922975, 18.46778],
-                                                        [98.922692, 18.467523],
-                                                        [98.921828, 18.466721],
-                                                        [98.921449, 18.466331],
-                                                        [98.920188, 18.465054],
-                                                        [98.919911, 18.464762],
-                                                        [98.919848, 18.46471],
-                                                        [98.919635, 18.464488],
-                                                        [98.919493, 18.464341],
-                                                        [98.918461, 18.463275],
-                                                        [98.91814, 18.462943],
-                                                        [98.916812, 18.461572],
-                                                        [98.916502, 18.461252],
-                                                        [98.91636, 18.461105],
-                                                        [98.915526, 18.460254],
-                                                        [98.914645, 18.459334],
-                                                        [98.913583, 18.45828],
-                                                        [98.913029, 18.457812],
-                                                        [98.912579, 18.457539],
-                                                        [98.911875, 18.45722],
-                                                        [98.910917, 18.456972],
-                                                        [98.910455, 18.456852],
-                                                        [98.909989, 18.45673],
-                                                        [98.909422, 18.456582],
-                                                        [98.908781, 18.456443],
-                                                        [98.906221, 18.45586],
-                                                        [98.905783, 18.455779],
-                                                        [98.904877, 18.4556],
-                                                        [98.901684, 18.454961],
-                                                        [98.901007, 18.454827],
-                                                        [98.89966, 18.45456],
-                                                        [98.899235, 18.454482],
-                                                        [98.898018, 18.454234],
-                                                        [98.896172, 18.453858],
-                                                        [98.893727, 18.453359],
-                                                        [98.893502, 18.453283],
-                                                        [98.893207, 18.453144],
-                                                        [98.892936, 18.452993],
-                                                        [98.892752, 18.45285],
-                                                        [98.892405, 18.452543],
-                                                        [98.892211, 18.452326],
-                                                        [98.891449, 18.451264],
-                                                        [98.890526, 18.44994],
-                                                        [98.890139, 18.449358],
-                                                        [98.889832, 18.448907],
-                                                        [98.889631, 18.448612],
-                                                        [98.889165, 18.448027],
-                                                        [98.88886, 18.447716],
-                                                        [98.888567, 18.447495],
-                                                        [98.888339, 18.447335],
-                                                        [98.888201, 18.447251],
-                                                        [98.888016, 18.447158],
-                                                        [98.887213, 18.446781],
-                                                        [98.886791, 18.446583],
-                                                        [98.885772, 18.446104],
-                                                        [98.884827, 18.44566],
-                                                        [98.884454, 18.445485],
-                                                        [98.884182, 18.445357],
-                                                        [98.882864, 18.444739],
-                                                        [98.881954, 18.444311],
-                                                        [98.881526, 18.44411],
-                                                        [98.880731, 18.443722],
-                                                        [98.880243, 18.443402],
-                                                        [98.879963, 18.443119],
-                                                        [98.87965, 18.442788],
-                                                        [98.879394, 18.44243],
-                                                        [98.878884, 18.441554],
-                                                        [98.877739, 18.439928],
-                                                        [98.877606, 18.439765],
-                                                        [98.877545, 18.439691],
-                                                        [98.877339, 18.439483],
-                                                        [98.877052, 18.439215],
-                                                        [98.876821, 18.439042],
-                                                        [98.876556, 18.438859],
-                                                        [98.875958, 18.438457],
-                                                        [98.875113, 18.437887],
-                                                        [98.874823, 18.437681],
-                                                        [98.874576, 18.437485],
-                                                        [98.87437, 18.437312],
-                                                        [98.874161, 18.437124],
-                                                        [98.872372, 18.435385],
-                                                        [98.872861, 18.435086],
-                                                        [98.876747, 18.432743],
-                                                        [98.876951, 18.432617],
-                                                        [98.878422, 18.431777],
-                                                        [98.879363, 18.431239],
-                                                        [98.879933, 18.430925],
-                                                        [98.880517, 18.430602],
-                                                        [98.880695, 18.430504],
-                                                        [98.881064, 18.430301],
-                                                        [98.881598, 18.429992],
-                                                        [98.882072, 18.429703],
-                                                        [98.882379, 18.429517],
-                                                        [98.882612, 18.42935],
-                                                        [98.883201, 18.428757],
-                                                        [98.884777, 18.427169],
-                                                        [98.885226, 18.42672],
-                                                        [98.885804, 18.426378],
-                                                        [98.886386, 18.426221],
-                                                        [98.886785, 18.426168],
-                                                        [98.887051, 18.426195],
-                                                        [98.888011, 18.426548],
-                                                        [98.888308, 18.426605],
-                                                        [98.888684, 18.426554],
-                                                        [98.889442, 18.426188],
-                                                        [98.889738, 18.426045],
-                                                        [98.889803, 18.426004],
-                                                        [98.889988, 18.425886],
-                                                        [98.890169, 18.425694],
-                                                        [98.890278, 18.425569],
-                                                        [98.890664, 18.425078],
-                                                        [98.891366, 18.424147],
-                                                        [98.891448, 18.423998],
-                                                        [98.891463, 18.423855],
-                                                        [98.891487, 18.423449],
-                                                        [98.891549, 18.423267],
-                                                        [98.891679, 18.42309],
-                                                        [98.892247, 18.422428],
-                                                        [98.892652, 18.422038],
-                                                        [98.892823, 18.42186],
-                                                        [98.893069, 18.421535],
-                                                        [98.893525, 18.4208],
-                                                        [98.89361, 18.420651],
-                                                        [98.894236, 18.41949],
-                                                        [98.896512, 18.415019],
-                                                        [98.896618, 18.414945],
-                                                        [98.896743, 18.414937],
-                                                        [98.896958, 18.415037],
-                                                        [98.896956, 18.414952],
-                                                        [98.896935, 18.414091],
-                                                        [98.896941, 18.413863],
-                                                        [98.897877, 18.413644],
-                                                        [98.898527, 18.413431],
-                                                        [98.898698, 18.413426],
-                                                        [98.8988, 18.413461],
-                                                        [98.899004, 18.413466],
-                                                        [98.900216, 18.413212],
-                                                        [98.902325, 18.412601],
-                                                        [98.902636, 18.413675],
-                                                        [98.902679, 18.413879],
-                                                        [98.902689, 18.414072],
-                                                        [98.902818, 18.414291],
-                                                        [98.902941, 18.414433]]}},
-                          {'type': 'Feature',
-                           'properties': {'agent_id': 4709,
-                                          'segment': 2,
-                                          'from': 'อ่างเก็บน้ำแม่วังส้าน',
-                                          'to': 'ถ้ำจำหม่าฟ้า',
-                                          'distance_m': 26712,
-                                          'distance_km': 26.712,
-                                          'from_source': 'csv',
-                                          'to_source': 'csv'},
-                           'geometry': {'type': 'LineString',
-                                        'coordinates': [[98.902941, 18.414433],
-                                                        [98.902818, 18.414291],
-                                                        [98.902689, 18.414072],
-                                                        [98.902679, 18.413879],
-                                                        [98.902636, 18.413675],
-                                                        [98.902325, 18.412601],
-                                                        [98.900216, 18.413212],
-                                                        [98.899004, 18.413466],
-                                                        [98.8988, 18.413461],
-                                                        [98.898698, 18.413426],
-                                                        [98.898527, 18.413431],
-                                                        [98.897877, 18.413644],
-                                                        [98.896941, 18.413863],
-                                                        [98.896935, 18.414091],
-                                                        [98.896956, 18.414952],
-                                                        [98.896958, 18.415037],
-                                                        [98.897448, 18.4153],
-                                                        [98.897939, 18.415606],
-                                                        [98.899551, 18.416862],
-                                                        [98.89973, 18.417052],
-                                                        [98.905151, 18.42119],
-                                                        [98.905199, 18.421208],
-                                                        [98.905238, 18.421204],
-                                                        [98.905279, 18.421184],
-                                                        [98.905496, 18.420929],
-                                                        [98.905587, 18.420877],
-                                                        [98.905687, 18.42084],
-                                                        [98.905903, 18.420804],
-                                                        [98.905982, 18.420796],
-                                                        [98.906066, 18.42078],
-                                                        [98.906105, 18.420783],
-                                                        [98.906143, 18.420795],
-                                                        [98.906271, 18.420912],
-                                                        [98.906411, 18.42105],
-                                                        [98.90661, 18.421169],
-                                                        [98.907215, 18.42141],
-                                                        [98.907296, 18.421411],
-                                                        [98.907374, 18.421381],
-                                                        [98.907427, 18.421314],
-                                                        [98.907469, 18.421205],
-                                                        [98.907526, 18.421122],
-                                                        [98.907601, 18.421057],
-                                                        [98.907705, 18.421011],
-                                                        [98.909687, 18.420562],
-                                                        [98.911354, 18.420259],
-                                                        [98.912562, 18.420064],
-                                                        [98.913933, 18.41991],
-                                                        [98.914118, 18.419929],
-                                                        [98.914395, 18.419991],
-                                                        [98.914604, 18.420083],
-                                                        [98.914786, 18.420103],
-                                                        [98.914915, 18.420083],
-                                                        [98.91507, 18.420037],
-                                                        [98.915255, 18.42001],
-                                                        [98.915462, 18.420032],
-                                                        [98.916086, 18.420126],
-                                                        [98.916465, 18.42019],
-                                                        [98.916969, 18.420302],
-                                                        [98.917881, 18.420505],
-                                                        [98.918252, 18.420531],
-                                                        [98.91973, 18.420542],
-                                                        [98.919718, 18.417832],
-                                                        [98.91975, 18.417605],
-                                                        [98.919777, 18.417547],
-                                                        [98.91982, 18.417455],
-                                                        [98.919954, 18.41729],
-                                                        [98.921385, 18.415768],
-                                                        [98.921676, 18.415417],
-                                                        [98.924704, 18.411206],
-                                                        [98.924894, 18.410994],
-                                                        [98.925394, 18.410523],
-                                                        [98.925565, 18.410413],
-                                                        [98.925731, 18.410363],
-                                                        [98.925914, 18.410335],
-                                                        [98.927488, 18.41024],
-                                                        [98.928176, 18.410199],
-                                                        [98.928947, 18.410153],
-                                                        [98.929797, 18.410102],
-                                                        [98.930844, 18.410039],
-                                                        [98.931102, 18.410039],
-                                                        [98.931289, 18.41007],
-                                                        [98.931477, 18.410126],
-                                                        [98.932392, 18.410541],
-                                                        [98.933367, 18.410981],
-                                                        [98.93454, 18.41151],
-                                                        [98.935249, 18.411901],
-                                                        [98.936047, 18.412428],
-                                                        [98.936949, 18.413022],
-                                                        [98.937382, 18.413266],
-                                                        [98.937404, 18.413263],
-                                                        [98.938676, 18.413674],
-                                                        [98.938895, 18.413707],
-                                                        [98.939111, 18.413714],
-                                                        [98.939567, 18.413694],
-                                                        [98.939728, 18.413658],
-                                                        [98.939878, 18.413592],
-                                                        [98.940601, 18.413213],
-                                                        [98.940939, 18.413081],
-                                                        [98.941289, 18.412991],
-                                                        [98.941446, 18.412974],
-                                                        [98.941637, 18.412953],
-                                                        [98.941981, 18.412946],
-                                                        [98.943161, 18.413012],
-                                                        [98.943461, 18.413007],
-                                                        [98.94374, 18.412966],
-                                                        [98.94395, 18.412938],
-                                                        [98.944025, 18.412929],
-                                                        [98.946025, 18.412615],
-                                                        [98.946269, 18.412584],
-                                                        [98.946546, 18.412589],
-                                                        [98.946887, 18.412605],
-                                                        [98.947687, 18.412642],
-                                                        [98.948541, 18.412676],
-                                                        [98.949663, 18.412727],
-                                                        [98.949882, 18.412773],
-                                                        [98.950096, 18.412887],
-                                                        [98.950241, 18.41304],
-                                                        [98.950344, 18.413221],
-                                                        [98.950391, 18.41334],
-                                                        [98.951385, 18.415842],
-                                                        [98.951481, 18.416015],
-                                                        [98.951621, 18.416157],
-                                                        [98.951771, 18.416254],
-                                                        [98.951942, 18.416302],
-                                                        [98.954244, 18.416763],
-                                                        [98.954528, 18.416839],
-                                                        [98.954742, 18.416954],
-                                                        [98.954978, 18.417137],
-                                                        [98.956058, 18.418042],
-                                                        [98.956165, 18.418132],
-                                                        [98.956303, 18.417543],
-                                                        [98.956386, 18.41733],
-                                                        [98.956529, 18.417202],
-                                                        [98.95689, 18.416989],
-                                                        [98.957021, 18.416845],
-                                                        [98.957153, 18.416496],
-                                                        [98.957251, 18.416297],
-                                                        [98.957425, 18.416084],
-                                                        [98.957644, 18.415863],
-                                                        [98.957795, 18.415676],
-                                                        [98.957958, 18.415333],
-                                                        [98.958052, 18.415003],
-                                                        [98.958103, 18.414674],
-                                                        [98.958145, 18.414363],
-                                                        [98.958209, 18.414137],
-                                                        [98.958256, 18.413974],
-                                                        [98.958337, 18.413426],
-                                                        [98.958349, 18.412654],
-                                                        [98.958482, 18.412701],
-                                                        [98.958777, 18.412778],
-                                                        [98.959056, 18.412885],
-                                                        [98.959855, 18.413444],
-                                                        [98.9599, 18.413486],
-                                                        [98.960214, 18.413775],
-                                                        [98.960531, 18.414157],
-                                                        [98.960697, 18.414249],
-                                                        [98.961132, 18.414361],
-                                                        [98.961432, 18.414457],
-                                                        [98.961742, 18.414475],
-                                                        [98.962001, 18.414559],
-                                                        [98.962052, 18.414545],
-                                                        [98.962327, 18.414455],
-                                                        [98.962559, 18.414442],
-                                                        [98.962855, 18.414452],
-                                                        [98.963605, 18.414478],
-                                                        [98.9639, 18.414422],
-                                                        [98.964083, 18.414326],
-                                                        [98.964596, 18.414884],
-                                                        [98.964845, 18.414819],
-                                                        [98.965085, 18.414768],
-                                                        [98.965412, 18.414656],
-                                                        [98.965606, 18.41459],
-                                                        [98.966087, 18.414375],
-                                                        [98.966131, 18.414356],
-                                                        [98.966249, 18.414244],
-                                                        [98.966389, 18.414065],
-                                                        [98.966544, 18.413964],
-                                                        [98.966796, 18.413852],
-                                                        [98.966855, 18.413844],
-                                                        [98.966909, 18.413836],
-                                                        [98.966979, 18.413887],
-                                                        [98.967274, 18.414503],
-                                                        [98.967349, 18.414574],
-                                                        [98.967456, 18.4146],
-                                                        [98.967939, 18.414681],
-                                                        [98.968286, 18.414814],
-                                                        [98.968341, 18.414824],
-                                                        [98.969055, 18.415058],
-                                                        [98.969188, 18.415091],
-                                                        [98.969264, 18.415088],
-                                                        [98.970112, 18.414885],
-                                                        [98.970326, 18.414783],
-                                                        [98.970498, 18.414625],
-                                                        [98.970813, 18.41428],
-                                                        [98.971405, 18.413643],
-                                                        [98.972241, 18.412762],
-                                                        [98.972783, 18.412243],
-                                                        [98.973061, 18.412047],
-                                                        [98.973646, 18.41165],
-                                                        [98.974124, 18.411383],
-                                                        [98.974574, 18.411182],
-                                                        [98.975519, 18.410833],
-                                                        [98.975629, 18.410801],
-                                                        [98.976308, 18.410604],
-                                                        [98.97657, 18.410574],
-                                                        [98.976764, 18.410594],
-                                                        [98.977026, 18.410655],
-                                                        [98.977288, 18.410683],
-                                                        [98.977493, 18.410671],
-                                                        [98.977793, 18.410704],
-                                                        [98.978282, 18.410757],
-                                                        [98.978807, 18.410854],
-                                                        [98.979065, 18.410945],
-                                                        [98.979349, 18.411134],
-                                                        [98.979631, 18.411433],
-                                                        [98.979955, 18.411778],
-                                                        [98.980303, 18.412083],
-                                                        [98.980771, 18.412589],
-                                                        [98.980813, 18.412729],
-                                                        [98.980819, 18.412915],
-                                                        [98.980834, 18.413223],
-                                                        [98.980909, 18.413508],
-                                                        [98.980955, 18.41358],
-                                                        [98.98106, 18.413747],
-                                                        [98.981691, 18.414642],
-                                                        [98.981735, 18.41468],
-                                                        [98.981793, 18.414698],
-                                                        [98.981903, 18.414686],
-                                                        [98.982042, 18.414635],
-                                                        [98.982149, 18.414549],
-                                                        [98.982546, 18.414137],
-                                                        [98.983104, 18.413455],
-                                                        [98.983447, 18.413131],
-                                                        [98.983844, 18.412806],
-                                                        [98.984058, 18.412546],
-                                                        [98.984525, 18.411732],
-                                                        [98.98489, 18.411106],
-                                                        [98.985561, 18.410136],
-                                                        [98.986087, 18.409469],
-                                                        [98.986833, 18.408675],
-                                                        [98.987101, 18.40835],
-                                                        [98.987407, 18.407881],
-                                                        [98.987605, 18.407632],
-                                                        [98.987943, 18.407326],
-                                                        [98.988318, 18.407044],
-                                                        [98.988688, 18.406723],
-                                                        [98.989122, 18.406423],
-                                                        [98.989352, 18.406312],
-                                                        [98.989428, 18.406275],
-                                                        [98.989724, 18.406176],
-                                                        [98.990078, 18.406125],
-                                                        [98.990399, 18.406051],
-                                                        [98.990647, 18.405947],
-                                                        [98.990871, 18.405817],
-                                                        [98.991108, 18.405723],
-                                                        [98.991741, 18.405535],
-                                                        [98.992031, 18.405413],
-                                                        [98.992272, 18.40525],
-                                                        [98.992408, 18.405152],
-                                                        [98.992454, 18.40512],
-                                                        [98.99262, 18.405064],
-                                                        [98.992787, 18.405056],
-                                                        [98.992953, 18.405107],
-                                                        [98.99313, 18.405214],
-                                                        [98.993232, 18.405107],
-                                                        [98.993421, 18.405039],
-                                                        [98.994407, 18.404873],
-                                                        [98.99459, 18.404812],
-                                                        [98.99608, 18.404257],
-                                                        [98.99632, 18.404094],
-                                                        [98.996563, 18.403837],
-                                                        [98.996793, 18.40351],
-                                                        [98.996919, 18.403142],
-                                                        [98.99725, 18.402206],
-                                                        [98.997277, 18.401972],
-                                                        [98.99725, 18.401727],
-                                                        [98.997179, 18.401446],
-                                                        [98.997148, 18.401323],
-                                                        [98.997144, 18.401104],
-                                                        [98.997186, 18.400913],
-                                                        [98.997191, 18.400888],
-                                                        [98.997534, 18.400244],
-                                                        [98.997637, 18.400129],
-                                                        [98.997787, 18.400048],
-                                                        [98.998699, 18.39963],
-                                                        [98.99887, 18.399518],
-                                                        [98.999015, 18.39933],
-                                                        [98.999589, 18.398388],
-                                                        [98.999986, 18.397869],
-                                                        [99.000438, 18.397459],
-                                                        [99.000732, 18.397192],
-                                                        [99.001129, 18.396744],
-                                                        [99.001341, 18.396474],
-                                                        [99.001477, 18.396301],
-                                                        [99.002356, 18.395087],
-                                                        [99.002512, 18.394787],
-                                                        [99.00262, 18.394464],
-                                                        [99.003076, 18.392875],
-                                                        [99.00312, 18.392819],
-                                                        [99.003167, 18.392758],
-                                                        [99.003301, 18.392667],
-                                                        [99.003575, 18.392514],
-                                                        [99.003683, 18.392424],
-                                                        [99.00379, 18.392336],
-                                                        [99.003918, 18.392153],
-                                                        [99.004063, 18.391842],
-                                                        [99.004656, 18.3904],
-                                                        [99.005157, 18.389203],
-                                                        [99.005329, 18.388946],
-                                                        [99.005565, 18.388773],
-                                                        [99.005892, 18.388635],
-                                                        [99.006236, 18.388569],
-                                                        [99.006525, 18.388513],
-                                                        [99.006799, 18.388411],
-                                                        [99.007415, 18.388118],
-                                                        [99.007914, 18.387833],
-                                                        [99.008328, 18.387541],
-                                                        [99.008627, 18.38738],
-                                                        [99.009132, 18.387159],
-                                                        [99.009877, 18.386738],
-                                                        [99.010322, 18.386452],
-                                                        [99.010503, 18.38611],
-                                                        [99.010726, 18.385444],
-                                                        [99.010721, 18.38474],
-                                                        [99.010659, 18.384431],
-                                                        [99.010496, 18.383455],
-                                                        [99.010356, 18.3825],
-                                                        [99.010402, 18.382109],
-                                                        [99.010418, 18.382037],
-                                                        [99.010462, 18.381898],
-                                                        [99.010608, 18.381537],
-                                                        [99.010702, 18.381322],
-                                                        [99.011071, 18.380669],
-                                                        [99.011123, 18.380601],
-                                                        [99.01114, 18.380574],
-                                                        [99.011194, 18.380514],
-                                                        [99.011737, 18.379851],
-                                                        [99.012523, 18.379105],
-                                                        [99.013412, 18.378525],
-                                                        [99.015032, 18.377713],
-                                                        [99.015197, 18.377623],
-                                                        [99.015744, 18.377398],
-                                                        [99.015986, 18.377307],
-                                                        [99.01609, 18.377274],
-                                                        [99.016263, 18.377176],
-                                                        [99.016414, 18.377126],
-                                                        [99.016548, 18.377122],
-                                                        [99.016723, 18.377117],
-                                                        [99.017063, 18.377123],
-                                                        [99.017162, 18.377106],
-                                                        [99.017415, 18.377098],
-                                                        [99.017962, 18.377131],
-                                                        [99.018334, 18.377172],
-                                                        [99.018704, 18.3772],
-                                                        [99.018982, 18.377308],
-                                                        [99.019039, 18.377343],
-                                                        [99.019148, 18.377408],
-                                                        [99.019275, 18.377493],
-                                                        [99.019241, 18.37775],
-                                                        [99.019264, 18.377817],
-                                                        [99.019358, 18.37786],
-                                                        [99.019595, 18.377873],
-                                                        [99.019928, 18.378216],
-                                                        [99.02014, 18.378454],
-                                                        [99.020263, 18.378464],
-                                                        [99.020558, 18.37851],
-                                                        [99.020907, 18.37849],
-                                                        [99.021309, 18.378414],
-                                                        [99.021578, 18.378408],
-                                                        [99.021776, 18.378424],
-                                                        [99.021832, 18.378376],
-                                                        [99.021878, 18.378317],
-                                                        [99.021853, 18.378122],
-                                                        [99.022035, 18.37774],
-                                                        [99.022393, 18.377294],
-                                                        [99.022801, 18.377034],
-                                                        [99.023198, 18.37683],
-                                                        [99.023493, 18.376744],
-                                                        [99.023772, 18.376795],
-                                                        [99.024069, 18.376863],
-                                                        [99.024356, 18.376823],
-                                                        [99.02471, 18.376833],
-                                                        [99.025427, 18.376769],
-                                                        [99.025982, 18.37682],
-                                                        [99.0264, 18.376973],
-                                                        [99.026654, 18.377134],
-                                                        [99.026776, 18.377151],
-                                                        [99.026974, 18.377217],
-                                                        [99.028103, 18.377008],
-                                                        [99.028677, 18.376924],
-                                                        [99.029128, 18.376759],
-                                                        [99.029292, 18.376553],
-                                                        [99.029454, 18.376352],
-                                                        [99.029616, 18.376196],
-                                                        [99.029732, 18.376031],
-                                                        [99.030316, 18.376],
-                                                        [99.030611, 18.376],
-                                                        [99.030788, 18.376011],
-                                                        [99.030996, 18.376052],
-                                                        [99.031256, 18.375978],
-                                                        [99.031499, 18.37585],
-                                                        [99.031726, 18.375662],
-                                                        [99.03181, 18.375424],
-                                                        [99.031969, 18.375225],
-                                                        [99.032448, 18.374868],
-                                                        [99.032671, 18.374632],
-                                                        [99.03286, 18.374348],
-                                                        [99.033137, 18.374009],
-                                                        [99.033638, 18.373784],
-                                                        [99.03382, 18.373677],
-                                                        [99.033977, 18.373531],
-                                                        [99.034207, 18.373461],
-                                                        [99.03466, 18.373262],
-                                                        [99.03486, 18.373095],
-                                                        [99.035027, 18.372864],
-                                                        [99.035278, 18.372461],
-                                                        [99.035459, 18.372046],
-                                                        [99.035602, 18.371755],
-                                                        [99.035764, 18.371547],
-                                                        [99.036004, 18.371357],
-                                                        [99.036176, 18.371182],
-                                                        [99.036187, 18.371015],
-                                                        [99.036147, 18.370839],
-                                                        [99.036151, 18.370375],
-                                                        [99.036207, 18.36981],
-                                                        [99.036257, 18.369281],
-                                                        [99.036206, 18.369122],
-                                                        [99.036129, 18.368963],
-                                                        [99.035977, 18.368659],
-                                                        [99.035901, 18.36837],
-                                                        [99.035743, 18.368077],
-                                                        [99.035499, 18.36781],
-                                                        [99.035342, 18.367631],
-                                                        [99.03506, 18.367299],
-                                                        [99.03458, 18.366643],
-                                                        [99.0346, 18.36651],
-                                                        [99.034648, 18.366396],
-                                                        [99.034722, 18.366301],
-                                                        [99.035054, 18.366053],
-                                                        [99.035249, 18.365776],
-                                                        [99.035314, 18.365711],
-                                                        [99.03563, 18.365673],
-                                                        [99.035842, 18.36559],
-                                                        [99.036014, 18.365356],
-                                                        [99.036169, 18.365083],
-                                                        [99.03639, 18.364742],
-                                                        [99.036504, 18.36446],
-                                                        [99.036758, 18.364274],
-                                                        [99.03703, 18.364184],
-                                                        [99.037429, 18.364108],
-                                                        [99.037771, 18.364038],
-                                                        [99.037952, 18.363926],
-                                                        [99.038105, 18.363778],
-                                                        [99.038261, 18.363628],
-                                                        [99.038436, 18.363544],
-                                                        [99.038799, 18.363388],
-                                                        [99.039034, 18.363336],
-                                                        [99.039355, 18.363415],
-                                                        [99.039489, 18.363512],
-                                                        [99.039683, 18.363553],
-                                                        [99.039892, 18.363619],
-                                                        [99.039889, 18.363433],
-                                                        [99.039865, 18.363371],
-                                                        [99.039809, 18.363253],
-                                                        [99.039806, 18.363224],
-                                                        [99.039814, 18.363194],
-                                                        [99.039852, 18.363128],
-                                                        [99.039908, 18.363064],
-                                                        [99.039945, 18.36303],
-                                                        [99.039993, 18.362992],
-                                                        [99.040065, 18.36295],
-                                                        [99.04016, 18.362921],
-                                                        [99.040339, 18.362867],
-                                                        [99.040445, 18.36279],
-                                                        [99.040532, 18.362701],
-                                                        [99.040725, 18.362346],
-                                                        [99.040786, 18.362278],
-                                                        [99.040806, 18.362206],
-                                                        [99.040789, 18.361687],
-                                                        [99.04077, 18.361511],
-                                                        [99.040719, 18.361281],
-                                                        [99.040676, 18.361122],
-                                                        [99.040654, 18.36103],
-                                                        [99.040595, 18.360897],
-                                                        [99.040391, 18.360602],
-                                                        [99.040099, 18.360208],
-                                                        [99.039997, 18.360055],
-                                                        [99.039952, 18.359981],
-                                                        [99.039938, 18.359935],
-                                                        [99.039913, 18.359838],
-                                                        [99.039892, 18.359786],
-                                                        [99.039869, 18.359766],
-                                                        [99.039732, 18.359724],
-                                                        [99.039625, 18.359681],
-                                                        [99.039584, 18.359636],
-                                                        [99.039551, 18.35959],
-                                                        [99.039543, 18.359546],
-                                                        [99.039533, 18.359478],
-                                                        [99.039538, 18.359411],
-                                                        [99.039584, 18.359328],
-                                                        [99.039694, 18.359215],
-                                                        [99.039715, 18.359184],
-                                                        [99.039715, 18.359141],
-                                                        [99.039692, 18.3591],
-                                                        [99.039584, 18.358976],
-                                                        [99.039551, 18.358932],
-                                                        [99.039534, 18.35889],
-                                                        [99.039502, 18.358795],
-                                                        [99.039486, 18.358754],
-                                                        [99.039445, 18.358702],
-                                                        [99.03924, 18.358516],
-                                                        [99.03907, 18.3584],
-                                                        [99.039028, 18.358361],
-                                                        [99.039, 18.358316],
-                                                        [99.038926, 18.358181],
-                                                        [99.038811, 18.357998],
-                                                        [99.038735, 18.357919],
-                                                        [99.038677, 18.357878],
-                                                        [99.038472, 18.357787],
-                                                        [99.038338, 18.357754],
-                                                        [99.038092, 18.357757],
-                                                        [99.037997, 18.357762],
-                                                        [99.037917, 18.357734],
-                                                        [99.037886, 18.357708],
-                                                        [99.037854, 18.35765],
-                                                        [99.037848, 18.357589],
-                                                        [99.037848, 18.357337],
-                                                        [99.037824, 18.357261],
-                                                        [99.037782, 18.357208],
-                                                        [99.03771, 18.357134],
-                                                        [99.037518, 18.357051],
-                                                        [99.037375, 18.357027],
-                                                        [99.03709, 18.357018],
-                                                        [99.036883, 18.357025],
-                                                        [99.036801, 18.357004],
-                                                        [99.036773, 18.356981],
-                                                        [99.036752, 18.356898],
-                                                        [99.03675, 18.356637],
-                                                        [99.03674, 18.356555],
-                                                        [99.036708, 18.356501],
-                                                        [99.036637, 18.356446],
-                                                        [99.036495, 18.356336],
-                                                        [99.036441, 18.356306],
-                                                        [99.036378, 18.35629],
-                                                        [99.03628, 18.356303],
-                                                        [99.035999, 18.356343],
-                                                        [99.03582, 18.356322],
-                                                        [99.035755, 18.356292],
-                                                        [99.035736, 18.356254],
-                                                        [99.035729, 18.356226],
-                                                        [99.035684, 18.355922],
-                                                        [99.035659, 18.355717],
-                                                        [99.035641, 18.355658],
-                                                        [99.035594, 18.355594],
-                                                        [99.03554, 18.355557],
-                                                        [99.035354, 18.355432],
-                                                        [99.035241, 18.355403],
-                                                        [99.035159, 18.355386],
-                                                        [99.035096, 18.355359],
-                                                        [99.035064, 18.355343],
-                                                        [99.034836, 18.355187],
-                                                        [99.034744, 18.355157],
-                                                        [99.034646, 18.35514],
-                                                        [99.034573, 18.355157],
-                                                        [99.034435, 18.355203],
-                                                        [99.034395, 18.355208],
-                                                        [99.034349, 18.355196],
-                                                        [99.034326, 18.355158],
-                                                        [99.034325, 18.355102],
-                                                        [99.034337, 18.355022],
-                                                        [99.034356, 18.3549],
-                                                        [99.034353, 18.354832],
-                                                        [99.034343, 18.354784],
-                                                        [99.034309, 18.354719],
-                                                        [99.034257, 18.354687],
-                                                        [99.033972, 18.354552],
-                                                        [99.033876, 18.35448],
-                                                        [99.033838, 18.354426],
-                                                        [99.033815, 18.354364],
-                                                        [99.033822, 18.354285],
-                                                        [99.033842, 18.354201],
-                                                        [99.033848, 18.354131],
-                                                        [99.033834, 18.354022],
-                                                        [99.033805, 18.353949],
-                                                        [99.033781, 18.353878],
-                                                        [99.033767, 18.353767],
-                                                        [99.033851, 18.353584],
-                                                        [99.033878, 18.353503],
-                                                        [99.033983, 18.353171],
-                                                        [99.034078, 18.352912],
-                                                        [99.034102, 18.352798],
-                                                        [99.034104, 18.352735],
-                                                        [99.034085, 18.35266],
-                                                        [99.034042, 18.352548],
-                                                        [99.033955, 18.352427],
-                                                        [99.033938, 18.352385],
-                                                        [99.033935, 18.352359],
-                                                        [99.033952, 18.352325],
-                                                        [99.034034, 18.352287],
-                                                        [99.034344, 18.352159],
-                                                        [99.034478, 18.35207],
-                                                        [99.034561, 18.352003],
-                                                        [99.034603, 18.351926],
-                                                        [99.034615, 18.351865],
-                                                        [99.034636, 18.351681],
-                                                        [99.034648, 18.351618],
-                                                        [99.034671, 18.351551],
-                                                        [99.034722, 18.351427],
-                                                        [99.034741, 18.351361],
-                                                        [99.034742, 18.351292],
-                                                        [99.034727, 18.35122],
-                                                        [99.03469, 18.351122],
-                                                        [99.034631, 18.351023],
-                                                        [99.034609, 18.350979],
-                                                        [99.034604, 18.350933],
-                                                        [99.03463, 18.350884],
-                                                        [99.034746, 18.350764],
-                                                        [99.034789, 18.350717],
-                                                        [99.034793, 18.350667],
-                                                        [99.034773, 18.350622],
-                                                        [99.034655, 18.350525],
-                                                        [99.034282, 18.35031],
-                                                        [99.034222, 18.350249],
-                                                        [99.034206, 18.350189],
-                                                        [99.034234, 18.350116],
-                                                        [99.034406, 18.349962],
-                                                        [99.034507, 18.349882],
-                                                        [99.034533, 18.349831],
-                                                        [99.034553, 18.349723],
-                                                        [99.034561, 18.349482],
-                                                        [99.034573, 18.349317],
-                                                        [99.03458, 18.34922],
-                                                        [99.034644, 18.348893],
-                                                        [99.034672, 18.348781],
-                                                        [99.03469, 18.348688],
-                                                        [99.034699, 18.348604],
-                                                        [99.034701, 18.348533],
-                                                        [99.034686, 18.348207],
-                                                        [99.034663, 18.347959],
-                                                        [99.034658, 18.347732],
-                                                        [99.034667, 18.347611],
-                                                        [99.034706, 18.347415],
-                                                        [99.034741, 18.347313],
-                                                        [99.034807, 18.347224],
-                                                        [99.034935, 18.347023],
-                                                        [99.035036, 18.346832],
-                                                        [99.035085, 18.346715],
-                                                        [99.035158, 18.346522],
-                                                        [99.035169, 18.346444],
-                                                        [99.035158, 18.346392],
-                                                        [99.035136, 18.346327],
-                                                        [99.03498, 18.346141],
-                                                        [99.034908, 18.346075],
-                                                        [99.034892, 18.346035],
-                                                        [99.034904, 18.345996],
-                                                        [99.034941, 18.345977],
-                                                        [99.034998, 18.34597],
-                                                        [99.03503, 18.345957],
-                                                        [99.035067, 18.345941],
-                                                        [99.035118, 18.345888],
-                                                        [99.035198, 18.345674],
-                                                        [99.035359, 18.345055],
-                                                        [99.035375, 18.344918],
-                                                        [99.035367, 18.344821],
-                                                        [99.035367, 18.344752],
-                                                        [99.035407, 18.344666],
-                                                        [99.035474, 18.344503],
-                                                        [99.035592, 18.344238],
-                                                        [99.035705, 18.344029],
-                                                        [99.035912, 18.34354],
-                                                        [99.036005, 18.343296],
-                                                        [99.036046, 18.343151],
-                                                        [99.036083, 18.343008],
-                                                        [99.036217, 18.342626],
-                                                        [99.036319, 18.342222],
-                                                        [99.036419, 18.34174],
-                                                        [99.036429, 18.34159],
-                                                        [99.036419, 18.34143],
-                                                        [99.036384, 18.341257],
-                                                        [99.036365, 18.341134],
-                                                        [99.036373, 18.341061],
-                                                        [99.036419, 18.340837],
-                                                        [99.036419, 18.340758],
-                                                        [99.036408, 18.340709],
-                                                        [99.036306, 18.340643],
-                                                        [99.035668, 18.340383],
-                                                        [99.035517, 18.340302],
-                                                        [99.035389, 18.340208],
-                                                        [99.035263, 18.340108],
-                                                        [99.035155, 18.34006],
-                                                        [99.034949, 18.340007],
-                                                        [99.034882, 18.339979],
-                                                        [99.034836, 18.33994],
-                                                        [99.034686, 18.339607],
-                                                        [99.034672, 18.339523],
-                                                        [99.034683, 18.339459],
-                                                        [99.034772, 18.339337],
-                                                        [99.034772, 18.339271],
-                                                        [99.03475, 18.339222],
-                                                        [99.034579, 18.339138],
-                                                        [99.034533, 18.339098],
-                                                        [99.034501, 18.339029],
-                                                        [99.034495, 18.33897],
-                                                        [99.034613, 18.338721],
-                                                        [99.034748, 18.33854],
-                                                        [99.034914, 18.338349],
-                                                        [99.034984, 18.338291],
-                                                        [99.03508, 18.338257],
-                                                        [99.03555, 18.338064],
-                                                        [99.035686, 18.33797],
-                                                        [99.035777, 18.337886],
-                                                        [99.035807, 18.337794],
-                                                        [99.035826, 18.337651],
-                                                        [99.035796, 18.336977],
-                                                        [99.03581, 18.336875],
-                                                        [99.035853, 18.336821],
-                                                        [99.035925, 18.336811],
-                                                        [99.03604, 18.336867],
-                                                        [99.036333, 18.33702],
-                                                        [99.036435, 18.337046],
-                                                        [99.036539, 18.337033],
-                                                        [99.036593, 18.336995],
-                                                        [99.036673, 18.336883],
-                                                        [99.036684, 18.336796],
-                                                        [99.036652, 18.336694],
-                                                        [99.036529, 18.336587],
-                                                        [99.036421, 18.336506],
-                                                        [99.036362, 18.336417],
-                                                        [99.036319, 18.336289],
-                                                        [99.036292, 18.336106],
-                                                        [99.036295, 18.336017],
-                                                        [99.036335, 18.335948],
-                                                        [99.0364, 18.335915],
-                                                        [99.036647, 18.335818],
-                                                        [99.03677, 18.335737],
-                                                        [99.036952, 18.335561],
-                                                        [99.037068, 18.335363],
-                                                        [99.037188, 18.335184],
-                                                        [99.037242, 18.3351],
-                                                        [99.037304, 18.335049],
-                                                        [99.03736, 18.335024],
-                                                        [99.037937, 18.334879],
-                                                        [99.038079, 18.334828],
-                                                        [99.038146, 18.334787],
-                                                        [99.038189, 18.334698],
-                                                        [99.038269, 18.334008],
-                                                        [99.038283, 18.333937],
-                                                        [99.038312, 18.333894]]}},
-                          {'type': 'Feature',
-                           'properties': {'agent_id': 4709,
-                                          'segment': 3,
-                                          'from': 'ถ้ำจำหม่าฟ้า',
-                                          'to': 'ถ้ำเอราวัณ',
-                                          'distance_m': 36599.7,
-                                          'distance_km': 36.5997,
-                                          'from_source': 'csv',
-                                          'to_source': 'csv'},
-                           'geometry': {'type': 'LineString',
-                                        'coordinates': [[99.038312, 18.333894],
-                                                        [99.038283, 18.333937],
-                                                        [99.038269, 18.334008],
-                                                        [99.038189, 18.334698],
-                                                        [99.038146, 18.334787],
-                                                        [99.038079, 18.334828],
-                                                        [99.037937, 18.334879],
-                                                        [99.03736, 18.335024],
-                                                        [99.037304, 18.335049],
-                                                        [99.037242, 18.3351],
-                                                        [99.037188, 18.335184],
-                                                        [99.037068, 18.335363],
-                                                        [99.036952, 18.335561],
-                                                        [99.03677, 18.335737],
-                                                        [99.036647, 18.335818],
-                                                        [99.0364, 18.335915],
-                                                        [99.036335, 18.335948],
-                                                        [99.036295, 18.336017],
-                                                        [99.036292, 18.336106],
-                                                        [99.036319, 18.336289],
-                                                        [99.036362, 18.336417],
-                                                        [99.036421, 18.336506],
-                                                        [99.036529, 18.336587],
-                                                        [99.036652, 18.336694],
-                                                        [99.036684, 18.336796],
-                                                        [99.036673, 18.336883],
-                                                        [99.036593, 18.336995],
-                                                        [99.036539, 18.337033],
-                                                        [99.036435, 18.337046],
-                                                        [99.036333, 18.33702],
-                                                        [99.03604, 18.336867],
-                                                        [99.035925, 18.336811],
-                                                        [99.035853, 18.336821],
-                                                        [99.03581, 18.336875],
-                                                        [99.035796, 18.336977],
-                                                        [99.035826, 18.337651],
-                                                        [99.035807, 18.337794],
-                                                        [99.035777, 18.337886],
-                                                        [99.035686, 18.33797],
-                                                        [99.03555, 18.338064],
-                                                        [99.03508, 18.338257],
-                                                        [99.034984, 18.338291],
-                                                        [99.034914, 18.338349],
-                                                        [99.034748, 18.33854],
-                                                        [99.034613, 18.338721],
-                                                        [99.034495, 18.33897],
-                                                        [99.034501, 18.339029],
-                                                        [99.034533, 18.339098],
-                                                        [99.034579, 18.339138],
-                                                        [99.03475, 18.339222],
-                                                        [99.034772, 18.339271],
-                                                        [99.034772, 18.339337],
-                                                        [99.034683, 18.339459],
-                                                        [99.034672, 18.339523],
-                                                        [99.034686, 18.339607],
-                                                        [99.034836, 18.33994],
-                                                        [99.034882, 18.339979],
-                                                        [99.034949, 18.340007],
-                                                        [99.035155, 18.34006],
-                                                        [99.035263, 18.340108],
-                                                        [99.035389, 18.340208],
-                                                        [99.035517, 18.340302],
-                                                        [99.035668, 18.340383],
-                                                        [99.036306, 18.340643],
-                                                        [99.036408, 18.340709],
-                                                        [99.036419, 18.340758],
-                                                        [99.036419, 18.340837],
-                                                        [99.036373, 18.341061],
-                                                        [99.036365, 18.341134],
-                                                        [99.036384, 18.341257],
-                                                        [99.036419, 18.34143],
-                                                        [99.036429, 18.34159],
-                                                        [99.036419, 18.34174],
-                                                        [99.036319, 18.342222],
-                                                        [99.036217, 18.342626],
-                                                        [99.036083, 18.343008],
-                                                        [99.036046, 18.343151],
-                                                        [99.036005, 18.343296],
-                                                        [99.035912, 18.34354],
-                                                        [99.035705, 18.344029],
-                                                        [99.035592, 18.344238],
-                                                        [99.035474, 18.344503],
-                                                        [99.035407, 18.344666],
-                                                        [99.035367, 18.344752],
-                                                        [99.035367, 18.344821],
-                                                        [99.035375, 18.344918],
-                                                        [99.035359, 18.345055],
-                                                        [99.035198, 18.345674],
-                                                        [99.035118, 18.345888],
-                                                        [99.035067, 18.345941],
-                                                        [99.03503, 18.345957],
-                                                        [99.034998, 18.34597],
-                                                        [99.034941, 18.345977],
-                                                        [99.034904, 18.345996],
-                                                        [99.034892, 18.346035],
-                                                        [99.034908, 18.346075],
-                                                        [99.03498, 18.346141],
-                                                        [99.035136, 18.346327],
-                                                        [99.035158, 18.346392],
-                                                        [99.035169, 18.346444],
-                                                        [99.035158, 18.346522],
-                                                        [99.035085, 18.346715],
-                                                        [99.035036, 18.346832],
-                                                        [99.034935, 18.347023],
-                                                        [99.034807, 18.347224],
-                                                        [99.034741, 18.347313],
-                                                        [99.034706, 18.347415],
-                                                        [99.034667, 18.347611],
-                                                        [99.034658, 18.347732],
-                                                        [99.034663, 18.347959],
-                                                        [99.034686, 18.348207],
-                                                        [99.034701, 18.348533],
-                                                        [99.034699, 18.348604],
-                                                        [99.03469, 18.348688],
-                                                        [99.034672, 18.348781],
-                                                        [99.034644, 18.348893],
-                                                        [99.03458, 18.34922],
-                                                        [99.034573, 18.349317],
-                                                        [99.034561, 18.349482],
-                                                        [99.034553, 18.349723],
-                                                        [99.034533, 18.349831],
-                                                        [99.034507, 18.349882],
-                                                        [99.034406, 18.349962],
-                                                        [99.034234, 18.350116],
-                                                        [99.034206, 18.350189],
-                                                        [99.034222, 18.350249],
-                                                        [99.034282, 18.35031],
-                                                        [99.034655, 18.350525],
-                                                        [99.034773, 18.350622],
-                                                        [99.034793, 18.350667],
-                                                        [99.034789, 18.350717],
-                                                        [99.034746, 18.350764],
-                                                        [99.03463, 18.350884],
-                                                        [99.034604, 18.350933],
-                                                        [99.034609, 18.350979],
-                                                        [99.034631, 18.351023],
-                                                        [99.03469, 18.351122],
-                                                        [99.034727, 18.35122],
-                                                        [99.034742, 18.351292],
-                                                        [99.034741, 18.351361],
-                                                        [99.034722, 18.351427],
-                                                        [99.034671, 18.351551],
-                                                        [99.034648, 18.351618],
-                                                        [99.034636, 18.351681],
-                                                        [99.034615, 18.351865],
-                                                        [99.034603, 18.351926],
-                                                        [99.034561, 18.352003],
-                                                        [99.034478, 18.35207],
-                                                        [99.034344, 18.352159],
-                                                        [99.034034, 18.352287],
-                                                        [99.033952, 18.352325],
-                                                        [99.033935, 18.352359],
-                                                        [99.033938, 18.352385],
-                                                        [99.033955, 18.352427],
-                                                        [99.034042, 18.352548],
-                                                        [99.034085, 18.35266],
-                                                        [99.034104, 18.352735],
-                                                        [99.034102, 18.352798],
-                                                        [99.034078, 18.352912],
-                                                        [99.033983, 18.353171],
-                                                        [99.033878, 18.353503],
-                                                        [99.033851, 18.353584],
-                                                        [99.033767, 18.353767],
-                                                        [99.033781, 18.353878],
-                                                        [99.033805, 18.353949],
-                                                        [99.033834, 18.354022],
-                                                        [99.033848, 18.354131],
-                                                        [99.033842, 18.354201],
-                                                        [99.033822, 18.354285],
-                                                        [99.033815, 18.354364],
-                                                        [99.033838, 18.354426],
-                                                        [99.033876, 18.35448],
-                                                        [99.033972, 18.354552],
-                                                        [99.034257, 18.354687],
-                                                        [99.034309, 18.354719],
-                                                        [99.034343, 18.354784],
-                                                        [99.034353, 18.354832],
-                                                        [99.034356, 18.3549],
-                                                        [99.034337, 18.355022],
-                                                        [99.034325, 18.355102],
-                                                        [99.034326, 18.355158],
-                                                        [99.034349, 18.355196],
-                                                        [99.034395, 18.355208],
-                                                        [99.034435, 18.355203],
-                                                        [99.034573, 18.355157],
-                                                        [99.034646, 18.35514],
-                                                        [99.034744, 18.355157],
-                                                        [99.034836, 18.355187],
-                                                        [99.035064, 18.355343],
-                                                        [99.035096, 18.355359],
-                                                        [99.035159, 18.355386],
-                                                        [99.035241, 18.355403],
-                                                        [99.035354, 18.355432],
-                                                        [99.03554, 18.355557],
-                                                        [99.035594, 18.355594],
-                                                        [99.035641, 18.355658],
-                                                        [99.035659, 18.355717],
-                                                        [99.035684, 18.355922],
-                                                        [99.035729, 18.356226],
-                                                        [99.035736, 18.356254],
-                                                        [99.035755, 18.356292],
-                                                        [99.03582, 18.356322],
-                                                        [99.035999, 18.356343],
-                                                        [99.03628, 18.356303],
-                                                        [99.036378, 18.35629],
-                                                        [99.036441, 18.356306],
-                                                        [99.036495, 18.356336],
-                                                        [99.036637, 18.356446],
-                                                        [99.036708, 18.356501],
-                                                        [99.03674, 18.356555],
-                                                        [99.03675, 18.356637],
-                                                        [99.036752, 18.356898],
-                                                        [99.036773, 18.356981],
-                                                        [99.036801, 18.357004],
-                                                        [99.036883, 18.357025],
-                                                        [99.03709, 18.357018],
-                                                        [99.037375, 18.357027],
-                                                        [99.037518, 18.357051],
-                                                        [99.03771, 18.357134],
-                                                        [99.037782, 18.357208],
-                                                        [99.037824, 18.357261],
-                                                        [99.037848, 18.357337],
-                                                        [99.037848, 18.357589],
-                                                        [99.037854, 18.35765],
-                                                        [99.037886, 18.357708],
-                                                        [99.037917, 18.357734],
-                                                        [99.037997, 18.357762],
-                                                        [99.038092, 18.357757],
-                                                        [99.038338, 18.357754],
-                                                        [99.038472, 18.357787],
-                                                        [99.038677, 18.357878],
-                                                        [99.038735, 18.357919],
-                                                        [99.038811, 18.357998],
-                                                        [99.038926, 18.358181],
-                                                        [99.039, 18.358316],
-                                                        [99.039028, 18.358361],
-                                                        [99.03907, 18.3584],
-                                                        [99.03924, 18.358516],
-                                                        [99.039445, 18.358702],
-                                                        [99.039486, 18.358754],
-                                                        [99.039502, 18.358795],
-                                                        [99.039534, 18.35889],
-                                                        [99.039551, 18.358932],
-                                                        [99.039584, 18.358976],
-                                                        [99.039692, 18.3591],
-                                                        [99.039715, 18.359141],
-                                                        [99.039715, 18.359184],
-                                                        [99.039694, 18.359215],
-                                                        [99.039584, 18.359328],
-                                                        [99.039538, 18.359411],
-                                                        [99.039533, 18.359478],
-                                                        [99.039543, 18.359546],
-                                                        [99.039551, 18.35959],
-                                                        [99.039584, 18.359636],
-                                                        [99.039625, 18.359681],
-                                                        [99.039732, 18.359724],
-                                                        [99.039869, 18.359766],
-                                                        [99.039892, 18.359786],
-                                                        [99.039913, 18.359838],
-                                                        [99.039938, 18.359935],
-                                                        [99.039952, 18.359981],
-                                                        [99.039997, 18.360055],
-                                                        [99.040099, 18.360208],
-                                                        [99.040391, 18.360602],
-                                                        [99.040595, 18.360897],
-                                                        [99.040654, 18.36103],
-                                                        [99.040676, 18.361122],
-                                                        [99.040719, 18.361281],
-                                                        [99.04077, 18.361511],
-                                                        [99.040789, 18.361687],
-                                                        [99.040806, 18.362206],
-                                                        [99.040786, 18.362278],
-                                                        [99.040725, 18.362346],
-                                                        [99.040532, 18.362701],
-                                                        [99.040445, 18.36279],
-                                                        [99.040339, 18.362867],
-                                                        [99.04016, 18.362921],
-                                                        [99.040065, 18.36295],
-                                                        [99.039993, 18.362992],
-                                                        [99.039945, 18.36303],
-                                                        [99.039908, 18.363064],
-                                                        [99.039852, 18.363128],
-                                                        [99.039814, 18.363194],
-                                                        [99.039806, 18.363224],
-                                                        [99.039809, 18.363253],
-                                                        [99.039865, 18.363371],
-                                                        [99.039889, 18.363433],
-                                                        [99.039892, 18.363619],
-                                                        [99.039683, 18.363553],
-                                                        [99.039489, 18.363512],
-                                                        [99.039355, 18.363415],
-                                                        [99.039034, 18.363336],
-                                                        [99.038799, 18.363388],
-                                                        [99.038436, 18.363544],
-                                                        [99.038261, 18.363628],
-                                                        [99.038105, 18.363778],
-                                                        [99.037952, 18.363926],
-                                                        [99.037771, 18.364038],
-                                                        [99.037429, 18.364108],
-                                                        [99.03703, 18.364184],
-                                                        [99.036758, 18.364274],
-                                                        [99.036504, 18.36446],
-                                                        [99.03639, 18.364742],
-                                                        [99.036169, 18.365083],
-                                                        [99.036014, 18.365356],
-                                                        [99.035842, 18.36559],
-                                                        [99.03563, 18.365673],
-                                                        [99.035314, 18.365711],
-                                                        [99.035249, 18.365776],
-                                                        [99.035054, 18.366053],
-                                                        [99.034722, 18.366301],
-                                                        [99.034648, 18.366396],
-                                                        [99.0346, 18.36651],
-                                                        [99.03458, 18.366643],
-                                                        [99.03506, 18.367299],
-                                                        [99.035342, 18.367631],
-                                                        [99.035499, 18.36781],
-                                                        [99.035743, 18.368077],
-                                                        [99.035901, 18.36837],
-                                                        [99.035977, 18.368659],
-                                                        [99.036129, 18.368963],
-                                                        [99.036206, 18.369122],
-                                                        [99.036257, 18.369281],
-                                                        [99.036207, 18.36981],
-                                                        [99.036151, 18.370375],
-                                                        [99.036147, 18.370839],
-                                                        [99.036187, 18.371015],
-                                                        [99.036176, 18.371182],
-                                                        [99.036004, 18.371357],
-                                                        [99.035764, 18.371547],
-                                                        [99.035602, 18.371755],
-                                                        [99.035459, 18.372046],
-                                                        [99.035278, 18.372461],
-                                                        [99.035027, 18.372864],
-                                                        [99.03486, 18.373095],
-                                                        [99.03466, 18.373262],
-                                                        [99.034207, 18.373461],
-                                                        [99.033977, 18.373531],
-                                                        [99.03382, 18.373677],
-                                                        [99.033638, 18.373784],
-                                                        [99.033137, 18.374009],
-                                                        [99.03286, 18.374348],
-                                                        [99.032671, 18.374632],
-                                                        [99.032448, 18.374868],
-                                                        [99.031969, 18.375225],
-                                                        [99.03181, 18.375424],
-                                                        [99.031726, 18.375662],
-                                                        [99.031499, 18.37585],
-                                                        [99.031256, 18.375978],
-                                                        [99.030996, 18.376052],
-                                                        [99.030788, 18.376011],
-                                                        [99.030611, 18.376],
-                                                        [99.030316, 18.376],
-                                                        [99.029732, 18.376031],
-                                                        [99.029616, 18.376196],
-                                                        [99.029454, 18.376352],
-                                                        [99.029292, 18.376553],
-                                                        [99.029128, 18.376759],
-                                                        [99.028677, 18.376924],
-                                                        [99.028103, 18.377008],
-                                                        [99.026974, 18.377217],
-                                                        [99.026776, 18.377151],
-                                                        [99.026654, 18.377134],
-                                                        [99.0264, 18.376973],
-                                                        [99.025982, 18.37682],
-                                                        [99.025427, 18.376769],
-                                                        [99.02471, 18.376833],
-                                                        [99.024356, 18.376823],
-                                                        [99.024069, 18.376863],
-                                                        [99.023772, 18.376795],
-                                                        [99.023493, 18.376744],
-                                                        [99.023198, 18.37683],
-                                                        [99.022801, 18.377034],
-                                                        [99.022393, 18.377294],
-                                                        [99.022035, 18.37774],
-                                                        [99.021853, 18.378122],
-                                                        [99.021878, 18.378317],
-                                                        [99.021832, 18.378376],
-                                                        [99.021776, 18.378424],
-                                                        [99.021578, 18.378408],
-                                                        [99.021309, 18.378414],
-                                                        [99.020907, 18.37849],
-                                                        [99.020558, 18.37851],
-                                                        [99.020263, 18.378464],
-                                                        [99.02014, 18.378454],
-                                                        [99.019928, 18.378216],
-                                                        [99.019595, 18.377873],
-                                                        [99.019358, 18.37786],
-                                                        [99.019264, 18.377817],
-                                                        [99.019241, 18.37775],
-                                                        [99.019275, 18.377493],
-                                                        [99.019148, 18.377408],
-                                                        [99.019039, 18.377343],
-                                                        [99.018982, 18.377308],
-                                                        [99.018704, 18.3772],
-                                                        [99.018334, 18.377172],
-                                                        [99.017962, 18.377131],
-                                                        [99.017415, 18.377098],
-                                                        [99.017162, 18.377106],
-                                                        [99.017063, 18.377123],
-                                                        [99.016723, 18.377117],
-                                                        [99.016548, 18.377122],
-                                                        [99.016414, 18.377126],
-                                                        [99.016263, 18.377176],
-                                                        [99.01609, 18.377274],
-                                                        [99.015986, 18.377307],
-                                                        [99.015744, 18.377398],
-                                                        [99.015197, 18.377623],
-                                                        [99.015032, 18.377713],
-                                                        [99.013412, 18.378525],
-                                                        [99.012523, 18.379105],
-                                                        [99.011737, 18.379851],
-                                                        [99.011194, 18.380514],
-                                                        [99.01114, 18.380574],
-                                                        [99.011123, 18.380601],
-                                                        [99.011071, 18.380669],
-                                                        [99.010702, 18.381322],
-                                                        [99.010608, 18.381537],
-                                                        [99.010462, 18.381898],
-                                                        [99.010418, 18.382037],
-                                                        [99.010402, 18.382109],
-                                                        [99.010356, 18.3825],
-                                                        [99.010496, 18.383455],
-                                                        [99.010659, 18.384431],
-                                                        [99.010721, 18.38474],
-                                                        [99.010726, 18.385444],
-                                                        [99.010503, 18.38611],
-                                                        [99.010322, 18.386452],
-                                                        [99.009877, 18.386738],
-                                                        [99.009132, 18.387159],
-                                                        [99.008627, 18.38738],
-                                                        [99.008328, 18.387541],
-                                                        [99.007914, 18.387833],
-                                                        [99.007415, 18.388118],
-                                                        [99.006799, 18.388411],
-                                                        [99.006525, 18.388513],
-                                                        [99.006236, 18.388569],
-                                                        [99.005892, 18.388635],
-                                                        [99.005565, 18.388773],
-                                                        [99.005329, 18.388946],
-                                                        [99.005157, 18.389203],
-                                                        [99.004656, 18.3904],
-                                                        [99.004063, 18.391842],
-                                                        [99.003918, 18.392153],
-                                                        [99.00379, 18.392336],
-                                                        [99.003683, 18.392424],
-                                                        [99.003575, 18.392514],
-                                                        [99.003301, 18.392667],
-                                                        [99.003167, 18.392758],
-                                                        [99.00312, 18.392819],
-                                                        [99.003076, 18.392875],
-                                                        [99.00262, 18.394464],
-                                                        [99.002512, 18.394787],
-                                                        [99.002356, 18.395087],
-                                                        [99.001477, 18.396301],
-                                                        [99.001341, 18.396474],
-                                                        [99.000998, 18.396239],
-                                                        [99.000728, 18.396023],
-                                                        [99.00055, 18.395867],
-                                                        [99.000504, 18.395857],
-                                                        [99.000454, 18.395834],
-                                                        [99.000247, 18.39582],
-                                                        [98.999875, 18.395675],
-                                                        [98.999526, 18.395438],
-                                                        [98.999203, 18.395276],
-                                                        [98.998921, 18.395199],
-                                                        [98.998644, 18.395232],
-                                                        [98.998274, 18.395303],
-                                                        [98.998014, 18.395418],
-                                                        [98.997864, 18.395401],
-                                                        [98.997509, 18.395334],
-                                                        [98.997341, 18.395381],
-                                                        [98.99721, 18.395418],
-                                                        [98.996854, 18.395425],
-                                                        [98.996594, 18.395405],
-                                                        [98.996299, 18.395327],
-                                                        [98.996129, 18.395381],
-                                                        [98.995964, 18.395428],
-                                                        [98.995761, 18.395269],
-                                                        [98.995552, 18.394975],
-                                                        [98.995401, 18.394928],
-                                                        [98.995179, 18.394918],
-                                                        [98.994826, 18.394377],
-                                                        [98.994592, 18.394043],
-                                                        [98.994422, 18.3939],
-                                                        [98.994374, 18.393868],
-                                                        [98.994333, 18.393852],
-                                                        [98.994266, 18.393829],
-                                                        [98.994182, 18.393787],
-                                                        [98.99382, 18.393634],
-                                                        [98.993554, 18.393481],
-                                                        [98.993232, 18.393247],
-                                                        [98.992929, 18.393018],
-                                                        [98.992669, 18.392822],
-                                                        [98.992468, 18.392626],
-                                                        [98.992194, 18.392318],
-                                                        [98.991988, 18.392084],
-                                                        [98.991746, 18.391875],
-                                                        [98.991513, 18.39169],
-                                                        [98.99129, 18.391588],
-                                                        [98.991194, 18.391532],
-                                                        [98.991087, 18.391415],
-                                                        [98.99069, 18.391071],
-                                                        [98.990301, 18.390705],
-                                                        [98.990099, 18.390565],
-                                                        [98.989947, 18.390476],
-                                                        [98.989721, 18.390318],
-                                                        [98.989539, 18.390168],
-                                                        [98.989373, 18.39003],
-                                                        [98.989153, 18.389931],
-                                                        [98.988919, 18.389875],
-                                                        [98.988812, 18.389839],
-                                                        [98.988758, 18.389799],
-                                                        [98.988686, 18.389707],
-                                                        [98.988624, 18.389659],
-                                                        [98.988528, 18.389618],
-                                                        [98.988439, 18.389605],
-                                                        [98.988324, 18.389585],
-                                                        [98.988249, 18.389531],
-                                                        [98.98812, 18.389417],
-                                                        [98.988026, 18.389356],
-                                                        [98.987876, 18.389297],
-                                                        [98.987804, 18.389261],
-                                                        [98.987742, 18.389208],
-                                                        [98.987613, 18.389111],
-                                                        [98.987543, 18.389037],
-                                                        [98.987503, 18.388938],
-                                                        [98.987439, 18.388735],
-                                                        [98.987393, 18.388658],
-                                                        [98.987305, 18.388595],
-                                                        [98.987211, 18.388516],
-                                                        [98.987173, 18.388457],
-                                                        [98.987103, 18.388322],
-                                                        [98.987002, 18.388083],
-                                                        [98.986745, 18.387806],
-                                                        [98.986688, 18.387449],
-                                                        [98.98669, 18.38721],
-                                                        [98.986692, 18.387039],
-                                                        [98.98671, 18.386691],
-                                                        [98.986735, 18.386199],
-                                                        [98.986719, 18.385599],
-                                                        [98.986618, 18.385235],
-                                                        [98.986414, 18.384904],
-                                                        [98.986312, 18.384451],
-                                                        [98.986205, 18.384222],
-                                                        [98.985593, 18.383921],
-                                                        [98.984896, 18.383896],
-                                                        [98.984048, 18.383891],
-                                                        [98.983839, 18.38391],
-                                                        [98.983668, 18.383926],
-                                                        [98.983437, 18.383881],
-                                                        [98.983201, 18.383723],
-                                                        [98.983062, 18.383546],
-                                                        [98.983045, 18.383524],
-                                                        [98.983013, 18.383351],
-                                                        [98.983072, 18.382644],
-                                                        [98.983104, 18.381951],
-                                                        [98.98305, 18.38175],
-                                                        [98.982793, 18.381483],
-                                                        [98.982402, 18.381305],
-                                                        [98.981935, 18.381244],
-                                                        [98.981559, 18.3813],
-                                                        [98.981318, 18.381422],
-                                                        [98.980701, 18.382022],
-                                                        [98.980218, 18.382282],
-                                                        [98.979607, 18.382521],
-                                                        [98.979097, 18.382608],
-                                                        [98.978678, 18.382837],
-                                                        [98.978536, 18.382941],
-                                                        [98.978228, 18.383],
-                                                        [98.977633, 18.38302],
-                                                        [98.977328, 18.383123],
-                                                        [98.976764, 18.383326],
-                                                        [98.976125, 18.383514],
-                                                        [98.975852, 18.383524],
-                                                        [98.97531, 18.383443],
-                                                        [98.974677, 18.383295],
-                                                        [98.974183, 18.383051],
-                                                        [98.973829, 18.382893],
-                                                        [98.973625, 18.382852],
-                                                        [98.973405, 18.382893],
-                                                        [98.973182, 18.382981],
-                                                        [98.973014, 18.383041],
-                                                        [98.972826, 18.383036],
-                                                        [98.972064, 18.382801],
-                                                        [98.971753, 18.38273],
-                                                        [98.971557, 18.382747],
-                                                        [98.971371, 18.382891],
-                                                        [98.970401, 18.382797],
-                                                        [98.969702, 18.382793],
-                                                        [98.969588, 18.382792],
-                                                        [98.969228, 18.382785],
-                                                        [98.969087, 18.382822],
-                                                        [98.968944, 18.382938],
-                                                        [98.968757, 18.38296],
-                                                        [98.968658, 18.382888],
-                                                        [98.968423, 18.38252],
-                                                        [98.968241, 18.38235],
-                                                        [98.968041, 18.382328],
-                                                        [98.967646, 18.382352],
-                                                        [98.967027, 18.38241],
-                                                        [98.966678, 18.382323],
-                                                        [98.966279, 18.382441],
-                                                        [98.964479, 18.38298],
-                                                        [98.964066, 18.383309],
-                                                        [98.963707, 18.383575],
-                                                        [98.963553, 18.383798],
-                                                        [98.963276, 18.384073],
-                                                        [98.962918, 18.384324],
-                                                        [98.962674, 18.384659],
-                                                        [98.962579, 18.384767],
-                                                        [98.962437, 18.384867],
-                                                        [98.961897, 18.384982],
-                                                        [98.961806, 18.38412],
-                                                        [98.96179, 18.383889],
-                                                        [98.96181, 18.383652],
-                                                        [98.961864, 18.383156],
-                                                        [98.962139, 18.381088],
-                                                        [98.96216, 18.380358],
-                                                        [98.962167, 18.379517],
-                                                        [98.962209, 18.379225],
-                                                        [98.962433, 18.378417],
-                                                        [98.962497, 18.378046],
-                                                        [98.962526, 18.377582],
-                                                        [98.962513, 18.37725],
-                                                        [98.962508, 18.377128],
-                                                        [98.962435, 18.37656],
-                                                        [98.9624, 18.376341],
-                                                        [98.962187, 18.375316],
-                                                        [98.962144, 18.375023],
-                                                        [98.961844, 18.373195],
-                                                        [98.961772, 18.372696],
-                                                        [98.961764, 18.372182],
-                                                        [98.961787, 18.370972],
-                                                        [98.96172, 18.370404],
-                                                        [98.961601, 18.369958],
-                                                        [98.961233, 18.368791],
-                                                        [98.960777, 18.366232],
-                                                        [98.960813, 18.365508],
-                                                        [98.9612, 18.363356],
-                                                        [98.961554, 18.361443],
-                                                        [98.961517, 18.360973],
-                                                        [98.961339, 18.360594],
-                                                        [98.961055, 18.360359],
-                                                        [98.960685, 18.360174],
-                                                        [98.960209, 18.360123],
-                                                        [98.959691, 18.360082],
-                                                        [98.959147, 18.360124],
-                                                        [98.958054, 18.360208],
-                                                        [98.957834, 18.360142],
-                                                        [98.95769, 18.359966],
-                                                        [98.957427, 18.359265],
-                                                        [98.957221, 18.358831],
-                                                        [98.957006, 18.358604],
-                                                        [98.956922, 18.358515],
-                                                        [98.956683, 18.358326],
-                                                        [98.956451, 18.358254],
-                                                        [98.956202, 18.35824],
-                                                        [98.955894, 18.358273],
-                                                        [98.955628, 18.358388],
-                                                        [98.955067, 18.358799],
-                                                        [98.954988, 18.358861],
-                                                        [98.954878, 18.358902],
-                                                        [98.954774, 18.358893],
-                                                        [98.954614, 18.358861],
-                                                        [98.954084, 18.358674],
-                                                        [98.953843, 18.358555],
-                                                        [98.953581, 18.358375],
-                                                        [98.953537, 18.35824],
-                                                        [98.953565, 18.358135],
-                                                        [98.953643, 18.357866],
-                                                        [98.953535, 18.357624],
-                                                        [98.953401, 18.357513],
-                                                        [98.953264, 18.357451],
-                                                        [98.952992, 18.357332],
-                                                        [98.952906, 18.357218],
-                                                        [98.95287, 18.357014],
-                                                        [98.952924, 18.356872],
-                                                        [98.953101, 18.356813],
-                                                        [98.953457, 18.356757],
-                                                        [98.9536, 18.356697],
-                                                        [98.953643, 18.35662],
-                                                        [98.953613, 18.356447],
-                                                        [98.953462, 18.356257],
-                                                        [98.953332, 18.356121],
-                                                        [98.95329, 18.355991],
-                                                        [98.953347, 18.355845],
-                                                        [98.953621, 18.355337],
-                                                        [98.953733, 18.355213],
-                                                        [98.953892, 18.355124],
-                                                        [98.954142, 18.355125],
-                                                        [98.954674, 18.355176],
-                                                        [98.954831, 18.355198],
-                                                        [98.954966, 18.355186],
-                                                        [98.955106, 18.355081],
-                                                        [98.955315, 18.354904],
-                                                        [98.955571, 18.354711],
-                                                        [98.955887, 18.354582],
-                                                        [98.956108, 18.354503],
-                                                        [98.956246, 18.354413],
-                                                        [98.956296, 18.354339],
-                                                        [98.956309, 18.354175],
-                                                        [98.956273, 18.354043],
-                                                        [98.956235, 18.353891],
-                                                        [98.956248, 18.353649],
-                                                        [98.956393, 18.353396],
-                                                        [98.956498, 18.353205],
-                                                        [98.956512, 18.353007],
-                                                        [98.95648, 18.352828],
-                                                        [98.955675, 18.351245],
-                                                        [98.955443, 18.350881],
-                                                        [98.955215, 18.350623],
-                                                        [98.954913, 18.350448],
-                                                        [98.954376, 18.350214],
-                                                        [98.954256, 18.350148],
-                                                        [98.95416, 18.350014],
-                                                        [98.954115, 18.349883],
-                                                        [98.954145, 18.349758],
-                                                        [98.95428, 18.349658],
-                                                        [98.954452, 18.349598],
-                                                        [98.955513, 18.349237],
-                                                        [98.955702, 18.349076],
-                                                        [98.955781, 18.348933],
-                                                        [98.955862, 18.346862],
-                                                        [98.95584, 18.346181],
-                                                        [98.955783, 18.345952],
-                                                        [98.955763, 18.345786],
-                                                        [98.955506, 18.345131],
-                                                        [98.95511, 18.344473],
-                                                        [98.95458, 18.343829],
-                                                        [98.954119, 18.343379],
-                                                        [98.953975, 18.34313],
-                                                        [98.953555, 18.342015],
-                                                        [98.95347, 18.341907],
-                                                        [98.953357, 18.34183],
-                                                        [98.95319, 18.341802],
-                                                        [98.952753, 18.341768],
-                                                        [98.951073, 18.341643],
-                                                        [98.950768, 18.341598],
-                                                        [98.950496, 18.341483],
-                                                        [98.949952, 18.341188],
-                                                        [98.949251, 18.340759],
-                                                        [98.949133, 18.340639],
-                                                        [98.948959, 18.340372],
-                                                        [98.948288, 18.338833],
-                                                        [98.94816, 18.338613],
-                                                        [98.948022, 18.338428],
-                                                        [98.947786, 18.338296],
-                                                        [98.942823, 18.336637],
-                                                        [98.942694, 18.33658],
-                                                        [98.94252, 18.336503],
-                                                        [98.942243, 18.336287],
-                                                        [98.941175, 18.334981],
-                                                        [98.940868, 18.334647],
-                                                        [98.939824, 18.334078],
-                                                        [98.938817, 18.333686],
-                                                        [98.937905, 18.333363],
-                                                        [98.936339, 18.332594],
-                                                        [98.932999, 18.330389],
-                                                        [98.931254, 18.329343],
-                                                        [98.930987, 18.329104],
-                                                        [98.929733, 18.327529],
-                                                        [98.929168, 18.32682],
-                                                        [98.928045, 18.325164],
-                                                        [98.927832, 18.324833],
-                                                        [98.926024, 18.322019],
-                                                        [98.925237, 18.320546],
-                                                        [98.925124, 18.320381],
-                                                        [98.924892, 18.320167],
-                                                        [98.922368, 18.317822],
-                                                        [98.922167, 18.318175],
-                                                        [98.92204, 18.318382],
-                                                        [98.921917, 18.318527],
-                                                        [98.921745, 18.318657],
-                                                        [98.921523, 18.318738],
-                                                        [98.92087, 18.318875],
-                                                        [98.920189, 18.319014],
-                                                        [98.920016, 18.319019],
-                                                        [98.919866, 18.318993],
-                                                        [98.918938, 18.3185],
-                                                        [98.91864, 18.318313],
-                                                        [98.918386, 18.318078],
-                                                        [98.918024, 18.317808],
-                                                        [98.917588, 18.317553],
-                                                        [98.917222, 18.31739],
-                                                        [98.916816, 18.31725],
-                                                        [98.915917, 18.317049],
-                                                        [98.915747, 18.317004],
-                                                        [98.915368, 18.316807],
-                                                        [98.915194, 18.316739],
-                                                        [98.91498, 18.316711],
-                                                        [98.914676, 18.316778],
-                                                        [98.913995, 18.31707],
-                                                        [98.913706, 18.31717],
-                                                        [98.913187, 18.317519],
-                                                        [98.912509, 18.318067],
-                                                        [98.91189, 18.318472],
-                                                        [98.911669, 18.318744],
-                                                        [98.911438, 18.319113],
-                                                        [98.910535, 18.320708],
-                                                        [98.910288, 18.321105],
-                                                        [98.910081, 18.321406],
-                                                        [98.909686, 18.321925],
-                                                        [98.909631, 18.322007],
-                                                        [98.909567, 18.322121],
-                                                        [98.909529, 18.322297],
-                                                        [98.909558, 18.322578],
-                                                        [98.909582, 18.32285],
-                                                        [98.909553, 18.323138],
-                                                        [98.909468, 18.323614],
-                                                        [98.909319, 18.323983],
-                                                        [98.908926, 18.324717],
-                                                        [98.908372, 18.325648],
-                                                        [98.908018, 18.326272],
-                                                        [98.907819, 18.326629],
-                                                        [98.907565, 18.327304],
-                                                        [98.907417, 18.327534],
-                                                        [98.907167, 18.327768],
-                                                        [98.906915, 18.327918],
-                                                        [98.906648, 18.328049],
-                                                        [98.906513, 18.328151],
-                                                        [98.906245, 18.328416],
-                                                        [98.906039, 18.328698],
-                                                        [98.905907, 18.328947],
-                                                        [98.905781, 18.329202],
-                                                        [98.905648, 18.329402],
-                                                        [98.905433, 18.329569],
-                                                        [98.905132, 18.329702],
-                                                        [98.904597, 18.329815],
-                                                        [98.904036, 18.329924],
-                                                        [98.903301, 18.330156],
-                                                        [98.902855, 18.330411],
-                                                        [98.902588, 18.330617],
-                                                        [98.902005, 18.331254],
-                                                        [98.901532, 18.331798],
-                                                        [98.901246, 18.332015],
-                                                        [98.900694, 18.332412],
-                                                        [98.900595, 18.332515],
-                                                        [98.899667, 18.333516],
-                                                        [98.899602, 18.333634],
-                                                        [98.899569, 18.33388],
-                                                        [98.899567, 18.33422],
-                                                        [98.899665, 18.336803],
-                                                        [98.899715, 18.338126],
-                                                        [98.899708, 18.338279],
-                                                        [98.899703, 18.338389],
-                                                        [98.899676, 18.338631],
-                                                        [98.89927, 18.340192],
-                                                        [98.899191, 18.340929],
-                                                        [98.899216, 18.341346],
-                                                        [98.899263, 18.341773],
-                                                        [98.899344, 18.342166],
-                                                        [98.899352, 18.342205],
-                                                        [98.89891, 18.34228],
-                                                        [98.898577, 18.342275],
-                                                        [98.898186, 18.342219],
-                                                        [98.89795, 18.342239],
-                                                        [98.897885, 18.342272],
-                                                        [98.897789, 18.342316],
-                                                        [98.897384, 18.342379],
-                                                        [98.896898, 18.342356],
-                                                        [98.896584, 18.342282],
-                                                        [98.89623, 18.342074],
-                                                        [98.895951, 18.341738],
-                                                        [98.895697, 18.341424],
-                                                        [98.895257, 18.340951],
-                                                        [98.894924, 18.340421],
-                                                        [98.894806, 18.340111],
-                                                        [98.894699, 18.339663],
-                                                        [98.894559, 18.339301],
-                                                        [98.894264, 18.338868],
-                                                        [98.893948, 18.338629],
-                                                        [98.893484, 18.338321],
-                                                        [98.892886, 18.338135],
-                                                        [98.892081, 18.337845],
-                                                        [98.891754, 18.337611],
-                                                        [98.891587, 18.337407],
-                                                        [98.891507, 18.337132],
-                                                        [98.891469, 18.336893],
-                                                        [98.891405, 18.336765],
-                                                        [98.891271, 18.336663],
-                                                        [98.890203, 18.33621],
-                                                        [98.889973, 18.336139],
-                                                        [98.889731, 18.335991],
-                                                        [98.889565, 18.335905],
-                                                        [98.889286, 18.335879],
-                                                        [98.889008, 18.335926],
-                                                        [98.888841, 18.335945],
-                                                        [98.888186, 18.336159],
-                                                        [98.886309, 18.336994],
-                                                        [98.885907, 18.337086],
-                                                        [98.885483, 18.337152],
-                                                        [98.8853, 18.337213],
-                                                        [98.885123, 18.337371],
-                                                        [98.883734, 18.337901],
-                                                        [98.883578, 18.338099],
-                                                        [98.88345, 18.338293],
-                                                        [98.883101, 18.338435],
-                                                        [98.881744, 18.338838],
-                                                        [98.881545, 18.33894],
-                                                        [98.881465, 18.339103],
-                                                        [98.881465, 18.339617],
-                                                        [98.881476, 18.340039],
-                                                        [98.881347, 18.340274],
-                                                        [98.881197, 18.340401],
-                                                        [98.88102, 18.340452],
-                                                        [98.880896, 18.340461],
-                                                        [98.880784, 18.340284],
-                                                        [98.880365, 18.34005],
-                                                        [98.880081, 18.339856],
-                                                        [98.879582, 18.339515],
-                                                        [98.879335, 18.339413],
-                                                        [98.879104, 18.339342],
-                                                        [98.878723, 18.339162],
-                                                        [98.878438, 18.338943],
-                                                        [98.878278, 18.338734],
-                                                        [98.878159, 18.338479],
-                                                        [98.878047, 18.338098],
-                                                        [98.877918, 18.337721],
-                                                        [98.877752, 18.337502],
-                                                        [98.877571, 18.337295],
-                                                        [98.877301, 18.336987],
-                                                        [98.877262, 18.336911],
-                                                        [98.877135, 18.336662],
-                                                        [98.877119, 18.336478],
-                                                        [98.877172, 18.336259],
-                                                        [98.877285, 18.336005],
-                                                        [98.877285, 18.335837],
-                                                        [98.87717, 18.335553],
-                                                        [98.877038, 18.335409],
-                                                        [98.876797, 18.335271],
-                                                        [98.876579, 18.335216],
-                                                        [98.876423, 18.33513],
-                                                        [98.87625, 18.334996],
-                                                        [98.876083, 18.33493],
-                                                        [98.87581, 18.33491],
-                                                        [98.875241, 18.334951],
-                                                        [98.875107, 18.334996],
-                                                        [98.874978, 18.335124],
-                                                        [98.874876, 18.33518],
-                                                        [98.874603, 18.335215],
-                                                        [98.87442, 18.335322],
-                                                        [98.874222, 18.33545],
-                                                        [98.874072, 18.335485],
-                                                        [98.873868, 18.335419],
-                                                        [98.873555, 18.335036],
-                                                        [98.873344, 18.33488],
-                                                        [98.873107, 18.334809],
-                                                        [98.87285, 18.334691],
-                                                        [98.872684, 18.334646],
-                                                        [98.872365, 18.334613],
-                                                        [98.872091, 18.334554],
-                                                        [98.871764, 18.33445],
-                                                        [98.871477, 18.334394],
-                                                        [98.871208, 18.334381],
-                                                        [98.871123, 18.334348],
-                                                        [98.87108, 18.33431],
-                                                        [98.871069, 18.334259],
-                                                        [98.87109, 18.334159],
-                                                        [98.871268, 18.333961],
-                                                        [98.871402, 18.333874],
-                                                        [98.871622, 18.333811],
-                                                        [98.871713, 18.333808],
-                                                        [98.871841, 18.333844],
-                                                        [98.87193, 18.333867],
-                                                        [98.872008, 18.333861],
-                                                        [98.872099, 18.333828],
-                                                        [98.87223, 18.333742],
-                                                        [98.87241, 18.33353],
-                                                        [98.872461, 18.333464],
-                                                        [98.872552, 18.333403],
-                                                        [98.872719, 18.333319],
-                                                        [98.872794, 18.333273],
-                                                        [98.872847, 18.333171],
-                                                        [98.872853, 18.333057],
-                                                        [98.872802, 18.332868],
-                                                        [98.872724, 18.332736],
-                                                        [98.872292, 18.332283],
-                                                        [98.872228, 18.332173],
-                                                        [98.872198, 18.331929],
-                                                        [98.87219, 18.331562],
-                                                        [98.872171, 18.331435],
-                                                        [98.872099, 18.331333],
-                                                        [98.871986, 18.331247],
-                                                        [98.871911, 18.331186],
-                                                        [98.871874, 18.331104],
-                                                        [98.871863, 18.330735],
-                                                        [98.871884, 18.330646],
-                                                        [98.871935, 18.330569],
-                                                        [98.872338, 18.330343],
-                                                        [98.872617, 18.330193],
-                                                        [98.873043, 18.33003],
-                                                        [98.87311, 18.329986],
-                                                        [98.873145, 18.32994],
-                                                        [98.873215, 18.329645],
-                                                        [98.87325, 18.329098],
-                                                        [98.87322, 18.32896],
-                                                        [98.873167, 18.328874],
-                                                        [98.873094, 18.328813],
-                                                        [98.87274, 18.328632],
-                                                        [98.872705, 18.328548],
-                                                        [98.872705, 18.328456],
-                                                        [98.872834, 18.328145]]}},
-                          {'type': 'Feature',
-                           'properties': {'agent_id': 4709,
-                                          'segment': 4,
-                                          'from': 'ถ้ำเอราวัณ',
-                                          'to': 'ร้านอาหารถุงทอง',
-                                          'distance_m': 23594,
-                                          'distance_km': 23.594,
-                                          'from_source': 'csv',
-                                          'to_source': 'csv'},
-                           'geometry': {'type': 'LineString',
-                                        'coordinates': [[98.872834, 18.328145],
-                                                        [98.872705, 18.328456],
-                                                        [98.872705, 18.328548],
-                                                        [98.87274, 18.328632],
-                                                        [98.873094, 18.328813],
-                                                        [98.873167, 18.328874],
-                                                        [98.87322, 18.32896],
-                                                        [98.87325, 18.329098],
-                                                        [98.873215, 18.329645],
-                                                        [98.873145, 18.32994],
-                                                        [98.87311, 18.329986],
-                                                        [98.873043, 18.33003],
-                                                        [98.872617, 18.330193],
-                                                        [98.872338, 18.330343],
-                                                        [98.871935, 18.330569],
-                                                        [98.871884, 18.330646],
-                                                        [98.871863, 18.330735],
-                                                        [98.871874, 18.331104],
-                                                        [98.871911, 18.331186],
-                                                        [98.871986, 18.331247],
-                                                        [98.872099, 18.331333],
-                                                        [98.872171, 18.331435],
-                                                        [98.87219, 18.331562],
-                                                        [98.872198, 18.331929],
-                                                        [98.872228, 18.332173],
-                                                        [98.872292, 18.332283],
-                                                        [98.872724, 18.332736],
-                                                        [98.872802, 18.332868],
-                                                        [98.872853, 18.333057],
-                                                        [98.872847, 18.333171],
-                                                        [98.872794, 18.333273],
-                                                        [98.872719, 18.333319],
-                                                        [98.872552, 18.333403],
-                                                        [98.872461, 18.333464],
-                                                        [98.87241, 18.33353],
-                                                        [98.87223, 18.333742],
-                                                        [98.872099, 18.333828],
-                                                        [98.872008, 18.333861],
-                                                        [98.87193, 18.333867],
-                                                        [98.871841, 18.333844],
-                                                        [98.871713, 18.333808],
-                                                        [98.871622, 18.333811],
-                                                        [98.871402, 18.333874],
-                                                        [98.871268, 18.333961],
-                                                        [98.87109, 18.334159],
-                                                        [98.871069, 18.334259],
-                                                        [98.87108, 18.33431],
-                                                        [98.871123, 18.334348],
-                                                        [98.871208, 18.334381],
-                                                        [98.871477, 18.334394],
-                                                        [98.871764, 18.33445],
-                                                        [98.872091, 18.334554],
-                                                        [98.872365, 18.334613],
-                                                        [98.872684, 18.334646],
-                                                        [98.87285, 18.334691],
-                                                        [98.873107, 18.334809],
-                                                        [98.873344, 18.33488],
-                                                        [98.873555, 18.335036],
-                                                        [98.873868, 18.335419],
-                                                        [98.874072, 18.335485],
-                                                        [98.874222, 18.33545],
-                                                        [98.87442, 18.335322],
-                                                        [98.874603, 18.335215],
-                                                        [98.874876, 18.33518],
-                                                        [98.874978, 18.335124],
-                                                        [98.875107, 18.334996],
-                                                        [98.875241, 18.334951],
-                                                        [98.87581, 18.33491],
-                                                        [98.876083, 18.33493],
-                                                        [98.87625, 18.334996],
-                                                        [98.876423, 18.33513],
-                                                        [98.876579, 18.335216],
-                                                        [98.876797, 18.335271],
-                                                        [98.877038, 18.335409],
-                                                        [98.87717, 18.335553],
-                                                        [98.877285, 18.335837],
-                                                        [98.877285, 18.336005],
-                                                        [98.877172, 18.336259],
-                                                        [98.877119, 18.336478],
-                                                        [98.877135, 18.336662],
-                                                        [98.877262, 18.336911],
-                                                        [98.877301, 18.336987],
-                                                        [98.877571, 18.337295],
-                                                        [98.877752, 18.337502],
-                                                        [98.877918, 18.337721],
-                                                        [98.878047, 18.338098],
-                                                        [98.878159, 18.338479],
-                                                        [98.878278, 18.338734],
-                                                        [98.878438, 18.338943],
-                                                        [98.878723, 18.339162],
-                                                        [98.879104, 18.339342],
-                                                        [98.879335, 18.339413],
-                                                        [98.879582, 18.339515],
-                                                        [98.880081, 18.339856],
-                                                        [98.880365, 18.34005],
-                                                        [98.880784, 18.340284],
-                                                        [98.880896, 18.340461],
-                                                        [98.8808, 18.34062],
-                                                        [98.880682, 18.340681],
-                                                        [98.88036, 18.340707],
-                                                        [98.879963, 18.340864],
-                                                        [98.879582, 18.341119],
-                                                        [98.878453, 18.342206],
-                                                        [98.878235, 18.342473],
-                                                        [98.878112, 18.342687],
-                                                        [98.877806, 18.342881],
-                                                        [98.877527, 18.343156],
-                                                        [98.877302, 18.343482],
-                                                        [98.877168, 18.343558],
-                                                        [98.876814, 18.343609],
-                                                        [98.876594, 18.343731],
-                                                        [98.876412, 18.344011],
-                                                        [98.876358, 18.344225],
-                                                        [98.876336, 18.34452],
-                                                        [98.876412, 18.344668],
-                                                        [98.876733, 18.344989],
-                                                        [98.876776, 18.345101],
-                                                        [98.876843, 18.345612],
-                                                        [98.876961, 18.346137],
-                                                        [98.877053, 18.346309],
-                                                        [98.877135, 18.346406],
-                                                        [98.877323, 18.346491],
-                                                        [98.877779, 18.346735],
-                                                        [98.8779, 18.346891],
-                                                        [98.878155, 18.347341],
-                                                        [98.878292, 18.347624],
-                                                        [98.878329, 18.347929],
-                                                        [98.878268, 18.348283],
-                                                        [98.878298, 18.348668],
-                                                        [98.878174, 18.349197],
-                                                        [98.878195, 18.349671],
-                                                        [98.878171, 18.350691],
-                                                        [98.878241, 18.351002],
-                                                        [98.878203, 18.35119],
-                                                        [98.878089, 18.351396],
-                                                        [98.877688, 18.352118],
-                                                        [98.875362, 18.356628],
-                                                        [98.875218, 18.356834],
-                                                        [98.875038, 18.35698],
-                                                        [98.874651, 18.357171],
-                                                        [98.874486, 18.35729],
-                                                        [98.87411, 18.357835],
-                                                        [98.873928, 18.357962],
-                                                        [98.873825, 18.357998],
-                                                        [98.873702, 18.357988],
-                                                        [98.873424, 18.357855],
-                                                        [98.873279, 18.357845],
-                                                        [98.873043, 18.357947],
-                                                        [98.872184, 18.358843],
-                                                        [98.872088, 18.359021],
-                                                        [98.872099, 18.359123],
-                                                        [98.872184, 18.359266],
-                                                        [98.87216, 18.359416],
-                                                        [98.871117, 18.361918],
-                                                        [98.87102, 18.362053],
-                                                        [98.870897, 18.362183],
-                                                        [98.870712, 18.362329],
-                                                        [98.870044, 18.362916],
-                                                        [98.869792, 18.363247],
-                                                        [98.869066, 18.364563],
-                                                        [98.869008, 18.364629],
-                                                        [98.868934, 18.364708],
-                                                        [98.868301, 18.365263],
-                                                        [98.86768, 18.365783],
-                                                        [98.867378, 18.366088],
-                                                        [98.866974, 18.366533],
-                                                        [98.866776, 18.366673],
-                                                        [98.86653, 18.366811],
-                                                        [98.865925, 18.36697],
-                                                        [98.865607, 18.367075],
-                                                        [98.865275, 18.367238],
-                                                        [98.864438, 18.367681],
-                                                        [98.864203, 18.367859],
-                                                        [98.863741, 18.368207],
-                                                        [98.86341, 18.368455],
-                                                        [98.863328, 18.368516],
-                                                        [98.863183, 18.368598],
-                                                        [98.862604, 18.368807],
-                                                        [98.86189, 18.369031],
-                                                        [98.861541, 18.369214],
-                                                        [98.861321, 18.369423],
-                                                        [98.861187, 18.369723],
-                                                        [98.860694, 18.372095],
-                                                        [98.86053, 18.372169],
-                                                        [98.860257, 18.372403],
-                                                        [98.860104, 18.372599],
-                                                        [98.859849, 18.37305],
-                                                        [98.859519, 18.373424],
-                                                        [98.859074, 18.373847],
-                                                        [98.858623, 18.374183],
-                                                        [98.858087, 18.374529],
-                                                        [98.857935, 18.374658],
-                                                        [98.857817, 18.374767],
-                                                        [98.857483, 18.375173],
-                                                        [98.857306, 18.375356],
-                                                        [98.857167, 18.375432],
-                                                        [98.856976, 18.375471],
-                                                        [98.856746, 18.375471],
-                                                        [98.856499, 18.375501],
-                                                        [98.856236, 18.375603],
-                                                        [98.855946, 18.375781],
-                                                        [98.855667, 18.375944],
-                                                        [98.855531, 18.375974],
-                                                        [98.85548, 18.375985],
-                                                        [98.855292, 18.37598],
-                                                        [98.854981, 18.375924],
-                                                        [98.854902, 18.375912],
-                                                        [98.854777, 18.375893],
-                                                        [98.854519, 18.375908],
-                                                        [98.853618, 18.376092],
-                                                        [98.853436, 18.376092],
-                                                        [98.853259, 18.376051],
-                                                        [98.853082, 18.375975],
-                                                        [98.852813, 18.375858],
-                                                        [98.85254, 18.375776],
-                                                        [98.852282, 18.375766],
-                                                        [98.852014, 18.375812],
-                                                        [98.851472, 18.375934],
-                                                        [98.851231, 18.376026],
-                                                        [98.85015, 18.376588],
-                                                        [98.849933, 18.376754],
-                                                        [98.848922, 18.378008],
-                                                        [98.84871, 18.378184],
-                                                        [98.848479, 18.37825],
-                                                        [98.848254, 18.37825],
-                                                        [98.847771, 18.378179],
-                                                        [98.847334, 18.378181],
-                                                        [98.846848, 18.378235],
-                                                        [98.846642, 18.378304],
-                                                        [98.846312, 18.378495],
-                                                        [98.845915, 18.378678],
-                                                        [98.843855, 18.379396],
-                                                        [98.843597, 18.379503],
-                                                        [98.843343, 18.379663],
-                                                        [98.842975, 18.379961],
-                                                        [98.84261, 18.380287],
-                                                        [98.842396, 18.380393],
-                                                        [98.84216, 18.380429],
-                                                        [98.841838, 18.380419],
-                                                        [98.841532, 18.380434],
-                                                        [98.84117, 18.380518],
-                                                        [98.839827, 18.380875],
-                                                        [98.838861, 18.381132],
-                                                        [98.838533, 18.381244],
-                                                        [98.838174, 18.381396],
-                                                        [98.837144, 18.38189],
-                                                        [98.837002, 18.381989],
-                                                        [98.836567, 18.382478],
-                                                        [98.836366, 18.382608],
-                                                        [98.836111, 18.382677],
-                                                        [98.83532, 18.382766],
-                                                        [98.833963, 18.382913],
-                                                        [98.833644, 18.382997],
-                                                        [98.83344, 18.383125],
-                                                        [98.833266, 18.383326],
-                                                        [98.833005, 18.383853],
-                                                        [98.832756, 18.384181],
-                                                        [98.832386, 18.384547],
-                                                        [98.83142, 18.385398],
-                                                        [98.831254, 18.385571],
-                                                        [98.831141, 18.385764],
-                                                        [98.830755, 18.386563],
-                                                        [98.830578, 18.386808],
-                                                        [98.830106, 18.387291],
-                                                        [98.82987, 18.387469],
-                                                        [98.82929, 18.387724],
-                                                        [98.829081, 18.387872],
-                                                        [98.828295, 18.388628],
-                                                        [98.827644, 18.38919],
-                                                        [98.827338, 18.389414],
-                                                        [98.827286, 18.389438],
-                                                        [98.826981, 18.389579],
-                                                        [98.82656, 18.389725],
-                                                        [98.825524, 18.390062],
-                                                        [98.825312, 18.390175],
-                                                        [98.821054, 18.386069],
-                                                        [98.820888, 18.38593],
-                                                        [98.818129, 18.38325],
-                                                        [98.817761, 18.382949],
-                                                        [98.81715, 18.382303],
-                                                        [98.816809, 18.381904],
-                                                        [98.81658, 18.381535],
-                                                        [98.816435, 18.381187],
-                                                        [98.815933, 18.379321],
-                                                        [98.814472, 18.374038],
-                                                        [98.813878, 18.371733],
-                                                        [98.813372, 18.36987],
-                                                        [98.813128, 18.368976],
-                                                        [98.812743, 18.367568],
-                                                        [98.81273, 18.367519],
-                                                        [98.812601, 18.367048],
-                                                        [98.812422, 18.366392],
-                                                        [98.812246, 18.365731],
-                                                        [98.812217, 18.365603],
-                                                        [98.812159, 18.365401],
-                                                        [98.811722, 18.363691],
-                                                        [98.811692, 18.363606],
-                                                        [98.811453, 18.362669],
-                                                        [98.811313, 18.362054],
-                                                        [98.810875, 18.360279],
-                                                        [98.810793, 18.359981],
-                                                        [98.810646, 18.359427],
-                                                        [98.810352, 18.358301],
-                                                        [98.810254, 18.357945],
-                                                        [98.810021, 18.35706],
-                                                        [98.809696, 18.355907],
-                                                        [98.809453, 18.355017],
-                                                        [98.808959, 18.353209],
-                                                        [98.808458, 18.351213],
-                                                        [98.808261, 18.350335],
-                                                        [98.808209, 18.350082],
-                                                        [98.808158, 18.349856],
-                                                        [98.808157, 18.349837],
-                                                        [98.80815, 18.349652],
-                                                        [98.808179, 18.349436],
-                                                        [98.808847, 18.346902],
-                                                        [98.809014, 18.34637],
-                                                        [98.809098, 18.3461],
-                                                        [98.809208, 18.345739],
-                                                        [98.809332, 18.345468],
-                                                        [98.80949, 18.345202],
-                                                        [98.809658, 18.344975],
-                                                        [98.80983, 18.344777],
-                                                        [98.810067, 18.344564],
-                                                        [98.810303, 18.344402],
-                                                        [98.811178, 18.343949],
-                                                        [98.812364, 18.343376],
-                                                        [98.813139, 18.343003],
-                                                        [98.813814, 18.342677],
-                                                        [98.814106, 18.342484],
-                                                        [98.814354, 18.342283],
-                                                        [98.814591, 18.342042],
-                                                        [98.814801, 18.341738],
-                                                        [98.815032, 18.341309],
-                                                        [98.815537, 18.340326],
-                                                        [98.815878, 18.339542],
-                                                        [98.816061, 18.3392],
-                                                        [98.816434, 18.338502],
-                                                        [98.816516, 18.338348],
-                                                        [98.816872, 18.337681],
-                                                        [98.816986, 18.337429],
-                                                        [98.817192, 18.336984],
-                                                        [98.81726, 18.336828],
-                                                        [98.817421, 18.336478],
-                                                        [98.817466, 18.336386],
-                                                        [98.817529, 18.33615],
-                                                        [98.817551, 18.336089],
-                                                        [98.817596, 18.335904],
-                                                        [98.817621, 18.335665],
-                                                        [98.817648, 18.335412],
-                                                        [98.817659, 18.335284],
-                                                        [98.817672, 18.335209],
-                                                        [98.817678, 18.335082],
-                                                        [98.817654, 18.334391],
-                                                        [98.817637, 18.333911],
-                                                        [98.817606, 18.332644],
-                                                        [98.817575, 18.331637],
-                                                        [98.817565, 18.331442],
-                                                        [98.817532, 18.330216],
-                                                        [98.817502, 18.329231],
-                                                        [98.817534, 18.328901],
-                                                        [98.817468, 18.327021],
-                                                        [98.817453, 18.326627],
-                                                        [98.817445, 18.326188],
-                                                        [98.817436, 18.325892],
-                                                        [98.817427, 18.325577],
-                                                        [98.817421, 18.325523],
-                                                        [98.817332, 18.323632],
-                                                        [98.817319, 18.323194],
-                                                        [98.817313, 18.323006],
-                                                        [98.81733, 18.322781],
-                                                        [98.817346, 18.32263],
-                                                        [98.817385, 18.322421],
-                                                        [98.817455, 18.322136],
-                                                        [98.817557, 18.321865],
-                                                        [98.817647, 18.321686],
-                                                        [98.81774, 18.321533],
-                                                        [98.817955, 18.321205],
-                                                        [98.82018, 18.318197],
-                                                        [98.820506, 18.31775],
-                                                        [98.8209, 18.317354],
-                                                        [98.821641, 18.316788],
-                                                        [98.821854, 18.316636],
-                                                        [98.8224, 18.316246],
-                                                        [98.823046, 18.315785],
-                                                        [98.823121, 18.315726],
-                                                        [98.823513, 18.315398],
-                                                        [98.82384, 18.31495],
-                                                        [98.824049, 18.314512],
-                                                        [98.824237, 18.313825],
-                                                        [98.824444, 18.312628],
-                                                        [98.824452, 18.312293],
-                                                        [98.824404, 18.311996],
-                                                        [98.824299, 18.311743],
-                                                        [98.824076, 18.311415],
-                                                        [98.823756, 18.311093],
-                                                        [98.822897, 18.310268],
-                                                        [98.821553, 18.308929],
-                                                        [98.821316, 18.308644],
-                                                        [98.82102, 18.308158],
-                                                        [98.820734, 18.307524],
-                                                        [98.820609, 18.307103],
-                                                        [98.820474, 18.306653],
-                                                        [98.819994, 18.304955],
-                                                        [98.81989, 18.304622],
-                                                        [98.819791, 18.304392],
-                                                        [98.819605, 18.304055],
-                                                        [98.819367, 18.303736],
-                                                        [98.819058, 18.303453],
-                                                        [98.81852, 18.30304],
-                                                        [98.816543, 18.301564],
-                                                        [98.815769, 18.301001],
-                                                        [98.815502, 18.300641],
-                                                        [98.815407, 18.30046],
-                                                        [98.815312, 18.300181],
-                                                        [98.815275, 18.299971],
-                                                        [98.815284, 18.29976],
-                                                        [98.81532, 18.299445],
-                                                        [98.815374, 18.299154],
-                                                        [98.815586, 18.298179],
-                                                        [98.815674, 18.298199],
-                                                        [98.816018, 18.298276],
-                                                        [98.816493, 18.298383],
-                                                        [98.816984, 18.298602],
-                                                        [98.817237, 18.298265],
-                                                        [98.817475, 18.298057],
-                                                        [98.817583, 18.298407],
-                                                        [98.817909, 18.298331]]}},
-                          {'type': 'Feature',
-                           'properties': {'agent_id': 4709,
-                                          'segment': 5,
-                                          'from': 'ร้านอาหารถุงทอง',
-                                          'to': 'พีทีที สเตชั่น สาขาลำพูน-ดอยติ',
-                                          'distance_m': 46831.6,
-                                          'distance_km': 46.8316,
-                                          'from_source': 'csv',
-                                          'to_source': 'csv'},
-                           'geometry': {'type': 'LineString',
-                                        'coordinates': [[98.817909, 18.298331],
-                                                        [98.817583, 18.298407],
-                                                        [98.817624, 18.298517],
-                                                        [98.817678, 18.29887],
-                                                        [98.817462, 18.298816],
-                                                        [98.816984, 18.298602],
-                                                        [98.816493, 18.298383],
-                                                        [98.816018, 18.298276],
-                                                        [98.815674, 18.298199],
-                                                        [98.815586, 18.298179],
-                                                        [98.815648, 18.297889],
-                                                        [98.815848, 18.296958],
-                                                        [98.81569, 18.296925],
-                                                        [98.815496, 18.297851],
-                                                        [98.81547, 18.29797],
-                                                        [98.815393, 18.298357],
-                                                        [98.815252, 18.299051],
-                                                        [98.815128, 18.299655],
-                                                        [98.815102, 18.299907],
-                                                        [98.815106, 18.30003],
-                                                        [98.81511, 18.300173],
-                                                        [98.815172, 18.300352],
-                                                        [98.815239, 18.300501],
-                                                        [98.815309, 18.300642],
-                                                        [98.815396, 18.300782],
-                                                        [98.815627, 18.301066],
-                                                        [98.816681, 18.301854],
-                                                        [98.817927, 18.302766],
-                                                        [98.81826, 18.303012],
-                                                        [98.818436, 18.303143],
-                                                        [98.819171, 18.303729],
-                                                        [98.819531, 18.304169],
-                                                        [98.819674, 18.304429],
-                                                        [98.819782, 18.304705],
-                                                        [98.819846, 18.304921],
-                                                        [98.819926, 18.305187],
-                                                        [98.820069, 18.305687],
-                                                        [98.820107, 18.305793],
-                                                        [98.820356, 18.306681],
-                                                        [98.820622, 18.307552],
-                                                        [98.820855, 18.308085],
-                                                        [98.820934, 18.308266],
-                                                        [98.821043, 18.308466],
-                                                        [98.821223, 18.308746],
-                                                        [98.821447, 18.30903],
-                                                        [98.821527, 18.309124],
-                                                        [98.822831, 18.310369],
-                                                        [98.823684, 18.311184],
-                                                        [98.823994, 18.311496],
-                                                        [98.824209, 18.311817],
-                                                        [98.824288, 18.31202],
-                                                        [98.824325, 18.312225],
-                                                        [98.824312, 18.312618],
-                                                        [98.824058, 18.314126],
-                                                        [98.823961, 18.314435],
-                                                        [98.823731, 18.314883],
-                                                        [98.823482, 18.315246],
-                                                        [98.8231, 18.315587],
-                                                        [98.822329, 18.316151],
-                                                        [98.82221, 18.316238],
-                                                        [98.821286, 18.316913],
-                                                        [98.820862, 18.31725],
-                                                        [98.82042, 18.317685],
-                                                        [98.820057, 18.318179],
-                                                        [98.819086, 18.3195],
-                                                        [98.819001, 18.319617],
-                                                        [98.817978, 18.321013],
-                                                        [98.817875, 18.321155],
-                                                        [98.817658, 18.321486],
-                                                        [98.817562, 18.321644],
-                                                        [98.817468, 18.321829],
-                                                        [98.817363, 18.322111],
-                                                        [98.817291, 18.322403],
-                                                        [98.817251, 18.322618],
-                                                        [98.817234, 18.322773],
-                                                        [98.817217, 18.323004],
-                                                        [98.817223, 18.323196],
-                                                        [98.817236, 18.323635],
-                                                        [98.817331, 18.32558],
-                                                        [98.817348, 18.326193],
-                                                        [98.817373, 18.327049],
-                                                        [98.817438, 18.328898],
-                                                        [98.817502, 18.329231],
-                                                        [98.817532, 18.330216],
-                                                        [98.817565, 18.331442],
-                                                        [98.817575, 18.331637],
-                                                        [98.817606, 18.332644],
-                                                        [98.817637, 18.333911],
-                                                        [98.817654, 18.334391],
-                                                        [98.817678, 18.335082],
-                                                        [98.817672, 18.335209],
-                                                        [98.817659, 18.335284],
-                                                        [98.817648, 18.335412],
-                                                        [98.817621, 18.335665],
-                                                        [98.817596, 18.335904],
-                                                        [98.817551, 18.336089],
-                                                        [98.817529, 18.33615],
-                                                        [98.817466, 18.336386],
-                                                        [98.817421, 18.336478],
-                                                        [98.81726, 18.336828],
-                                                        [98.817192, 18.336984],
-                                                        [98.816986, 18.337429],
-                                                        [98.816872, 18.337681],
-                                                        [98.816516, 18.338348],
-                                                        [98.816434, 18.338502],
-                                                        [98.816061, 18.3392],
-                                                        [98.815878, 18.339542],
-                                                        [98.815444, 18.340268],
-                                                        [98.814889, 18.341323],
-                                                        [98.814674, 18.341711],
-                                                        [98.8145, 18.34197],
-                                                        [98.814272, 18.342202],
-                                                        [98.814033, 18.342395],
-                                                        [98.813753, 18.34258],
-                                                        [98.81231, 18.343276],
-                                                        [98.811123, 18.343849],
-                                                        [98.810294, 18.344274],
-                                                        [98.809991, 18.344477],
-                                                        [98.809743, 18.3447],
-                                                        [98.809564, 18.344907],
-                                                        [98.80939, 18.345142],
-                                                        [98.809226, 18.345418],
-                                                        [98.809097, 18.345701],
-                                                        [98.808925, 18.346235],
-                                                        [98.808736, 18.346856],
-                                                        [98.808062, 18.349417],
-                                                        [98.808032, 18.349647],
-                                                        [98.808039, 18.349861],
-                                                        [98.808091, 18.350098],
-                                                        [98.808145, 18.350357],
-                                                        [98.808343, 18.351239],
-                                                        [98.808414, 18.351553],
-                                                        [98.808857, 18.353243],
-                                                        [98.809156, 18.35425],
-                                                        [98.809357, 18.355062],
-                                                        [98.809581, 18.355932],
-                                                        [98.810761, 18.360308],
-                                                        [98.81089, 18.360743],
-                                                        [98.811242, 18.361933],
-                                                        [98.811453, 18.362669],
-                                                        [98.811692, 18.363606],
-                                                        [98.811722, 18.363691],
-                                                        [98.812159, 18.365401],
-                                                        [98.812217, 18.365603],
-                                                        [98.812246, 18.365731],
-                                                        [98.812422, 18.366392],
-                                                        [98.812601, 18.367048],
-                                                        [98.81273, 18.367519],
-                                                        [98.812743, 18.367568],
-                                                        [98.813128, 18.368976],
-                                                        [98.813372, 18.36987],
-                                                        [98.813878, 18.371733],
-                                                        [98.814472, 18.374038],
-                                                        [98.815933, 18.379321],
-                                                        [98.816435, 18.381187],
-                                                        [98.81658, 18.381535],
-                                                        [98.816809, 18.381904],
-                                                        [98.81715, 18.382303],
-                                                        [98.817761, 18.382949],
-                                                        [98.818129, 18.38325],
-                                                        [98.820888, 18.38593],
-                                                        [98.821054, 18.386069],
-                                                        [98.825312, 18.390175],
-                                                        [98.826846, 18.391645],
-                                                        [98.826965, 18.39176],
-                                                        [98.828756, 18.393493],
-                                                        [98.83025, 18.394937],
-                                                        [98.83238, 18.396997],
-                                                        [98.832789, 18.397379],
-                                                        [98.833445, 18.398019],
-                                                        [98.836628, 18.401084],
-                                                        [98.837304, 18.401737],
-                                                        [98.83854, 18.402929],
-                                                        [98.842889, 18.407126],
-                                                        [98.843245, 18.407476],
-                                                        [98.854598, 18.418427],
-                                                        [98.859764, 18.423385],
-                                                        [98.860254, 18.423963],
-                                                        [98.860624, 18.424309],
-                                                        [98.862034, 18.425627],
-                                                        [98.863209, 18.426767],
-                                                        [98.86403, 18.427565],
-                                                        [98.865134, 18.428619],
-                                                        [98.86673, 18.430147],
-                                                        [98.866931, 18.430343],
-                                                        [98.867742, 18.431131],
-                                                        [98.868044, 18.431421],
-                                                        [98.868264, 18.431636],
-                                                        [98.869408, 18.43269],
-                                                        [98.869591, 18.432865],
-                                                        [98.87062, 18.433907],
-                                                        [98.872119, 18.435368],
-                                                        [98.872305, 18.435542],
-                                                        [98.873975, 18.437159],
-                                                        [98.874231, 18.437399],
-                                                        [98.874492, 18.437608],
-                                                        [98.874761, 18.437811],
-                                                        [98.875005, 18.437982],
-                                                        [98.875387, 18.438236],
-                                                        [98.875882, 18.438561],
-                                                        [98.876238, 18.438802],
-                                                        [98.876774, 18.439178],
-                                                        [98.877109, 18.439462],
-                                                        [98.877331, 18.439694],
-                                                        [98.877579, 18.439988],
-                                                        [98.878741, 18.441634],
-                                                        [98.879394, 18.44243],
-                                                        [98.87965, 18.442788],
-                                                        [98.879963, 18.443119],
-                                                        [98.880243, 18.443402],
-                                                        [98.880731, 18.443722],
-                                                        [98.881526, 18.44411],
-                                                        [98.881954, 18.444311],
-                                                        [98.882864, 18.444739],
-                                                        [98.884182, 18.445357],
-                                                        [98.884454, 18.445485],
-                                                        [98.884827, 18.44566],
-                                                        [98.885772, 18.446104],
-                                                        [98.886791, 18.446583],
-                                                        [98.887213, 18.446781],
-                                                        [98.888016, 18.447158],
-                                                        [98.888201, 18.447251],
-                                                        [98.888339, 18.447335],
-                                                        [98.888567, 18.447495],
-                                                        [98.88886, 18.447716],
-                                                        [98.889165, 18.448027],
-                                                        [98.889631, 18.448612],
-                                                        [98.889832, 18.448907],
-                                                        [98.890139, 18.449358],
-                                                        [98.890526, 18.44994],
-                                                        [98.891449, 18.451264],
-                                                        [98.892211, 18.452326],
-                                                        [98.892405, 18.452543],
-                                                        [98.892752, 18.45285],
-                                                        [98.892936, 18.452993],
-                                                        [98.893207, 18.453144],
-                                                        [98.893502, 18.453283],
-                                                        [98.893727, 18.453359],
-                                                        [98.896172, 18.453858],
-                                                        [98.898018, 18.454234],
-                                                        [98.899235, 18.454482],
-                                                        [98.89966, 18.45456],
-                                                        [98.901007, 18.454827],
-                                                        [98.901684, 18.454961],
-                                                        [98.904877, 18.4556],
-                                                        [98.905783, 18.455779],
-                                                        [98.906221, 18.45586],
-                                                        [98.908781, 18.456443],
-                                                        [98.909422, 18.456582],
-                                                        [98.909989, 18.45673],
-                                                        [98.910455, 18.456852],
-                                                        [98.910917, 18.456972],
-                                                        [98.911875, 18.45722],
-                                                        [98.912579, 18.457539],
-                                                        [98.913029, 18.457812],
-                                                        [98.913583, 18.45828],
-                                                        [98.914645, 18.459334],
-                                                        [98.915526, 18.460254],
-                                                        [98.91636, 18.461105],
-                                                        [98.916502, 18.461252],
-                                                        [98.916812, 18.461572],
-                                                        [98.91814, 18.462943],
-                                                        [98.918461, 18.463275],
-                                                        [98.919493, 18.464341],
-                                                        [98.919635, 18.464488],
-                                                        [98.919848, 18.46471],
-                                                        [98.919911, 18.464762],
-                                                        [98.920188, 18.465054],
-                                                        [98.921449, 18.466331],
-                                                        [98.921828, 18.466721],
-                                                        [98.922692, 18.467523],
-                                                        [98.922975, 18.46778],
-                                                        [98.923898, 18.468605],
-                                                        [98.924432, 18.469083],
-                                                        [98.924751, 18.469384],
-                                                        [98.925596, 18.470114],
-                                                        [98.926377, 18.470804],
-                                                        [98.926703, 18.471108],
-                                                        [98.927777, 18.472057],
-                                                        [98.92852, 18.472693],
-                                                        [98.931781, 18.475629],
-                                                        [98.932066, 18.475882],
-                                                        [98.932144, 18.475944],
-                                                        [98.933593, 18.477238],
-                                                        [98.934196, 18.477769],
-                                                        [98.934314, 18.477872],
-                                                        [98.934387, 18.478024],
-                                                        [98.934421, 18.478167],
-                                                        [98.93455, 18.478808],
-                                                        [98.934637, 18.479035],
-                                                        [98.934718, 18.479176],
-                                                        [98.934826, 18.479323],
-                                                        [98.935033, 18.4795],
-                                                        [98.935513, 18.47988],
-                                                        [98.935644, 18.480037],
-                                                        [98.935809, 18.480235],
-                                                        [98.936531, 18.481255],
-                                                        [98.93662, 18.481436],
-                                                        [98.936697, 18.481592],
-                                                        [98.936852, 18.481985],
-                                                        [98.937012, 18.482519],
-                                                        [98.937029, 18.482579],
-                                                        [98.937057, 18.48268],
-                                                        [98.937197, 18.483187],
-                                                        [98.937463, 18.484204],
-                                                        [98.937611, 18.484872],
-                                                        [98.937852, 18.485804],
-                                                        [98.937917, 18.485986],
-                                                        [98.937997, 18.486256],
-                                                        [98.938024, 18.486357],
-                                                        [98.938127, 18.486695],
-                                                        [98.93824, 18.487037],
-                                                        [98.938483, 18.487695],
-                                                        [98.938529, 18.487819],
-                                                        [98.938706, 18.488406],
-                                                        [98.938988, 18.489278],
-                                                        [98.939071, 18.48947],
-                                                        [98.939181, 18.489726],
-                                                        [98.939289, 18.489896],
-                                                        [98.939692, 18.490535],
-                                                        [98.939836, 18.490763],
-                                                        [98.940163, 18.491363],
-                                                        [98.940566, 18.492361],
-                                                        [98.94065, 18.492609],
-                                                        [98.940798, 18.493047],
-                                                        [98.941048, 18.493785],
-                                                        [98.941145, 18.494365],
-                                                        [98.941156, 18.495312],
-                                                        [98.941166, 18.49543],
-                                                        [98.94122, 18.49579],
-                                                        [98.941381, 18.496258],
-                                                        [98.941703, 18.496828],
-                                                        [98.941848, 18.497009],
-                                                        [98.942313, 18.497553],
-                                                        [98.942505, 18.497804],
-                                                        [98.942668, 18.498018],
-                                                        [98.942733, 18.498293],
-                                                        [98.94269, 18.498649],
-                                                        [98.942647, 18.499137],
-                                                        [98.942665, 18.499379],
-                                                        [98.94269, 18.499615],
-                                                        [98.942705, 18.500021],
-                                                        [98.942692, 18.500178],
-                                                        [98.942679, 18.500287],
-                                                        [98.94255, 18.500511],
-                                                        [98.942027, 18.500976],
-                                                        [98.941907, 18.501081],
-                                                        [98.941617, 18.501416],
-                                                        [98.94151, 18.501671],
-                                                        [98.941492, 18.501851],
-                                                        [98.941477, 18.502006],
-                                                        [98.941456, 18.503197],
-                                                        [98.94151, 18.50336],
-                                                        [98.941539, 18.503397],
-                                                        [98.941638, 18.503522],
-                                                        [98.942132, 18.50396],
-                                                        [98.942514, 18.504295],
-                                                        [98.943119, 18.504825],
-                                                        [98.943308, 18.505095],
-                                                        [98.943428, 18.50529],
-                                                        [98.943521, 18.505476],
-                                                        [98.943659, 18.505964],
-                                                        [98.943702, 18.506311],
-                                                        [98.943711, 18.50667],
-                                                        [98.943654, 18.507297],
-                                                        [98.943643, 18.507399],
-                                                        [98.943605, 18.50773],
-                                                        [98.943521, 18.508136],
-                                                        [98.943499, 18.508242],
-                                                        [98.943323, 18.508737],
-                                                        [98.943095, 18.509316],
-                                                        [98.942979, 18.509601],
-                                                        [98.94257, 18.510368],
-                                                        [98.94253, 18.510417],
-                                                        [98.942405, 18.510593],
-                                                        [98.942169, 18.510965],
-                                                        [98.941898, 18.511477],
-                                                        [98.941853, 18.511621],
-                                                        [98.941805, 18.511859],
-                                                        [98.941799, 18.511946],
-                                                        [98.941799, 18.512205],
-                                                        [98.941799, 18.512557],
-                                                        [98.941788, 18.513999],
-                                                        [98.941783, 18.515654],
-                                                        [98.94179, 18.516117],
-                                                        [98.941787, 18.516918],
-                                                        [98.941769, 18.517369],
-                                                        [98.941707, 18.517593],
-                                                        [98.941681, 18.517708],
-                                                        [98.941629, 18.517895],
-                                                        [98.941529, 18.518254],
-                                                        [98.941453, 18.518443],
-                                                        [98.941288, 18.518799],
-                                                        [98.941144, 18.519091],
-                                                        [98.940806, 18.519769],
-                                                        [98.940589, 18.520254],
-                                                        [98.940463, 18.520589],
-                                                        [98.940424, 18.520696],
-                                                        [98.940365, 18.520969],
-                                                        [98.940278, 18.521512],
-                                                        [98.940181, 18.521955],
-                                                        [98.939905, 18.522992],
-                                                        [98.939779, 18.523361],
-                                                        [98.939667, 18.523734],
-                                                        [98.939631, 18.523917],
-                                                        [98.939627, 18.524056],
-                                                        [98.939632, 18.524205],
-                                                        [98.93963, 18.524562],
-                                                        [98.939616, 18.525111],
-                                                        [98.939619, 18.525202],
-                                                        [98.939637, 18.525455],
-                                                        [98.939648, 18.52564],
-                                                        [98.9397, 18.525965],
-                                                        [98.939741, 18.526113],
-                                                        [98.939864, 18.526584],
-                                                        [98.939971, 18.526921],
-                                                        [98.940201, 18.527666],
-                                                        [98.940329, 18.528081],
-                                                        [98.940452, 18.528473],
-                                                        [98.940488, 18.528636],
-                                                        [98.940493, 18.528809],
-                                                        [98.94049, 18.528966],
-                                                        [98.94049, 18.529821],
-                                                        [98.940476, 18.530815],
-                                                        [98.940472, 18.531069],
-                                                        [98.94046, 18.531361],
-                                                        [98.940364, 18.531931],
-                                                        [98.94027, 18.532584],
-                                                        [98.939761, 18.5347],
-                                                        [98.93972, 18.53491],
-                                                        [98.939653, 18.535258],
-                                                        [98.939503, 18.536033],
-                                                        [98.939217, 18.537389],
-                                                        [98.938755, 18.53938],
-                                                        [98.938649, 18.540098],
-                                                        [98.938615, 18.540341],
-                                                        [98.938584, 18.540548],
-                                                        [98.938583, 18.540626],
-                                                        [98.938597, 18.540725],
-                                                        [98.938617, 18.540825],
-                                                        [98.938795, 18.541275],
-                                                        [98.938877, 18.541464],
-                                                        [98.939206, 18.542281],
-                                                        [98.939399, 18.542744],
-                                                        [98.939544, 18.543049],
-                                                        [98.939655, 18.543178],
-                                                        [98.939793, 18.543279],
-                                                        [98.940055, 18.5434],
-                                                        [98.940425, 18.543441],
-                                                        [98.940702, 18.543394],
-                                                        [98.940891, 18.543286],
-                                                        [98.941087, 18.543108],
-                                                        [98.941471, 18.542598],
-                                                        [98.94186, 18.542109],
-                                                        [98.942068, 18.541896],
-                                                        [98.942329, 18.541704],
-                                                        [98.942602, 18.541586],
-                                                        [98.943401, 18.541369],
-                                                        [98.944226, 18.541183],
-                                                        [98.945579, 18.540878],
-                                                        [98.946853, 18.540592],
-                                                        [98.948289, 18.540269],
-                                                        [98.948818, 18.540253],
-                                                        [98.950759, 18.540668],
-                                                        [98.950963, 18.540717],
-                                                        [98.951643, 18.540893],
-                                                        [98.952612, 18.541247],
-                                                        [98.953274, 18.541488],
-                                                        [98.953597, 18.541592],
-                                                        [98.953795, 18.54165],
-                                                        [98.954917, 18.541807],
-                                                        [98.955099, 18.541823],
-                                                        [98.955634, 18.541926],
-                                                        [98.956517, 18.542214],
-                                                        [98.956909, 18.542312],
-                                                        [98.957407, 18.542438],
-                                                        [98.958958, 18.542764],
-                                                        [98.959027, 18.542777],
-                                                        [98.959973, 18.542954],
-                                                        [98.960455, 18.542947],
-                                                        [98.960726, 18.542937],
-                                                        [98.961037, 18.542977],
-                                                        [98.961795, 18.543276],
-                                                        [98.962294, 18.543399],
-                                                        [98.963311, 18.543563],
-                                                        [98.964364, 18.543576],
-                                                        [98.964634, 18.543573],
-                                                        [98.966114, 18.543539],
-                                                        [98.966481, 18.543578],
-                                                        [98.966869, 18.543683],
-                                                        [98.968035, 18.543928],
-                                                        [98.96855, 18.544037],
-                                                        [98.968675, 18.544061],
-                                                        [98.969233, 18.544169],
-                                                        [98.970243, 18.544395],
-                                                        [98.970439, 18.544442],
-                                                        [98.970722, 18.544548],
-                                                        [98.970952, 18.544621],
-                                                        [98.971251, 18.544807],
-                                                        [98.971563, 18.545044],
-                                                        [98.97183, 18.545298],
-                                                        [98.972032, 18.545491],
-                                                        [98.972419, 18.545749],
-                                                        [98.972818, 18.546025],
-                                                        [98.973342, 18.54641],
-                                                        [98.973766, 18.546803],
-                                                        [98.973878, 18.546918],
-                                                        [98.974881, 18.548013],
-                                                        [98.975257, 18.548503],
-                                                        [98.975821, 18.549266],
-                                                        [98.975966, 18.54948],
-                                                        [98.976054, 18.549611],
-                                                        [98.976249, 18.549907],
-                                                        [98.976436, 18.550191],
-                                                        [98.976883, 18.550881],
-                                                        [98.977046, 18.551132],
-                                                        [98.977199, 18.551368],
-                                                        [98.977239, 18.551431],
-                                                        [98.97746, 18.55174],
-                                                        [98.977495, 18.551789],
-                                                        [98.977607, 18.551946],
-                                                        [98.977793, 18.552207],
-                                                        [98.977833, 18.55227],
-                                                        [98.977914, 18.552397],
-                                                        [98.977989, 18.552497],
-                                                        [98.978166, 18.552707],
-                                                        [98.978361, 18.552919],
-                                                        [98.978879, 18.55346],
-                                                        [98.979399, 18.553966],
-                                                        [98.979884, 18.554434],
-                                                        [98.980075, 18.554619],
-                                                        [98.98029, 18.554837],
-                                                        [98.980514, 18.55505],
-                                                        [98.980591, 18.555124],
-                                                        [98.980736, 18.555261],
-                                                        [98.981053, 18.555564],
-                                                        [98.98109, 18.555612],
-                                                        [98.981334, 18.555839],
-                                                        [98.981982, 18.55647],
-                                                        [98.982224, 18.556671],
-                                                        [98.982379, 18.5568],
-                                                        [98.983175, 18.557319],
-                                                        [98.983239, 18.55735],
-                                                        [98.983695, 18.557652],
-                                                        [98.984434, 18.558139],
-                                                        [98.984691, 18.558308],
-                                                        [98.985545, 18.558887],
-                                                        [98.987669, 18.560278],
-                                                        [98.988288, 18.560697],
-                                                        [98.988406, 18.560775],
-                                                        [98.988829, 18.561039],
-                                                        [98.989419, 18.561403],
-                                                        [98.990207, 18.561866],
-                                                        [98.990252, 18.561891],
-                                                        [98.990435, 18.561978],
-                                                        [98.990456, 18.561988],
-                                                        [98.990634, 18.562088],
-                                                        [98.990927, 18.562253],
-                                                        [98.991109, 18.562385],
-                                                        [98.991211, 18.562497],
-                                                        [98.991243, 18.562533],
-                                                        [98.991361, 18.562701],
-                                                        [98.991495, 18.562904],
-                                                        [98.991687, 18.563275],
-                                                        [98.991822, 18.563531],
-                                                        [98.992195, 18.564067],
-                                                        [98.992624, 18.564642],
-                                                        [98.992659, 18.56468],
-                                                        [98.992901, 18.564953],
-                                                        [98.992996, 18.56509],
-                                                        [98.993746, 18.566075],
-                                                        [98.993898, 18.566325],
-                                                        [98.993952, 18.566399],
-                                                        [98.994389, 18.567004],
-                                                        [98.994585, 18.567249],
-                                                        [98.994756, 18.567451],
-                                                        [98.994856, 18.56757],
-                                                        [98.994946, 18.567675],
-                                                        [98.995104, 18.567862],
-                                                        [98.99519, 18.567951],
-                                                        [98.995375, 18.568147],
-                                                        [98.995462, 18.568231],
-                                                        [98.99568, 18.568465],
-                                                        [98.99572, 18.568504],
-                                                        [98.99586, 18.568638],
-                                                        [98.99619, 18.568938],
-                                                        [98.996248, 18.56899],
-                                                        [98.996529, 18.569235],
-                                                        [98.997282, 18.569888],
-                                                        [98.997387, 18.569973],
-                                                        [98.997724, 18.57024],
-                                                        [98.997998, 18.570457],
-                                                        [98.998045, 18.570494],
-                                                        [98.998136, 18.570557],
-                                                        [98.998534, 18.570866],
-                                                        [98.998816, 18.5711],
-                                                        [98.999032, 18.57129],
-                                                        [98.999261, 18.571468],
-                                                        [98.999507, 18.571644],
-                                                        [98.999668, 18.57175],
-                                                        [98.999806, 18.571838],
-                                                        [98.999923, 18.571909],
-                                                        [98.999944, 18.571923],
-                                                        [99.000068, 18.571997],
-                                                        [99.000368, 18.572208],
-                                                        [99.000692, 18.572459],
-                                                        [99.000767, 18.572526],
-                                                        [99.000882, 18.572628],
-                                                        [99.001033, 18.572781],
-                                                        [99.00122, 18.572967],
-                                                        [99.00144, 18.57318],
-                                                        [99.001766, 18.573524],
-                                                        [99.001829, 18.573596],
-                                                        [99.002051, 18.573848],
-                                                        [99.002423, 18.574224],
-                                                        [99.002508, 18.574286],
-                                                        [99.002599, 18.574317],
-                                                        [99.00269, 18.574329],
-                                                        [99.002892, 18.574336],
-                                                        [99.003366, 18.574276],
-                                                        [99.003491, 18.574254],
-                                                        [99.003701, 18.574269],
-                                                        [99.003808, 18.574311],
-                                                        [99.003904, 18.574178],
-                                                        [99.003988, 18.574107],
-                                                        [99.00412, 18.573995],
-                                                        [99.00433, 18.573813],
-                                                        [99.004558, 18.573648],
-                                                        [99.004775, 18.573491],
-                                                        [99.004948, 18.57338],
-                                                        [99.005185, 18.573242],
-                                                        [99.005341, 18.573159],
-                                                        [99.006134, 18.57285],
-                                                        [99.006878, 18.572577],
-                                                        [99.006976, 18.572549],
-                                                        [99.007063, 18.572515],
-                                                        [99.007249, 18.572471],
-                                                        [99.007327, 18.57246],
-                                                        [99.007414, 18.572455],
-                                                        [99.007515, 18.572453],
-                                                        [99.007613, 18.572468],
-                                                        [99.007732, 18.57251],
-                                                        [99.00784, 18.572559],
-                                                        [99.007985, 18.572639],
-                                                        [99.008095, 18.572736],
-                                                        [99.008188, 18.572863],
-                                                        [99.008256, 18.572964],
-                                                        [99.008304, 18.573077],
-                                                        [99.008394, 18.573388],
-                                                        [99.008478, 18.57367],
-                                                        [99.008679, 18.574396],
-                                                        [99.008697, 18.574452],
-                                                        [99.008794, 18.574468],
-                                                        [99.009006, 18.574403],
-                                                        [99.009226, 18.574334],
-                                                        [99.010364, 18.573932],
-                                                        [99.010722, 18.573805],
-                                                        [99.013102, 18.573017],
-                                                        [99.014533, 18.572542],
-                                                        [99.014814, 18.572449],
-                                                        [99.014954, 18.572403],
-                                                        [99.015095, 18.572356],
-                                                        [99.016243, 18.571976],
-                                                        [99.016769, 18.571802],
-                                                        [99.016887, 18.571769],
-                                                        [99.01738, 18.571599],
-                                                        [99.017475, 18.571567],
-                                                        [99.018046, 18.571364],
-                                                        [99.018506, 18.571165],
-                                                        [99.019313, 18.570829],
-                                                        [99.020189, 18.570465],
-                                                        [99.020639, 18.570278],
-                                                        [99.021047, 18.570108],
-                                                        [99.021451, 18.569941],
-                                                        [99.022324, 18.569578],
-                                                        [99.023138, 18.569227],
-                                                        [99.02322, 18.569192],
-                                                        [99.024009, 18.568852],
-                                                        [99.024744, 18.568516],
-                                                        [99.025059, 18.568349],
-                                                        [99.025381, 18.568167],
-                                                        [99.025605, 18.568032],
-                                                        [99.025979, 18.567779],
-                                                        [99.026014, 18.567751],
-                                                        [99.026376, 18.567572],
-                                                        [99.026832, 18.567284],
-                                                        [99.02708, 18.567124],
-                                                        [99.027393, 18.566897],
-                                                        [99.028595, 18.566052]]}},
-                          {'type': 'Feature',
-                           'properties': {'agent_id': 4709,
-                                          'segment': 6,
-                                          'from': 'พีทีที สเตชั่น สาขาลำพูน-ดอยติ',
-                                          'to': 'เพ็ญศิริไหมไทยลำพูน',
-                                          'distance_m': 3012.5,
-                                          'distance_km': 3.0125,
-                                          'from_source': 'csv',
-                                          'to_source': 'csv'},
-                           'geometry': {'type': 'LineString',
-                                        'coordinates': [[99.028595, 18.566052],
-                                                        [99.028977, 18.565783],
-                                                        [99.029352, 18.565508],
-                                                        [99.029558, 18.565358],
-                                                        [99.029742, 18.565064],
-                                                        [99.031666, 18.563684],
-                                                        [99.032285, 18.563235],
-                                                        [99.032195, 18.563148],
-                                                        [99.031309, 18.56376],
-                                                        [99.029163, 18.565307],
-                                                        [99.026278, 18.567442],
-                                                        [99.026077, 18.567588],
-                                                        [99.025848, 18.567738],
-                                                        [99.025553, 18.567937],
-                                                        [99.025418, 18.568028],
-                                                        [99.025176, 18.568174],
-                                                        [99.024791, 18.568377],
-                                                        [99.024322, 18.568596],
-                                                        [99.02397, 18.568751],
-                                                        [99.023175, 18.569088],
-                                                        [99.022277, 18.569469],
-                                                        [99.022072, 18.569556],
-                                                        [99.021666, 18.569727],
-                                                        [99.02141, 18.569836],
-                                                        [99.020178, 18.570356],
-                                                        [99.018574, 18.571034],
-                                                        [99.018473, 18.571077],
-                                                        [99.017435, 18.571466],
-                                                        [99.01734, 18.571497],
-                                                        [99.01738, 18.571599],
-                                                        [99.017475, 18.571567],
-                                                        [99.018046, 18.571364],
-                                                        [99.018506, 18.571165],
-                                                        [99.019313, 18.570829],
-                                                        [99.020189, 18.570465],
-                                                        [99.020639, 18.570278],
-                                                        [99.021047, 18.570108],
-                                                        [99.021715, 18.572106]]}},
-                          {'type': 'Feature',
-                           'properties': {'agent_id': 4709,
-                                          'segment': 7,
-                                          'from': 'เพ็ญศิริไหมไทยลำพูน',
-                                          'to': "Chef's House Nakorn Lamphun",
-                                          'distance_m': 1943.1,
-                                          'distance_km': 1.9430999999999998,
-                                          'from_source': 'csv',
-                                          'to_source': 'csv'},
-                           'geometry': {'type': 'LineString',
-                                        'coordinates': [[99.021715, 18.572106],
-                                                        [99.021047, 18.570108],
-                                                        [99.021451, 18.569941],
-                                                        [99.022324, 18.569578],
-                                                        [99.023138, 18.569227],
-                                                        [99.02322, 18.569192],
-                                                        [99.024009, 18.568852],
-                                                        [99.024744, 18.568516],
-                                                        [99.025059, 18.568349],
-                                                        [99.025381, 18.568167],
-                                                        [99.025605, 18.568032],
-                                                        [99.025979, 18.567779],
-                                                        [99.026014, 18.567751],
-                                                        [99.026814, 18.567196],
-                                                        [99.029742, 18.565064],
-                                                        [99.031666, 18.563684],
-                                                        [99.032285, 18.563235],
-                                                        [99.032195, 18.563148],
-                                                        [99.031309, 18.56376],
-                                                        [99.031229, 18.563664],
-                                                        [99.031095, 18.563755],
-                                                        [99.030881, 18.5639],
-                                                        [99.030077, 18.564487]]}},
-                          {'type': 'Feature',
-                           'properties': {'agent_id': 4709,
-                                          'segment': 8,
-                                          'from': "Chef's House Nakorn Lamphun",
-                                          'to': 'โรงแรมพญาอิน ลำพูน Phaya Inn',
-                                          'distance_m': 3105.6,
-                                          'distance_km': 3.1056,
-                                          'from_source': 'csv',
-                                          'to_source': 'csv'},
-                           'geometry': {'type': 'LineString',
-                                        'coordinates': [[99.030077, 18.564487],
-                                                        [99.029438, 18.564953],
-                                                        [99.026931, 18.56678],
-                                                        [99.026346, 18.567273],
-                                                        [99.025848, 18.567738],
-                                                        [99.025553, 18.567937],
-                                                        [99.025418, 18.568028],
-                                                        [99.025176, 18.568174],
-                                                        [99.024791, 18.568377],
-                                                        [99.024322, 18.568596],
-                                                        [99.02397, 18.568751],
-                                                        [99.023175, 18.569088],
-                                                        [99.022277, 18.569469],
-                                                        [99.022072, 18.569556],
-                                                        [99.021666, 18.569727],
-                                                        [99.02141, 18.569836],
-                                                        [99.020178, 18.570356],
-                                                        [99.018574, 18.571034],
-                                                        [99.018473, 18.571077],
-                                                        [99.017435, 18.571466],
-                                                        [99.01734, 18.571497],
-                                                        [99.01738, 18.571599],
-                                                        [99.017458, 18.572066],
-                                                        [99.017543, 18.57252],
-                                                        [99.017609, 18.572607],
-                                                        [99.017963, 18.57492],
-                                                        [99.018097, 18.575641],
-                                                        [99.018191, 18.57614],
-                                                        [99.01835, 18.576739],
-                                                        [99.018385, 18.576941],
-                                                        [99.018436, 18.577227],
-                                                        [99.018511, 18.577656],
-                                                        [99.018671, 18.578493],
-                                                        [99.018724, 18.578836],
-                                                        [99.018768, 18.579127],
-                                                        [99.018795, 18.579274],
-                                                        [99.018843, 18.579517],
-                                                        [99.018912, 18.579726],
-                                                        [99.019129, 18.580162],
-                                                        [99.018772, 18.580397],
-                                                        [99.017533, 18.581122],
-                                                        [99.017504, 18.581267],
-                                                        [99.017559, 18.581767],
-                                                        [99.017477, 18.582038],
-                                                        [99.017351, 18.582341],
-                                                        [99.017084, 18.582746],
-                                                        [99.016752, 18.583145],
-                                                        [99.01603, 18.58285],
-                                                        [99.015772, 18.582782]]}}]},
- 'mae-hong-son': {'type': 'FeatureCollection',
-                  'features': [{'type': 'Feature',
-                                'properties': {'agent_id': 4,
-                                               'segment': 1,
-                                               'from': 'ตาลเจ็ดต้นปายรีสอร์ท',
-                                               'to': 'ข้าวซอยพี่น้อง',
-                                               'distance_m': 4216.9,
-                                               'distance_km': 4.2169,
-                                               'from_source': 'graph',
-                                               'to_source': 'graph'},
-                                'geometry': {'type': 'LineString',
-                                             'coordinates': [[98.449441, 19.397844],
-                                                             [98.449458, 19.398014],
-                                                             [98.449401, 19.398065],
-                                                             [98.449062, 19.398138],
-                                                             [98.448591, 19.398282],
-                                                             [98.448426, 19.397531],
-                                                             [98.448354, 19.397008],
-                                                             [98.448161, 19.393559],
-                                                             [98.448109, 19.393064],
-                                                             [98.448066, 19.392684],
-                                                             [98.448067, 19.392534],
-                                                             [98.448142, 19.391944],
-                                                             [98.448141, 19.391779],
-                                                             [98.448102, 19.391633],
-                                                             [98.447699, 19.390392],
-                                                             [98.447135, 19.388414],
-                                                             [98.447104, 19.388316],
-                                                             [98.446678, 19.386449],
-                                                             [98.446411, 19.385348],
-                                                             [98.44634, 19.385134],
-                                                             [98.446049, 19.384506],
-                                                             [98.445949, 19.384252],
-                                                             [98.445605, 19.382957],
-                                                             [98.445489, 19.382548],
-                                                             [98.445454, 19.382403],
-                                                             [98.445465, 19.382308],
-                                                             [98.445533, 19.382225],
-                                                             [98.445748, 19.382061],
-                                                             [98.446106, 19.38171],
-                                                             [98.446258, 19.38151],
-                                                             [98.4463, 19.381304],
-                                                             [98.446294, 19.381131],
-                                                             [98.446221, 19.380525],
-                                                             [98.446067, 19.379736],
-                                                             [98.445946, 19.379147],
-                                                             [98.445676, 19.377901],
-                                                             [98.445596, 19.377271],
-                                                             [98.445537, 19.376878],
-                                                             [98.445497, 19.37654],
-                                                             [98.445462, 19.376068],
-                                                             [98.44544, 19.375658],
-                                                             [98.445403, 19.375072],
-                                                             [98.445408, 19.374916],
-                                                             [98.444822, 19.374536],
-                                                             [98.444625, 19.374471],
-                                                             [98.444468, 19.374449],
-                                                             [98.444456, 19.37445],
-                                                             [98.444327, 19.37446],
-                                                             [98.443939, 19.374554],
-                                                             [98.44318, 19.374706],
-                                                             [98.443012, 19.374746],
-                                                             [98.442857, 19.374793],
-                                                             [98.442718, 19.374837],
-                                                             [98.442617, 19.374843],
-                                                             [98.442456, 19.37484],
-                                                             [98.442173, 19.374829],
-                                                             [98.441995, 19.374844],
-                                                             [98.441746, 19.374891],
-                                                             [98.441456, 19.374934],
-                                                             [98.441324, 19.374946],
-                                                             [98.441134, 19.374948],
-                                                             [98.440568, 19.374952],
-                                                             [98.440422, 19.374794],
-                                                             [98.439882, 19.374145],
-                                                             [98.439409, 19.373568],
-                                                             [98.439371, 19.373441],
-                                                             [98.439357, 19.373138],
-                                                             [98.439542, 19.371284],
-                                                             [98.439571, 19.371033],
-                                                             [98.439494, 19.370547],
-                                                             [98.439388, 19.370132],
-                                                             [98.439381, 19.370104],
-                                                             [98.43916, 19.369672],
-                                                             [98.439088, 19.369482],
-                                                             [98.438886, 19.368775],
-                                                             [98.43864, 19.368023],
-                                                             [98.438729, 19.367965],
-                                                             [98.438778, 19.367921],
-                                                             [98.438914, 19.367784],
-                                                             [98.439033, 19.367631],
-                                                             [98.438916, 19.367572]]}},
-                               {'type': 'Feature',
-                                'properties': {'agent_id': 4,
-                                               'segment': 2,
-                                               'from': 'ข้าวซอยพี่น้อง',
-                                               'to': 'สัปปายยะ สปา',
-                                               'distance_m': 1976.4,
-                                               'distance_km': 1.9764000000000002,
-                                               'from_source': 'graph',
-                                               'to_source': 'manual'},
-                                'geometry': {'type': 'LineString',
-                                             'coordinates': [[98.438916, 19.367572],
-                                                             [98.439033, 19.367631],
-                                                             [98.439158, 19.367422],
-                                                             [98.439259, 19.367229],
-                                                             [98.43934, 19.366997],
-                                                             [98.439389, 19.366775],
-                                                             [98.439429, 19.366425],
-                                                             [98.439441, 19.366268],
-                                                             [98.439447, 19.365963],
-                                                             [98.439427, 19.365717],
-                                                             [98.439421, 19.365535],
-                                                             [98.439435, 19.365306],
-                                                             [98.439461, 19.365124],
-                                                             [98.439507, 19.364914],
-                                                             [98.439544, 19.364648],
-                                                             [98.439567, 19.36404],
-                                                             [98.439614, 19.363834],
-                                                             [98.439674, 19.363664],
-                                                             [98.43987, 19.363219],
-                                                             [98.440081, 19.362831],
-                                                             [98.440172, 19.362735],
-                                                             [98.440382, 19.36255],
-                                                             [98.440451, 19.362411],
-                                                             [98.440453, 19.362301],
-                                                             [98.440417, 19.362177],
-                                                             [98.440161, 19.361631],
-                                                             [98.439841, 19.360926],
-                                                             [98.439781, 19.360796],
-                                                             [98.439349, 19.359823],
-                                                             [98.439319, 19.359758],
-                                                             [98.438972, 19.358923],
-                                                             [98.439544, 19.358624],
-                                                             [98.43994, 19.358417],
-                                                             [98.439971, 19.358401],
-                                                             [98.440625, 19.35806],
-                                                             [98.440234, 19.357278],
-                                                             [98.439987, 19.356812],
-                                                             [98.440483, 19.356442],
-                                                             [98.440613, 19.356334],
-                                                             [98.440634, 19.356289],
-                                                             [98.440634, 19.356244],
-                                                             [98.440539, 19.35606],
-                                                             [98.44053, 19.356004],
-                                                             [98.440547, 19.355934],
-                                                             [98.440622, 19.355679],
-                                                             [98.440654, 19.355534],
-                                                             [98.440721, 19.355031],
-                                                             [98.44074, 19.354966],
-                                                             [98.44077, 19.354913],
-                                                             [98.441167, 19.354339],
-                                                             [98.441348, 19.354068],
-                                                             [98.441395, 19.35394],
-                                                             [98.441458, 19.353882],
-                                                             [98.441714, 19.353734],
-                                                             [98.441835, 19.35363],
-                                                             [98.441982, 19.353435],
-                                                             [98.442077, 19.353215],
-                                                             [98.442114, 19.353013],
-                                                             [98.442154, 19.352787],
-                                                             [98.442164, 19.352568],
-                                                             [98.442161, 19.35239],
-                                                             [98.442159, 19.35236]]}},
-                               {'type': 'Feature',
-                                'properties': {'agent_id': 4,
-                                               'segment': 3,
-                                               'from': 'สัปปายยะ สปา',
-                                               'to': 'ร้านกาแฟ คอฟฟี่ อิน เลิฟ',
-                                               'distance_m': 2365.3,
-                                               'distance_km': 2.3653000000000004,
-                                               'from_source': 'manual',
-                                               'to_source': 'graph'},
-                                'geometry': {'type': 'LineString',
-                                             'coordinates': [[98.442159, 19.35236],
-                                                             [98.442149, 19.352202],
-                                                             [98.442131, 19.352094],
-                                                             [98.442096, 19.351973],
-                                                             [98.442082, 19.35194],
-                                                             [98.44188, 19.351614],
-                                                             [98.441696, 19.351291],
-                                                             [98.44122, 19.350399],
-                                                             [98.440825, 19.350478],
-                                                             [98.440494, 19.350544],
-                                                             [98.439995, 19.350634],
-                                                             [98.438375, 19.350941],
-                                                             [98.438083, 19.350971],
-                                                             [98.437736, 19.350978],
-                                                             [98.437624, 19.350974],
-                                                             [98.436156, 19.350921],
-                                                             [98.435344, 19.350892],
-                                                             [98.435303, 19.350412],
-                                                             [98.435214, 19.349938],
-                                                             [98.43513, 19.349481],
-                                                             [98.435001, 19.349102],
-                                                             [98.434933, 19.3489],
-                                                             [98.434784, 19.348516],
-                                                             [98.43458, 19.348152],
-                                                             [98.434122, 19.347434],
-                                                             [98.433477, 19.346424],
-                                                             [98.433438, 19.346364],
-                                                             [98.433237, 19.346049],
-                                                             [98.433066, 19.345788],
-                                                             [98.43305, 19.345758],
-                                                             [98.43303, 19.345721],
-                                                             [98.432994, 19.345643],
-                                                             [98.432926, 19.345509],
-                                                             [98.432876, 19.345411],
-                                                             [98.432855, 19.345353],
-                                                             [98.432812, 19.345204],
-                                                             [98.432785, 19.34498],
-                                                             [98.432795, 19.344703],
-                                                             [98.432806, 19.344604],
-                                                             [98.432981, 19.343338],
-                                                             [98.433066, 19.34275],
-                                                             [98.433251, 19.341324],
-                                                             [98.433324, 19.340786],
-                                                             [98.433485, 19.339696],
-                                                             [98.433502, 19.339478],
-                                                             [98.433466, 19.339275],
-                                                             [98.433378, 19.339049],
-                                                             [98.433214, 19.338794],
-                                                             [98.433127, 19.33866],
-                                                             [98.432887, 19.338353],
-                                                             [98.433099, 19.338348],
-                                                             [98.433133, 19.338376]]}},
-                               {'type': 'Feature',
-                                'properties': {'agent_id': 4,
-                                               'segment': 4,
-                                               'from': 'ร้านกาแฟ คอฟฟี่ อิน เลิฟ',
-                                               'to': 'ปางช้างบ้านท่าปาย',
-                                               'distance_m': 7002.1,
-                                               'distance_km': 7.0021,
-                                               'from_source': 'graph',
-                                               'to_source': 'graph'},
-                                'geometry': {'type': 'LineString',
-                                             'coordinates': [[98.433133, 19.338376],
-                                                             [98.433099, 19.338348],
-                                                             [98.432887, 19.338353],
-                                                             [98.432308, 19.337613],
-                                                             [98.432123, 19.337351],
-                                                             [98.431986, 19.337093],
-                                                             [98.431846, 19.336824],
-                                                             [98.431768, 19.336606],
-                                                             [98.431701, 19.336406],
-                                                             [98.431693, 19.336277],
-                                                             [98.43169, 19.335946],
-                                                             [98.431701, 19.335596],
-                                                             [98.431711, 19.335228],
-                                                             [98.431723, 19.334956],
-                                                             [98.431749, 19.334732],
-                                                             [98.4318, 19.334512],
-                                                             [98.431892, 19.33429],
-                                                             [98.432922, 19.332682],
-                                                             [98.433736, 19.331436],
-                                                             [98.433879, 19.331217],
-                                                             [98.435638, 19.328519],
-                                                             [98.435672, 19.328466],
-                                                             [98.436264, 19.327564],
-                                                             [98.436434, 19.327244],
-                                                             [98.436501, 19.327067],
-                                                             [98.436515, 19.326969],
-                                                             [98.436539, 19.326801],
-                                                             [98.436529, 19.326285],
-                                                             [98.436522, 19.324085],
-                                                             [98.436497, 19.322293],
-                                                             [98.436502, 19.321907],
-                                                             [98.436527, 19.321696],
-                                                             [98.436585, 19.321493],
-                                                             [98.436677, 19.321326],
-                                                             [98.436799, 19.321134],
-                                                             [98.436892, 19.321005],
-                                                             [98.437798, 19.319759],
-                                                             [98.439008, 19.318125],
-                                                             [98.439136, 19.317959],
-                                                             [98.439851, 19.31698],
-                                                             [98.440187, 19.316383],
-                                                             [98.440479, 19.315778],
-                                                             [98.440855, 19.314951],
-                                                             [98.440918, 19.314825],
-                                                             [98.441148, 19.314304],
-                                                             [98.441214, 19.314144],
-                                                             [98.441713, 19.313063],
-                                                             [98.441784, 19.312982],
-                                                             [98.441862, 19.312904],
-                                                             [98.441951, 19.312843],
-                                                             [98.442042, 19.312798],
-                                                             [98.442159, 19.312768],
-                                                             [98.442352, 19.31274],
-                                                             [98.442504, 19.312739],
-                                                             [98.442657, 19.312772],
-                                                             [98.442798, 19.312817],
-                                                             [98.442963, 19.312925],
-                                                             [98.443118, 19.31303],
-                                                             [98.443714, 19.313428],
-                                                             [98.443876, 19.313528],
-                                                             [98.444199, 19.313728],
-                                                             [98.44455, 19.313833],
-                                                             [98.445533, 19.31392],
-                                                             [98.446755, 19.31402],
-                                                             [98.447609, 19.314007],
-                                                             [98.448059, 19.314039],
-                                                             [98.449341, 19.31423],
-                                                             [98.449556, 19.314224],
-                                                             [98.449677, 19.314153],
-                                                             [98.449786, 19.31405],
-                                                             [98.45007, 19.313739],
-                                                             [98.45024, 19.313513],
-                                                             [98.450304, 19.313462],
-                                                             [98.450486, 19.313317],
-                                                             [98.450929, 19.313002],
-                                                             [98.451446, 19.312625],
-                                                             [98.452591, 19.311695],
-                                                             [98.452792, 19.31144],
-                                                             [98.452861, 19.311239],
-                                                             [98.452968, 19.31087],
-                                                             [98.453081, 19.310377],
-                                                             [98.453097, 19.31014],
-                                                             [98.452619, 19.308566],
-                                                             [98.452622, 19.308147],
-                                                             [98.452774, 19.30683],
-                                                             [98.452799, 19.306371],
-                                                             [98.452822, 19.3063],
-                                                             [98.452934, 19.305971],
-                                                             [98.453036, 19.30585],
-                                                             [98.453256, 19.305701],
-                                                             [98.453949, 19.305393],
-                                                             [98.455177, 19.304695],
-                                                             [98.455376, 19.304621],
-                                                             [98.455971, 19.304518],
-                                                             [98.457077, 19.304052],
-                                                             [98.457275, 19.30402],
-                                                             [98.457489, 19.304039],
-                                                             [98.458588, 19.304283],
-                                                             [98.458962, 19.304306],
-                                                             [98.459152, 19.304276],
-                                                             [98.460632, 19.303777],
-                                                             [98.460902, 19.30364],
-                                                             [98.461128, 19.303507],
-                                                             [98.46144, 19.303216],
-                                                             [98.461708, 19.302826],
-                                                             [98.463054, 19.300415],
-                                                             [98.463829, 19.299251],
-                                                             [98.46418, 19.298705],
-                                                             [98.464236, 19.29862],
-                                                             [98.465237, 19.297068],
-                                                             [98.465256, 19.297029],
-                                                             [98.4654, 19.2969],
-                                                             [98.465662, 19.296732],
-                                                             [98.465821, 19.296658],
-                                                             [98.466076, 19.296595],
-                                                             [98.466131, 19.296768]]}},
-                               {'type': 'Feature',
-                                'properties': {'agent_id': 4,
-                                               'segment': 5,
-                                               'from': 'ปางช้างบ้านท่าปาย',
-                                               'to': 'กาแฟที่สะพานปาย',
-                                               'distance_m': 491.5,
-                                               'distance_km': 0.4915,
-                                               'from_source': 'graph',
-                                               'to_source': 'manual'},
-                                'geometry': {'type': 'LineString',
-                                             'coordinates': [[98.466131, 19.296768],
-                                                             [98.466076, 19.296595],
-                                                             [98.465821, 19.296658],
-                                                             [98.465662, 19.296732],
-                                                             [98.4654, 19.2969],
-                                                             [98.465256, 19.297029],
-                                                             [98.465237, 19.297068],
-                                                             [98.464236, 19.29862],
-                                                             [98.46418, 19.298705],
-                                                             [98.463829, 19.299251],
-                                                             [98.463765, 19.299214],
-                                                             [98.463669, 19.299143],
-                                                             [98.463618, 19.298582]]}},
-                               {'type': 'Feature',
-                                'properties': {'agent_id': 4,
-                                               'segment': 6,
-                                               'from': 'กาแฟที่สะพานปาย',
-                                               'to': 'สถานี EleXA ปาย',
-                                               'distance_m': 9042.7,
-                                               'distance_km': 9.0427,
-                                               'from_source': 'manual',
-                                               'to_source': 'graph'},
-                                'geometry': {'type': 'LineString',
-                                             'coordinates': [[98.463618, 19.298582],
-                                                             [98.463669, 19.299143],
-                                                             [98.463765, 19.299214],
-                                                             [98.463829, 19.299251],
-                                                             [98.463054, 19.300415],
-                                                             [98.461708, 19.302826],
-                                                             [98.46144, 19.303216],
-                                                             [98.461128, 19.303507],
-                                                             [98.460902, 19.30364],
-                                                             [98.460632, 19.303777],
-                                                             [98.459152, 19.304276],
-                                                             [98.458962, 19.304306],
-                                                             [98.458588, 19.304283],
-                                                             [98.457489, 19.304039],
-                                                             [98.457275, 19.30402],
-                                                             [98.457077, 19.304052],
-                                                             [98.455971, 19.304518],
-                                                             [98.455376, 19.304621],
-                                                             [98.455177, 19.304695],
-                                                             [98.453949, 19.305393],
-                                                             [98.453256, 19.305701],
-                                                             [98.453036, 19.30585],
-                                                             [98.452934, 19.305971],
-                                                             [98.452822, 19.3063],
-                                                             [98.452799, 19.306371],
-                                                             [98.452774, 19.30683],
-                                                             [98.452622, 19.308147],
-                                                             [98.452619, 19.308566],
-                                                             [98.453097, 19.31014],
-                                                             [98.453081, 19.310377],
-                                                             [98.452968, 19.31087],
-                                                             [98.452861, 19.311239],
-                                                             [98.452792, 19.31144],
-                                                             [98.452591, 19.311695],
-                                                             [98.451446, 19.312625],
-                                                             [98.450929, 19.313002],
-                                                             [98.450486, 19.313317],
-                                                             [98.450304, 19.313462],
-                                                             [98.45024, 19.313513],
-                                                             [98.45007, 19.313739],
-                                                             [98.449786, 19.31405],
-                                                             [98.449677, 19.314153],
-                                                             [98.449556, 19.314224],
-                                                             [98.449341, 19.31423],
-                                                             [98.448059, 19.314039],
-                                                             [98.447609, 19.314007],
-                                                             [98.446755, 19.31402],
-                                                             [98.445533, 19.31392],
-                                                             [98.44455, 19.313833],
-                                                             [98.444199, 19.313728],
-                                                             [98.443876, 19.313528],
-                                                             [98.443714, 19.313428],
-                                                             [98.443118, 19.31303],
-                                                             [98.442963, 19.312925],
-                                                             [98.442798, 19.312817],
-                                                             [98.442657, 19.312772],
-                                                             [98.442504, 19.312739],
-                                                             [98.442352, 19.31274],
-                                                             [98.442159, 19.312768],
-                                                             [98.442042, 19.312798],
-                                                             [98.441951, 19.312843],
-                                                             [98.441862, 19.312904],
-                                                             [98.441784, 19.312982],
-                                                             [98.441713, 19.313063],
-                                                             [98.441214, 19.314144],
-                                                             [98.441148, 19.314304],
-                                                             [98.440918, 19.314825],
-                                                             [98.440855, 19.314951],
-                                                             [98.440479, 19.315778],
-                                                             [98.440187, 19.316383],
-                                                             [98.439851, 19.31698],
-                                                             [98.439136, 19.317959],
-                                                             [98.439008, 19.318125],
-                                                             [98.437798, 19.319759],
-                                                             [98.436892, 19.321005],
-                                                             [98.436799, 19.321134],
-                                                             [98.436677, 19.321326],
-                                                             [98.436585, 19.321493],
-                                                             [98.436527, 19.321696],
-                                                             [98.436502, 19.321907],
-                                                             [98.436497, 19.322293],
-                                                             [98.436522, 19.324085],
-                                                             [98.436529, 19.326285],
-                                                             [98.436539, 19.326801],
-                                                             [98.436515, 19.326969],
-                                                             [98.436501, 19.327067],
-                                                             [98.436434, 19.327244],
-                                                             [98.436264, 19.327564],
-                                                             [98.435672, 19.328466],
-                                                             [98.435638, 19.328519],
-                                                             [98.433879, 19.331217],
-                                                             [98.433736, 19.331436],
-                                                             [98.432922, 19.332682],
-                                                             [98.431892, 19.33429],
-                                                             [98.4318, 19.334512],
-                                                             [98.431749, 19.334732],
-                                                             [98.431723, 19.334956],
-                                                             [98.431711, 19.335228],
-                                                             [98.431701, 19.335596],
-                                                             [98.43169, 19.335946],
-                                                             [98.431693, 19.336277],
-                                                             [98.431701, 19.336406],
-                                                             [98.431768, 19.336606],
-                                                             [98.431846, 19.336824],
-                                                             [98.431986, 19.337093],
-                                                             [98.432123, 19.337351],
-                                                             [98.432308, 19.337613],
-                                                             [98.432887, 19.338353],
-                                                             [98.433127, 19.33866],
-                                                             [98.433214, 19.338794],
-                                                             [98.433378, 19.339049],
-                                                             [98.433466, 19.339275],
-                                                             [98.433502, 19.339478],
-                                                             [98.433485, 19.339696],
-                                                             [98.433324, 19.340786],
-                                                             [98.433251, 19.341324],
-                                                             [98.433066, 19.34275],
-                                                             [98.432981, 19.343338],
-                                                             [98.432806, 19.344604],
-                                                             [98.432795, 19.344703],
-                                                             [98.432785, 19.34498],
-                                                             [98.432812, 19.345204],
-                                                             [98.432855, 19.345353],
-                                                             [98.432876, 19.345411],
-                                                             [98.432926, 19.345509],
-                                                             [98.432994, 19.345643],
-                                                             [98.43303, 19.345721],
-                                                             [98.43305, 19.345758],
-                                                             [98.433066, 19.345788],
-                                                             [98.433237, 19.346049],
-                                                             [98.433438, 19.346364],
-                                                             [98.433477, 19.346424],
-                                                             [98.434122, 19.347434],
-                                                             [98.43458, 19.348152],
-                                                             [98.434784, 19.348516],
-                                                             [98.434933, 19.3489],
-                                                             [98.435001, 19.349102],
-                                                             [98.43513, 19.349481],
-                                                             [98.435214, 19.349938],
-                                                             [98.435303, 19.350412],
-                                                             [98.435344, 19.350892],
-                                                             [98.436156, 19.350921],
-                                                             [98.437624, 19.350974],
-                                                             [98.437736, 19.350978],
-                                                             [98.438083, 19.350971],
-                                                             [98.438375, 19.350941],
-                                                             [98.439995, 19.350634],
-                                                             [98.440494, 19.350544],
-                                                             [98.440825, 19.350478],
-                                                             [98.44122, 19.350399],
-                                                             [98.441122, 19.35018],
-                                                             [98.441124, 19.350097],
-                                                             [98.441154, 19.349983],
-                                                             [98.44128, 19.349783],
-                                                             [98.441387, 19.34961],
-                                                             [98.441437, 19.349436],
-                                                             [98.441448, 19.349257],
-                                                             [98.441419, 19.349139],
-                                                             [98.44126, 19.348872],
-                                                             [98.441984, 19.348583],
-                                                             [98.442223, 19.348448]]}},
-                               {'type': 'Feature',
-                                'properties': {'agent_id': 4,
-                                               'segment': 7,
-                                               'from': 'สถานี EleXA ปาย',
-                                               'to': 'วัดหลวง',
-                                               'distance_m': 1630.8,
-                                               'distance_km': 1.6308,
-                                               'from_source': 'graph',
-                                               'to_source': 'manual'},
-                                'geometry': {'type': 'LineString',
-                                             'coordinates': [[98.442223, 19.348448],
-                                                             [98.441984, 19.348583],
-                                                             [98.44126, 19.348872],
-                                                             [98.441419, 19.349139],
-                                                             [98.441448, 19.349257],
-                                                             [98.441437, 19.349436],
-                                                             [98.441387, 19.34961],
-                                                             [98.44128, 19.349783],
-                                                             [98.441154, 19.349983],
-                                                             [98.441124, 19.350097],
-                                                             [98.441122, 19.35018],
-                                                             [98.44122, 19.350399],
-                                                             [98.441696, 19.351291],
-                                                             [98.44188, 19.351614],
-                                                             [98.442082, 19.35194],
-                                                             [98.442096, 19.351973],
-                                                             [98.442131, 19.352094],
-                                                             [98.442149, 19.352202],
-                                                             [98.442161, 19.35239],
-                                                             [98.442164, 19.352568],
-                                                             [98.442154, 19.352787],
-                                                             [98.442114, 19.353013],
-                                                             [98.442077, 19.353215],
-                                                             [98.441982, 19.353435],
-                                                             [98.441835, 19.35363],
-                                                             [98.441714, 19.353734],
-                                                             [98.441458, 19.353882],
-                                                             [98.441395, 19.35394],
-                                                             [98.441348, 19.354068],
-                                                             [98.441167, 19.354339],
-                                                             [98.44077, 19.354913],
-                                                             [98.44074, 19.354966],
-                                                             [98.440721, 19.355031],
-                                                             [98.440654, 19.355534],
-                                                             [98.440622, 19.355679],
-                                                             [98.440547, 19.355934],
-                                                             [98.44053, 19.356004],
-                                                             [98.440539, 19.35606],
-                                                             [98.440634, 19.356244],
-                                                             [98.440634, 19.356289],
-                                                             [98.440613, 19.356334],
-                                                             [98.440483, 19.356442],
-                                                             [98.439987, 19.356812],
-                                                             [98.440234, 19.357278],
-                                                             [98.440625, 19.35806],
-                                                             [98.439971, 19.358401],
-                                                             [98.43994, 19.358417],
-                                                             [98.439544, 19.358624],
-                                                             [98.438972, 19.358923],
-                                                             [98.439319, 19.359758],
-                                                             [98.438761, 19.359971]]}},
-                               {'type': 'Feature',
-                                'properties': {'agent_id': 4,
-                                               'segment': 8,
-                                               'from': 'วัดหลวง',
-                                               'to': 'วัดพระธาตุแม่เย็น',
-                                               'distance_m': 2385.4,
-                                               'distance_km': 2.3854,
-                                               'from_source': 'manual',
-                                               'to_source': 'manual'},
-                                'geometry': {'type': 'LineString',
-                                             'coordinates': [[98.438761, 19.359971],
-                                                             [98.439319, 19.359758],
-                                                             [98.438972, 19.358923],
-                                                             [98.439544, 19.358624],
-                                                             [98.43994, 19.358417],
-                                                             [98.439971, 19.358401],
-                                                             [98.440625, 19.35806],
-                                                             [98.441295, 19.357759],
-                                                             [98.441388, 19.357717],
-                                                             [98.441939, 19.357469],
-                                                             [98.442029, 19.357429],
-                                                             [98.44253, 19.357204],
-                                                             [98.443625, 19.356712],
-                                                             [98.443817, 19.356626],
-                                                             [98.444157, 19.356441],
-                                                             [98.444329, 19.356349],
-                                                             [98.445082, 19.355949],
-                                                             [98.445282, 19.355848],
-                                                             [98.445962, 19.355573],
-                                                             [98.446043, 19.355531],
-                                                             [98.446097, 19.355477],
-                                                             [98.446246, 19.35529],
-                                                             [98.446848, 19.354648],
-                                                             [98.447037, 19.354437],
-                                                             [98.447181, 19.354265],
-                                                             [98.447251, 19.354127],
-                                                             [98.44733, 19.35394],
-                                                             [98.447383, 19.353857],
-                                                             [98.447459, 19.35378],
-                                                             [98.447536, 19.353745],
-                                                             [98.447599, 19.353732],
-                                                             [98.447679, 19.353727],
-                                                             [98.447946, 19.353812],
-                                                             [98.448079, 19.353823],
-                                                             [98.44817, 19.3538],
-                                                             [98.448245, 19.353785],
-                                                             [98.448604, 19.353388],
-                                                             [98.448987, 19.352983],
-                                                             [98.44939, 19.352504],
-                                                             [98.449566, 19.352319],
-                                                             [98.449655, 19.352254],
-                                                             [98.449717, 19.352221],
-                                                             [98.449789, 19.352182],
-                                                             [98.45092, 19.351849],
-                                                             [98.450989, 19.351815],
-                                                             [98.451038, 19.351781],
-                                                             [98.451047, 19.351748],
-                                                             [98.450914, 19.351449],
-                                                             [98.450823, 19.35126],
-                                                             [98.450796, 19.351187],
-                                                             [98.45079, 19.351124],
-                                                             [98.450786, 19.350943],
-                                                             [98.45079, 19.350879],
-                                                             [98.451745, 19.350581],
-                                                             [98.452125, 19.350428],
-                                                             [98.452198, 19.350347],
-                                                             [98.452417, 19.350065],
-                                                             [98.452472, 19.349828],
-                                                             [98.452488, 19.349777],
-                                                             [98.452514, 19.349444],
-                                                             [98.452517, 19.349405],
-                                                             [98.452719, 19.349127],
-                                                             [98.452947, 19.349032],
-                                                             [98.453117, 19.349164],
-                                                             [98.453334, 19.349547],
-                                                             [98.453578, 19.349911],
-                                                             [98.453713, 19.350026],
-                                                             [98.453851, 19.350099],
-                                                             [98.454011, 19.35016],
-                                                             [98.45417, 19.350202],
-                                                             [98.454299, 19.350217],
-                                                             [98.454448, 19.350199],
-                                                             [98.454589, 19.350243]]}},
-                               {'type': 'Feature',
-                                'properties': {'agent_id': 4,
-                                               'segment': 9,
-                                               'from': 'วัดพระธาตุแม่เย็น',
-                                               'to': 'ถนนคนเดินปาย ',
-                                               'distance_m': 2206.9,
-                                               'distance_km': 2.2069,
-                                               'from_source': 'manual',
-                                               'to_source': 'graph'},
-                                'geometry': {'type': 'LineString',
-                                             'coordinates': [[98.454589, 19.350243],
-                                                             [98.454448, 19.350199],
-                                                             [98.454299, 19.350217],
-                                                             [98.45417, 19.350202],
-                                                             [98.454011, 19.35016],
-                                                             [98.453851, 19.350099],
-                                                             [98.453713, 19.350026],
-                                                             [98.453578, 19.349911],
-                                                             [98.453334, 19.349547],
-                                                             [98.453117, 19.349164],
-                                                             [98.452947, 19.349032],
-                                                             [98.452719, 19.349127],
-                                                             [98.452517, 19.349405],
-                                                             [98.452514, 19.349444],
-                                                             [98.452488, 19.349777],
-                                                             [98.452472, 19.349828],
-                                                             [98.452417, 19.350065],
-                                                             [98.452198, 19.350347],
-                                                             [98.452125, 19.350428],
-                                                             [98.451745, 19.350581],
-                                                             [98.45079, 19.350879],
-                                                             [98.450786, 19.350943],
-                                                             [98.45079, 19.351124],
-                                                             [98.450796, 19.351187],
-                                                             [98.450823, 19.35126],
-                                                             [98.450914, 19.351449],
-                                                             [98.451047, 19.351748],
-                                                             [98.451038, 19.351781],
-                                                             [98.450989, 19.351815],
-                                                             [98.45092, 19.351849],
-                                                             [98.449789, 19.352182],
-                                                             [98.449717, 19.352221],
-                                                             [98.449655, 19.352254],
-                                                             [98.449566, 19.352319],
-                                                             [98.44939, 19.352504],
-                                                             [98.448987, 19.352983],
-                                                             [98.448604, 19.353388],
-                                                             [98.448245, 19.353785],
-                                                             [98.44817, 19.3538],
-                                                             [98.448079, 19.353823],
-                                                             [98.447946, 19.353812],
-                                                             [98.447679, 19.353727],
-                                                             [98.447599, 19.353732],
-                                                             [98.447536, 19.353745],
-                                                             [98.447459, 19.35378],
-                                                             [98.447383, 19.353857],
-                                                             [98.44733, 19.35394],
-                                                             [98.447251, 19.354127],
-                                                             [98.447181, 19.354265],
-                                                             [98.447037, 19.354437],
-                                                             [98.446848, 19.354648],
-                                                             [98.446246, 19.35529],
-                                                             [98.446097, 19.355477],
-                                                             [98.446043, 19.355531],
-                                                             [98.445962, 19.355573],
-                                                             [98.445282, 19.355848],
-                                                             [98.445082, 19.355949],
-                                                             [98.444329, 19.356349],
-                                                             [98.444157, 19.356441],
-                                                             [98.443817, 19.356626],
-                                                             [98.443625, 19.356712],
-                                                             [98.44253, 19.357204],
-                                                             [98.442029, 19.357429],
-                                                             [98.441939, 19.357469],
-                                                             [98.441388, 19.357717],
-                                                             [98.441295, 19.357759],
-                                                             [98.440625, 19.35806],
-                                                             [98.441051, 19.358974],
-                                                             [98.441235, 19.359369],
-                                                             [98.441327, 19.359566]]}},
-                               {'type': 'Feature',
-                                'properties': {'agent_id': 4,
-                                               'segment': 10,
-                                               'from': 'ถนนคนเดินปาย ',
-                                               'to': 'บ้านเนินเขาวิวปาย รีสอร์ท',
-                                               'distance_m': 2136.1,
-                                               'distance_km': 2.1361,
-                                               'from_source': 'graph',
-                                               'to_source': 'graph'},
-                                'geometry': {'type': 'LineString',
-                                             'coordinates': [[98.441327, 19.359566],
-                                                             [98.441235, 19.359369],
-                                                             [98.441051, 19.358974],
-                                                             [98.440625, 19.35806],
-                                                             [98.441295, 19.357759],
-                                                             [98.441388, 19.357717],
-                                                             [98.441939, 19.357469],
-                                                             [98.442029, 19.357429],
-                                                             [98.44253, 19.357204],
-                                                             [98.443625, 19.356712],
-                                                             [98.443817, 19.356626],
-                                                             [98.444157, 19.356441],
-                                                             [98.444329, 19.356349],
-                                                             [98.445082, 19.355949],
-                                                             [98.445282, 19.355848],
-                                                             [98.445962, 19.355573],
-                                                             [98.446043, 19.355531],
-                                                             [98.446072, 19.355613],
-                                                             [98.446098, 19.356205],
-                                                             [98.446206, 19.356721],
-                                                             [98.446389, 19.357085],
-                                                             [98.446494, 19.357225],
-                                                             [98.447076, 19.35778],
-                                                             [98.447235, 19.357882],
-                                                             [98.447512, 19.357994],
-                                                             [98.447649, 19.358087],
-                                                             [98.447841, 19.35828],
-                                                             [98.448084, 19.358599],
-                                                             [98.448313, 19.358982],
-                                                             [98.448437, 19.359449],
-                                                             [98.44845, 19.359536],
-                                                             [98.448523, 19.35993],
-                                                             [98.448577, 19.360053],
-                                                             [98.448678, 19.360146],
-                                                             [98.448926, 19.360171],
-                                                             [98.449034, 19.360202],
-                                                             [98.449095, 19.36024],
-                                                             [98.449141, 19.360329],
-                                                             [98.449229, 19.360794],
-                                                             [98.449271, 19.360921],
-                                                             [98.449501, 19.361282],
-                                                             [98.449545, 19.36136],
-                                                             [98.449574, 19.361448],
-                                                             [98.449712, 19.362879],
-                                                             [98.449721, 19.363107],
-                                                             [98.449779, 19.364299],
-                                                             [98.449807, 19.364797],
-                                                             [98.449832, 19.365314],
-                                                             [98.450622, 19.365051]]}}]}}
-# --- End embedded route data ---
+# ข้อมูลเส้นทางสำรอง (เดิมฝังเป็น literal ในไฟล์นี้) เก็บเป็น JSON บีบอัดใน app/data/ และโหลดเมื่อ fallback ใช้ครั้งแรก
+EMBEDDED_DATA_DIR = os.path.join(HERE, "data")
+_EMBEDDED_FILES = {
+    'json': 'route_json.json.gz',
+    'geojson': 'route_geojson.json.gz',
+}
+
+
+@lru_cache(maxsize=None)
+def _embedded_routes(kind: str) -> Dict[str, object]:
+    """dict province_slug -> ข้อมูลเส้นทางสำรองชนิด kind ('json' | 'geojson')"""
+    try:
+        with gzip.open(os.path.join(EMBEDDED_DATA_DIR, _EMBEDDED_FILES[kind]), 'rt', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _embedded(kind: str, province_slug: str):
+    return _embedded_routes(kind).get(province_slug)
 
 def _load_json_from_path_or_data(path: Optional[str], data: Optional[object]):
     if path and os.path.exists(path):
@@ -6303,6 +266,9 @@ def _load_json_from_path_or_data(path: Optional[str], data: Optional[object]):
                 return json.load(f)
         except Exception:
             pass
+    if callable(data):
+        # ข้อมูลสำรองแบบ lazy: โหลดเฉพาะเมื่อไม่มีไฟล์จริง
+        data = data()
     if data is not None:
         if isinstance(data, str):
             try:
@@ -6314,14 +280,11 @@ def _load_json_from_path_or_data(path: Optional[str], data: Optional[object]):
 
 
 @lru_cache(maxsize=1)
-def _poi_index():
-    """แปลงรายการ POI เป็น dict name_lower -> (label, lat, lon)"""
-    idx = {}
+def poi_index() -> NameIndex:
+    """ดัชนีชื่อ POI demo + จุด from/to ของ geojson -> พิกัด (ใช้ร่วมกันทุกที่ที่ทำ stops จากชื่อ)"""
+    entries = []
     def add(label, lat, lon):
-        if label:
-            key = str(label).strip().lower()
-            if key and lat is not None and lon is not None:
-                idx.setdefault(key, (label, float(lat), float(lon)))
+        entries.append((label, lat, lon))
     for src in (CHARGERS, ATTRACTIONS, FOODS, CAFES, HOTELS):
         for i in src:
             add(i.get('name_th') or i.get('name'), i.get('lat'), i.get('lon'))
@@ -6358,21 +321,11 @@ def _poi_index():
                     add(to_name, last[1], last[0])
             elif isinstance(geom, dict) and geom.get('type') == 'Point' and isinstance(coords, list) and len(coords) >= 2:
                 add(from_name, coords[1], coords[0])
-    return idx
+    return NameIndex(entries)
 
 def poi_lookup(name: str):
-    """คืน dict(label,lat,lon) จากชื่อที่ตรงกับ POI demo ถ้าเจอ"""
-    if not name:
-        return None
-    key = str(name).strip().lower()
-    if not key:
-        return None
-    idx = _poi_index()
-    hit = idx.get(key)
-    if hit:
-        label, lat, lon = hit
-        return {'label': label, 'lat': lat, 'lon': lon}
-    return None
+    """คืน dict(label,lat,lon) ของ POI demo ที่ชื่อตรง/ขึ้นต้น/คล้ายพอ ถ้าเจอ"""
+    return poi_index().resolve(name)
 
 # --------- Helpers to turn route files into agent-like objects ----------
 
@@ -6384,26 +337,26 @@ def _aggregated_files() -> Dict[str, Dict[str, object]]:
         'mae-hong-son': {
             'json': os.path.join(DATA_ROUTES_DIR, 'Maehongson_all.json'),
             'geojson': os.path.join(DATA_ROUTES_DIR, 'Maehongson_all.geojson'),
-            'json_data': ROUTE_JSON_DATA.get('mae-hong-son'),
-            'geojson_data': ROUTE_GEOJSON_DATA.get('mae-hong-son'),
+            'json_data': partial(_embedded, 'json', 'mae-hong-son'),
+            'geojson_data': partial(_embedded, 'geojson', 'mae-hong-son'),
         },
         'chiang-mai': {
             'json': os.path.join(DATA_ROUTES_DIR, 'Chiangmai_routes_all.json'),
             'geojson': os.path.join(DATA_ROUTES_DIR, 'Chiangmai_routes_all.geojson'),
-            'json_data': ROUTE_JSON_DATA.get('chiang-mai'),
-            'geojson_data': ROUTE_GEOJSON_DATA.get('chiang-mai'),
+            'json_data': partial(_embedded, 'json', 'chiang-mai'),
+            'geojson_data': partial(_embedded, 'geojson', 'chiang-mai'),
         },
         'lampang': {
             'json': os.path.join(DATA_ROUTES_DIR, 'Lampang_routes_all.json'),
             'geojson': os.path.join(DATA_ROUTES_DIR, 'Lampang_routes_all.geojson'),
-            'json_data': ROUTE_JSON_DATA.get('lampang'),
-            'geojson_data': ROUTE_GEOJSON_DATA.get('lampang'),
+            'json_data': partial(_embedded, 'json', 'lampang'),
+            'geojson_data': partial(_embedded, 'geojson', 'lampang'),
         },
         'lamphun': {
             'json': os.path.join(DATA_ROUTES_DIR, 'Lamphun_routes.json'),
             'geojson': os.path.join(DATA_ROUTES_DIR, 'Lamphun_routes.geojson'),
-            'json_data': ROUTE_JSON_DATA.get('lamphun'),
-            'geojson_data': ROUTE_GEOJSON_DATA.get('lamphun'),
+            'json_data': partial(_embedded, 'json', 'lamphun'),
+            'geojson_data': partial(_embedded, 'geojson', 'lamphun'),
         },
     }
 
@@ -6485,7 +438,7 @@ def _load_route_geojson(path: Optional[str], data: Optional[object] = None) -> L
 
 def _build_polyline_and_stops_from_segments(segs: List[Dict]) -> tuple:
     """
-    สร้าง polyline และ stops จาก segment list โดยอาศัย poi_lookup (ซึ่งตอนนี้รวมพิกัดจาก geojson แล้ว)
+    สร้าง polyline และ stops จาก segment list โดยอาศัย poi_lookup (ซึ่งรวมพิกัดจาก geojson แล้ว)
     """
     poly: List[Dict] = []
     stops: List[Dict] = []
@@ -6568,52 +521,54 @@ def _build_timeline_from_log(log_entries: List[str]) -> List[Dict]:
         })
     return timeline
 
-def _build_polyline_from_geojson(raw: Optional[object], agent_id: object) -> List[Dict]:
-    if not raw or not isinstance(raw, dict):
+def _polyline_from_segments(segments: List[tuple]) -> List[Dict]:
+    """ต่อพิกัด LineString ของ segment (เรียงตามลำดับ segment) เป็น polyline เดียว ตัดจุดซ้ำติดกันด้วย diff ของ numpy"""
+    # import ตอนสร้างเส้นทาง demo ครั้งแรก ไม่ให้เพิ่มเวลา start ของ API
+    import numpy as np
+
+    parts = []
+    for _order, coords in sorted(segments, key=lambda s: (s[0] is None, s[0])):
+        pairs = [pair[:2] for pair in coords
+                 if isinstance(pair, (list, tuple)) and len(pair) >= 2 and pair[0] is not None and pair[1] is not None]
+        if pairs:
+            parts.append(np.asarray(pairs, dtype=float))
+    if not parts:
         return []
+    points = np.concatenate(parts)  # คอลัมน์ lon, lat
+    keep = np.ones(len(points), dtype=bool)
+    keep[1:] = (np.abs(np.diff(points, axis=0)) >= 1e-9).any(axis=1)
+    return [{'lat': lat, 'lon': lon} for lon, lat in points[keep].tolist()]
+
+def _polylines_by_agent(raw: Optional[object]) -> Dict[object, List[Dict]]:
+    """จัดกลุ่ม LineString ใน FeatureCollection ตาม agent_id ในรอบเดียว แล้วสร้าง polyline ของแต่ละ agent"""
+    if not raw or not isinstance(raw, dict):
+        return {}
     if raw.get('type') == 'FeatureCollection':
         feats = raw.get('features') or []
     elif raw.get('type') == 'Feature':
         feats = [raw]
     else:
-        return []
-    segments: List[tuple] = []
+        return {}
+    grouped: Dict[object, List[tuple]] = {}
     for ft in feats:
         if not isinstance(ft, dict):
             continue
         props = ft.get('properties') or {}
-        if props.get('agent_id') != agent_id:
-            continue
         geom = ft.get('geometry') or {}
         if geom.get('type') != 'LineString':
             continue
         coords = geom.get('coordinates')
         if not isinstance(coords, list):
             continue
-        segments.append((props.get('segment'), coords))
-    segments_sorted = sorted(segments, key=lambda s: (s[0] is None, s[0]))
-    poly: List[Dict] = []
-    for _order, coords in segments_sorted:
-        for pair in coords:
-            if not isinstance(pair, (list, tuple)) or len(pair) < 2:
-                continue
-            lon, lat = pair[0], pair[1]
-            if lat is None or lon is None:
-                continue
-            point = {'lat': float(lat), 'lon': float(lon)}
-            if poly:
-                last = poly[-1]
-                if abs(last['lat'] - point['lat']) < 1e-9 and abs(last['lon'] - point['lon']) < 1e-9:
-                    continue
-            poly.append(point)
-    return poly
+        grouped.setdefault(props.get('agent_id'), []).append((props.get('segment'), coords))
+    return {agent_id: _polyline_from_segments(segments) for agent_id, segments in grouped.items()}
 
 def _build_agents_from_routes() -> List[Dict]:
     agents: List[Dict] = []
     for prov_slug, meta in _aggregated_files().items():
         summaries = _load_route_summary_json(meta.get('json'), meta.get('json_data'))
         geo_segments = _load_route_geojson(meta.get('geojson'), meta.get('geojson_data'))
-        raw_geojson = _load_json_from_path_or_data(meta.get('geojson'), meta.get('geojson_data'))
+        polylines = _polylines_by_agent(_load_json_from_path_or_data(meta.get('geojson'), meta.get('geojson_data')))
         segments_by_id: Dict[object, List[Dict]] = {}
         for entry in geo_segments:
             agent_id = entry.get('agent_id')
@@ -6632,9 +587,9 @@ def _build_agents_from_routes() -> List[Dict]:
             except Exception:
                 agent_id = 100000 + len(agents)
             segs = segments_by_id.get(agent_raw) or segments_by_id.get(agent_id) or []
-            polyline = _build_polyline_from_geojson(raw_geojson, agent_raw)
+            polyline = polylines.get(agent_raw) or []
             if not polyline and agent_raw != agent_id:
-                polyline = _build_polyline_from_geojson(raw_geojson, agent_id)
+                polyline = polylines.get(agent_id) or []
             poi_tags = summary.get('visited_pois')
             if not isinstance(poi_tags, list):
                 poi_tags = []
@@ -6775,5 +730,16 @@ def load_route_agents_by_province() -> Dict[str, List[Dict]]:
     return _ROUTE_AGENTS_BY_PROVINCE
 
 
-if not AGENTS:
-    AGENTS = _build_agents_from_routes()
+
+def __getattr__(name: str):
+    """AGENTS / ROUTE_JSON_DATA / ROUTE_GEOJSON_DATA สร้างเมื่อถูกใช้ครั้งแรก (ไม่ต้องจ่ายตอน import ถ้า DB ปกติ)"""
+    if name == 'AGENTS':
+        value = _build_agents_from_routes()
+    elif name == 'ROUTE_JSON_DATA':
+        value = _embedded_routes('json')
+    elif name == 'ROUTE_GEOJSON_DATA':
+        value = _embedded_routes('geojson')
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
@@ -0,0 +1,118 @@
+"""ดัชนีในหน่วยความจำของข้อมูล demo (ใช้ตอน DB ล่ม) สร้างครั้งเดียวเมื่อถูกใช้ครั้งแรก อ่านอย่างเดียว"""
+import sys
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from .spatial import GeoFilter, GridIndex
+from .textnorm import SEPARATOR, search_key, search_text, text_rank
+from . import demo_data
+
+
+def _trigrams(text: str) -> Set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class DemoStore:
+    """
+    รายการ demo หนึ่งประเภทพร้อมดัชนี: (province, id) -> item, แบ่งตามจังหวัด, search_text + trigram ของชื่อ และ grid พิกัด
+    select() เลือกดัชนีที่แคบที่สุดก่อนแล้วค่อยกรองที่เหลือ ผลเรียงตามลำดับเดิมของรายการ (หรือตามระยะเมื่อมี near)
+    """
+
+    def __init__(self, items: Sequence[dict], name_fields: Sequence[str] = ('name_th', 'name_en'), aliases: Sequence[str] = ()):
+        self.items: List[dict] = list(items)
+        self.by_key: Dict[Tuple[Optional[str], str], dict] = {}
+        self.by_province: Dict[Optional[str], List[dict]] = {}
+        self.texts: List[str] = []
+        self._pos: Dict[int, int] = {}
+        self._grams: Dict[str, Set[int]] = {}
+        for pos, item in enumerate(self.items):
+            self._pos[id(item)] = pos
+            province = item.get('province')
+            for field in ('id',) + tuple(aliases):
+                if item.get(field):
+                    self.by_key.setdefault((province, str(item[field])), item)
+            self.by_province.setdefault(province, []).append(item)
+            text = search_text(*(item.get(f) for f in name_fields))
+            self.texts.append(text)
+            for gram in _trigrams(text):
+                self._grams.setdefault(gram, set()).add(pos)
+        self.grid: GridIndex = GridIndex((i.get('lat'), i.get('lon'), i) for i in self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def get(self, province: Optional[str], key: str) -> Optional[dict]:
+        """หา item ด้วย (จังหวัด, id หรือ alias)"""
+        return self.by_key.get((province, key))
+
+    def in_province(self, province: Optional[str]) -> List[dict]:
+        return self.by_province.get(province, []) if province else self.items
+
+    def text(self, item: dict) -> str:
+        return self.texts[self._pos[id(item)]]
+
+    def search(self, q: Optional[str]) -> List[int]:
+        """ตำแหน่งของ item ที่ชื่อมีคำค้น (normalize แบบ search_text) เรียงตามลำดับเดิม"""
+        key = search_key(q).replace(SEPARATOR, '')
+        if not key:
+            return list(range(len(self.items)))
+        if len(key) < 3:
+            candidates: Iterable[int] = range(len(self.items))
+        else:
+            postings = sorted((self._grams.get(g, set()) for g in _trigrams(key)), key=len)
+            candidates = set.intersection(*postings) if postings[0] else ()
+        return sorted(pos for pos in candidates if key in self.texts[pos])
+
+    def rank(self, q: Optional[str], item: dict) -> int:
+        """คะแนนความตรงแบบ textnorm.match_rank จาก search_text ที่คำนวณไว้แล้ว"""
+        return text_rank(q, self.text(item))
+
+    def _geo_candidates(self, geo: GeoFilter) -> List[dict]:
+        if geo.bbox:
+            return [item for _lat, _lon, item in self.grid.within(*geo.bbox) if geo.match(item)]
+        lat, lon = geo.near
+        return [item for _d, item in self.grid.nearest(lat, lon, len(self.grid), geo.radius_km)]
+
+    def select(self, province: Optional[str] = None, q: Optional[str] = None, geo: Optional[GeoFilter] = None) -> List[dict]:
+        """กรองตามจังหวัด/คำค้น/พื้นที่ ด้วยดัชนีแทนการไล่ทั้งรายการ"""
+        if geo:
+            rows = self._geo_candidates(geo)
+            if province:
+                rows = [i for i in rows if i.get('province') == province]
+            if q:
+                hits = set(self.search(q))
+                rows = [i for i in rows if self._pos[id(i)] in hits]
+            if not geo.near:
+                rows.sort(key=lambda i: self._pos[id(i)])
+            return rows
+        if q:
+            rows = [self.items[pos] for pos in self.search(q)]
+            return [i for i in rows if i.get('province') == province] if province else rows
+        return self.in_province(province)
+
+
+# ชื่อ store -> (รายการใน demo_data, ตัวเลือกของ DemoStore)
+_STORES = {
+    'CHARGERS': ('CHARGERS', {'name_fields': ('name', 'brand', 'address')}),
+    'ATTRACTIONS': ('ATTRACTIONS', {'aliases': ('name_en',)}),
+    'FOODS': ('FOODS', {}),
+    'CAFES': ('CAFES', {}),
+    'HOTELS': ('HOTELS', {}),
+}
+
+
+def load_all() -> None:
+    """สร้างดัชนีทุก store ตอนนี้ (preload ในโปรเซสแม่ก่อน fork)"""
+    module = sys.modules[__name__]
+    for name in _STORES:
+        getattr(module, name)
+
+
+def __getattr__(name: str):
+    """CHARGERS / ATTRACTIONS / FOODS / CAFES / HOTELS สร้างดัชนีเมื่อถูกใช้ครั้งแรก (import router ไม่ต้องจ่าย)"""
+    spec = _STORES.get(name)
+    if spec is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    source, options = spec
+    value = DemoStore(getattr(demo_data, source), **options)
+    globals()[name] = value
+    return value
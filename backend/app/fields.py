@@ -0,0 +1,48 @@
+"""เลือกคอลัมน์ของ list endpoint ตามพารามิเตอร์ fields= (select เฉพาะคอลัมน์ที่ใช้ ไม่โหลดทั้ง ORM entity)"""
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+# คอลัมน์ภายในที่ไม่เปิดให้ขอผ่าน fields=
+_HIDDEN = {'province_id', 'geog', 'search_text', 'open_minutes'}
+
+
+class FieldSet:
+    """
+    ชุดฟิลด์ที่ list endpoint ส่งได้: defaults คือรูปแบบเดิมของ response
+    ส่วนคอลัมน์อื่นของตารางขอเพิ่มได้ด้วย fields= ; post ใช้แปลงค่าหลัง query (เช่น json เวลาเปิดปิด)
+    """
+
+    def __init__(self, model, defaults: Dict[str, Any], post: Optional[Dict[str, Callable[[Any], Any]]] = None):
+        self.model = model
+        self.columns: Dict[str, Any] = dict(defaults)
+        for col in model.__table__.columns:
+            if col.key not in self.columns and col.key not in _HIDDEN:
+                self.columns[col.key] = getattr(model, col.key)
+        self.defaults: Tuple[str, ...] = tuple(defaults)
+        self.post = post or {}
+
+    def choose(self, fields: Optional[str]) -> Tuple[str, ...]:
+        """แปลง 'a,b,c' เป็นรายชื่อฟิลด์ (มี id เสมอ) ValueError ถ้ามีชื่อที่ไม่รู้จัก"""
+        if not fields:
+            return self.defaults
+        names = [f.strip() for f in fields.split(',') if f.strip()]
+        unknown = [n for n in names if n not in self.columns]
+        if unknown:
+            raise ValueError(f"unknown fields: {', '.join(unknown)}")
+        return tuple(dict.fromkeys(['id'] + names))
+
+    def select_columns(self, names: Iterable[str]) -> list:
+        return [self.columns[n].label(n) for n in names]
+
+    def row(self, row, names: Iterable[str]) -> Dict[str, Any]:
+        """แปลงแถวผลลัพธ์ (Row ที่ label ตามชื่อฟิลด์) เป็น dict"""
+        mapping = row._mapping
+        out: Dict[str, Any] = {}
+        for n in names:
+            value = mapping[n]
+            fn = self.post.get(n)
+            out[n] = fn(value) if fn else value
+        return out
+
+    def project(self, item: Dict[str, Any], names: Iterable[str]) -> Dict[str, Any]:
+        """ตัดรายการ demo ให้เหลือเฉพาะฟิลด์ที่ขอ"""
+        return {n: item.get(n) for n in names}
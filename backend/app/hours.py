@@ -0,0 +1,85 @@
+"""เวลาเปิดปิดร้าน: แปลงข้อความ open/close เป็นช่วงนาทีของสัปดาห์ (int4multirange) ตอน ETL และเช็คว่าเปิดอยู่ไหม"""
+import re
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+# เวลาในข้อมูลร้านเป็นเวลาไทย (UTC+7) นับนาทีของสัปดาห์จากวันจันทร์ 00:00
+THAI_TZ = timezone(timedelta(hours=7))
+DAY_MINUTES = 24 * 60
+WEEK_MINUTES = 7 * DAY_MINUTES
+
+_TIME_RE = re.compile(r'^(\d{1,2})(?:[:.](\d{2}))?(?:\s*น\.?)?$')
+
+
+def parse_hhmm(raw: Optional[str]) -> Optional[int]:
+    """'10:00' / '9.30' / '18 น.' -> นาทีนับจากเที่ยงคืน (None ถ้าอ่านไม่ได้)"""
+    if not raw:
+        return None
+    m = _TIME_RE.match(str(raw).strip())
+    if not m:
+        return None
+    hour, minute = int(m.group(1)), int(m.group(2) or 0)
+    if hour > 24 or minute > 59 or (hour == 24 and minute):
+        return None
+    return hour * 60 + minute
+
+
+@lru_cache(maxsize=1024)
+def week_ranges(open_text: Optional[str], close_text: Optional[str]) -> Tuple[Tuple[int, int], ...]:
+    """
+    ช่วง [start, end) นาทีของสัปดาห์ที่ร้านเปิด (ข้อมูลต้นทางมีเวลาเดียวกันทุกวัน)
+    ปิดหลังเที่ยงคืนต่อไปวันถัดไป, เปิด=ปิด ถือว่าเปิด 24 ชั่วโมง, อ่านเวลาไม่ได้คืน tuple ว่าง
+    """
+    start, end = parse_hhmm(open_text), parse_hhmm(close_text)
+    if start is None or end is None:
+        return ()
+    if start == end or (start == 0 and end == DAY_MINUTES):
+        return ((0, WEEK_MINUTES),)
+    if end <= start:
+        end += DAY_MINUTES
+    out: List[Tuple[int, int]] = []
+    for day in range(7):
+        a, b = day * DAY_MINUTES + start, day * DAY_MINUTES + end
+        if b > WEEK_MINUTES:
+            # ช่วงคืนวันอาทิตย์ล้นไปเช้าวันจันทร์ของสัปดาห์ถัดไป
+            out.append((a, WEEK_MINUTES))
+            out.append((0, b - WEEK_MINUTES))
+        else:
+            out.append((a, b))
+    return tuple(sorted(out))
+
+
+def multirange_literal(ranges) -> Optional[str]:
+    """ช่วงเวลาเป็นข้อความ int4multirange ของ Postgres (None ถ้าไม่มีข้อมูล)"""
+    if not ranges:
+        return None
+    return '{' + ','.join(f'[{a},{b})' for a, b in ranges) + '}'
+
+
+def minute_of_week(when: datetime) -> int:
+    """นาทีของสัปดาห์ตามเวลาไทย (datetime ที่ไม่มี timezone ถือเป็นเวลาไทย)"""
+    if when.tzinfo is not None:
+        when = when.astimezone(THAI_TZ)
+    return when.weekday() * DAY_MINUTES + when.hour * 60 + when.minute
+
+
+def parse_open_at(raw: str, now: Optional[datetime] = None) -> int:
+    """แปลงพารามิเตอร์ open_at (ISO datetime หรือ 'HH:MM' ของวันนี้) เป็นนาทีของสัปดาห์ ValueError ถ้ารูปแบบผิด"""
+    minutes = parse_hhmm(raw)
+    if minutes is not None and minutes < DAY_MINUTES:
+        today = (now or datetime.now(THAI_TZ)).astimezone(THAI_TZ)
+        return today.weekday() * DAY_MINUTES + minutes
+    try:
+        return minute_of_week(datetime.fromisoformat(raw))
+    except ValueError:
+        raise ValueError('open_at must be HH:MM or an ISO datetime')
+
+
+def now_minute() -> int:
+    return minute_of_week(datetime.now(THAI_TZ))
+
+
+def is_open(open_text: Optional[str], close_text: Optional[str], minute: int) -> bool:
+    """เช็คกับข้อมูลในหน่วยความจำ (fallback) แบบเดียวกับ open_minutes @> minute ใน SQL"""
+    return any(a <= minute < b for a, b in week_ranges(open_text, close_text))
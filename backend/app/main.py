@@ -1,11 +1,14 @@
 """จุดเริ่มต้นของ FastAPI ตั้ง middleware/routers และ healthcheck"""
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.middleware.gzip import GZipMiddleware
-from .routers import search, agents, chargers, routes, pois, chatbot
-from . import config
+from .routers import search, agents, chargers, routes, pois, chatbot, maps, tiles
+from . import config, offload
+from .cache import FastJSONResponse
+from .compression import CompressionMiddleware
 
-app = FastAPI(title='EV Journey API')
+app = FastAPI(title='EV Journey API', default_response_class=FastJSONResponse)
+# ปิด process pool ของงานเส้นทางเมื่อแอปหยุด
+app.add_event_handler('shutdown', offload.shutdown)
 
 # ตั้งค่า CORS จาก env: ถ้าเจอ * จะเปิดกว้าง แต่ตัด credential ออก
 allow_all = '*' in config.ALLOWED_ORIGINS
@@ -18,10 +21,12 @@ app.add_middleware(
     allow_credentials=cors_allow_credentials,
     allow_methods=['*'],
     allow_headers=['*'],
+    # ให้ frontend อ่าน cursor หน้าถัดไปของ list endpoint ได้
+    expose_headers=['X-Next-Cursor'],
 )
 
-# บีบอัด response JSON ที่ใหญ่เกิน 1KB ให้โหลดเร็วขึ้น
-app.add_middleware(GZipMiddleware, minimum_size=1024)
+# บีบอัด response ที่ใหญ่เกิน COMPRESS_MIN_SIZE ด้วย br/zstd/gzip ตามที่ client รับได้ (body ใน cache บีบไว้ล่วงหน้าแล้วส่งผ่าน)
+app.add_middleware(CompressionMiddleware, minimum_size=config.COMPRESS_MIN_SIZE)
 
 # รวม router ตามโดเมนของข้อมูล
 app.include_router(search.router)
@@ -29,6 +34,8 @@ app.include_router(agents.router)
 app.include_router(chargers.router)
 app.include_router(routes.router)
 app.include_router(pois.router)
+app.include_router(maps.router)
+app.include_router(tiles.router)
 app.include_router(chatbot.router)
 
 @app.get('/api/health')
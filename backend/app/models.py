@@ -1,6 +1,6 @@
 """ORM model สำหรับตารางหลักของฐานข้อมูล"""
 from sqlalchemy import Column, Integer, Text, Float, ForeignKey, Numeric
-from sqlalchemy.orm import declarative_base
+from sqlalchemy.orm import declarative_base, deferred
 
 Base = declarative_base()
 
@@ -24,6 +24,10 @@ class Charger(Base):
     province_id = Column(Integer, ForeignKey('provinces.id'))
     brand = Column(Text)
     address = Column(Text)
+    # geography(Point) ที่ Postgres คำนวณจาก lat/lon (generated column) ใช้กับ GiST index; ไม่โหลดมากับ entity
+    geog = deferred(Column(Text))
+    # ชื่อที่ normalize แล้ว (textnorm.search_text) ที่ ETL เขียนไว้ ใช้กับ pg_trgm GIN index
+    search_text = deferred(Column(Text))
 
 class Attraction(Base):
     """แหล่งท่องเที่ยว/จุดสนใจ"""
@@ -59,6 +63,10 @@ class Attraction(Base):
     nearby_location = Column(Text)
     type_th = Column(Text)
     region_th = Column(Text)
+    # geography(Point) ที่ Postgres คำนวณจาก lat/lon (generated column) ใช้กับ GiST index; ไม่โหลดมากับ entity
+    geog = deferred(Column(Text))
+    # ชื่อที่ normalize แล้ว (textnorm.search_text) ที่ ETL เขียนไว้ ใช้กับ pg_trgm GIN index
+    search_text = deferred(Column(Text))
 
 class Food(Base):
     """ร้านอาหาร"""
@@ -71,6 +79,14 @@ class Food(Base):
     lon = Column(Float)
     province_id = Column(Integer, ForeignKey('provinces.id'))
     open_hours_json = Column(Text)
+    # เวลาเปิด/ปิดที่ ETL แยกไว้แล้ว และช่วงนาทีของสัปดาห์ (int4multirange) สำหรับกรองร้านที่เปิดอยู่
+    open_text = Column(Text)
+    close_text = Column(Text)
+    open_minutes = deferred(Column(Text))
+    # geography(Point) ที่ Postgres คำนวณจาก lat/lon (generated column) ใช้กับ GiST index; ไม่โหลดมากับ entity
+    geog = deferred(Column(Text))
+    # ชื่อที่ normalize แล้ว (textnorm.search_text) ที่ ETL เขียนไว้ ใช้กับ pg_trgm GIN index
+    search_text = deferred(Column(Text))
 
 class Cafe(Base):
     """คาเฟ่"""
@@ -82,6 +98,10 @@ class Cafe(Base):
     lon = Column(Float)
     province_id = Column(Integer, ForeignKey('provinces.id'))
     open_hours_json = Column(Text)
+    # geography(Point) ที่ Postgres คำนวณจาก lat/lon (generated column) ใช้กับ GiST index; ไม่โหลดมากับ entity
+    geog = deferred(Column(Text))
+    # ชื่อที่ normalize แล้ว (textnorm.search_text) ที่ ETL เขียนไว้ ใช้กับ pg_trgm GIN index
+    search_text = deferred(Column(Text))
 
 class Hotel(Base):
     """โรงแรม/ที่พัก"""
@@ -95,6 +115,10 @@ class Hotel(Base):
     lat = Column(Float)
     lon = Column(Float)
     province_id = Column(Integer, ForeignKey('provinces.id'))
+    # geography(Point) ที่ Postgres คำนวณจาก lat/lon (generated column) ใช้กับ GiST index; ไม่โหลดมากับ entity
+    geog = deferred(Column(Text))
+    # ชื่อที่ normalize แล้ว (textnorm.search_text) ที่ ETL เขียนไว้ ใช้กับ pg_trgm GIN index
+    search_text = deferred(Column(Text))
 
 class Agent(Base):
     """เส้นทางตัวอย่าง (agent) ที่มี metadata"""
@@ -132,3 +156,27 @@ class AgentRoute(Base):
     t_end_min = Column(Numeric)
     distance_m = Column(Numeric)
     geom = Column(Text)
+
+class AgentStop(Base):
+    """จุดแวะของ agent ที่ ETL คำนวณไว้ล่วงหน้า (day = NULL คือทั้งทริป)"""
+    __tablename__ = 'agent_stops'
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    agent_id = Column(Integer, ForeignKey('agents.id'))
+    day = Column(Integer)
+    stop_order = Column(Integer)
+    label = Column(Text)
+    lat = Column(Float)
+    lon = Column(Float)
+    source = Column(Text)
+
+class AgentDay(Base):
+    """ดัชนีรายวันของ agent: ช่วง id ของ log/route ในแต่ละวัน (วันแรก = 1)"""
+    __tablename__ = 'agent_days'
+    agent_id = Column(Integer, ForeignKey('agents.id'), primary_key=True)
+    day = Column(Integer, primary_key=True)
+    log_first_id = Column(Integer)
+    log_last_id = Column(Integer)
+    log_count = Column(Integer)
+    route_first_id = Column(Integer)
+    route_last_id = Column(Integer)
+    route_count = Column(Integer)
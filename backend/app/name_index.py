@@ -0,0 +1,102 @@
+"""ดัชนีจับคู่ชื่อสถานที่ -> พิกัด (ใช้ทำ stops/polyline ของเส้นทาง demo): ตรงตัว, ขึ้นต้น, แล้วค่อย trigram ที่คล้ายพอ"""
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .textnorm import label_key
+
+# ความคล้ายแบบ pg_trgm similarity() ขั้นต่ำที่ยอมรับว่าเป็นชื่อเดียวกัน
+SIMILARITY_THRESHOLD = 0.5
+# คำค้นสั้นกว่านี้ไม่หาแบบขึ้นต้น (สั้นไปจะจับชื่อมั่ว)
+MIN_PREFIX = 4
+
+
+def trigrams(key: str) -> Set[str]:
+    """trigram แบบ pg_trgm: เติมช่องว่างหน้า 2 หลัง 1 ทีละคำ"""
+    grams: Set[str] = set()
+    for word in key.split():
+        padded = f'  {word} '
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def similarity(a: Set[str], b: Set[str]) -> float:
+    if not a or not b:
+        return 0.0
+    shared = len(a & b)
+    return shared / (len(a) + len(b) - shared)
+
+
+class NameIndex:
+    """
+    ชื่อ (normalize ด้วย label_key) -> (label, lat, lon) ชื่อซ้ำใช้รายการแรกที่เพิ่ม
+    lookup: ตรงตัว -> ชื่อที่ขึ้นต้นด้วยคำค้น (สั้นสุดก่อน) -> trigram similarity สูงสุดที่ผ่าน threshold
+    """
+
+    def __init__(self, entries: Iterable[Tuple[Optional[str], object, object]], threshold: float = SIMILARITY_THRESHOLD):
+        self.threshold = threshold
+        self.labels: List[Tuple[str, float, float]] = []
+        self.keys: List[str] = []
+        self.exact: Dict[str, int] = {}
+        self._grams: List[Set[str]] = []
+        self._postings: Dict[str, Set[int]] = {}
+        for label, lat, lon in entries:
+            key = label_key(label)
+            if not key or lat is None or lon is None or key in self.exact:
+                continue
+            pos = len(self.labels)
+            self.exact[key] = pos
+            self.labels.append((str(label), float(lat), float(lon)))
+            self.keys.append(key)
+            grams = trigrams(key)
+            self._grams.append(grams)
+            for gram in grams:
+                self._postings.setdefault(gram, set()).add(pos)
+        self._sorted: List[Tuple[str, int]] = sorted((key, pos) for pos, key in enumerate(self.keys))
+        self.lookup = lru_cache(maxsize=4096)(self._lookup)
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def _prefix(self, key: str) -> Optional[int]:
+        best = None
+        i = bisect_left(self._sorted, (key, -1))
+        while i < len(self._sorted) and self._sorted[i][0].startswith(key):
+            cand, pos = self._sorted[i]
+            if best is None or (len(cand), pos) < (len(self.keys[best]), best):
+                best = pos
+            i += 1
+        return best
+
+    def _similar(self, key: str) -> Optional[int]:
+        grams = trigrams(key)
+        candidates: Set[int] = set()
+        for gram in grams:
+            candidates.update(self._postings.get(gram, ()))
+        best, best_score = None, self.threshold
+        for pos in sorted(candidates):
+            score = similarity(grams, self._grams[pos])
+            if score > best_score or (score == best_score and best is None):
+                best, best_score = pos, score
+        return best
+
+    def _lookup(self, name: Optional[str]) -> Optional[Tuple[str, float, float]]:
+        key = label_key(name)
+        if not key:
+            return None
+        pos = self.exact.get(key)
+        if pos is None and len(key) >= MIN_PREFIX:
+            pos = self._prefix(key)
+        if pos is None:
+            pos = self._similar(key)
+        return self.labels[pos] if pos is not None else None
+
+    def resolve(self, name: Optional[str]) -> Optional[dict]:
+        """คืน dict(label, lat, lon) แบบ resolver ของ stops (None ถ้าไม่เจอ)"""
+        hit = self.lookup(name)
+        if hit is None:
+            return None
+        label, lat, lon = hit
+        return {'label': label, 'lat': lat, 'lon': lon}
+
+    __call__ = resolve
@@ -0,0 +1,152 @@
+"""
+process pool สำหรับงานเส้นทางที่กิน CPU (parse ไฟล์ JSON ใหญ่, สร้าง graph, ค้นเส้นทาง) ไม่ให้ถือ GIL ของ worker API
+งานในโปรเซสลูก serialize ผลเป็น JSON bytes เอง ฝั่ง API แค่ส่ง bytes ต่อ; จำกัดงานค้าง (503) และเวลารอผล (504)
+ใต้ gunicorn (preload) pool เป็นแบบ fork จาก worker ทันทีหลัง fork โปรเซสลูกใช้ route graph ที่โหลดไว้ในโปรเซสแม่ร่วมกัน
+"""
+import asyncio
+import logging
+import multiprocessing
+import os
+import signal
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Iterable, Optional, Tuple
+
+from fastapi import HTTPException, Response
+from starlette.concurrency import run_in_threadpool
+
+from .cache import dumps
+from .config import ROUTE_POOL_WORKERS, ROUTE_POOL_MAX_PENDING, ROUTE_TASK_TIMEOUT_SEC
+
+logger = logging.getLogger(__name__)
+
+_STATE = {'pool': None, 'pending': 0}
+_LOCK = threading.Lock()
+
+
+def _invoke(fn: Callable[..., Any], args: tuple) -> Tuple[int, Any]:
+    """รันในโปรเซสลูก: คืน (200, JSON bytes) หรือ (status, detail) ของ HTTPException (exception ของ FastAPI pickle ข้ามโปรเซสไม่ได้)"""
+    try:
+        return 200, dumps(fn(*args))
+    except HTTPException as exc:
+        return exc.status_code, exc.detail
+
+
+def _exit_with_parent(parent: int) -> None:
+    """โปรเซสลูกแบบ fork ถือปลายทั้งสองของ queue ไว้เอง จึงไม่เห็น EOF เมื่อ worker ตาย: ออกเองเมื่อโปรเซสแม่เปลี่ยน"""
+    while os.getppid() == parent:
+        time.sleep(1.0)
+    os._exit(0)
+
+
+def _init_forked_child(parent: int, close_fds: Tuple[int, ...]) -> None:
+    """
+    initializer ของโปรเซสลูกแบบ fork: ปิด socket ที่ worker รับ request (ไม่ให้ค้างพอร์ตไว้ถ้าโปรเซสลูกยังอยู่)
+    คืน signal handler ที่สืบทอดมาจาก gunicorn เป็นค่าปกติ และเฝ้าดูว่า worker ยังอยู่
+    """
+    for fd in close_fds:
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+    for name in ('SIGTERM', 'SIGINT', 'SIGQUIT', 'SIGHUP', 'SIGUSR1', 'SIGUSR2', 'SIGWINCH', 'SIGCHLD', 'SIGTTIN', 'SIGTTOU'):
+        sig = getattr(signal, name, None)
+        if sig is not None:
+            signal.signal(sig, signal.SIG_DFL)
+    threading.Thread(target=_exit_with_parent, args=(parent,), daemon=True).start()
+
+
+def _ready() -> bool:
+    return True
+
+
+def start_forked_pool(close_fds: Iterable[int] = ()) -> None:
+    """
+    เรียกใน worker ของ gunicorn ทันทีหลัง fork (ยังมี thread เดียว ก่อนเริ่ม event loop/threadpool): สร้าง pool แบบ fork
+    โปรเซสลูกได้ route graph ที่ preload + gc.freeze ไว้ในโปรเซสแม่ไปแบบ copy-on-write ไม่ต้องสร้างใหม่คนละชุด
+    close_fds คือ fd ของ socket ที่ worker รับ request ซึ่งโปรเซสลูกไม่ควรถือไว้
+    """
+    if ROUTE_POOL_WORKERS <= 0:
+        return
+    pool = ProcessPoolExecutor(
+        max_workers=ROUTE_POOL_WORKERS,
+        mp_context=multiprocessing.get_context('fork'),
+        initializer=_init_forked_child,
+        initargs=(os.getpid(), tuple(close_fds)),
+    )
+    # pool แบบ fork เปิดโปรเซสลูกครบทุกตัวตอน submit แรก: สั่งตอนนี้ที่ยังไม่มี thread อื่น
+    pool.submit(_ready).result()
+    with _LOCK:
+        _STATE['pool'] = pool
+
+
+def _pool() -> ProcessPoolExecutor:
+    with _LOCK:
+        if _STATE['pool'] is None:
+            from .preload import warm_route_graphs
+            # ไม่มี pool ที่ fork ไว้ (uvicorn โปรเซสเดียว หรือ pool เดิมพัง) ใช้ spawn แล้วสร้าง graph ในโปรเซสลูกเอง
+            # ไม่ fork จากโปรเซสที่มี thread ของ threadpool/event loop อยู่แล้ว (เสี่ยง lock ค้าง)
+            _STATE['pool'] = ProcessPoolExecutor(
+                max_workers=ROUTE_POOL_WORKERS,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=warm_route_graphs,
+            )
+        return _STATE['pool']
+
+
+def _release(_future) -> None:
+    with _LOCK:
+        _STATE['pending'] -= 1
+
+
+def _reset_pool(pool: ProcessPoolExecutor) -> None:
+    """โปรเซสลูกตาย (เช่น OOM) ทำให้ pool ใช้ต่อไม่ได้: ทิ้งแล้วให้ request ถัดไปสร้างใหม่"""
+    with _LOCK:
+        if _STATE['pool'] is pool:
+            _STATE['pool'] = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def run_json(fn: Callable[..., Any], *args: Any) -> Response:
+    """
+    รัน fn(*args) (ต้องเป็นฟังก์ชันระดับโมดูลที่ pickle ได้) ใน process pool แล้วคืน JSON response
+    งานที่เกินเวลาจะตอบ 504 ทันที แต่โปรเซสลูกยังทำจนเสร็จและนับเป็นงานค้างจนกว่าจะเสร็จจริง
+    """
+    if ROUTE_POOL_WORKERS <= 0:
+        status, payload = await run_in_threadpool(_invoke, fn, args)
+    else:
+        with _LOCK:
+            if _STATE['pending'] >= ROUTE_POOL_MAX_PENDING:
+                raise HTTPException(status_code=503, detail='Route workers are busy, try again later', headers={'Retry-After': '1'})
+            _STATE['pending'] += 1
+        pool: Optional[ProcessPoolExecutor] = None
+        try:
+            pool = _pool()
+            future = pool.submit(_invoke, fn, args)
+        except (BrokenProcessPool, RuntimeError):
+            _release(None)
+            if pool is not None:
+                _reset_pool(pool)
+            raise HTTPException(status_code=503, detail='Route workers unavailable', headers={'Retry-After': '1'})
+        future.add_done_callback(_release)
+        try:
+            status, payload = await asyncio.wait_for(asyncio.wrap_future(future), ROUTE_TASK_TIMEOUT_SEC)
+        except asyncio.TimeoutError:
+            raise HTTPException(status_code=504, detail='Route computation timed out')
+        except BrokenProcessPool:
+            logger.exception('route worker pool broke while running %s', getattr(fn, '__name__', fn))
+            _reset_pool(pool)
+            raise HTTPException(status_code=503, detail='Route workers unavailable', headers={'Retry-After': '1'})
+    if status != 200:
+        raise HTTPException(status_code=status, detail=payload)
+    return Response(content=payload, media_type='application/json')
+
+
+def shutdown() -> None:
+    """ปิด pool ตอนแอปหยุด: ยกเลิกงานที่ยังไม่เริ่ม แล้วรอโปรเซสลูกออก (งานที่กำลังรันไม่เกิน ROUTE_TASK_TIMEOUT_SEC)"""
+    with _LOCK:
+        pool, _STATE['pool'] = _STATE['pool'], None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,122 @@
+"""keyset pagination ของ list endpoint: เรียงตาม (sort key, id) และส่ง cursor ทึบ (base64 ของ JSON) ไปหน้าถัดไป"""
+import base64
+import binascii
+import json
+from typing import Any, Callable, List, Optional, Tuple
+
+from sqlalchemy import String, func, literal_column, select, tuple_, union_all
+
+# ชื่อ header ที่ส่ง cursor หน้าถัดไปของ response แบบ list
+NEXT_HEADER = 'X-Next-Cursor'
+
+
+def encode_cursor(sort_value: Any, row_id: Any) -> str:
+    raw = json.dumps([sort_value, row_id], ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Tuple[Any, Any]:
+    """แปลง cursor กลับเป็น (sort value, id) ValueError ถ้า cursor เสีย"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        value = json.loads(raw.decode('utf-8'))
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError):
+        raise ValueError('invalid cursor')
+    if not isinstance(value, list) or len(value) != 2:
+        raise ValueError('invalid cursor')
+    sort_value, row_id = value
+    if not isinstance(sort_value, (str, int, float, type(None))) or not isinstance(row_id, (str, int)):
+        raise ValueError('invalid cursor')
+    return sort_value, row_id
+
+
+class Page(list):
+    """รายการหนึ่งหน้า พร้อม cursor ของหน้าถัดไป (None = หน้าสุดท้าย) serialize เป็น list ปกติ"""
+
+    def __init__(self, items=(), next: Optional[str] = None):
+        super().__init__(items)
+        self.next = next
+
+
+def next_cursor(data: Any) -> Optional[str]:
+    """cursor หน้าถัดไปจากผลของ list endpoint (ทั้งแบบ Page และ envelope ของ with_counts)"""
+    if isinstance(data, dict):
+        return data.get('next')
+    return getattr(data, 'next', None)
+
+
+def page_headers(data: Any) -> dict:
+    cursor = next_cursor(data)
+    return {NEXT_HEADER: cursor} if cursor else {}
+
+
+def text_key(column):
+    """
+    sort key ของคอลัมน์ชื่อ: '' นับเป็น NULL (ไปท้าย) และเทียบแบบ codepoint (COLLATE "C")
+    ตรงกับการเรียงข้อมูล demo ใน Python (item.get(name) or None) ไม่ว่าฐานข้อมูลจะใช้ collation อะไร
+    cursor จากโหมดหนึ่งจึงใช้ต่อในอีกโหมดได้โดยไม่ข้ามหรือซ้ำแถว
+    """
+    return func.nullif(column, literal_column("''")).collate('C')
+
+
+def _codepoint(expr):
+    """id แบบข้อความเทียบแบบ codepoint เหมือน Python (ตัวเลขไม่ต้อง)"""
+    return expr.collate('C') if isinstance(expr.type, String) else expr
+
+
+class Keyset:
+    """
+    เงื่อนไข/ลำดับของ keyset pagination บน (sort, id): sort เรียงน้อยไปมาก ค่า NULL อยู่ท้าย (ตรงกับ btree ปกติ)
+    ทุกหน้าอ่านแค่ limit + 1 แถวจาก index (province_id, sort, id) ไม่ว่าจะลึกแค่ไหน
+    """
+
+    def __init__(self, sort, id_col, cursor: Optional[str] = None):
+        self.sort = sort
+        self.id_col = id_col
+        self.id_sort = _codepoint(id_col)
+        self.after = decode_cursor(cursor) if cursor else None
+
+    def apply(self, stmt, limit: int):
+        """เติมเงื่อนไขหลัง cursor, ลำดับ (sort, id) และคอลัมน์ sort_key ให้ select (อ่านเกิน 1 แถวเพื่อรู้ว่ามีหน้าถัดไป)"""
+        stmt = stmt.add_columns(self.sort.label('sort_key')).order_by(None)
+
+        def ordered(s):
+            return s.order_by(self.sort.asc(), self.id_sort.asc()).limit(limit + 1)
+
+        if not self.after:
+            return ordered(stmt)
+        sort_value, row_id = self.after
+        if sort_value is None:
+            return ordered(stmt.where(self.sort.is_(None), self.id_sort > row_id))
+        # แถวที่ sort เป็น NULL อยู่ท้ายสุด: อ่านแยกสองช่วงให้แต่ละช่วงเดิน index ตามลำดับได้
+        # (ถ้ารวมเป็น OR เดียว planner ต้องอ่านแถวหลัง cursor ทั้งหมดมา sort ใหม่)
+        after = ordered(stmt.where(tuple_(self.sort, self.id_sort) > tuple_(sort_value, row_id)))
+        nulls = ordered(stmt.where(self.sort.is_(None)))
+        rest = union_all(after, nulls).subquery()
+        return select(rest).order_by(rest.c.sort_key.asc().nulls_last(), _codepoint(rest.c[self.id_col.key]).asc()).limit(limit + 1)
+
+    def page(self, rows, limit: int, convert: Callable[[Any], Any]) -> Page:
+        """ตัดแถวที่อ่านเกินมาออก แล้วสร้าง cursor จากแถวสุดท้ายของหน้า"""
+        cursor = None
+        if 0 < limit < len(rows):
+            last = rows[limit - 1]._mapping
+            cursor = encode_cursor(last['sort_key'], last[self.id_col.key])
+        rows = rows[:max(limit, 0)]
+        return Page([convert(r) for r in rows], cursor)
+
+    def page_items(self, items: List[dict], limit: int, sort_value: Callable[[dict], Any]) -> Page:
+        """keyset แบบเดียวกันบนข้อมูล demo ในหน่วยความจำ"""
+        def key(item):
+            value = sort_value(item)
+            return (value is None, value if value is not None else 0, item['id'])
+
+        rows = sorted(items, key=key)
+        if self.after:
+            sort_after, id_after = self.after
+            after = (sort_after is None, sort_after if sort_after is not None else 0, id_after)
+            rows = [i for i in rows if key(i) > after]
+        cursor = None
+        if 0 < limit < len(rows):
+            cursor = encode_cursor(sort_value(rows[limit - 1]), rows[limit - 1]['id'])
+        rows = rows[:max(limit, 0)]
+        return Page(rows, cursor)
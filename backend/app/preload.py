@@ -0,0 +1,62 @@
+"""
+โหลดข้อมูลอ่านอย่างเดียว (demo, ดัชนี demo, agent จากไฟล์ route, route graph) ในโปรเซสแม่ก่อน fork worker
+แล้ว gc.freeze() ให้ worker ทุกตัวใช้หน้าหน่วยความจำเดียวกันแบบ copy-on-write (ใช้กับ gunicorn preload_app)
+"""
+import gc
+import logging
+import os
+from typing import Iterable
+
+logger = logging.getLogger(__name__)
+
+# source ของ route graph ที่สร้างไว้ล่วงหน้า (ค่าเริ่มต้นของ /api/routes/search และ /nodes คือ all-agg)
+PRELOAD_ROUTE_SOURCES = [s.strip() for s in os.getenv('PRELOAD_ROUTE_SOURCES', 'all-agg,all').split(',') if s.strip()]
+
+
+def warm_shared_data() -> None:
+    """สร้างข้อมูลที่ปกติ lazy ให้ครบตอนนี้ worker จะได้ไม่ต้องสร้างซ้ำคนละชุด"""
+    from . import demo_data, demo_store
+
+    demo_store.load_all()
+    demo_data.AGENTS
+    demo_data.load_route_agents()
+    demo_data.poi_index()
+    warm_route_graphs()
+
+
+def warm_route_graphs() -> None:
+    """สร้าง route graph ของ PRELOAD_ROUTE_SOURCES (ใช้ทั้งตอน preload และเป็น initializer ของ process pool งานเส้นทาง)"""
+    from .routers import routes
+
+    for source in PRELOAD_ROUTE_SOURCES:
+        try:
+            routes._get_graph_cached(source)
+        except Exception:
+            logger.exception('preload route graph %s failed', source)
+
+
+def freeze_for_fork() -> None:
+    """เรียกในโปรเซสแม่ก่อน fork: ย้าย object ที่มีอยู่ทั้งหมดออกจากการไล่ของ GC
+    (ไม่อย่างนั้นการ collect ใน worker จะแตะ header ของทุก object ทำให้หน้าถูก copy แยกทีละ worker)"""
+    warm_shared_data()
+    gc.collect()
+    gc.freeze()
+    logger.info('preloaded shared data, %d objects frozen', gc.get_freeze_count())
+
+
+def after_fork(listener_fds: Iterable[int] = ()) -> None:
+    """
+    เรียกใน worker หลัง fork: connection pool ที่สืบทอดจากแม่ห้ามใช้ร่วมกัน ให้ worker เปิดชุดของตัวเอง
+    แล้วเปิด process pool งานเส้นทางแบบ fork ตอนนี้ (โปรเซสลูกใช้ route graph ที่ warm ไว้ในโปรเซสแม่)
+    listener_fds คือ socket ที่ worker รับ request ซึ่งโปรเซสลูกของ pool จะปิดทิ้ง
+    """
+    from . import offload
+    from .db import async_engine, engine
+    from .routers import routes
+
+    engine.dispose(close=False)
+    async_engine.sync_engine.dispose(close=False)
+    route_engine = routes._DB_STATE.get('engine')
+    if route_engine is not None:
+        route_engine.dispose(close=False)
+    offload.start_forked_pool(listener_fds)
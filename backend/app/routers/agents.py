@@ -1,20 +1,25 @@
 """API สำหรับข้อมูล agent (เส้นทางตัวอย่าง)"""
 import json
-import re
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import RedirectResponse
-from typing import List, Optional
-from sqlalchemy import select, func
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import select, func, or_, any_, bindparam, Integer
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from ..schemas import AgentDetail, AgentLog as AgentLogSchema, LatLng, AgentStop
-from ..db import get_db, SessionLocal
-from ..models import Agent, AgentLog, AgentRoute, Charger, Attraction, Food, Cafe, Hotel
+from ..schemas import AgentDetail, AgentBatchRequest, AgentLog as AgentLogSchema, LatLng, AgentStop
+from ..db import get_async_db, get_db, SessionLocal
+from ..models import Agent, AgentDay, AgentLog, AgentRoute, AgentStop as AgentStopRow, Charger, Attraction, Food, Cafe, Hotel
+from ..cache import cached_json_async, json_response, mark_fallback
+from .. import stops as stops_lib
 from .. import demo_data
 
 
 def _agent_detail_from_demo(demo: dict) -> AgentDetail:
     """แปลง demo object เป็น AgentDetail (ใช้ตอน fallback ไม่มีข้อมูล DB หรือข้อมูลไม่ครบ)"""
-    polyline = [LatLng(**p) for p in demo.get('polyline', [])] if demo.get('polyline') else []
+    # พิกัดที่เซิร์ฟเวอร์สร้างเองไม่ต้อง validate ทีละจุด
+    polyline = [LatLng.model_construct(**p) for p in demo.get('polyline', [])] if demo.get('polyline') else []
     stops = [AgentStop(**s) for s in demo.get('stops', [])] if demo.get('stops') else []
     if (not polyline and not stops) and demo.get('segments'):
         polyline, stops = _build_from_segments(demo)
@@ -57,277 +62,381 @@ def _get_demo_agent(agent_id: int):
     return None
 
 def _build_from_segments(agent: dict):
-    """สร้าง polyline/stops อย่างง่ายจาก segments ของ agent (demo route)"""
-    segs = agent.get('segments') or []
-    poly: List[LatLng] = []
-    stops: List[AgentStop] = []
-    seen = set()
-    def add_point(label, lat, lon):
-        if lat is None or lon is None:
-            return
-        key = (round(float(lat),6), round(float(lon),6))
-        if key in seen:
-            return
-        seen.add(key)
-        poly.append(LatLng(lat=float(lat), lon=float(lon)))
-        stops.append(AgentStop(label=label or f'จุดที่ {len(stops)+1}', lat=float(lat), lon=float(lon)))
-    for s in segs:
-        for label in (s.get('from'), s.get('to')):
-            hit = demo_data.poi_lookup(label)
-            if hit:
-                add_point(hit['label'], hit['lat'], hit['lon'])
-    return poly, stops
+    """สร้าง polyline/stops อย่างง่ายจาก segments ของ agent (demo route) ด้วยดัชนีชื่อ POI เดียวกับ demo_data"""
+    poly, stops = demo_data._build_polyline_and_stops_from_segments(agent.get('segments') or [])
+    return [LatLng(**p) for p in poly], [AgentStop(**st) for st in stops]
 
-def _load_polyline(db: Session, agent_id: int, day: Optional[int] = None) -> List[LatLng]:
-    """โหลดพิกัด polyline จากตาราง agent_routes (รองรับเลือกวัน)"""
-    def _fetch(day_value: Optional[int]):
-        stmt = (
-            select(func.ST_AsGeoJSON(AgentRoute.geom))
-            .where(AgentRoute.agent_id == agent_id)
-            .order_by(AgentRoute.day.asc().nullsfirst(), AgentRoute.t_start_min.asc().nullsfirst())
-        )
-        if day_value is not None:
-            stmt = stmt.where(AgentRoute.day == day_value)
-        return db.execute(stmt).scalars().all()
-
-    def _append_points(rows: List[str], acc: List[LatLng]):
-        for geo_json in rows:
-            if not geo_json:
-                continue
-            try:
-                data = json.loads(geo_json)
-            except Exception:
-                continue
-            coords = data.get('coordinates') or []
-            for lon, lat in coords:
-                # Skip invalid/null-island coordinates that sometimes sneak in from bad data
-                if abs(float(lat or 0)) < 1e-6 and abs(float(lon or 0)) < 1e-6:
-                    continue
-                if not acc or acc[-1].lat != float(lat) or acc[-1].lon != float(lon):
-                    acc.append(LatLng(lat=float(lat), lon=float(lon)))
-
-    points: List[LatLng] = []
-    _append_points(_fetch(day), points)
-    # Some imported routes use 0-based day indexing. If the requested day is empty, try day-1 as a fallback.
-    if not points and day is not None and day > 0:
-        _append_points(_fetch(day - 1), points)
-    return points
-
-def _find_poi_by_name(db: Session, name: Optional[str]):
+async def _load_agent_row(db: AsyncSession, agent_id: int, day: Optional[int] = None):
     """
-    Look up a POI by name across all CSV-backed tables to reuse canonical name/coords.
-    Returns dict(label, lat, lon) or None.
+    โหลดแถว agent พร้อมช่วง id ของวันที่ขอจาก agent_days ใน query เดียว
+    คืน (agent, day_row) โดย day_row = None เมื่อไม่ได้ระบุวันหรือ agent ยังไม่มีดัชนีรายวัน (import รุ่นเก่า)
     """
-    if not name:
-        return None
-    name_norm = name.strip()
-    if not name_norm:
-        return None
-    candidates = [
-        (Charger, Charger.name),
-        (Attraction, Attraction.name_th),
-        (Food, Food.name_th),
-        (Cafe, Cafe.name_th),
-        (Hotel, Hotel.name_th),
-    ]
-    for model, col in candidates:
-        row = db.execute(
-            select(col, model.lat, model.lon).where(func.lower(col) == func.lower(name_norm)).limit(1)
-        ).first()
-        if row and row[1] is not None and row[2] is not None:
-            return {'label': row[0], 'lat': float(row[1]), 'lon': float(row[2])}
-    for model, col in candidates:
-        row = db.execute(
-            select(col, model.lat, model.lon).where(col.ilike(f'%{name_norm}%')).limit(1)
-        ).first()
-        if row and row[1] is not None and row[2] is not None:
-            return {'label': row[0], 'lat': float(row[1]), 'lon': float(row[2])}
-    return None
+    if day is None:
+        return (await db.execute(select(Agent).where(Agent.id == agent_id))).scalars().first(), None
+    indexed = select(AgentDay.agent_id).where(AgentDay.agent_id == agent_id).exists()
+    row = (await db.execute(
+        select(Agent, AgentDay, indexed)
+        .outerjoin(AgentDay, (AgentDay.agent_id == Agent.id) & (AgentDay.day == day))
+        .where(Agent.id == agent_id)
+    )).first()
+    if not row:
+        return None, None
+    agent, day_row, has_index = row
+    if not has_index:
+        return agent, None
+    # มีดัชนีแต่ไม่มีแถวของวันนั้น = วันนั้นไม่มีทั้ง log และ route
+    return agent, day_row or AgentDay(agent_id=agent_id, day=day, log_count=0, route_count=0)
 
 
-def _load_stops(db: Session, agent_id: int, day: Optional[int] = None) -> List[AgentStop]:
-    """รวมจุดแวะจาก route + timeline เพื่อแสดง pin บนแผนที่"""
-    poi_stmt = select(AgentLog.poi_name).where(AgentLog.agent_id == agent_id)
-    log_point_stmt = select(AgentLog.poi_name, AgentLog.lat, AgentLog.lon).where(
-        AgentLog.agent_id == agent_id, AgentLog.lat.isnot(None), AgentLog.lon.isnot(None)
-    )
+async def _fetch_logs(db: AsyncSession, agent_id: int, day: Optional[int] = None, day_row: Optional[AgentDay] = None) -> List[AgentLog]:
+    """ดึง log ของ agent (รายวันใช้ช่วง id จาก agent_days ถ้ามี)"""
+    stmt = select(AgentLog).where(AgentLog.agent_id == agent_id).order_by(AgentLog.id.asc())
     if day is not None:
-        poi_stmt = poi_stmt.where(AgentLog.day_num == day)
-        log_point_stmt = log_point_stmt.where(AgentLog.day_num == day)
-
-    poi_names = [pn for pn in db.execute(poi_stmt).scalars().all() if pn]
-    log_points = [(pn, lat, lon) for pn, lat, lon in db.execute(log_point_stmt).all()]
-    # ดึงชื่อโรงแรมเริ่มทริปจาก log แรก (ถ้าพอรู้จาก action)
-    start_stmt = (
-        select(AgentLog.poi_name, AgentLog.action)
-        .where(AgentLog.agent_id == agent_id)
-        .order_by(AgentLog.id.asc())
+        if day_row is not None:
+            if not day_row.log_count:
+                return []
+            stmt = stmt.where(AgentLog.id.between(day_row.log_first_id, day_row.log_last_id))
+        stmt = stmt.where(AgentLog.day_num == day)
+    return (await db.execute(stmt)).scalars().all()
+
+
+def _route_geoms_stmt(agent_id: int, day: Optional[int] = None, day_row: Optional[AgentDay] = None):
+    """query (target, geojson) ของ agent_routes (เลขวันถูก normalize เป็นฐาน 1 ตอน ETL แล้ว) None = วันนั้นไม่มี route"""
+    stmt = (
+        select(AgentRoute.target, func.ST_AsGeoJSON(AgentRoute.geom))
+        .where(AgentRoute.agent_id == agent_id)
+        .order_by(AgentRoute.day.asc().nullsfirst(), AgentRoute.t_start_min.asc().nullsfirst())
     )
     if day is not None:
-        start_stmt = start_stmt.where(AgentLog.day_num == day)
-    start_name: Optional[str] = None
-    for pn, act in db.execute(start_stmt).all():
-        if pn:
-            start_name = pn
-            break
-        if act:
-            m = re.search(r"เริ่มทริป.*เริ่มจากโรงแรม[:\s]+([^(\s]+.*?)(?:\sแบต|\(|$)", act)
-            if m:
-                start_name = m.group(1).strip()
-                break
-    if start_name:
-        poi_names = list(dict.fromkeys([start_name] + poi_names))  # preserve order, avoid dup
-
-    def _fetch_route_rows(day_value: Optional[int]):
-        stmt = (
-            select(AgentRoute.target, func.ST_AsGeoJSON(AgentRoute.geom))
-            .where(AgentRoute.agent_id == agent_id)
-            .order_by(AgentRoute.day.asc().nullsfirst(), AgentRoute.t_start_min.asc().nullsfirst())
-        )
-        if day_value is not None:
-            stmt = stmt.where(AgentRoute.day == day_value)
-        return db.execute(stmt).all()
-
-    route_rows = _fetch_route_rows(day)
-    if not route_rows and day is not None and day > 0:
-        route_rows = _fetch_route_rows(day - 1)
-    stops: List[AgentStop] = []
-    seen = set()
-    norm_label = lambda v: (v or '').strip().lower()
-
-    def add_stop(label: str, lat_val: float, lon_val: float):
-        # Guard against placeholder (0,0) coordinates to avoid null-island markers
-        if abs(float(lat_val or 0)) < 1e-6 and abs(float(lon_val or 0)) < 1e-6:
-            return
-        key = (round(lat_val, 6), round(lon_val, 6))
-        if key in seen:
-            return
-        seen.add(key)
-        stops.append(AgentStop(label=label, lat=float(lat_val), lon=float(lon_val)))
-
-    # 1) ใช้ visited_pois (timeline) หาในตาราง POI จริงก่อน เพื่อให้ตำแหน่งตรงไฟล์ CSV
-    for pn in poi_names:
-        match = _find_poi_by_name(db, pn)
-        if not match:
-            continue
-        label = match['label'] or pn
-        add_stop(label, match['lat'], match['lon'])
+        if day_row is not None:
+            if not day_row.route_count:
+                return None
+            stmt = stmt.where(AgentRoute.id.between(day_row.route_first_id, day_row.route_last_id))
+        stmt = stmt.where(AgentRoute.day == day)
+    return stmt
+
 
-    # 2) ตำแหน่งจาก geometry ของเส้นทาง (agent_routes)
-    for target, geo_json in route_rows:
+def _parse_geoms(rows) -> List[tuple]:
+    geoms: List[tuple] = []
+    for target, geo_json in rows:
         if not geo_json:
             continue
         try:
-            data = json.loads(geo_json)
+            geoms.append((target, json.loads(geo_json)))
         except Exception:
             continue
-        coords = data.get('coordinates')
-        if not coords:
-            continue
-        lat = lon = None
-        if data.get('type') == 'LineString' and isinstance(coords, list):
-            last = coords[-1]
-            if isinstance(last, list) and len(last) >= 2:
-                lon, lat = last[0], last[1]
-        elif data.get('type') == 'Point' and isinstance(coords, list) and len(coords) >= 2:
-            lon, lat = coords[0], coords[1]
-        elif isinstance(coords, list) and len(coords) and isinstance(coords[0], list):
-            last = coords[-1]
-            if isinstance(last, list) and len(last):
-                candidate = last[-1] if isinstance(last[0], list) else last
-                if len(candidate) >= 2:
-                    lon, lat = candidate[0], candidate[1]
-        fallback_name = poi_names[len(stops)] if len(poi_names) > len(stops) else None
-        preferred_label = target or fallback_name
-
-        poi_match = _find_poi_by_name(db, preferred_label) or _find_poi_by_name(db, fallback_name)
-        if poi_match:
-            label = poi_match['label']
-            lat = poi_match['lat']
-            lon = poi_match['lon']
-        else:
-            label = preferred_label or f'จุดที่ {len(stops) + 1}'
-
-        if lat is None or lon is None:
-            continue
-        add_stop(label, float(lat), float(lon))
+    return geoms
 
-    # 3) เติมจาก AgentLog ที่มี lat/lon เพื่อครอบคลุมกรณีชื่อไม่เจอในตาราง
-    for pn, lat, lon in log_points:
-        if lat is None or lon is None:
-            continue
-        label = pn or f'จุดที่ {len(stops) + 1}'
-        add_stop(label, float(lat), float(lon))
 
-    # 4) ถ้ายังไม่เจอหมุดเริ่มทริป (โรงแรม) เลย ให้ fallback ใช้พิกัดจุดแรกของ polyline
-    if start_name:
-        start_norm = norm_label(start_name)
-        start_already = any(norm_label(s.label) == start_norm for s in stops if getattr(s, 'label', None))
-        if not start_already:
-            poly = _load_polyline(db, agent_id, day)
-            if poly:
-                p0 = poly[0]
-                add_stop(start_name, float(p0.lat), float(p0.lon))
+def _fetch_route_geoms(db: Session, agent_id: int, day: Optional[int] = None, day_row: Optional[AgentDay] = None) -> List[tuple]:
+    """ดึง (target, geometry) ของ agent_routes ใน query เดียว"""
+    stmt = _route_geoms_stmt(agent_id, day, day_row)
+    return _parse_geoms(db.execute(stmt).all()) if stmt is not None else []
 
-    return stops
 
-@router.get('/{agent_id}', response_model=AgentDetail)
-def get_agent(agent_id: int, day: Optional[int] = Query(None), db: Session = Depends(get_db)):
-    """รายละเอียด agent พร้อม timeline, polyline และจุดแวะ"""
+async def _fetch_route_rows(db: AsyncSession, agent_id: int, day: Optional[int] = None, day_row: Optional[AgentDay] = None) -> List[tuple]:
+    """แถว (target, geojson) ดิบสำหรับ AsyncSession (parse ด้วย _parse_geoms ใน thread)"""
+    stmt = _route_geoms_stmt(agent_id, day, day_row)
+    return (await db.execute(stmt)).all() if stmt is not None else []
+
+
+def _polyline_from_geoms(geoms: List[tuple]) -> List[LatLng]:
+    """ต่อพิกัดของทุก segment เป็น polyline เดียว (ตัดจุดซ้ำติดกัน)"""
+    return [LatLng.model_construct(lat=lat, lon=lon) for lat, lon in stops_lib.polyline_points(geoms)]
+
+
+def _load_polyline(db: Session, agent_id: int, day: Optional[int] = None) -> List[LatLng]:
+    """โหลดพิกัด polyline จากตาราง agent_routes (รองรับเลือกวัน)"""
+    return _polyline_from_geoms(_fetch_route_geoms(db, agent_id, day))
+
+
+_POI_TABLES = [
+    (Charger, Charger.name),
+    (Attraction, Attraction.name_th),
+    (Food, Food.name_th),
+    (Cafe, Cafe.name_th),
+    (Hotel, Hotel.name_th),
+]
+
+
+class _PoiResolver:
+    """
+    Look up POIs by name across all CSV-backed tables to reuse canonical name/coords.
+    Exact (case-insensitive) matches for every name are fetched with one query per table;
+    only names still missing fall back to ILIKE, and every answer is memoized per request.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.memo: Dict[str, Optional[dict]] = {}
+
+    def prefetch(self, names) -> None:
+        keys = {n.strip().lower(): n.strip() for n in names if n and n.strip()}
+        pending = {k for k in keys if k not in self.memo}
+        for model, col in _POI_TABLES:
+            if not pending:
+                break
+            rows = self.db.execute(
+                select(func.lower(col), col, model.lat, model.lon)
+                .where(func.lower(col).in_(pending), model.lat.isnot(None), model.lon.isnot(None))
+            ).all()
+            for key, label, lat, lon in rows:
+                if key in pending:
+                    self.memo[key] = {'label': label, 'lat': float(lat), 'lon': float(lon)}
+                    pending.discard(key)
+
+    def __call__(self, name: Optional[str]) -> Optional[dict]:
+        if not name:
+            return None
+        name_norm = name.strip()
+        if not name_norm:
+            return None
+        key = name_norm.lower()
+        if key not in self.memo:
+            self.prefetch([name_norm])
+        if key not in self.memo:
+            self.memo[key] = self._find_like(name_norm)
+        return self.memo[key]
+
+    def _find_like(self, name_norm: str) -> Optional[dict]:
+        for model, col in _POI_TABLES:
+            row = self.db.execute(
+                select(col, model.lat, model.lon).where(col.ilike(f'%{name_norm}%')).limit(1)
+            ).first()
+            if row and row[1] is not None and row[2] is not None:
+                return {'label': row[0], 'lat': float(row[1]), 'lon': float(row[2])}
+        return None
+
+
+async def _load_stored_stops(db: AsyncSession, agent_id: int, day: Optional[int]) -> List[tuple]:
+    """อ่านจุดแวะที่ ETL คำนวณไว้แล้วจากตาราง agent_stops (day = NULL คือทั้งทริป)"""
+    stmt = (
+        select(AgentStopRow.label, AgentStopRow.lat, AgentStopRow.lon)
+        .where(AgentStopRow.agent_id == agent_id)
+        .where(AgentStopRow.day == day if day is not None else AgentStopRow.day.is_(None))
+        .order_by(AgentStopRow.stop_order.asc())
+    )
+    return (await db.execute(stmt)).all()
+
+
+def _stops_from_rows(rows) -> List[AgentStop]:
+    return [AgentStop(label=label, lat=float(lat), lon=float(lon)) for label, lat, lon in rows]
+
+
+def _build_stops(logs: List[AgentLog], geoms: List[tuple], polyline: List[LatLng], resolve: _PoiResolver) -> List[AgentStop]:
+    """คำนวณจุดแวะตอน request (ใช้เมื่อยังไม่มีผลที่ ETL คำนวณไว้ใน agent_stops)"""
+    stops = stops_lib.build_stops(
+        [(r.poi_name, r.action, r.lat, r.lon) for r in logs],
+        geoms,
+        [(p.lat, p.lon) for p in polyline],
+        resolve,
+    )
+    return [AgentStop(label=st['label'], lat=st['lat'], lon=st['lon']) for st in stops]
+
+
+def _detail_from_parts(a: Agent, rows: List[AgentLog], geoms: List[tuple], stored_stops: List[AgentStop], resolve: Optional[_PoiResolver]) -> AgentDetail:
+    """รวม log/geometry/stops ที่โหลดมาแล้วเป็น AgentDetail (ใช้ร่วมกันทั้ง endpoint เดี่ยวและ batch)"""
+    logs: List[AgentLogSchema] = [
+        AgentLogSchema(ts_text=r.ts_text or '', day=r.day_num or 0, action=r.action or '', poi_name=r.poi_name, lat=r.lat, lon=r.lon)
+        for r in rows
+    ]
+    visited_pois = [r.poi_name.strip() for r in rows if r.poi_name and r.poi_name.strip()]
+    polyline = _polyline_from_geoms(geoms)
+    stops = stored_stops or _build_stops(rows, geoms, polyline, resolve)
+    # ถ้า DB มีข้อมูลไม่ครบ (polyline/stops ว่าง) ให้ fallback ไปใช้ demo เพื่อให้ UI แสดงเส้นทางได้
+    if (not polyline and not stops):
+        demo = _get_demo_agent(a.id)
+        if demo:
+            return _agent_detail_from_demo(demo)
+    return AgentDetail(
+        id=a.id,
+        title=a.label or f'Agent #{a.id}',
+        style=a.style or 'mix',
+        total_km=float(a.total_km or 0),
+        days=a.days or 0,
+        timeline=logs,
+        visited_pois=visited_pois,
+        polyline=polyline,
+        stops=stops,
+    )
+
+
+def _detail_in_thread(a: Agent, rows: List[AgentLog], route_rows: List[tuple], stop_rows: List[tuple]) -> AgentDetail:
+    """
+    ประกอบ AgentDetail จากแถวดิบ (เรียกผ่าน run_in_threadpool) agent ที่ยังไม่มี agent_stops ต้องคำนวณจุดแวะเอง
+    resolver จึงใช้ Session sync ของตัวเอง (เปิด connection เมื่อ query จริงเท่านั้น)
+    """
+    with SessionLocal() as s:
+        return _detail_from_parts(a, rows, _parse_geoms(route_rows), _stops_from_rows(stop_rows), _PoiResolver(s))
+
+
+def _demo_detail(agent_id: int) -> AgentDetail:
+    demo = _get_demo_agent(agent_id)
+    if not demo:
+        raise HTTPException(status_code=404, detail='Not found')
+    return _agent_detail_from_demo(demo)
+
+
+async def _assemble_agent(agent_id: int, day: Optional[int], db: AsyncSession) -> AgentDetail:
+    """ประกอบ AgentDetail: โหลด log และ geometry อย่างละครั้งแล้วใช้ร่วมกันทั้ง timeline/polyline/stops"""
     try:
-        a = db.execute(select(Agent).where(Agent.id == agent_id)).scalars().first()
+        a, day_row = await _load_agent_row(db, agent_id, day)
         if not a:
             raise RuntimeError("agent-not-found")
-        stmt = select(AgentLog).where(AgentLog.agent_id == agent_id).order_by(AgentLog.id.asc())
-        if day is not None:
-            stmt = stmt.where(AgentLog.day_num == day)
-        rows = db.execute(stmt).scalars().all()
-        logs: List[AgentLogSchema] = [
-            AgentLogSchema(ts_text=r.ts_text or '', day=r.day_num or 0, action=r.action or '', poi_name=r.poi_name, lat=r.lat, lon=r.lon)
-            for r in rows
-        ]
-        visited_pois = [r.poi_name.strip() for r in rows if r.poi_name and r.poi_name.strip()]
-        polyline = _load_polyline(db, agent_id, day)
-        stops = _load_stops(db, agent_id, day)
-        # ถ้า DB มีข้อมูลไม่ครบ (polyline/stops ว่าง) ให้ fallback ไปใช้ demo เพื่อให้ UI แสดงเส้นทางได้
-        if (not polyline and not stops):
-            demo = _get_demo_agent(agent_id)
-            if demo:
-                return _agent_detail_from_demo(demo)
-        return AgentDetail(
-            id=a.id,
-            title=a.label or f'Agent #{a.id}',
-            style=a.style or 'mix',
-            total_km=float(a.total_km or 0),
-            days=a.days or 0,
-            timeline=logs,
-            visited_pois=visited_pois,
-            polyline=polyline,
-            stops=stops,
-        )
+        rows = await _fetch_logs(db, agent_id, day, day_row)
+        route_rows = await _fetch_route_rows(db, agent_id, day, day_row)
+        stop_rows = await _load_stored_stops(db, agent_id, day)
+        return await run_in_threadpool(_detail_in_thread, a, rows, route_rows, stop_rows)
     except Exception:
-        demo = _get_demo_agent(agent_id)
-        if not demo:
-            raise HTTPException(status_code=404, detail='Not found')
-        return _agent_detail_from_demo(demo)
+        mark_fallback()
+        return await run_in_threadpool(_demo_detail, agent_id)
+
+
+def _simplify_polyline(points: List[LatLng], tolerance: float) -> List[LatLng]:
+    """ลดจำนวนจุดด้วย Douglas-Peucker (ใช้กับ polyline จาก demo ที่ไม่ได้ผ่าน ST_Simplify)"""
+    if tolerance <= 0 or len(points) < 3:
+        return points
+    keep = [False] * len(points)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        lo, hi = stack.pop()
+        a, b = points[lo], points[hi]
+        dx, dy = b.lon - a.lon, b.lat - a.lat
+        norm = (dx * dx + dy * dy) ** 0.5
+        best, best_i = -1.0, -1
+        for i in range(lo + 1, hi):
+            p = points[i]
+            if norm == 0:
+                dist = ((p.lon - a.lon) ** 2 + (p.lat - a.lat) ** 2) ** 0.5
+            else:
+                dist = abs(dy * (p.lon - a.lon) - dx * (p.lat - a.lat)) / norm
+            if dist > best:
+                best, best_i = dist, i
+        if best > tolerance:
+            keep[best_i] = True
+            stack.append((lo, best_i))
+            stack.append((best_i, hi))
+    return [p for p, k in zip(points, keep) if k]
+
+
+def _batch_scope(ids: List[int], days: Dict[int, int]):
+    """ตาราง (agent_id, day) จาก unnest ของ array เพื่อ join แบบ set-based (day = NULL คือทั้งทริป)"""
+    return select(
+        func.unnest(bindparam('batch_ids', ids, type_=ARRAY(Integer))).label('agent_id'),
+        func.unnest(bindparam('batch_days', [days.get(i) for i in ids], type_=ARRAY(Integer))).label('day'),
+    ).subquery('scope')
+
+
+async def _assemble_batch(ids: List[int], days: Dict[int, int], simplify: Optional[float], db: AsyncSession) -> List[AgentDetail]:
+    """โหลด agent/log/route/stops ของทุก id ด้วย query ละครั้ง แล้วประกอบ AgentDetail ตามลำดับ id ที่ขอ (ใน thread)"""
+    try:
+        parts = await _load_batch(ids, days, simplify, db)
+    except Exception:
+        parts = None
+    out, failed = await run_in_threadpool(_batch_details, ids, simplify, parts)
+    if failed:
+        mark_fallback()
+    return out
+
+
+async def _load_batch(ids: List[int], days: Dict[int, int], simplify: Optional[float], db: AsyncSession) -> tuple:
+    """แถวดิบ (agents, logs, routes, stops) ของทุก id แยกตาม agent_id (แปลงต่อใน _batch_details)"""
+    scope = _batch_scope(ids, days)
+    agents = {
+        a.id: a for a in (await db.execute(
+                select(Agent).where(Agent.id == any_(bindparam('agent_ids', ids, type_=ARRAY(Integer))))
+        )).scalars().all()
+    }
+    logs: Dict[int, List[AgentLog]] = {}
+    log_stmt = (
+        select(AgentLog)
+        .join(scope, AgentLog.agent_id == scope.c.agent_id)
+        .where(or_(scope.c.day.is_(None), AgentLog.day_num == scope.c.day))
+        .order_by(AgentLog.agent_id.asc(), AgentLog.id.asc())
+    )
+    for r in (await db.execute(log_stmt)).scalars().all():
+        logs.setdefault(r.agent_id, []).append(r)
+    geom_expr = func.ST_Simplify(AgentRoute.geom, simplify) if simplify else AgentRoute.geom
+    route_stmt = (
+        select(AgentRoute.agent_id, AgentRoute.target, func.ST_AsGeoJSON(geom_expr))
+        .join(scope, AgentRoute.agent_id == scope.c.agent_id)
+        .where(or_(scope.c.day.is_(None), AgentRoute.day == scope.c.day))
+        .order_by(AgentRoute.agent_id.asc(), AgentRoute.day.asc().nullsfirst(), AgentRoute.t_start_min.asc().nullsfirst())
+    )
+    routes: Dict[int, List[tuple]] = {}
+    for agent_id, target, geo_json in (await db.execute(route_stmt)).all():
+        routes.setdefault(agent_id, []).append((target, geo_json))
+    stop_stmt = (
+        select(AgentStopRow.agent_id, AgentStopRow.label, AgentStopRow.lat, AgentStopRow.lon)
+        .join(scope, AgentStopRow.agent_id == scope.c.agent_id)
+        .where(AgentStopRow.day.is_not_distinct_from(scope.c.day))
+        .order_by(AgentStopRow.agent_id.asc(), AgentStopRow.stop_order.asc())
+    )
+    stops: Dict[int, List[tuple]] = {}
+    for agent_id, label, lat, lon in (await db.execute(stop_stmt)).all():
+        stops.setdefault(agent_id, []).append((label, lat, lon))
+    return agents, logs, routes, stops
+
+
+def _batch_details(ids: List[int], simplify: Optional[float], parts: Optional[tuple]) -> Tuple[List[AgentDetail], bool]:
+    """ประกอบ AgentDetail ตามลำดับ id (เรียกผ่าน run_in_threadpool) คืน (รายการ, ใช้ demo แทน DB หรือไม่)"""
+    details: Dict[int, AgentDetail] = {}
+    failed = parts is None
+    if parts is not None:
+        agents, logs, routes, stops = parts
+        try:
+            with SessionLocal() as s:
+                resolve = _PoiResolver(s)
+                for agent_id, a in agents.items():
+                    details[agent_id] = _detail_from_parts(a, logs.get(agent_id, []), _parse_geoms(routes.get(agent_id, [])), _stops_from_rows(stops.get(agent_id, [])), resolve)
+        except Exception:
+            failed = True
+            details = {}
+    out: List[AgentDetail] = []
+    for agent_id in ids:
+        detail = details.get(agent_id)
+        if detail is None:
+            demo = _get_demo_agent(agent_id)
+            if not demo:
+                continue
+            detail = _agent_detail_from_demo(demo)
+            if simplify and detail.polyline:
+                detail.polyline = _simplify_polyline(detail.polyline, simplify)
+        out.append(detail)
+    return out, failed
+
+
+@router.post('/batch', response_model=List[AgentDetail])
+async def get_agents_batch(req: AgentBatchRequest, db: AsyncSession = Depends(get_async_db)):
+    """รายละเอียด agent หลายตัวในคำร้องเดียว (หน้าเปรียบเทียบทริป) ข้าม id ที่ไม่พบ"""
+    ids = list(dict.fromkeys(req.ids))
+    days = {int(k): v for k, v in (req.days or {}).items() if v is not None}
+    key = ('agent-batch', tuple(ids), tuple(sorted(days.items())), req.simplify)
+    return await cached_json_async(db, key, lambda: _assemble_batch(ids, days, req.simplify, db))
+
+@router.get('/{agent_id}', response_model=AgentDetail)
+async def get_agent(agent_id: int, day: Optional[int] = Query(None), db: AsyncSession = Depends(get_async_db)):
+    """รายละเอียด agent พร้อม timeline, polyline และจุดแวะ (cache ต่อ agent/วัน)"""
+    return await cached_json_async(db, ('agent', agent_id, day), lambda: _assemble_agent(agent_id, day, db))
 
 @router.get('/{agent_id}/polyline', response_model=List[LatLng])
 def agent_polyline(agent_id: int, db: Session = Depends(get_db)):
-    """คืนเส้น polyline ล้วน ๆ"""
+    """คืนเส้น polyline ล้วน ๆ (ส่งเป็น JSON ตรง ๆ ไม่ validate response_model ทีละจุด)"""
     try:
         pts = _load_polyline(db, agent_id)
         if not pts:
             raise RuntimeError("polyline-empty")
-        return pts
+        return json_response(pts)
     except Exception:
         demo = _get_demo_agent(agent_id)
         if not demo:
             return []
         if demo.get('polyline'):
-            return [LatLng(**p) for p in demo.get('polyline', [])]
+            return json_response(demo['polyline'])
         if demo.get('segments'):
             poly, _st = _build_from_segments(demo)
-            return poly
+            return json_response(poly)
         return []
 
 @router.get('/{agent_id}/maps-link')
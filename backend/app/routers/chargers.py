@@ -1,58 +1,94 @@
 """API สถานีชาร์จรถ EV"""
 from fastapi import APIRouter, Query, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from typing import Optional, List
-from sqlalchemy import select, or_, asc
-from sqlalchemy.orm import Session
-from ..db import get_db
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..db import get_async_db
 from ..models import Charger, Province
-from .. import demo_data
+from ..cache import cached_json_async, json_response_async, mark_fallback
+from ..spatial import GeoFilter
+from ..fields import FieldSet
+from ..paging import Keyset, Page, page_headers, text_key
+from ..textnorm import search_clause
+from .. import demo_store
 
 router = APIRouter(prefix='/api/chargers', tags=['chargers'])
 
+CHARGER_FIELDS = FieldSet(Charger, {
+    'id': Charger.id,
+    'name': Charger.name,
+    'type': Charger.type,
+    'kw': Charger.kw,
+    'capacity': Charger.capacity,
+    'lat': Charger.lat,
+    'lon': Charger.lon,
+    'province': Province.slug_en,
+}, post={'kw': lambda v: float(v) if v is not None else None})
+
 @router.get('')
-def list_chargers(province: Optional[str] = None, q: Optional[str] = None, limit: int = 200, db: Session = Depends(get_db)):
-    """ค้นหาสถานีชาร์จทั้งหมด รองรับกรองจังหวัด/คำค้น"""
-    stmt = select(Charger, Province.slug_en).join(Province, Province.id == Charger.province_id)
+async def list_chargers(province: Optional[str] = None, q: Optional[str] = None, limit: int = 200, bbox: Optional[str] = None, near: Optional[str] = None, radius_km: Optional[float] = None, fields: Optional[str] = None, cursor: Optional[str] = None, db: AsyncSession = Depends(get_async_db)):
+    """ค้นหาสถานีชาร์จทั้งหมด รองรับกรองจังหวัด/คำค้น/กรอบแผนที่ (bbox) และรัศมีรอบจุด (near + radius_km)"""
+    try:
+        geo = GeoFilter(bbox, near, radius_km)
+        names = CHARGER_FIELDS.choose(fields)
+        # เรียงตามชื่อ (หรือระยะเมื่อมี near) แล้วตาม id ส่ง cursor หน้าถัดไปใน X-Next-Cursor
+        sort = Charger.geog.op('<->')(geo.here()) if geo.near else text_key(Charger.name)
+        keyset = Keyset(sort, Charger.id, cursor)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    if q or geo:
+        data = await _list_chargers(province, q, limit, geo, names, keyset, db)
+        return await json_response_async(data, page_headers(data))
+    return await cached_json_async(db, ('chargers', province, limit, names, cursor), lambda: _list_chargers(province, None, limit, GeoFilter(), names, keyset, db), page_headers)
+
+
+async def _list_chargers(province: Optional[str], q: Optional[str], limit: int, geo: GeoFilter, names: tuple, keyset: Keyset, db: AsyncSession):
+    stmt = select(*CHARGER_FIELDS.select_columns(names)).select_from(Charger).join(Province, Province.id == Charger.province_id)
     if province:
         stmt = stmt.where(Province.slug_en == province)
     if q:
-        like = f"%{q}%"
-        stmt = stmt.where(or_(Charger.name.ilike(like), Charger.brand.ilike(like), Charger.address.ilike(like)))
-    stmt = stmt.order_by(asc(Charger.name)).limit(limit)
+        stmt = stmt.where(search_clause(Charger.search_text, q))
+    if geo:
+        stmt = geo.apply(stmt, Charger.geog)
+    stmt = keyset.apply(stmt, limit)
     try:
-        rows = db.execute(stmt).all()
-        return [{ 'id': c.id, 'name': c.name, 'type': c.type, 'kw': float(c.kw) if c.kw is not None else None, 'capacity': c.capacity, 'lat': c.lat, 'lon': c.lon, 'province': slug } for c, slug in rows]
+        rows = (await db.execute(stmt)).all()
     except Exception:
-        items = demo_data.CHARGERS
-        if province:
-            items = [i for i in items if i['province'] == province]
-        if q:
-            ql = q.lower()
-            items = [i for i in items if ql in (i.get('name','').lower())]
-        return items[:limit]
+        mark_fallback()
+        return await run_in_threadpool(_demo_chargers, province, q, limit, geo, names, keyset)
+    # แปลงแถวใน thread ไม่ให้ถือ event loop
+    return await run_in_threadpool(keyset.page, rows, limit, lambda r: CHARGER_FIELDS.row(r, names))
+
+
+def _demo_chargers(province: Optional[str], q: Optional[str], limit: int, geo: GeoFilter, names: tuple, keyset: Keyset):
+    items = demo_store.CHARGERS.select(province, q, geo)
+    page = keyset.page_items(items, limit, geo.distance_m if geo.near else lambda i: i.get('name') or None)
+    if names != CHARGER_FIELDS.defaults:
+        return Page([CHARGER_FIELDS.project(i, names) for i in page], page.next)
+    return page
 
 @router.get('/{province}')
-def chargers_by_province(province: str, db: Session = Depends(get_db)):
+async def chargers_by_province(province: str, db: AsyncSession = Depends(get_async_db)):
     """ดึงสถานีชาร์จในจังหวัดที่กำหนด"""
     stmt = select(Charger).join(Province, Province.id == Charger.province_id).where(Province.slug_en == province)
     try:
-        rows = db.execute(stmt).scalars().all()
+        rows = (await db.execute(stmt)).scalars().all()
         return [{ 'id': c.id, 'name': c.name, 'type': c.type, 'kw': float(c.kw) if c.kw is not None else None, 'capacity': c.capacity, 'lat': c.lat, 'lon': c.lon, 'province': province } for c in rows]
     except Exception:
-        items = [i for i in demo_data.CHARGERS if i['province'] == province]
-        return items
+        return demo_store.CHARGERS.in_province(province)
 
 @router.get('/{province}/{cid}')
-def charger_detail(province: str, cid: str, db: Session = Depends(get_db)):
+async def charger_detail(province: str, cid: str, db: AsyncSession = Depends(get_async_db)):
     """รายละเอียดสถานีชาร์จรายตัว"""
     stmt = select(Charger).join(Province, Province.id == Charger.province_id).where(Province.slug_en == province, Charger.id == cid)
     try:
-        c = db.execute(stmt).scalars().first()
+        c = (await db.execute(stmt)).scalars().first()
         if not c:
             raise HTTPException(status_code=404, detail='Not found')
         return { 'id': c.id, 'name': c.name, 'type': c.type, 'kw': float(c.kw) if c.kw is not None else None, 'capacity': c.capacity, 'lat': c.lat, 'lon': c.lon, 'province': province }
     except Exception:
-        for i in demo_data.CHARGERS:
-            if i['province'] == province and i['id'] == cid:
-                return i
+        i = demo_store.CHARGERS.get(province, cid)
+        if i:
+            return i
         raise HTTPException(status_code=404, detail='Not found')
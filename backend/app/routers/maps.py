@@ -0,0 +1,130 @@
+"""API จุดบนแผนที่ตาม viewport: รวมกลุ่ม (cluster) ที่ซูมต่ำ และคืนจุดเดี่ยวที่ซูมสูง"""
+import math
+from typing import Dict, List, Tuple
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ..db import get_db
+from ..models import Attraction, Province, Food, Cafe, Hotel, Charger
+from ..cache import TTLCache, data_version, register
+from ..config import FALLBACK_CACHE_TTL
+from ..spatial import GridIndex, parse_bbox
+from .. import demo_store
+
+router = APIRouter(prefix='/api/map', tags=['map'])
+
+# layer -> (model, คอลัมน์ชื่อ, ชื่อ store ใน demo_store, key ชื่อใน demo)
+LAYERS = {
+    'chargers': (Charger, Charger.name, 'CHARGERS', 'name'),
+    'attractions': (Attraction, Attraction.name_th, 'ATTRACTIONS', 'name_th'),
+    'food': (Food, Food.name_th, 'FOODS', 'name_th'),
+    'cafes': (Cafe, Cafe.name_th, 'CAFES', 'name_th'),
+    'hotels': (Hotel, Hotel.name_th, 'HOTELS', 'name_th'),
+}
+
+# ตั้งแต่ซูมนี้ขึ้นไปส่งจุดเดี่ยวทั้งหมดโดยไม่รวมกลุ่ม
+CLUSTER_MAX_ZOOM = 15
+# ขนาดช่องรวมกลุ่มบนจอ (พิกเซลของ tile 256px)
+CLUSTER_CELL_PX = 64
+
+# grid index ต่อ layer ผูกกับ data version (ถูกล้างพร้อม cache อื่นเมื่อ ETL นำเข้าข้อมูลใหม่)
+_INDEXES = register(TTLCache(ttl=24 * 3600, maxsize=len(LAYERS) * 2))
+
+
+def _load_layer(layer: str, db: Session) -> Tuple[List[dict], bool]:
+    """ดึงจุดของ layer จาก DB (เฉพาะคอลัมน์ที่ใช้บนแผนที่) ถ้า DB ใช้ไม่ได้ใช้ demo; คืน (จุด, เป็นข้อมูล demo ไหม)"""
+    model, name_col, demo, demo_name = LAYERS[layer]
+    stmt = (
+        select(model.id, name_col, model.lat, model.lon, Province.slug_en)
+        .join(Province, Province.id == model.province_id)
+        .where(model.lat.is_not(None), model.lon.is_not(None))
+    )
+    try:
+        return [
+            {'id': pid, 'name': name, 'lat': float(lat), 'lon': float(lon), 'province': slug}
+            for pid, name, lat, lon, slug in db.execute(stmt).all()
+        ], False
+    except Exception:
+        try:
+            db.rollback()
+        except Exception:
+            pass
+        return [
+            {'id': i['id'], 'name': i.get(demo_name) or i.get('name_en'), 'lat': i['lat'], 'lon': i['lon'], 'province': i.get('province')}
+            for i in getattr(demo_store, demo).items if i.get('lat') is not None and i.get('lon') is not None
+        ], True
+
+
+def _layer_index(layer: str, db: Session) -> GridIndex:
+    """grid index ของ layer (สร้างใหม่เมื่อ data version เปลี่ยนหรือหมดอายุ; index จากข้อมูล demo เก็บแค่ FALLBACK_CACHE_TTL)"""
+    key = (data_version(db), layer)
+    index = _INDEXES.get(key)
+    if index is None:
+        points, fallback = _load_layer(layer, db)
+        index = GridIndex((p['lat'], p['lon'], p) for p in points)
+        _INDEXES.set(key, index, FALLBACK_CACHE_TTL if fallback else None)
+    return index
+
+
+def _mercator(lat: float, lon: float) -> Tuple[float, float]:
+    """พิกัดเป็นตำแหน่งบนแผนที่ Web Mercator แบบ normalize (0..1)"""
+    lat = max(-85.05112878, min(85.05112878, lat))
+    s = math.sin(math.radians(lat))
+    return (lon + 180.0) / 360.0, 0.5 - math.log((1 + s) / (1 - s)) / (4 * math.pi)
+
+
+def _cluster(layer: str, points: List[Tuple[float, float, dict]], zoom: int) -> List[dict]:
+    """รวมจุดที่อยู่ช่องเดียวกันบนจอ (ช่องละ CLUSTER_CELL_PX พิกเซล) เป็นกลุ่มพร้อมจำนวนและจุดศูนย์กลาง"""
+    cell = CLUSTER_CELL_PX / (256.0 * (2 ** zoom))
+    groups: Dict[Tuple[int, int], List[Tuple[float, float, dict]]] = {}
+    for lat, lon, item in points:
+        x, y = _mercator(lat, lon)
+        groups.setdefault((int(x / cell), int(y / cell)), []).append((lat, lon, item))
+    out: List[dict] = []
+    for members in groups.values():
+        if len(members) == 1:
+            out.append(_point(layer, *members[0]))
+            continue
+        lats = [m[0] for m in members]
+        lons = [m[1] for m in members]
+        out.append({
+            'kind': 'cluster',
+            'layer': layer,
+            'count': len(members),
+            'lat': sum(lats) / len(lats),
+            'lon': sum(lons) / len(lons),
+            'bbox': [min(lons), min(lats), max(lons), max(lats)],
+        })
+    return out
+
+
+def _point(layer: str, lat: float, lon: float, item: dict) -> dict:
+    return {'kind': 'point', 'layer': layer, 'id': item['id'], 'name': item.get('name'), 'province': item.get('province'), 'lat': lat, 'lon': lon}
+
+
+@router.get('/points')
+def map_points(
+    bbox: str,
+    zoom: int = Query(..., ge=0, le=22),
+    layers: str = 'chargers',
+    db: Session = Depends(get_db),
+):
+    """จุดใน viewport (bbox=minLon,minLat,maxLon,maxLat) ของแต่ละ layer: รวมกลุ่มถ้าซูมต่ำกว่า CLUSTER_MAX_ZOOM"""
+    try:
+        min_lon, min_lat, max_lon, max_lat = parse_bbox(bbox)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    wanted = [l.strip() for l in layers.split(',') if l.strip()]
+    unknown = [l for l in wanted if l not in LAYERS]
+    if not wanted or unknown:
+        raise HTTPException(status_code=400, detail=f"layers must be some of: {', '.join(LAYERS)}")
+    items: List[dict] = []
+    for layer in dict.fromkeys(wanted):
+        points = _layer_index(layer, db).within(min_lon, min_lat, max_lon, max_lat)
+        if zoom >= CLUSTER_MAX_ZOOM:
+            items.extend(_point(layer, *p) for p in points)
+        else:
+            items.extend(_cluster(layer, points, zoom))
+    return {'zoom': zoom, 'clustered': zoom < CLUSTER_MAX_ZOOM, 'items': items}
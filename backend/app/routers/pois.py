@@ -2,20 +2,77 @@
 import json
 from typing import Optional, Dict
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import select, or_, asc, func
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select, or_, asc, cast, func, literal, literal_column, union_all, Float, Integer
+from sqlalchemy.dialects.postgresql import array
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from ..db import get_db
-from ..models import Attraction, Province, Food, Cafe, Hotel
+from ..db import get_async_db, get_db
+from ..models import Attraction, Province, Food, Cafe, Hotel, Charger
 from ..config import PROVINCE_SEED
-from .. import demo_data
+from ..cache import TTLCache, cached_json, cached_json_async, data_version_async, json_response_async, mark_fallback, register
+from ..fields import FieldSet
+from ..hours import is_open, now_minute, parse_open_at
+from ..paging import Keyset, Page, next_cursor, page_headers, text_key
+from ..spatial import GeoFilter
+from ..textnorm import like_pattern, rank_expr, search_clause
+from .. import demo_data, demo_store
 
 router = APIRouter(prefix='/api', tags=['pois'])
 
 SLUG_TO_THAI: Dict[str, str] = { slug: th for slug, th in PROVINCE_SEED }
 
 
+def _geo_filter(bbox: Optional[str], near: Optional[str], radius_km: Optional[float]) -> GeoFilter:
+    """แปลงพารามิเตอร์ bbox/near/radius_km เป็น GeoFilter (รูปแบบผิดตอบ 400)"""
+    try:
+        return GeoFilter(bbox, near, radius_km)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+
+def _fields(field_set: FieldSet, fields: Optional[str]):
+    """แปลงพารามิเตอร์ fields= เป็นรายชื่อคอลัมน์ (ชื่อที่ไม่รู้จักตอบ 400)"""
+    try:
+        return field_set.choose(fields)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+
+def _keyset(model, name, geo: GeoFilter, cursor: Optional[str]) -> Keyset:
+    """ลำดับของหน้า: ตามระยะเมื่อมี near ไม่งั้นตามชื่อ (text_key) แล้วตาม id (cursor เสียตอบ 400)"""
+    sort = model.geog.op('<->')(geo.here()) if geo.near else text_key(name)
+    try:
+        return Keyset(sort, model.id, cursor)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+
+def _demo_sort(geo: GeoFilter, name: str):
+    """ค่า sort ของข้อมูล demo ให้ตรงกับ _keyset (ระยะเป็นเมตรเหมือน <-> ใน SQL, ชื่อว่างนับเป็น NULL เหมือน text_key)"""
+    if geo.near:
+        return geo.distance_m
+    return lambda item: item.get(name) or None
+
+
+def _open_minute(open_at: Optional[str], open_now: bool) -> Optional[int]:
+    """นาทีของสัปดาห์ที่ต้องการให้ร้านเปิด จาก open_at / open_now (None = ไม่กรอง, รูปแบบผิดตอบ 400)"""
+    if open_at:
+        try:
+            return parse_open_at(open_at)
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc))
+    return now_minute() if open_now else None
+
+
+def _open_hours_pair(value) -> Dict[str, str]:
+    """[open_text, close_text] จาก SQL เป็นรูปแบบ open_hours เดิม"""
+    open_text, close_text = value or ('', '')
+    return {'open': (open_text or '').strip(), 'close': (close_text or '').strip()}
+
+
 def _parse_open_hours(raw: Optional[str]) -> Dict[str, str]:
     """แปลงข้อมูลเวลาเปิดปิด (json/string/dict) ให้อยู่รูปแบบเดียว"""
     default = {'open': '', 'close': ''}
@@ -36,60 +93,165 @@ def _parse_open_hours(raw: Optional[str]) -> Dict[str, str]:
         return default
 
 
+ATTRACTION_FIELDS = FieldSet(Attraction, {
+    'id': Attraction.id,
+    'name_th': Attraction.name_th,
+    'name_en': Attraction.name_en,
+    'kind': Attraction.kind,
+    'lat': Attraction.lat,
+    'lon': Attraction.lon,
+    'province': Province.slug_en,
+    'province_th': func.coalesce(Attraction.province_th, Province.name_th),
+    'address_th': Attraction.address_th,
+    'district_th': Attraction.district_th,
+    'subdistrict_th': Attraction.subdistrict_th,
+})
+FOOD_FIELDS = FieldSet(Food, {
+    'id': Food.id,
+    'name_th': Food.name_th,
+    'name_en': Food.name_en,
+    'province': Province.slug_en,
+    'lat': Food.lat,
+    'lon': Food.lon,
+    # ETL แยกเวลาเปิด/ปิดเป็นคอลัมน์ไว้แล้ว ไม่ต้อง parse json ทีละแถว
+    'open_hours': array([Food.open_text, Food.close_text]),
+}, post={'open_hours': _open_hours_pair, 'open_hours_json': _parse_open_hours})
+CAFE_FIELDS = FieldSet(Cafe, {
+    'id': Cafe.id,
+    'name_th': Cafe.name_th,
+    'name_en': Cafe.name_en,
+    'province': Province.slug_en,
+    'lat': Cafe.lat,
+    'lon': Cafe.lon,
+}, post={'open_hours_json': _parse_open_hours})
+HOTEL_FIELDS = FieldSet(Hotel, {
+    'id': Hotel.id,
+    'name_th': Hotel.name_th,
+    'name_en': Hotel.name_en,
+    'province': Province.slug_en,
+    'lat': Hotel.lat,
+    'lon': Hotel.lon,
+    'stars': Hotel.stars,
+    'phone': Hotel.phone,
+    'address': Hotel.address,
+})
+
+
 @router.get('/provinces')
 def list_provinces(db: Session = Depends(get_db)):
     """ดึงรายการจังหวัด ใช้ฐานข้อมูลก่อน ถ้าไม่มีใช้ seed"""
+    return cached_json(db, ('provinces',), lambda: _list_provinces(db))
+
+
+def _list_provinces(db: Session):
     # Try DB first
     try:
         rows = db.execute(select(Province).order_by(asc(Province.name_th))).scalars().all()
         if rows:
             return [{ 'slug': p.slug_en, 'name_th': p.name_th } for p in rows]
     except Exception:
+        mark_fallback()
         return demo_data.PROVINCES
     # Fallback to seed
     return [{ 'slug': s, 'name_th': th } for s, th in PROVINCE_SEED]
 
 
+def _facet_counts(stmt, column):
+    """scalar subquery นับจำนวนแถวที่ผ่านตัวกรองของ stmt แยกตาม column เป็น json {ค่า: จำนวน} (ไปกับ query รายการเลย)"""
+    filtered = stmt.with_only_columns(column.label('facet')).order_by(None).limit(None).subquery()
+    grouped = select(filtered.c.facet, func.count().label('n')).group_by(filtered.c.facet).subquery()
+    return select(func.json_object_agg(func.coalesce(grouped.c.facet, ''), grouped.c.n)).scalar_subquery().label('facets')
+
+
+async def _fetch_with_facets(db: AsyncSession, stmt, facets):
+    """รัน stmt พร้อมคอลัมน์ facets แล้วคืน (rows, counts); ถ้าหน้านี้ไม่มีแถวเลยค่อยถาม facets แยก"""
+    if facets is None:
+        return (await db.execute(stmt)).all(), None
+    rows = (await db.execute(stmt.add_columns(facets))).all()
+    counts = rows[0].facets if rows else (await db.execute(select(facets))).scalar()
+    return rows, dict(counts or {})
+
+
+# facet จังหวัดของ food/cafes/hotels นับจากทุกจังหวัด (ไม่ใช้ตัวกรอง province/cursor ของหน้าที่ขอ)
+# จึง cache แยกจากหน้ารายการ: หน้าที่กรองจังหวัดไม่ต้องนับทั้งตารางซ้ำทุกคำร้อง
+_PROVINCE_FACETS = register(TTLCache())
+
+
+async def _fetch_with_province_facets(db: AsyncSession, stmt, facets, key: tuple):
+    """รัน stmt แล้วคืน (rows, counts) โดย counts ของ facet จังหวัดนับครั้งเดียวต่อ data version และตัวกรองที่ไม่ใช่จังหวัด (key)"""
+    rows = (await db.execute(stmt)).all()
+    if facets is None:
+        return rows, None
+    full_key = (await data_version_async(db),) + key
+    counts = _PROVINCE_FACETS.get(full_key)
+    if counts is None:
+        counts = dict((await db.execute(select(facets))).scalar() or {})
+        _PROVINCE_FACETS.set(full_key, counts)
+    return rows, counts
+
+
+def _with_counts(items, facet: str, counts: Dict[str, int], selected: Optional[str]):
+    """รูปแบบ response ของ with_counts=true: facets นับโดยไม่ใช้ตัวกรองของ facet เอง ส่วน total คือจำนวนที่ตรงทุกตัวกรอง"""
+    total = counts.get(selected, 0) if selected else sum(counts.values())
+    return {'items': items, 'total': int(total), 'facets': {facet: counts}, 'next': next_cursor(items)}
+
+
+async def _respond(data):
+    """response ของ list ที่ไม่ผ่าน cache พร้อม header cursor หน้าถัดไป"""
+    return await json_response_async(data, page_headers(data))
+
+
+def _rows_page(rows, counts, limit: int, facet: str, selected: Optional[str], with_counts: bool, field_set: FieldSet, names: tuple, keyset: Keyset):
+    """แปลงแถวจาก SQL เป็นหน้ารายการ (เรียกผ่าน run_in_threadpool ไม่ให้ถือ event loop)"""
+    items = keyset.page(rows, limit, lambda r: field_set.row(r, names))
+    return _with_counts(items, facet, counts, selected) if with_counts else items
+
+
+def _demo_page(items, limit: int, facet: str, selected: Optional[str], with_counts: bool, field_set: FieldSet, names: tuple, keyset: Keyset, sort_value):
+    """ตัดหน้าของข้อมูล demo (items ยังไม่กรอง facet) และคำนวณ facets แบบเดียวกับ SQL"""
+    page = [i for i in items if i.get(facet) == selected] if selected else items
+    page = keyset.page_items(page, limit, sort_value)
+    # ไม่ได้ขอ fields= ก็ส่งรายการ demo ตามเดิม
+    if names != field_set.defaults:
+        page = Page([field_set.project(i, names) for i in page], page.next)
+    if not with_counts:
+        return page
+    counts: Dict[str, int] = {}
+    for i in items:
+        key = i.get(facet) or ''
+        counts[key] = counts.get(key, 0) + 1
+    return _with_counts(page, facet, counts, selected)
+
+
 @router.get('/attractions')
-def list_attractions(province: Optional[str] = None, q: Optional[str] = None, kind: Optional[str] = None, limit: int = 200, db: Session = Depends(get_db)):
-    """ค้นหาแหล่งท่องเที่ยวตามจังหวัด/คำค้น/ชนิด"""
-    stmt = select(Attraction, Province.slug_en, Province.name_th).join(Province, Province.id == Attraction.province_id)
+async def list_attractions(province: Optional[str] = None, q: Optional[str] = None, kind: Optional[str] = None, limit: int = 200, bbox: Optional[str] = None, near: Optional[str] = None, radius_km: Optional[float] = None, with_counts: bool = False, fields: Optional[str] = None, cursor: Optional[str] = None, db: AsyncSession = Depends(get_async_db)):
+    """ค้นหาแหล่งท่องเที่ยวตามจังหวัด/คำค้น/ชนิด (with_counts=true คืน items + total + facets ตาม kind)"""
+    geo = _geo_filter(bbox, near, radius_km)
+    names = _fields(ATTRACTION_FIELDS, fields)
+    if q or geo:
+        return await _respond(await _list_attractions(province, q, kind, limit, geo, with_counts, names, cursor, db))
+    return await cached_json_async(db, ('attractions', province, kind, limit, with_counts, names, cursor), lambda: _list_attractions(province, None, kind, limit, GeoFilter(), with_counts, names, cursor, db), page_headers)
+
+
+async def _list_attractions(province: Optional[str], q: Optional[str], kind: Optional[str], limit: int, geo: GeoFilter, with_counts: bool, names: tuple, cursor: Optional[str], db: AsyncSession):
+    stmt = select(*ATTRACTION_FIELDS.select_columns(names)).select_from(Attraction).join(Province, Province.id == Attraction.province_id)
     if province:
         stmt = stmt.where(Province.slug_en == province)
     if q:
-        like = f"%{q}%"
-        stmt = stmt.where(or_(Attraction.name_th.ilike(like), Attraction.name_en.ilike(like)))
+        stmt = stmt.where(search_clause(Attraction.search_text, q))
+    if geo:
+        stmt = geo.apply(stmt, Attraction.geog)
+    facets = _facet_counts(stmt, Attraction.kind) if with_counts else None
     if kind:
         stmt = stmt.where(Attraction.kind == kind)
-    stmt = stmt.order_by(asc(Attraction.name_th)).limit(limit)
+    keyset = _keyset(Attraction, Attraction.name_th, geo, cursor)
+    stmt = keyset.apply(stmt, limit)
     try:
-        rows = db.execute(stmt).all()
-        results = []
-        for attr, slug, province_name_th in rows:
-            results.append({
-                'id': attr.id,
-                'name_th': attr.name_th,
-                'name_en': attr.name_en,
-                'kind': attr.kind,
-                'lat': attr.lat,
-                'lon': attr.lon,
-                'province': slug,
-                'province_th': attr.province_th or province_name_th,
-                'address_th': attr.address_th,
-                'district_th': attr.district_th,
-                'subdistrict_th': attr.subdistrict_th,
-            })
-        return results
+        rows, counts = await _fetch_with_facets(db, stmt, facets)
     except Exception:
-        items = demo_data.ATTRACTIONS
-        if province:
-            items = [i for i in items if i['province'] == province]
-        if q:
-            ql = q.lower()
-            items = [i for i in items if ql in (i.get('name_th','').lower() + i.get('name_en','').lower())]
-        if kind:
-            items = [i for i in items if i.get('kind') == kind]
-        return items[:limit]
+        mark_fallback()
+        return await run_in_threadpool(lambda: _demo_page(demo_store.ATTRACTIONS.select(province, q, geo), limit, 'kind', kind, with_counts, ATTRACTION_FIELDS, names, keyset, _demo_sort(geo, 'name_th')))
+    return await run_in_threadpool(_rows_page, rows, counts, limit, 'kind', kind, with_counts, ATTRACTION_FIELDS, names, keyset)
 
 
 @router.get('/attractions/count')
@@ -104,8 +266,7 @@ def count_attractions(province: Optional[str] = None, q: Optional[str] = None, d
     if province:
         stmt = stmt.where(Province.slug_en == province)
     if q:
-        like = f"%{q}%"
-        stmt = stmt.where(or_(Attraction.name_th.ilike(like), Attraction.name_en.ilike(like)))
+        stmt = stmt.where(search_clause(Attraction.search_text, q))
     try:
         total, cta, avt, nta = db.execute(stmt).one()
         return {
@@ -115,12 +276,7 @@ def count_attractions(province: Optional[str] = None, q: Optional[str] = None, d
             'nta': int(nta or 0),
         }
     except Exception:
-        items = demo_data.ATTRACTIONS
-        if province:
-            items = [i for i in items if i['province'] == province]
-        if q:
-            ql = q.lower()
-            items = [i for i in items if ql in (i.get('name_th','').lower() + i.get('name_en','').lower())]
+        items = demo_store.ATTRACTIONS.select(province, q)
         return {
             'total': len(items),
             'cta': len([i for i in items if i.get('kind') == 'CTA']),
@@ -176,46 +332,52 @@ def attraction_detail(province: str, slug_or_id: str, db: Session = Depends(get_
             'subdistrict_th': attr.subdistrict_th,
         }
     except Exception:
-        for i in demo_data.ATTRACTIONS:
-            if i['province'] == province and (i['id'] == slug_or_id or i.get('name_en') == slug_or_id):
-                i = i.copy()
-                i.setdefault('province_th', SLUG_TO_THAI.get(province, ''))
-                return i
+        i = demo_store.ATTRACTIONS.get(province, slug_or_id)
+        if i:
+            i = i.copy()
+            i.setdefault('province_th', SLUG_TO_THAI.get(province, ''))
+            return i
         raise HTTPException(status_code=404, detail='Not found')
 
 
 @router.get('/food')
-def list_food(province: Optional[str] = None, q: Optional[str] = None, limit: int = 200, db: Session = Depends(get_db)):
-    """รายการร้านอาหารพร้อมเวลาทำการ"""
-    stmt = select(Food, Province.slug_en).join(Province, Province.id == Food.province_id)
+async def list_food(province: Optional[str] = None, q: Optional[str] = None, limit: int = 200, bbox: Optional[str] = None, near: Optional[str] = None, radius_km: Optional[float] = None, with_counts: bool = False, fields: Optional[str] = None, cursor: Optional[str] = None, open_at: Optional[str] = None, open_now: bool = False, db: AsyncSession = Depends(get_async_db)):
+    """รายการร้านอาหารพร้อมเวลาทำการ (with_counts=true คืน items + total + facets ตามจังหวัด; open_at=HH:MM|ISO หรือ open_now=true กรองร้านที่เปิด)"""
+    geo = _geo_filter(bbox, near, radius_km)
+    names = _fields(FOOD_FIELDS, fields)
+    minute = _open_minute(open_at, open_now)
+    if q or geo or minute is not None:
+        return await _respond(await _list_food(province, q, limit, geo, with_counts, names, cursor, minute, db))
+    return await cached_json_async(db, ('food', province, limit, with_counts, names, cursor), lambda: _list_food(province, None, limit, GeoFilter(), with_counts, names, cursor, None, db), page_headers)
+
+
+async def _list_food(province: Optional[str], q: Optional[str], limit: int, geo: GeoFilter, with_counts: bool, names: tuple, cursor: Optional[str], minute: Optional[int], db: AsyncSession):
+    stmt = select(*FOOD_FIELDS.select_columns(names)).select_from(Food).join(Province, Province.id == Food.province_id)
+    if q:
+        stmt = stmt.where(search_clause(Food.search_text, q))
+    if geo:
+        stmt = geo.apply(stmt, Food.geog)
+    if minute is not None:
+        stmt = stmt.where(Food.open_minutes.op('@>')(cast(minute, Integer)))
+    facets = _facet_counts(stmt, Province.slug_en) if with_counts else None
     if province:
         stmt = stmt.where(Province.slug_en == province)
-    if q:
-        like = f"%{q}%"
-        stmt = stmt.where(or_(Food.name_th.ilike(like), Food.name_en.ilike(like)))
-    stmt = stmt.order_by(asc(Food.name_th)).limit(limit)
+    keyset = _keyset(Food, Food.name_th, geo, cursor)
+    stmt = keyset.apply(stmt, limit)
     try:
-        rows = db.execute(stmt).all()
-        items = []
-        for food, slug in rows:
-            items.append({
-                'id': food.id,
-                'name_th': food.name_th,
-                'name_en': food.name_en,
-                'province': slug,
-                'lat': food.lat,
-                'lon': food.lon,
-                'open_hours': _parse_open_hours(food.open_hours_json),
-            })
-        return items
+        rows, counts = await _fetch_with_province_facets(db, stmt, facets, ('food', q, geo.key(), minute))
     except Exception:
-        items = demo_data.FOODS
-        if province:
-            items = [i for i in items if i['province'] == province]
-        if q:
-            ql = q.lower()
-            items = [i for i in items if ql in (i.get('name_th','').lower() + i.get('name_en','').lower())]
-        return items[:limit]
+        mark_fallback()
+        return await run_in_threadpool(lambda: _demo_page(_demo_food(province, q, geo, with_counts, minute), limit, 'province', province, with_counts, FOOD_FIELDS, names, keyset, _demo_sort(geo, 'name_th')))
+    return await run_in_threadpool(_rows_page, rows, counts, limit, 'province', province, with_counts, FOOD_FIELDS, names, keyset)
+
+
+def _demo_food(province: Optional[str], q: Optional[str], geo: GeoFilter, with_counts: bool, minute: Optional[int]):
+    # with_counts ต้องนับ facet จังหวัดจากทุกจังหวัด จึงยังไม่กรองจังหวัดตรงนี้
+    items = demo_store.FOODS.select(None if with_counts else province, q, geo)
+    if minute is not None:
+        items = [i for i in items if is_open((i.get('open_hours') or {}).get('open'), (i.get('open_hours') or {}).get('close'), minute)]
+    return items
 
 
 @router.get('/food/count')
@@ -225,18 +387,12 @@ def count_food(province: Optional[str] = None, q: Optional[str] = None, db: Sess
     if province:
         stmt = stmt.where(Province.slug_en == province)
     if q:
-        like = f"%{q}%"
-        stmt = stmt.where(or_(Food.name_th.ilike(like), Food.name_en.ilike(like)))
+        stmt = stmt.where(search_clause(Food.search_text, q))
     try:
         total = db.execute(stmt).scalar() or 0
         return {'total': int(total)}
     except Exception:
-        items = demo_data.FOODS
-        if province:
-            items = [i for i in items if i['province'] == province]
-        if q:
-            ql = q.lower()
-            items = [i for i in items if ql in (i.get('name_th','').lower() + i.get('name_en','').lower())]
+        items = demo_store.FOODS.select(province, q)
         return {'total': len(items)}
 
 
@@ -256,36 +412,43 @@ def food_detail(province: str, slug_or_id: str, db: Session = Depends(get_db)):
             'lat': food.lat,
             'lon': food.lon,
             'price_range': food.price_range,
-            'open_hours': _parse_open_hours(food.open_hours_json),
+            'open_hours': _open_hours_pair((food.open_text, food.close_text)),
         }
     except Exception:
-        for i in demo_data.FOODS:
-            if i['province'] == province and i['id'] == slug_or_id:
-                return i
+        i = demo_store.FOODS.get(province, slug_or_id)
+        if i:
+            return i
         raise HTTPException(status_code=404, detail='Not found')
 
 
 @router.get('/cafes')
-def list_cafes(province: Optional[str] = None, q: Optional[str] = None, limit: int = 200, db: Session = Depends(get_db)):
-    """รายการคาเฟ่"""
-    stmt = select(Cafe, Province.slug_en).join(Province, Province.id == Cafe.province_id)
+async def list_cafes(province: Optional[str] = None, q: Optional[str] = None, limit: int = 200, bbox: Optional[str] = None, near: Optional[str] = None, radius_km: Optional[float] = None, with_counts: bool = False, fields: Optional[str] = None, cursor: Optional[str] = None, db: AsyncSession = Depends(get_async_db)):
+    """รายการคาเฟ่ (with_counts=true คืน items + total + facets ตามจังหวัด)"""
+    geo = _geo_filter(bbox, near, radius_km)
+    names = _fields(CAFE_FIELDS, fields)
+    if q or geo:
+        return await _respond(await _list_cafes(province, q, limit, geo, with_counts, names, cursor, db))
+    return await cached_json_async(db, ('cafes', province, limit, with_counts, names, cursor), lambda: _list_cafes(province, None, limit, GeoFilter(), with_counts, names, cursor, db), page_headers)
+
+
+async def _list_cafes(province: Optional[str], q: Optional[str], limit: int, geo: GeoFilter, with_counts: bool, names: tuple, cursor: Optional[str], db: AsyncSession):
+    stmt = select(*CAFE_FIELDS.select_columns(names)).select_from(Cafe).join(Province, Province.id == Cafe.province_id)
+    if q:
+        stmt = stmt.where(search_clause(Cafe.search_text, q))
+    if geo:
+        stmt = geo.apply(stmt, Cafe.geog)
+    facets = _facet_counts(stmt, Province.slug_en) if with_counts else None
     if province:
         stmt = stmt.where(Province.slug_en == province)
-    if q:
-        like = f"%{q}%"
-        stmt = stmt.where(or_(Cafe.name_th.ilike(like), Cafe.name_en.ilike(like)))
-    stmt = stmt.order_by(asc(Cafe.name_th)).limit(limit)
+    keyset = _keyset(Cafe, Cafe.name_th, geo, cursor)
+    stmt = keyset.apply(stmt, limit)
     try:
-        rows = db.execute(stmt).all()
-        return [{ 'id': c.id, 'name_th': c.name_th, 'name_en': c.name_en, 'province': slug, 'lat': c.lat, 'lon': c.lon } for c, slug in rows]
+        rows, counts = await _fetch_with_province_facets(db, stmt, facets, ('cafes', q, geo.key()))
     except Exception:
-        items = demo_data.CAFES
-        if province:
-            items = [i for i in items if i['province'] == province]
-        if q:
-            ql = q.lower()
-            items = [i for i in items if ql in (i.get('name_th','').lower() + i.get('name_en','').lower())]
-        return items[:limit]
+        mark_fallback()
+        # with_counts ต้องนับ facet จังหวัดจากทุกจังหวัด จึงยังไม่กรองจังหวัดตรงนี้
+        return await run_in_threadpool(lambda: _demo_page(demo_store.CAFES.select(None if with_counts else province, q, geo), limit, 'province', province, with_counts, CAFE_FIELDS, names, keyset, _demo_sort(geo, 'name_th')))
+    return await run_in_threadpool(_rows_page, rows, counts, limit, 'province', province, with_counts, CAFE_FIELDS, names, keyset)
 
 
 @router.get('/cafes/count')
@@ -295,18 +458,12 @@ def count_cafes(province: Optional[str] = None, q: Optional[str] = None, db: Ses
     if province:
         stmt = stmt.where(Province.slug_en == province)
     if q:
-        like = f"%{q}%"
-        stmt = stmt.where(or_(Cafe.name_th.ilike(like), Cafe.name_en.ilike(like)))
+        stmt = stmt.where(search_clause(Cafe.search_text, q))
     try:
         total = db.execute(stmt).scalar() or 0
         return {'total': int(total)}
     except Exception:
-        items = demo_data.CAFES
-        if province:
-            items = [i for i in items if i['province'] == province]
-        if q:
-            ql = q.lower()
-            items = [i for i in items if ql in (i.get('name_th','').lower() + i.get('name_en','').lower())]
+        items = demo_store.CAFES.select(province, q)
         return {'total': len(items)}
 
 
@@ -320,38 +477,40 @@ def cafe_detail(province: str, slug_or_id: str, db: Session = Depends(get_db)):
             raise HTTPException(status_code=404, detail='Not found')
         return { 'id': c.id, 'name_th': c.name_th, 'name_en': c.name_en, 'province': province, 'lat': c.lat, 'lon': c.lon }
     except Exception:
-        for i in demo_data.CAFES:
-            if i['province'] == province and i['id'] == slug_or_id:
-                return i
+        i = demo_store.CAFES.get(province, slug_or_id)
+        if i:
+            return i
         raise HTTPException(status_code=404, detail='Not found')
 
 
 @router.get('/hotels')
-def list_hotels(province: Optional[str] = None, q: Optional[str] = None, limit: int = 200, db: Session = Depends(get_db)):
-    """รายการโรงแรม/ที่พัก"""
-    stmt = select(Hotel, Province.slug_en).join(Province, Province.id == Hotel.province_id)
+async def list_hotels(province: Optional[str] = None, q: Optional[str] = None, limit: int = 200, bbox: Optional[str] = None, near: Optional[str] = None, radius_km: Optional[float] = None, with_counts: bool = False, fields: Optional[str] = None, cursor: Optional[str] = None, db: AsyncSession = Depends(get_async_db)):
+    """รายการโรงแรม/ที่พัก (with_counts=true คืน items + total + facets ตามจังหวัด)"""
+    geo = _geo_filter(bbox, near, radius_km)
+    names = _fields(HOTEL_FIELDS, fields)
+    if q or geo:
+        return await _respond(await _list_hotels(province, q, limit, geo, with_counts, names, cursor, db))
+    return await cached_json_async(db, ('hotels', province, limit, with_counts, names, cursor), lambda: _list_hotels(province, None, limit, GeoFilter(), with_counts, names, cursor, db), page_headers)
+
+
+async def _list_hotels(province: Optional[str], q: Optional[str], limit: int, geo: GeoFilter, with_counts: bool, names: tuple, cursor: Optional[str], db: AsyncSession):
+    stmt = select(*HOTEL_FIELDS.select_columns(names)).select_from(Hotel).join(Province, Province.id == Hotel.province_id)
+    if q:
+        stmt = stmt.where(search_clause(Hotel.search_text, q))
+    if geo:
+        stmt = geo.apply(stmt, Hotel.geog)
+    facets = _facet_counts(stmt, Province.slug_en) if with_counts else None
     if province:
         stmt = stmt.where(Province.slug_en == province)
-    if q:
-        like = f"%{q}%"
-        stmt = stmt.where(or_(Hotel.name_th.ilike(like), Hotel.name_en.ilike(like)))
-    stmt = stmt.order_by(
-        # push rowsที่มีชื่อไทย (ไม่ว่าง/ไม่ null) ขึ้นก่อน
-        asc((Hotel.name_th == None) | (Hotel.name_th == '')),
-        asc(Hotel.name_th),
-        asc(Hotel.name_en)
-    ).limit(limit)
+    keyset = _keyset(Hotel, Hotel.name_th, geo, cursor)
+    stmt = keyset.apply(stmt, limit)
     try:
-        rows = db.execute(stmt).all()
-        return [{ 'id': h.id, 'name_th': h.name_th, 'name_en': h.name_en, 'province': slug, 'lat': h.lat, 'lon': h.lon, 'stars': h.stars, 'phone': h.phone, 'address': h.address } for h, slug in rows]
+        rows, counts = await _fetch_with_province_facets(db, stmt, facets, ('hotels', q, geo.key()))
     except Exception:
-        items = demo_data.HOTELS
-        if province:
-            items = [i for i in items if i['province'] == province]
-        if q:
-            ql = q.lower()
-            items = [i for i in items if ql in (i.get('name_th','').lower() + i.get('name_en','').lower())]
-        return items[:limit]
+        mark_fallback()
+        # with_counts ต้องนับ facet จังหวัดจากทุกจังหวัด จึงยังไม่กรองจังหวัดตรงนี้
+        return await run_in_threadpool(lambda: _demo_page(demo_store.HOTELS.select(None if with_counts else province, q, geo), limit, 'province', province, with_counts, HOTEL_FIELDS, names, keyset, _demo_sort(geo, 'name_th')))
+    return await run_in_threadpool(_rows_page, rows, counts, limit, 'province', province, with_counts, HOTEL_FIELDS, names, keyset)
 
 
 @router.get('/hotels/count')
@@ -361,18 +520,12 @@ def count_hotels(province: Optional[str] = None, q: Optional[str] = None, db: Se
     if province:
         stmt = stmt.where(Province.slug_en == province)
     if q:
-        like = f"%{q}%"
-        stmt = stmt.where(or_(Hotel.name_th.ilike(like), Hotel.name_en.ilike(like)))
+        stmt = stmt.where(search_clause(Hotel.search_text, q))
     try:
         total = db.execute(stmt).scalar() or 0
         return {'total': int(total)}
     except Exception:
-        items = demo_data.HOTELS
-        if province:
-            items = [i for i in items if i['province'] == province]
-        if q:
-            ql = q.lower()
-            items = [i for i in items if ql in (i.get('name_th','').lower() + i.get('name_en','').lower())]
+        items = demo_store.HOTELS.select(province, q)
         return {'total': len(items)}
 
 
@@ -386,7 +539,170 @@ def hotel_detail(province: str, slug_or_id: str, db: Session = Depends(get_db)):
             raise HTTPException(status_code=404, detail='Not found')
         return { 'id': h.id, 'name_th': h.name_th, 'name_en': h.name_en, 'province': province, 'lat': h.lat, 'lon': h.lon, 'stars': h.stars, 'phone': h.phone, 'address': h.address }
     except Exception:
-        for i in demo_data.HOTELS:
-            if i['province'] == province and i['id'] == slug_or_id:
-                return i
+        i = demo_store.HOTELS.get(province, slug_or_id)
+        if i:
+            return i
         raise HTTPException(status_code=404, detail='Not found')
+
+
+# ประเภท POI สำหรับ /nearby และ /pois/search: (model, คอลัมน์ชื่อไทย, คอลัมน์ชื่ออังกฤษ, ชื่อ store ใน demo_store)
+POI_TYPES = {
+    'attraction': (Attraction, Attraction.name_th, Attraction.name_en, 'ATTRACTIONS'),
+    'food': (Food, Food.name_th, Food.name_en, 'FOODS'),
+    'cafe': (Cafe, Cafe.name_th, Cafe.name_en, 'CAFES'),
+    'hotel': (Hotel, Hotel.name_th, Hotel.name_en, 'HOTELS'),
+    'charger': (Charger, Charger.name, Charger.name, 'CHARGERS'),
+}
+
+
+def _parse_types(types: str):
+    wanted = [t.strip().lower() for t in (types or '').split(',') if t.strip()]
+    valid = [t for t in dict.fromkeys(wanted) if t in POI_TYPES]
+    if not valid:
+        raise HTTPException(status_code=400, detail=f"types must be some of: {', '.join(POI_TYPES)}")
+    return valid
+
+
+def _nearby_item(poi_type: str, row: dict, distance_km: float) -> dict:
+    name_th = row.get('name_th') or row.get('name')
+    return {
+        'type': poi_type,
+        'id': row.get('id'),
+        'name_th': name_th,
+        'name_en': row.get('name_en') or (row.get('name') if poi_type == 'charger' else None),
+        'province': row.get('province'),
+        'lat': row.get('lat'),
+        'lon': row.get('lon'),
+        'distance_km': round(distance_km, 3),
+    }
+
+
+@router.get('/nearby')
+def nearby(
+    lat: float = Query(..., ge=-90, le=90),
+    lon: float = Query(..., ge=-180, le=180),
+    radius: Optional[float] = Query(None, gt=0, description='รัศมีค้นหา (กิโลเมตร)'),
+    types: str = 'attraction,food,cafe',
+    k: int = Query(5, ge=1, le=50),
+    province: Optional[str] = None,
+    db: Session = Depends(get_db),
+):
+    """k สถานที่ที่ใกล้พิกัดที่สุด รวมหลายประเภท เรียงตามระยะทาง (KNN ผ่าน GiST index)"""
+    wanted = _parse_types(types)
+    here = func.geography(func.ST_SetSRID(func.ST_MakePoint(lon, lat), literal_column('4326')))
+    parts = []
+    for poi_type in wanted:
+        model, name_th, name_en, _demo = POI_TYPES[poi_type]
+        geog = model.geog
+        # แต่ละประเภทเอา k อันดับแรกจาก index ก่อน แล้วค่อยรวมเรียงอีกรอบ
+        part = (
+            select(
+                literal(poi_type).label('type'),
+                model.id.label('id'),
+                name_th.label('name_th'),
+                name_en.label('name_en'),
+                Province.slug_en.label('province'),
+                model.lat.label('lat'),
+                model.lon.label('lon'),
+                func.ST_Distance(geog, here).label('dist_m'),
+            )
+            .join(Province, Province.id == model.province_id)
+            .where(model.lat.is_not(None), model.lon.is_not(None))
+            .order_by(geog.op('<->')(here))
+            .limit(k)
+        )
+        if province:
+            part = part.where(Province.slug_en == province)
+        if radius:
+            part = part.where(func.ST_DWithin(geog, here, radius * 1000))
+        parts.append(part)
+    merged = union_all(*parts).subquery('nearby')
+    stmt = select(merged).order_by(merged.c.dist_m.asc()).limit(k)
+    try:
+        rows = db.execute(stmt).mappings().all()
+        return [_nearby_item(r['type'], dict(r), float(r['dist_m'] or 0) / 1000) for r in rows]
+    except Exception:
+        found = []
+        for poi_type in wanted:
+            grid = getattr(demo_store, POI_TYPES[poi_type][3]).grid
+            # ขอเผื่อไว้เมื่อกรองจังหวัดทีหลัง
+            limit = len(grid) if province else k
+            for dist, row in grid.nearest(lat, lon, limit, radius):
+                if province and row.get('province') != province:
+                    continue
+                found.append((dist, poi_type, row))
+        found.sort(key=lambda t: t[0])
+        return [_nearby_item(poi_type, row, dist) for dist, poi_type, row in found[:k]]
+
+
+def _search_item(poi_type: str, row: dict, rank: int, distance_km: Optional[float]) -> dict:
+    item = _nearby_item(poi_type, row, distance_km or 0)
+    item['rank'] = rank
+    if distance_km is None:
+        item['distance_km'] = None
+    return item
+
+
+@router.get('/pois/search')
+def search_pois(
+    q: str = Query(..., min_length=1),
+    types: str = ','.join(POI_TYPES),
+    province: Optional[str] = None,
+    near: Optional[str] = None,
+    radius_km: Optional[float] = None,
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+):
+    """ค้นหาชื่อข้ามทุกประเภท POI ใน query เดียว (UNION ALL) เรียงตาม rank > ระยะทาง (ถ้ามี near) > ความยาวชื่อ"""
+    wanted = _parse_types(types)
+    geo = _geo_filter(None, near, radius_km)
+    if not like_pattern(q):
+        return []
+    parts = []
+    for poi_type in wanted:
+        model, name_th, name_en, _demo = POI_TYPES[poi_type]
+        rank = rank_expr(model.search_text, q)
+        dist = func.ST_Distance(model.geog, geo.here()) if geo else literal(None, type_=Float)
+        part = (
+            select(
+                literal(poi_type).label('type'),
+                model.id.label('id'),
+                name_th.label('name_th'),
+                name_en.label('name_en'),
+                Province.slug_en.label('province'),
+                model.lat.label('lat'),
+                model.lon.label('lon'),
+                rank.label('rank'),
+                dist.label('dist_m'),
+                func.length(model.search_text).label('text_len'),
+            )
+            .join(Province, Province.id == model.province_id)
+            .where(search_clause(model.search_text, q), *geo.conditions(model.geog))
+            .order_by(rank.desc(), func.length(model.search_text).asc())
+            .limit(limit)
+        )
+        if province:
+            part = part.where(Province.slug_en == province)
+        parts.append(part)
+    merged = union_all(*parts).subquery('hits')
+    stmt = (
+        select(merged)
+        .order_by(merged.c.rank.desc(), merged.c.dist_m.asc().nullslast(), merged.c.text_len.asc(), merged.c.name_th.asc())
+        .limit(limit)
+    )
+    try:
+        rows = db.execute(stmt).mappings().all()
+        return [
+            _search_item(r['type'], dict(r), int(r['rank']), float(r['dist_m']) / 1000 if r['dist_m'] is not None else None)
+            for r in rows
+        ]
+    except Exception:
+        hits = []
+        for poi_type in wanted:
+            store = getattr(demo_store, POI_TYPES[poi_type][3])
+            for row in store.select(province, q, geo):
+                rank = store.rank(q, row)
+                dist = geo.distance_km(row)
+                hits.append(((-rank, dist if dist is not None else 0, len(store.text(row)), row.get('name_th') or row.get('name') or ''), poi_type, row, rank, dist))
+        hits.sort(key=lambda h: h[0])
+        return [_search_item(poi_type, row, rank, dist) for _key, poi_type, row, rank, dist in hits[:limit]]
@@ -7,8 +7,12 @@ from sqlalchemy import create_engine, text
 from sqlalchemy.exc import SQLAlchemyError
 
 from fastapi import APIRouter, HTTPException, Query
+from starlette.concurrency import run_in_threadpool
 import time
 
+from .. import offload
+from ..textnorm import label_key
+
 router = APIRouter(prefix='/api/routes', tags=['routes'])
 
 # Key -> (filename, display name)
@@ -348,19 +352,7 @@ _CACHE: Dict[str, Any] = {
 
 def _norm(s: str) -> str:
     """ทำความสะอาดข้อความชื่อจุดเริ่ม/ปลายทางให้เปรียบเทียบง่าย"""
-    if not s:
-        return ''
-    # Normalize similar to frontend
-    out = str(s)
-    out = out.replace('\u200b', '').replace('\u200c', '').replace('\u200d', '').replace('\ufeff', '')
-    for ch in ['\u2010','\u2011','\u2012','\u2013','\u2014','\u2015','\u2212','\ufe58','\ufe63','\uff0d']:
-        out = out.replace(ch, '-')
-    for ch in ['“','”','"','‘','’']:
-        out = out.replace(ch, '')
-    for ch in ['(',')','[',']','{','}','（','）']:
-        out = out.replace(ch, ' ')
-    out = ' '.join(out.split()).strip().lower()
-    return out
+    return label_key(s)
 
 
 def _build_graph(routes: List[Dict[str, Any]]):
@@ -551,8 +543,13 @@ def list_sources():
 
 
 @router.get('')
-def get_routes(source: str = Query('all', description='Source key or all')):
-    """คืนชุด route ตาม source (all = รวมทุกแหล่ง)"""
+async def get_routes(source: str = Query('all', description='Source key or all')):
+    """คืนชุด route ตาม source (all = รวมทุกแหล่ง) parse ไฟล์ใน process pool"""
+    return await offload.run_json(_collect_routes, source)
+
+
+def _collect_routes(source: str) -> List[Dict[str, Any]]:
+    """อ่าน route ทุกไฟล์ของ source (รันในโปรเซสลูกของ offload)"""
     dd = _data_dir()
     items: List[Dict[str, Any]] = []
     if source in (None, '', 'all', 'ALL'):
@@ -645,11 +642,16 @@ def _find_feature_in_aggregated_geojson(from_name: str, to_name: str) -> Optiona
 
 
 @router.get('/geojson')
-def get_geojson(from_name: str = Query(...), to_name: str = Query(...), source: str = Query('all-agg')):
-    """คืน GeoJSON ของเส้นทางเริ่ม-ปลายตามข้อมูล DB/ไฟล์ที่มี"""
-    db_feature = _get_geojson_from_db(from_name, to_name, source)
+async def get_geojson(from_name: str = Query(...), to_name: str = Query(...), source: str = Query('all-agg')):
+    """คืน GeoJSON ของเส้นทางเริ่ม-ปลายตามข้อมูล DB/ไฟล์ที่มี (ไล่ไฟล์ใน process pool เมื่อ DB ไม่มี)"""
+    db_feature = await run_in_threadpool(_get_geojson_from_db, from_name, to_name, source)
     if db_feature:
         return { 'type': 'FeatureCollection', 'features': [db_feature] }
+    return await offload.run_json(_geojson_from_files, from_name, to_name)
+
+
+def _geojson_from_files(from_name: str, to_name: str) -> Dict[str, Any]:
+    """หา GeoJSON จากไฟล์ภายนอก/aggregate (รันในโปรเซสลูกของ offload)"""
     # Try sibling-per-segment geojson next to external json
     gj_path = _try_find_geojson_for(from_name, to_name)
     if gj_path:
@@ -667,19 +669,28 @@ def get_geojson(from_name: str = Query(...), to_name: str = Query(...), source:
 
 
 @router.get('/nodes')
-def get_nodes(source: str = Query('all-agg')):
-    """คืนชื่อ node ทั้งหมดเพื่อนำไป autocomplete"""
+async def get_nodes(source: str = Query('all-agg')):
+    """คืนชื่อ node ทั้งหมดเพื่อนำไป autocomplete (graph สร้าง/cache อยู่ในโปรเซสลูกเดียวกับ search)"""
+    return await offload.run_json(_nodes, source)
+
+
+def _nodes(source: str):
     _, _, _, nodes = _get_graph_cached(source)
     return nodes
 
 
 @router.get('/search')
-def search_route(
+async def search_route(
     from_name: str = Query(...),
     to_name: str = Query(...),
     source: str = Query("all-agg"),
 ):
-    """ค้นหาเส้นทางที่เชื่อม from->to จากแหล่งข้อมูลที่เลือก"""
+    """ค้นหาเส้นทางที่เชื่อม from->to จากแหล่งข้อมูลที่เลือก (สร้าง graph/ค้นใน process pool)"""
+    return await offload.run_json(_search, from_name, to_name, source)
+
+
+def _search(from_name: str, to_name: str, source: str):
+    """ค้นเส้นทางบน graph ที่ cache ไว้ในโปรเซสลูก"""
     _, adj, label_map, _ = _get_graph_cached(source)
     sk = _find_best_key(label_map, from_name)
     ek = _find_best_key(label_map, to_name)
@@ -1,11 +1,14 @@
 """API ค้นหา agent/timeline และรายการแนะนำ"""
 from fastapi import APIRouter, Query, Depends
-from typing import List, Optional
+from fastapi.concurrency import run_in_threadpool
+from typing import Dict, List, Optional
 from sqlalchemy import select, func, or_, desc
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from ..schemas import AgentCard
-from ..db import get_db
+from ..db import get_async_db, get_db
 from ..models import Agent, AgentLog, Province
+from ..cache import cached_json, json_response_async, mark_fallback
 from .. import demo_data
 
 def _demo_agents():
@@ -17,14 +20,66 @@ router = APIRouter(prefix='/api/agents', tags=['agents'])
 FEATURED_PROVINCES = ['chiang-mai','lamphun','lampang','mae-hong-son']
 
 @router.get('/search', response_model=List[AgentCard])
-def search_agents(
+async def search_agents(
     q: str = Query(..., min_length=1),
     province: Optional[str] = None,
     limit: Optional[int] = Query(None, ge=1),
     same_hotel: bool = Query(False, alias='sameHotel'),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """ค้นหา agent ด้วยคำหลัก (กรองจังหวัดได้)"""
+    # การ์ดสร้างจาก schema อยู่แล้ว ส่ง JSON ตรง ๆ ไม่ต้อง validate ซ้ำผ่าน response_model
+    return await json_response_async(await _search_agents(q, province, limit, same_hotel, db))
+
+
+def _tag_label(poi_name: Optional[str], action: Optional[str]) -> Optional[str]:
+    """ชื่อแท็กของการ์ด: ชื่อ POI หรือชื่อ action (ตัดวงเล็บท้าย)"""
+    if poi_name:
+        return poi_name
+    label = (action or '').split('(')[0].strip()
+    return label[:40] if label else None
+
+
+def _demo_search(q: str, province: Optional[str], limit: Optional[int]) -> List[AgentCard]:
+    items = _demo_agents()
+    if province:
+        items = [a for a in items if a.get('province_slug') == province]
+    ql = q.lower()
+    items = [a for a in items if ql in ' '.join(a.get('poi_tags', [])).lower() or ql in a.get('label','').lower()]
+    if limit:
+        items = items[:limit]
+    return [AgentCard(
+        id=a['id'],
+        title=a.get('label', f"Agent #{a['id']}"),
+        style=a.get('style','mix'),
+        total_km=float(a.get('total_km',0)),
+        days=a.get('days',0),
+        poi_tags=a.get('poi_tags',[]),
+        points=len(a.get('poi_tags',[])),
+        province_slug=a.get('province_slug',''),
+    ) for a in items]
+
+
+def _search_cards(rows, tag_rows) -> List[AgentCard]:
+    """ประกอบการ์ดจากแถว agent และแท็กที่จัดกลุ่มแล้ว (เรียกผ่าน run_in_threadpool)"""
+    tags: Dict[int, List[str]] = {}
+    for agent_id, pn, act in tag_rows:
+        label = _tag_label(pn, act)
+        if label:
+            tags.setdefault(agent_id, []).append(label)
+    return [AgentCard(
+        id=agent.id,
+        title=agent.label or f'Agent #{agent.id}',
+        style=agent.style or 'mix',
+        total_km=float(agent.total_km or 0),
+        days=agent.days or 0,
+        poi_tags=tags.get(agent.id, []),
+        points=int(hits or 0),
+        province_slug=slug,
+    ) for agent, hits, slug, _start_hits in rows]
+
+
+async def _search_agents(q: str, province: Optional[str], limit: Optional[int], same_hotel: bool, db: AsyncSession) -> List[AgentCard]:
     like = f"%{q}%"
     # first/last log ต่อ agent (ใช้ทั้งการ boost และ filter start/end)
     boundary_log_subq = (
@@ -73,61 +128,29 @@ def search_agents(
         )
     if province:
         stmt = stmt.where(Province.slug_en == province)
+    matches = or_(AgentLog.poi_name.ilike(like), AgentLog.action.ilike(like))
     try:
-        rows = db.execute(stmt).all()
+        rows = (await db.execute(stmt)).all()
         if not rows:
             raise RuntimeError("no-agent-rows")
-    except Exception:
-        items = _demo_agents()
-        if province:
-            items = [a for a in items if a.get('province_slug') == province]
-        ql = q.lower()
-        items = [a for a in items if ql in ' '.join(a.get('poi_tags', [])).lower() or ql in a.get('label','').lower()]
-        if limit:
-            items = items[:limit]
-        if same_hotel:
-            pass
-        return [AgentCard(
-            id=a['id'],
-            title=a.get('label', f"Agent #{a['id']}"),
-            style=a.get('style','mix'),
-            total_km=float(a.get('total_km',0)),
-            days=a.get('days',0),
-            poi_tags=a.get('poi_tags',[]),
-            points=len(a.get('poi_tags',[])),
-            province_slug=a.get('province_slug',''),
-        ) for a in items]
-
-    # collect top tags per agent (distinct poi_names with highest frequency among matching logs)
-    results: List[AgentCard] = []
-    for agent, hits, slug, start_hits in rows:
-        tags_stmt = (
-            select(AgentLog.poi_name, AgentLog.action, func.count('*').label('c'))
-            .where(AgentLog.agent_id == agent.id, or_(AgentLog.poi_name.ilike(like), AgentLog.action.ilike(like)))
-            .group_by(AgentLog.poi_name, AgentLog.action)
-            .order_by(func.count('*').desc())
-            .limit(5)
+        # แท็ก 5 อันดับแรกต่อ agent (poi_name/action ที่ตรงคำค้นบ่อยสุด) ของทุก agent ใน query เดียว
+        counted = (
+            select(
+                AgentLog.agent_id, AgentLog.poi_name, AgentLog.action,
+                func.row_number().over(partition_by=AgentLog.agent_id, order_by=func.count('*').desc()).label('rank'),
+            )
+            .where(AgentLog.agent_id.in_([agent.id for agent, *_ in rows]), matches)
+            .group_by(AgentLog.agent_id, AgentLog.poi_name, AgentLog.action)
+            .subquery()
         )
-        tag_rows = db.execute(tags_stmt).all()
-        poi_tags = []
-        for pn, act, _c in tag_rows:
-            if pn:
-                poi_tags.append(pn)
-            else:
-                label = (act or '').split('(')[0].strip()
-                if label:
-                    poi_tags.append(label[:40])
-        results.append(AgentCard(
-            id=agent.id,
-            title=agent.label or f'Agent #{agent.id}',
-            style=agent.style or 'mix',
-            total_km=float(agent.total_km or 0),
-            days=agent.days or 0,
-            poi_tags=poi_tags,
-            points=int(hits or 0),
-            province_slug=slug,
-        ))
-    return results
+        tag_rows = (await db.execute(
+            select(counted.c.agent_id, counted.c.poi_name, counted.c.action)
+            .where(counted.c.rank <= 5)
+            .order_by(counted.c.agent_id, counted.c.rank)
+        )).all()
+    except Exception:
+        return await run_in_threadpool(_demo_search, q, province, limit)
+    return await run_in_threadpool(_search_cards, rows, tag_rows)
 
 @router.get('/suggest')
 def suggest_poi(q: str = Query(..., min_length=1), limit: int = 8, db: Session = Depends(get_db)):
@@ -155,7 +178,12 @@ def suggest_poi(q: str = Query(..., min_length=1), limit: int = 8, db: Session =
 
 @router.get('/featured', response_model=List[AgentCard])
 def featured_agents(limit: int = 12, db: Session = Depends(get_db)):
-    """ดึง agent แนะนำสำหรับ 4 จังหวัดหลัก"""
+    """ดึง agent แนะนำสำหรับ 4 จังหวัดหลัก (cache ไว้จนกว่า ETL รอบใหม่)"""
+    return cached_json(db, ('featured', limit), lambda: _featured_cards(limit, db))
+
+
+def _featured_cards(limit: int, db: Session) -> List[AgentCard]:
+    """สร้างการ์ด agent แนะนำจาก DB (fallback เป็น demo)"""
     stmt = (
         select(Agent, Province.slug_en)
         .join(Province, Province.id == Agent.province_id)
@@ -168,6 +196,7 @@ def featured_agents(limit: int = 12, db: Session = Depends(get_db)):
         if not rows:
             raise RuntimeError("no-agent-rows")
     except Exception:
+        mark_fallback()
         items = [a for a in _demo_agents() if a.get('province_slug') in FEATURED_PROVINCES][:limit]
         return [AgentCard(
             id=a['id'],
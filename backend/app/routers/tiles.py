@@ -0,0 +1,49 @@
+"""API vector tile (MVT) ของ POI และเส้นทาง สำหรับแผนที่ฝั่ง client"""
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy.orm import Session
+
+from ..db import get_db
+from ..cache import data_version
+from .. import tiles
+
+router = APIRouter(prefix='/api/tiles', tags=['tiles'])
+
+
+@router.get('/{layer}/{z}/{x}/{y}.mvt')
+def get_tile(layer: str, z: int, x: int, y: int, request: Request, db: Session = Depends(get_db)):
+    """
+    คืน tile ของ layer ที่ z/x/y (อ่านจาก cache บนดิสก์ถ้ามี) tile ว่างตอบ 204
+    URL ไม่มี version: browser ต้อง revalidate ทุกครั้ง (no-cache) ด้วย ETag ของ data version ได้ 304 จนกว่า ETL รอบใหม่
+    """
+    if layer not in tiles.LAYER_SQL:
+        raise HTTPException(status_code=404, detail='Unknown layer')
+    if not tiles.valid_tile(z, x, y):
+        raise HTTPException(status_code=400, detail='Invalid tile coordinates')
+    version = data_version(db)
+    if version is None:
+        headers = {'Cache-Control': 'no-store'}
+    else:
+        headers = {'Cache-Control': 'public, no-cache', 'ETag': tiles.etag(version)}
+        if _etag_matches(request.headers.get('if-none-match'), headers['ETag']):
+            return Response(status_code=304, headers=headers)
+    try:
+        data = tiles.get_tile(db, version, layer, z, x, y)
+    except Exception:
+        # ไม่มี demo fallback สำหรับ tile เพราะต้องใช้ PostGIS สร้าง
+        db.rollback()
+        raise HTTPException(status_code=503, detail='Vector tiles are unavailable without PostGIS')
+    if not data:
+        return Response(status_code=204, headers=headers)
+    return Response(content=data, media_type=tiles.MEDIA_TYPE, headers=headers)
+
+
+def _etag_matches(if_none_match, etag: str) -> bool:
+    """เทียบ If-None-Match แบบ weak (ไม่สน W/ นำหน้า) รองรับหลายค่าและ *"""
+    if not if_none_match:
+        return False
+    bare = etag[2:] if etag.startswith('W/') else etag
+    for tag in if_none_match.split(','):
+        tag = tag.strip()
+        if tag == '*' or (tag[2:] if tag.startswith('W/') else tag) == bare:
+            return True
+    return False
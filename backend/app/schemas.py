@@ -1,6 +1,6 @@
 """Pydantic schema สำหรับ serialize/validate response ของ API"""
-from pydantic import BaseModel
-from typing import Optional, List
+from pydantic import BaseModel, Field
+from typing import Optional, List, Dict
 
 class LatLng(BaseModel):
     """คู่พิกัด lat/lon"""
@@ -42,3 +42,9 @@ class AgentDetail(BaseModel):
     visited_pois: Optional[List[str]] = None
     polyline: Optional[List[LatLng]] = None
     stops: Optional[List[AgentStop]] = None
+
+class AgentBatchRequest(BaseModel):
+    """คำขอรายละเอียด agent หลายตัวพร้อมกัน (เลือกวันราย id และลดความละเอียดเส้นได้)"""
+    ids: List[int] = Field(..., min_length=1, max_length=20)
+    days: Optional[Dict[int, Optional[int]]] = None
+    simplify: Optional[float] = Field(None, ge=0, description='tolerance (องศา) สำหรับ ST_Simplify')
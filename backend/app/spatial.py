@@ -0,0 +1,234 @@
+"""เครื่องมือเชิงพื้นที่: grid index ในหน่วยความจำ (fallback เมื่อไม่มี PostGIS) และตัวกรอง bbox/รัศมีของ list endpoint"""
+import heapq
+import math
+from typing import Dict, Generic, Iterable, List, Optional, Tuple, TypeVar
+
+from sqlalchemy import func, literal_column
+
+T = TypeVar('T')
+
+EARTH_RADIUS_KM = 6371.0
+KM_PER_DEG_LAT = 111.32
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """ระยะทางบนผิวโลกระหว่างสองพิกัด (กิโลเมตร)"""
+    p1, p2 = math.radians(lat1), math.radians(lat2)
+    dlat = p2 - p1
+    dlon = math.radians(lon2 - lon1)
+    h = math.sin(dlat / 2) ** 2 + math.cos(p1) * math.cos(p2) * math.sin(dlon / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(h)))
+
+
+class GridIndex(Generic[T]):
+    """
+    แบ่งพิกัดเป็นช่องขนาด cell_deg องศา แล้วเก็บรายการในแต่ละช่อง
+    ค้นหา k จุดใกล้สุดโดยไล่ช่องเป็นวงรอบจุดค้นหา หยุดเมื่อวงถัดไปไกลกว่าผลลัพธ์ลำดับที่ k
+    """
+
+    # รัศมีค้นหาสูงสุดของ nearest เมื่อไม่ได้ระบุ radius_km (จำกัดงานของ query ที่อยู่ไกลจากข้อมูลมาก)
+    MAX_RADIUS_KM = 1000.0
+
+    def __init__(self, items: Iterable[Tuple[float, float, T]], cell_deg: float = 0.05):
+        self.cell_deg = cell_deg
+        self.cells: Dict[Tuple[int, int], List[Tuple[float, float, T]]] = {}
+        self.size = 0
+        for lat, lon, item in items:
+            if lat is None or lon is None:
+                continue
+            lat, lon = float(lat), float(lon)
+            # พิกัด (0,0) มาจากข้อมูลเสีย ไม่นำมาทำดัชนี
+            if abs(lat) < 1e-6 and abs(lon) < 1e-6:
+                continue
+            self.cells.setdefault(self._cell(lat, lon), []).append((lat, lon, item))
+            self.size += 1
+        if self.cells:
+            xs = [c[0] for c in self.cells]
+            ys = [c[1] for c in self.cells]
+            self.bounds = (min(xs), min(ys), max(xs), max(ys))
+        else:
+            self.bounds = (0, 0, -1, -1)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _cell(self, lat: float, lon: float) -> Tuple[int, int]:
+        return int(math.floor(lon / self.cell_deg)), int(math.floor(lat / self.cell_deg))
+
+    def _ring(self, cx: int, cy: int, r: int, box: Tuple[int, int, int, int]):
+        """ช่องบนขอบวงที่ r รอบ (cx, cy) เฉพาะที่อยู่ในกรอบช่อง box (ไม่ไล่ช่องนอกกรอบข้อมูล)"""
+        x0, y0, x1, y1 = box
+        xs = range(max(cx - r, x0), min(cx + r, x1) + 1)
+        ys = range(max(cy - r + 1, y0), min(cy + r - 1, y1) + 1)
+        if y0 <= cy - r <= y1:
+            for x in xs:
+                yield x, cy - r
+        if r and y0 <= cy + r <= y1:
+            for x in xs:
+                yield x, cy + r
+        if x0 <= cx - r <= x1:
+            for y in ys:
+                yield cx - r, y
+        if r and x0 <= cx + r <= x1:
+            for y in ys:
+                yield cx + r, y
+
+    def _search_box(self, lat: float, lon: float, radius_km: float) -> Optional[Tuple[int, int, int, int]]:
+        """กรอบช่องที่ต้องค้น: กรอบข้อมูลตัดด้วยกรอบรอบรัศมีค้นหา (None ถ้าไม่ซ้อนกัน)"""
+        x0, y0, x1, y1 = self.bounds
+        dlat = radius_km / KM_PER_DEG_LAT
+        y0 = max(y0, int(math.floor((lat - dlat) / self.cell_deg)))
+        y1 = min(y1, int(math.floor((lat + dlat) / self.cell_deg)))
+        # ความกว้างองศา lon ใช้ละติจูดที่ไกลศูนย์สูตรสุดของกรอบ ใกล้ขั้วโลกกว้างเกิน 180 องศาก็ไม่ตัดแกน lon
+        cos_edge = math.cos(math.radians(min(90.0, abs(lat) + dlat)))
+        if cos_edge > 0 and radius_km / (KM_PER_DEG_LAT * cos_edge) < 180:
+            dlon = radius_km / (KM_PER_DEG_LAT * cos_edge)
+            x0 = max(x0, int(math.floor((lon - dlon) / self.cell_deg)))
+            x1 = min(x1, int(math.floor((lon + dlon) / self.cell_deg)))
+        if x0 > x1 or y0 > y1:
+            return None
+        return x0, y0, x1, y1
+
+    def nearest(self, lat: float, lon: float, k: int = 5, radius_km: Optional[float] = None) -> List[Tuple[float, T]]:
+        """
+        คืน [(ระยะกิโลเมตร, item)] ของ k จุดที่ใกล้สุด (ไม่เกิน radius_km หรือ MAX_RADIUS_KM ถ้าไม่กำหนด) เรียงใกล้ไปไกล
+        ไล่เฉพาะวงที่ตัดกับกรอบข้อมูล ตั้งแต่วงแรกที่แตะกรอบจนวงที่คลุมกรอบทั้งหมด
+        """
+        if not self.cells or k <= 0:
+            return []
+        radius_km = min(radius_km, self.MAX_RADIUS_KM) if radius_km is not None else self.MAX_RADIUS_KM
+        box = self._search_box(lat, lon, radius_km)
+        if box is None:
+            return []
+        cx, cy = self._cell(lat, lon)
+        x0, y0, x1, y1 = box
+        min_r = max(x0 - cx, cx - x1, y0 - cy, cy - y1, 0)
+        max_r = max(abs(cx - x0), abs(cx - x1), abs(cy - y0), abs(cy - y1))
+        best: List[Tuple[float, int, T]] = []  # max-heap ผ่านค่าลบ
+        seq = 0
+        for r in range(min_r, max_r + 1):
+            # ระยะต่ำสุดของช่องในวงที่ r (ใช้ความกว้างองศา lon ที่ละติจูดสูงสุดของวง เพื่อไม่ให้ประเมินเกิน)
+            widest_lat = min(89.0, abs(lat) + (r + 1) * self.cell_deg)
+            lower = (r - 1) * self.cell_deg * KM_PER_DEG_LAT * math.cos(math.radians(widest_lat)) if r > 0 else 0.0
+            if lower > radius_km:
+                break
+            if len(best) >= k and lower > -best[0][0]:
+                break
+            for cell in self._ring(cx, cy, r, box):
+                for plat, plon, item in self.cells.get(cell, ()):
+                    d = haversine_km(lat, lon, plat, plon)
+                    if d > radius_km:
+                        continue
+                    seq += 1
+                    if len(best) < k:
+                        heapq.heappush(best, (-d, seq, item))
+                    elif d < -best[0][0]:
+                        heapq.heapreplace(best, (-d, seq, item))
+        return [(-nd, item) for nd, _seq, item in sorted(best, key=lambda t: (-t[0], t[1]))]
+
+    def within(self, min_lon: float, min_lat: float, max_lon: float, max_lat: float) -> List[Tuple[float, float, T]]:
+        """คืน (lat, lon, item) ทุกจุดที่อยู่ในกรอบ bbox"""
+        x0, y0 = self._cell(min_lat, min_lon)
+        x1, y1 = self._cell(max_lat, max_lon)
+        x0, y0 = max(x0, self.bounds[0]), max(y0, self.bounds[1])
+        x1, y1 = min(x1, self.bounds[2]), min(y1, self.bounds[3])
+        out: List[Tuple[float, float, T]] = []
+        for x in range(x0, x1 + 1):
+            for y in range(y0, y1 + 1):
+                for plat, plon, item in self.cells.get((x, y), ()):
+                    if min_lat <= plat <= max_lat and min_lon <= plon <= max_lon:
+                        out.append((plat, plon, item))
+        return out
+
+
+def parse_bbox(raw: str) -> Tuple[float, float, float, float]:
+    """แปลง 'minLon,minLat,maxLon,maxLat' เป็น tuple (ValueError ถ้ารูปแบบผิด)"""
+    parts = [float(p) for p in raw.split(',')]
+    if len(parts) != 4:
+        raise ValueError('bbox must be minLon,minLat,maxLon,maxLat')
+    min_lon, min_lat, max_lon, max_lat = parts
+    if min_lon > max_lon or min_lat > max_lat:
+        raise ValueError('bbox min must not exceed max')
+    if not (-180 <= min_lon <= 180 and -180 <= max_lon <= 180 and -90 <= min_lat <= 90 and -90 <= max_lat <= 90):
+        raise ValueError('bbox out of range')
+    return min_lon, min_lat, max_lon, max_lat
+
+
+def parse_latlon(raw: str) -> Tuple[float, float]:
+    """แปลง 'lat,lon' เป็น tuple (ValueError ถ้ารูปแบบผิด)"""
+    parts = [float(p) for p in raw.split(',')]
+    if len(parts) != 2 or not (-90 <= parts[0] <= 90 and -180 <= parts[1] <= 180):
+        raise ValueError('near must be lat,lon')
+    return parts[0], parts[1]
+
+
+class GeoFilter:
+    """ตัวกรองพื้นที่ของ list endpoint: กรอบ bbox และ/หรือรัศมีรอบจุด near ใช้ได้ทั้ง SQL (PostGIS) และข้อมูล demo"""
+
+    DEFAULT_RADIUS_KM = 5.0
+
+    def __init__(self, bbox: Optional[str] = None, near: Optional[str] = None, radius_km: Optional[float] = None):
+        self.bbox = parse_bbox(bbox) if bbox else None
+        self.near = parse_latlon(near) if near else None
+        if radius_km is not None and radius_km <= 0:
+            raise ValueError('radius_km must be positive')
+        self.radius_km = radius_km if radius_km is not None else self.DEFAULT_RADIUS_KM
+
+    def __bool__(self) -> bool:
+        return bool(self.bbox or self.near)
+
+    def key(self) -> tuple:
+        return (self.bbox, self.near, self.radius_km if self.near else None)
+
+    def here(self):
+        """จุด near เป็น geography (None ถ้าไม่ได้ระบุ)"""
+        if not self.near:
+            return None
+        lat, lon = self.near
+        return func.geography(func.ST_SetSRID(func.ST_MakePoint(lon, lat), literal_column('4326')))
+
+    def conditions(self, geog) -> list:
+        """เงื่อนไข bbox/รัศมีบนคอลัมน์ geog (ใช้ GiST index)"""
+        out = []
+        if self.bbox:
+            envelope = func.ST_MakeEnvelope(*self.bbox, literal_column('4326'))
+            out.append(func.ST_Intersects(geog, func.geography(envelope)))
+        if self.near:
+            out.append(func.ST_DWithin(geog, self.here(), self.radius_km * 1000))
+        return out
+
+    def apply(self, stmt, geog):
+        """เติมเงื่อนไข bbox/รัศมีให้ select และเรียงใกล้ไปไกลเมื่อมี near"""
+        stmt = stmt.where(*self.conditions(geog))
+        if self.near:
+            stmt = stmt.order_by(None).order_by(geog.op('<->')(self.here()))
+        return stmt
+
+    def distance_km(self, item: dict) -> Optional[float]:
+        if not self.near or item.get('lat') is None or item.get('lon') is None:
+            return None
+        return haversine_km(self.near[0], self.near[1], item['lat'], item['lon'])
+
+    def distance_m(self, item: dict) -> Optional[float]:
+        """ระยะเป็นเมตร หน่วยเดียวกับ <-> ของ geography ใน SQL (ค่า sort/cursor ของข้อมูล demo ใช้ข้ามกับ cursor จาก DB ได้)"""
+        km = self.distance_km(item)
+        return None if km is None else km * 1000
+
+    def match(self, item: dict) -> bool:
+        lat, lon = item.get('lat'), item.get('lon')
+        if lat is None or lon is None:
+            return False
+        if self.bbox:
+            min_lon, min_lat, max_lon, max_lat = self.bbox
+            if not (min_lat <= lat <= max_lat and min_lon <= lon <= max_lon):
+                return False
+        if self.near and self.distance_km(item) > self.radius_km:
+            return False
+        return True
+
+    def filter_items(self, items: List[dict]) -> List[dict]:
+        """กรองรายการ demo ตามพื้นที่ และเรียงตามระยะเมื่อมี near"""
+        items = [i for i in items if self.match(i)]
+        if self.near:
+            items.sort(key=self.distance_km)
+        return items
@@ -0,0 +1,164 @@
+"""heuristic หาจุดแวะ (stops) ของ agent จาก log + geometry ใช้ร่วมกันทั้งตอน ETL และ fallback ตอน request"""
+import re
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# (poi_name, action, lat, lon) เรียงตามลำดับ log
+LogTuple = Tuple[Optional[str], Optional[str], Optional[float], Optional[float]]
+# (target, geometry dict แบบ GeoJSON)
+GeomTuple = Tuple[Optional[str], dict]
+
+START_HOTEL_RE = re.compile(r"เริ่มทริป.*เริ่มจากโรงแรม[:\s]+([^(\s]+.*?)(?:\sแบต|\(|$)")
+
+
+def polyline_points(geoms: Iterable[GeomTuple]) -> List[Tuple[float, float]]:
+    """ต่อพิกัดของทุก segment เป็น (lat, lon) เดียว ตัดจุด (0,0) และจุดซ้ำติดกัน"""
+    points: List[Tuple[float, float]] = []
+    for _target, data in geoms:
+        coords = data.get('coordinates') or []
+        for pair in coords:
+            if not isinstance(pair, (list, tuple)) or len(pair) < 2 or isinstance(pair[0], (list, tuple)):
+                continue
+            lon, lat = float(pair[0] or 0), float(pair[1] or 0)
+            # Skip invalid/null-island coordinates that sometimes sneak in from bad data
+            if abs(lat) < 1e-6 and abs(lon) < 1e-6:
+                continue
+            if not points or points[-1] != (lat, lon):
+                points.append((lat, lon))
+    return points
+
+
+def start_hotel_name(logs: Sequence[LogTuple]) -> Optional[str]:
+    """ดึงชื่อโรงแรมเริ่มทริปจาก log แรกที่มี poi_name หรือข้อความ 'เริ่มจากโรงแรม'"""
+    for pn, act, _lat, _lon in logs:
+        if pn:
+            return pn
+        if act:
+            m = START_HOTEL_RE.search(act)
+            if m:
+                return m.group(1).strip()
+    return None
+
+
+def _route_endpoint(data: dict) -> Tuple[Optional[float], Optional[float]]:
+    """คืน (lat, lon) ของปลายทาง segment จาก geometry หลายรูปแบบ"""
+    coords = data.get('coordinates')
+    if not coords:
+        return None, None
+    lat = lon = None
+    if data.get('type') == 'LineString' and isinstance(coords, list):
+        last = coords[-1]
+        if isinstance(last, list) and len(last) >= 2:
+            lon, lat = last[0], last[1]
+    elif data.get('type') == 'Point' and isinstance(coords, list) and len(coords) >= 2:
+        lon, lat = coords[0], coords[1]
+    elif isinstance(coords, list) and len(coords) and isinstance(coords[0], list):
+        last = coords[-1]
+        if isinstance(last, list) and len(last):
+            candidate = last[-1] if isinstance(last[0], list) else last
+            if len(candidate) >= 2:
+                lon, lat = candidate[0], candidate[1]
+    return lat, lon
+
+
+def build_stops(
+    logs: Sequence[LogTuple],
+    geoms: Sequence[GeomTuple],
+    polyline: Sequence[Tuple[float, float]],
+    resolve: Callable[[Optional[str]], Optional[dict]],
+) -> List[Dict]:
+    """รวมจุดแวะจาก route + timeline เพื่อแสดง pin บนแผนที่ คืน dict(label, lat, lon, source) ตามลำดับ"""
+    poi_names = [pn for pn, _act, _lat, _lon in logs if pn]
+    log_points = [(pn, lat, lon) for pn, _act, lat, lon in logs if lat is not None and lon is not None]
+    start_name = start_hotel_name(logs)
+    if start_name:
+        poi_names = list(dict.fromkeys([start_name] + poi_names))  # preserve order, avoid dup
+
+    prefetch = getattr(resolve, 'prefetch', None)
+    if prefetch:
+        prefetch(poi_names + [target for target, _data in geoms if target])
+    stops: List[Dict] = []
+    seen = set()
+    norm_label = lambda v: (v or '').strip().lower()
+
+    def add_stop(label: str, lat_val: float, lon_val: float, source: str):
+        # Guard against placeholder (0,0) coordinates to avoid null-island markers
+        if abs(float(lat_val or 0)) < 1e-6 and abs(float(lon_val or 0)) < 1e-6:
+            return
+        key = (round(lat_val, 6), round(lon_val, 6))
+        if key in seen:
+            return
+        seen.add(key)
+        stops.append({'label': label, 'lat': float(lat_val), 'lon': float(lon_val), 'source': source})
+
+    # 1) ใช้ visited_pois (timeline) หาในตาราง POI จริงก่อน เพื่อให้ตำแหน่งตรงไฟล์ CSV
+    for pn in poi_names:
+        match = resolve(pn)
+        if not match:
+            continue
+        add_stop(match['label'] or pn, match['lat'], match['lon'], 'poi')
+
+    # 2) ตำแหน่งจาก geometry ของเส้นทาง (agent_routes)
+    for target, data in geoms:
+        if not data.get('coordinates'):
+            continue
+        lat, lon = _route_endpoint(data)
+        fallback_name = poi_names[len(stops)] if len(poi_names) > len(stops) else None
+        preferred_label = target or fallback_name
+
+        poi_match = resolve(preferred_label) or resolve(fallback_name)
+        if poi_match:
+            label = poi_match['label']
+            lat = poi_match['lat']
+            lon = poi_match['lon']
+        else:
+            label = preferred_label or f'จุดที่ {len(stops) + 1}'
+
+        if lat is None or lon is None:
+            continue
+        add_stop(label, float(lat), float(lon), 'route')
+
+    # 3) เติมจาก AgentLog ที่มี lat/lon เพื่อครอบคลุมกรณีชื่อไม่เจอในตาราง
+    for pn, lat, lon in log_points:
+        add_stop(pn or f'จุดที่ {len(stops) + 1}', float(lat), float(lon), 'log')
+
+    # 4) ถ้ายังไม่เจอหมุดเริ่มทริป (โรงแรม) เลย ให้ fallback ใช้พิกัดจุดแรกของ polyline
+    if start_name:
+        start_norm = norm_label(start_name)
+        start_already = any(norm_label(s['label']) == start_norm for s in stops if s.get('label'))
+        if not start_already and polyline:
+            lat0, lon0 = polyline[0]
+            add_stop(start_name, float(lat0), float(lon0), 'start')
+
+    return stops
+
+
+class MemoryPoiResolver:
+    """
+    ค้นหา POI ตามชื่อจากรายการที่โหลดไว้ในหน่วยความจำ (ใช้ตอน ETL)
+    ลำดับเหมือน query ตอน runtime: ตรงชื่อแบบไม่สนตัวพิมพ์ก่อน แล้วค่อยหาแบบ substring ตามลำดับตาราง
+    """
+
+    def __init__(self, tables: Sequence[Sequence[Tuple[str, float, float]]]):
+        self.tables = [[(str(label), float(lat), float(lon)) for label, lat, lon in rows if label and lat is not None and lon is not None] for rows in tables]
+        self.exact: Dict[str, dict] = {}
+        for rows in self.tables:
+            for label, lat, lon in rows:
+                self.exact.setdefault(label.lower(), {'label': label, 'lat': lat, 'lon': lon})
+        self.memo: Dict[str, Optional[dict]] = {}
+
+    def __call__(self, name: Optional[str]) -> Optional[dict]:
+        if not name:
+            return None
+        key = name.strip().lower()
+        if not key:
+            return None
+        if key in self.memo:
+            return self.memo[key]
+        hit = self.exact.get(key)
+        if hit is None:
+            for rows in self.tables:
+                hit = next(({'label': label, 'lat': lat, 'lon': lon} for label, lat, lon in rows if key in label.lower()), None)
+                if hit:
+                    break
+        self.memo[key] = hit
+        return hit
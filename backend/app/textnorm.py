@@ -0,0 +1,89 @@
+"""normalize ข้อความสำหรับค้นหา: ใช้ทั้งตอน ETL (คอลัมน์ search_text) และตอนแปลงคำค้นของผู้ใช้"""
+import re
+import unicodedata
+from typing import Optional
+
+from sqlalchemy import case, true
+
+# ตัวอักษรความกว้างศูนย์ที่มักติดมากับข้อความไทยจากเว็บ/CSV
+_ZERO_WIDTH = dict.fromkeys(map(ord, '\u200b\u200c\u200d\u2060\ufeff'), None)
+_SPACE_RE = re.compile(r'\s+')
+# ตัวคั่นระหว่างชื่อไทย/อังกฤษใน search_text กันไม่ให้คำค้นจับคร่อมสองชื่อ
+SEPARATOR = '|'
+
+
+def search_key(value: Optional[str]) -> str:
+    """ตัวพิมพ์เล็ก ตัด zero-width/ช่องว่าง และเครื่องหมายเน้นเสียงละติน (ไม่แตะสระ/วรรณยุกต์ไทย)"""
+    if not value or value != value:  # None/ว่าง/NaN จาก pandas
+        return ''
+    out = unicodedata.normalize('NFD', str(value).translate(_ZERO_WIDTH))
+    out = ''.join(ch for ch in out if not '\u0300' <= ch <= '\u036f')
+    out = unicodedata.normalize('NFC', out).lower()
+    return _SPACE_RE.sub('', out)
+
+
+def search_text(*parts: Optional[str]) -> str:
+    """รวมชื่อหลายภาษาเป็นค่าเดียวสำหรับคอลัมน์ search_text (ใช้กับ pg_trgm GIN index)"""
+    return SEPARATOR.join(k for k in (search_key(p) for p in parts) if k)
+
+
+def _escape_like(key: str) -> str:
+    return key.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+def like_pattern(q: Optional[str]) -> Optional[str]:
+    """แปลงคำค้นเป็น pattern '%...%' สำหรับ LIKE บน search_text (escape % _ \\) คืน None ถ้าว่าง"""
+    key = search_key(q).replace(SEPARATOR, '')
+    if not key:
+        return None
+    return '%' + _escape_like(key) + '%'
+
+
+def search_clause(column, q: Optional[str]):
+    """เงื่อนไข LIKE บนคอลัมน์ search_text (ใช้ GIN gin_trgm_ops ได้) ถ้าคำค้นว่างหลัง normalize จะไม่กรอง"""
+    pattern = like_pattern(q)
+    if pattern is None:
+        return true()
+    return column.like(pattern, escape='\\')
+
+
+def search_match(q: Optional[str], *values: Optional[str]) -> bool:
+    """เทียบคำค้นกับข้อมูลในหน่วยความจำ (fallback) ด้วย normalize แบบเดียวกับ search_text"""
+    key = search_key(q).replace(SEPARATOR, '')
+    return not key or key in search_text(*values)
+
+
+def rank_expr(column, q: Optional[str]):
+    """คะแนนความตรงใน SQL: 2 = ชื่อใดชื่อหนึ่งขึ้นต้นด้วยคำค้น, 1 = มีคำค้นอยู่กลางชื่อ (ตรงกับ match_rank)"""
+    key = _escape_like(search_key(q).replace(SEPARATOR, ''))
+    prefix = column.like(key + '%', escape='\\') | column.like('%' + SEPARATOR + key + '%', escape='\\')
+    return case((prefix, 2), else_=1)
+
+
+def text_rank(q: Optional[str], text: str) -> int:
+    """คะแนนความตรงของคำค้นกับค่า search_text ที่คำนวณไว้แล้ว (0 = ไม่ตรง)"""
+    key = search_key(q).replace(SEPARATOR, '')
+    if not key or key not in text:
+        return 0
+    return 2 if any(part.startswith(key) for part in text.split(SEPARATOR)) else 1
+
+
+def match_rank(q: Optional[str], *values: Optional[str]) -> int:
+    """คะแนนความตรงของข้อมูลในหน่วยความจำ แบบเดียวกับ rank_expr (0 = ไม่ตรง)"""
+    return text_rank(q, search_text(*values))
+
+
+_DASHES = dict.fromkeys(map(ord, '‐‑‒–—―−﹘﹣－'), '-')
+_QUOTES = dict.fromkeys(map(ord, '“”"‘’'), None)
+_BRACKETS = dict.fromkeys(map(ord, '()[]{}（）'), ' ')
+
+
+def label_key(value: Optional[str]) -> str:
+    """
+    normalize ชื่อสถานที่สำหรับจับคู่ชื่อจุดในเส้นทาง (แบบเดียวกับ frontend): ตัด zero-width/อัญประกาศ
+    ขีดทุกแบบเป็น '-' วงเล็บเป็นช่องว่าง ยุบช่องว่าง และตัวพิมพ์เล็ก
+    """
+    if not value:
+        return ''
+    out = str(value).translate(_ZERO_WIDTH).translate(_DASHES).translate(_QUOTES).translate(_BRACKETS)
+    return ' '.join(out.split()).lower()
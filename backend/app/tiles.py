@@ -0,0 +1,202 @@
+"""สร้าง Mapbox Vector Tile (MVT) จาก PostGIS พร้อม cache บนดิสก์แยกตาม data version"""
+import math
+import os
+import shutil
+import tempfile
+import threading
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+from sqlalchemy import text
+
+from .config import TILE_CACHE_DIR
+
+# layer -> SQL ที่คืนแถว (geom ใน EPSG:3857 ผ่าน ST_AsMVTGeom + attribute) ภายใน tile :z/:x/:y
+# จุด POI ใช้คอลัมน์ geog (GiST) ส่วนเส้นทางใช้ geom (GiST) กรองด้วย && กับกรอบ tile
+_POINT_SQL = """
+    SELECT ST_AsMVTGeom(ST_Transform(t.geog::geometry, 3857), b.env) AS geom,
+           t.id, {name} AS name, p.slug_en AS province{extra}
+    FROM {table} t
+    JOIN provinces p ON p.id = t.province_id, b
+    WHERE t.geog && b.env_geog
+"""
+
+# layer จุด POI -> (ตาราง, คอลัมน์ชื่อ, attribute เพิ่มเติม)
+_POINT_LAYERS: Dict[str, Tuple[str, str, str]] = {
+    'chargers': ('chargers', 't.name', ', t.type, t.kw::float8 AS kw'),
+    'attractions': ('attractions', 't.name_th', ', t.kind'),
+    'food': ('foods', 't.name_th', ''),
+    'cafes': ('cafes', 't.name_th', ''),
+    'hotels': ('hotels', 't.name_th', ', t.stars'),
+}
+
+LAYER_SQL: Dict[str, str] = {
+    **{
+        layer: _POINT_SQL.format(table=table, name=name, extra=extra)
+        for layer, (table, name, extra) in _POINT_LAYERS.items()
+    },
+    'agent_routes': """
+        SELECT ST_AsMVTGeom(ST_Transform(r.geom, 3857), b.env) AS geom,
+               r.agent_id, r.day, r.target
+        FROM agent_routes r, b
+        WHERE r.geom && b.env_4326
+    """,
+    'route_geoms': """
+        SELECT ST_AsMVTGeom(ST_Transform(r.geom, 3857), b.env) AS geom,
+               r.province, r.from_name, r.to_name
+        FROM route_geoms r, b
+        WHERE r.geom && b.env_4326
+    """,
+}
+
+MEDIA_TYPE = 'application/vnd.mapbox-vector-tile'
+MAX_ZOOM = 22
+
+
+def valid_tile(z: int, x: int, y: int) -> bool:
+    return 0 <= z <= MAX_ZOOM and 0 <= x < 2 ** z and 0 <= y < 2 ** z
+
+
+def render_tile(conn, layer: str, z: int, x: int, y: int) -> bytes:
+    """ให้ PostGIS สร้าง tile ของ layer (bytes ว่างถ้าไม่มี feature ใน tile)"""
+    sql = f"""
+        WITH b AS (
+            SELECT ST_TileEnvelope(:z, :x, :y) AS env,
+                   ST_Transform(ST_TileEnvelope(:z, :x, :y), 4326) AS env_4326,
+                   ST_Transform(ST_TileEnvelope(:z, :x, :y), 4326)::geography AS env_geog
+        ),
+        mvt AS ({LAYER_SQL[layer]})
+        SELECT ST_AsMVT(mvt.*, :layer, 4096, 'geom') FROM mvt WHERE mvt.geom IS NOT NULL
+    """
+    data = conn.execute(text(sql), {'z': z, 'x': x, 'y': y, 'layer': layer}).scalar()
+    return bytes(data or b'')
+
+
+def tile_path(version, layer: str, z: int, x: int, y: int) -> str:
+    return os.path.join(TILE_CACHE_DIR, f'v{version}', layer, str(z), str(x), f'{y}.mvt')
+
+
+def read_cached(version, layer: str, z: int, x: int, y: int) -> Optional[bytes]:
+    try:
+        with open(tile_path(version, layer, z, x, y), 'rb') as fh:
+            return fh.read()
+    except OSError:
+        return None
+
+
+def write_cached(version, layer: str, z: int, x: int, y: int, data: bytes) -> None:
+    """เขียน tile ลงดิสก์แบบ atomic (เขียนไฟล์ชั่วคราวแล้ว rename) ให้หลาย worker เขียนพร้อมกันได้"""
+    path = tile_path(version, layer, z, x, y)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        with os.fdopen(fd, 'wb') as fh:
+            fh.write(data)
+        os.replace(tmp, path)
+    except OSError:
+        # cache เป็นแค่ส่วนเสริม เขียนไม่ได้ก็ยังตอบ tile ได้
+        pass
+
+
+def etag(version) -> str:
+    """ETag ของ tile ใน data version นี้ (URL แยก tile อยู่แล้ว; weak เพราะ body อาจถูกบีบอัด)"""
+    return f'W/"v{version}"'
+
+
+def get_tile(conn, version, layer: str, z: int, x: int, y: int) -> bytes:
+    """อ่าน tile จาก cache ถ้ามี ไม่มีก็ render แล้วเก็บไว้ (ไม่รู้ version ก็ render สดไม่ลงดิสก์)"""
+    if version is None:
+        return render_tile(conn, layer, z, x, y)
+    _prune_once(version)
+    data = read_cached(version, layer, z, x, y)
+    if data is None:
+        data = render_tile(conn, layer, z, x, y)
+        write_cached(version, layer, z, x, y, data)
+    return data
+
+
+_PRUNED = {'version': None}
+_PRUNE_LOCK = threading.Lock()
+
+
+def _prune_once(version) -> None:
+    """ลบ cache ของ version เก่าครั้งเดียวต่อ version ที่ process นี้เห็น (ไม่ต้องรอ scripts/seed_tiles.py)"""
+    with _PRUNE_LOCK:
+        if _PRUNED['version'] == version:
+            return
+        _PRUNED['version'] = version
+    prune(version)
+
+
+def _older(name: str, keep: int) -> bool:
+    try:
+        return int(name[1:]) < keep
+    except ValueError:
+        # vNone จาก cache รุ่นก่อน หรือชื่ออื่นที่ไม่ใช่เลข version
+        return True
+
+
+def prune(keep_version) -> None:
+    """
+    ลบ cache ของ data version ที่เก่ากว่า keep_version
+    ไม่แตะ version ที่ใหม่กว่า: worker ที่ยังเห็น version เดิม (ภายใน DATA_VERSION_POLL_SEC) ต้องไม่ลบของ worker ที่เห็น version ใหม่แล้ว
+    """
+    if keep_version is None:
+        return
+    try:
+        names = os.listdir(TILE_CACHE_DIR)
+    except OSError:
+        return
+    for name in names:
+        if name.startswith('v') and _older(name, int(keep_version)):
+            shutil.rmtree(os.path.join(TILE_CACHE_DIR, name), ignore_errors=True)
+
+
+def _tile_range(bounds: Tuple[float, float, float, float], z: int) -> Iterator[Tuple[int, int]]:
+    """ไล่ (x, y) ของทุก tile ที่ซ้อนทับกรอบ (minLon, minLat, maxLon, maxLat) ที่ซูม z"""
+    min_lon, min_lat, max_lon, max_lat = bounds
+    n = 2 ** z
+
+    def to_xy(lat: float, lon: float) -> Tuple[int, int]:
+        lat = max(-85.05112878, min(85.05112878, lat))
+        x = int((lon + 180.0) / 360.0 * n)
+        y = int((1.0 - math.asinh(math.tan(math.radians(lat))) / math.pi) / 2.0 * n)
+        return min(max(x, 0), n - 1), min(max(y, 0), n - 1)
+
+    x0, y0 = to_xy(max_lat, min_lon)
+    x1, y1 = to_xy(min_lat, max_lon)
+    for x in range(x0, x1 + 1):
+        for y in range(y0, y1 + 1):
+            yield x, y
+
+
+def data_bounds(conn) -> Optional[Tuple[float, float, float, float]]:
+    """กรอบครอบข้อมูลทั้งหมด (POI ทุก layer + เส้นทาง) สำหรับกำหนดช่วง tile ที่จะ seed"""
+    parts = [f'SELECT geog::geometry AS g FROM {table} WHERE geog IS NOT NULL' for table, _name, _extra in _POINT_LAYERS.values()]
+    parts += ['SELECT geom FROM route_geoms', 'SELECT geom FROM agent_routes']
+    union = '\n                UNION ALL '.join(parts)
+    row = conn.execute(text(f"""
+        SELECT ST_XMin(e), ST_YMin(e), ST_XMax(e), ST_YMax(e) FROM (
+            SELECT ST_Extent(g) AS e FROM (
+                {union}
+            ) pts
+        ) ext
+    """)).first()
+    if not row or row[0] is None:
+        return None
+    return tuple(float(v) for v in row)
+
+
+def seed(conn, version, max_zoom: int, layers: Iterable[str] = tuple(LAYER_SQL)) -> int:
+    """สร้าง tile ล่วงหน้าทุก layer ตั้งแต่ซูม 0 ถึง max_zoom ภายในกรอบข้อมูล คืนจำนวน tile ที่สร้าง"""
+    bounds = data_bounds(conn)
+    if bounds is None:
+        return 0
+    layers = list(layers)
+    count = 0
+    for z in range(0, max_zoom + 1):
+        for x, y in _tile_range(bounds, z):
+            for layer in layers:
+                if read_cached(version, layer, z, x, y) is None:
+                    write_cached(version, layer, z, x, y, render_tile(conn, layer, z, x, y))
+                    count += 1
+    return count
@@ -15,6 +15,8 @@ if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
 from app.config import DATABASE_URL, CSV_BASE_DIR
+from app.cache import bump_data_version
+from app.textnorm import search_text
 from app.db import get_db
 from app.models import Province
 
@@ -121,12 +123,14 @@ with engine.begin() as conn:
                 'lat': lat,
                 'lon': lon,
                 'province_id': pid,
+                'search_text': search_text(name),
             }
         payload = list(payload_map.values())
         if payload:
             conn.execute(text("""
-                INSERT INTO attractions(id,name_th,name_en,kind,lat,lon,province_id)
-                VALUES (:id,:name_th,:name_en,:kind,:lat,:lon,:province_id)
+                INSERT INTO attractions(id,name_th,name_en,kind,lat,lon,province_id,search_text)
+                VALUES (:id,:name_th,:name_en,:kind,:lat,:lon,:province_id,:search_text)
                 ON CONFLICT (id) DO NOTHING
             """), payload)
             print(f'Upserted activities for {slug}: {len(payload)}')
+    bump_data_version(conn)
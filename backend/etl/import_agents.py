@@ -17,6 +17,8 @@ if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
 from app.config import DATABASE_URL
+from app.cache import bump_data_version
+from app.stops import MemoryPoiResolver, build_stops, polyline_points
 
 engine = create_engine(DATABASE_URL)
 
@@ -69,8 +71,9 @@ def _count_days(logs: List[str]) -> int:
 
 
 def _parse_log_line(line: str):
+    """แยก [Dn HH:MM] ข้อความ -> (ts, day หรือ None ถ้าไม่มีเลขวัน, action, ชื่อ POI)"""
     ts_part = ''
-    day_num = 0
+    day_num = None
     action_text = line.strip()
     m = re.match(r"\[(.*?)\]\s*(.*)$", action_text)
     if m:
@@ -94,20 +97,49 @@ def _parse_log_line(line: str):
     # ตัดข้อความแบตเตอรี่/ตัวเลขที่ตามหลังชื่อ เช่น "พอปัน รีสอร์ท แบต 39%" หรือ "พวงเพชรโฮเทล) ("
     if poi:
         poi = re.split(r"\sแบต|\s*\(|%", poi)[0].strip()
-    return ts_part, day_num or 0, action_text, poi
+    return ts_part, day_num, action_text, poi
 
 
-def insert_logs(conn, agent_id: int, logs: List[str], batch_size: int = 1000):
-    """แตกบรรทัด log แล้วใส่ลง agent_logs เป็น batch"""
+def _day_shift(days) -> int:
+    """ตรวจฐานเลขวันของ agent: ถ้าเริ่มที่ 0 ให้เลื่อน +1 เพื่อให้ทุกตารางนับวันแรกเป็น 1"""
+    known = [d for d in days if d is not None]
+    return 1 if known and min(known) == 0 else 0
+
+
+def normalize_route_days(features: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """เลื่อนเลขวันของ segment ให้เป็นฐาน 1 (บางไฟล์ GeoJSON นับวันจาก 0)"""
+    shift = _day_shift(_to_int(ft.get('day')) for ft in features)
+    if not shift:
+        return features
+    out = []
+    for ft in features:
+        day = _to_int(ft.get('day'))
+        out.append({**ft, 'day': day + shift if day is not None else None})
+    return out
+
+
+def _to_int(val):
+    """แปลงเป็น int หากทำได้"""
+    if val is None:
+        return None
+    try:
+        return int(val)
+    except Exception:
+        return None
+
+
+def insert_logs(conn, agent_id: int, logs: List[str], batch_size: int = 1000) -> List[Dict[str, Any]]:
+    """แตกบรรทัด log แล้วใส่ลง agent_logs เป็น batch (คืนแถวที่ parse แล้วไว้ใช้ต่อ)"""
     if not logs:
-        return
+        return []
+    parsed = [_parse_log_line(line or '') for line in logs]
+    shift = _day_shift(day_num for _ts, day_num, _act, _poi in parsed)
     rows = []
-    for line in logs:
-        ts_text, day_num, action, poi_name = _parse_log_line(line or '')
+    for ts_text, day_num, action, poi_name in parsed:
         rows.append({
             'agent_id': agent_id,
             'ts_text': ts_text,
-            'day_num': day_num,
+            'day_num': day_num + shift if day_num is not None else 0,
             'action': action,
             'poi_name': poi_name,
         })
@@ -117,6 +149,7 @@ def insert_logs(conn, agent_id: int, logs: List[str], batch_size: int = 1000):
     """)
     for i in range(0, len(rows), batch_size):
         conn.execute(sql, rows[i:i+batch_size])
+    return rows
 
 
 def upsert_agent(conn, new_id: int, row: Dict[str, Any], province_id: int):
@@ -174,6 +207,57 @@ def insert_routes(conn, agent_id: int, features: List[Dict[str, Any]], batch_siz
         conn.execute(sql, payload[i:i+batch_size])
 
 
+def load_poi_resolver(conn) -> MemoryPoiResolver:
+    """โหลดชื่อ/พิกัด POI ทุกตารางครั้งเดียว (ลำดับเดียวกับการค้นตอน runtime) ไว้ resolve จุดแวะ"""
+    tables = []
+    for table, col in (('chargers', 'name'), ('attractions', 'name_th'), ('foods', 'name_th'), ('cafes', 'name_th'), ('hotels', 'name_th')):
+        tables.append(conn.execute(text(f'SELECT {col}, lat, lon FROM {table} WHERE lat IS NOT NULL AND lon IS NOT NULL ORDER BY id')).all())
+    return MemoryPoiResolver(tables)
+
+
+def insert_stops(conn, agent_id: int, log_rows: List[Dict[str, Any]], features: List[Dict[str, Any]], resolver: MemoryPoiResolver):
+    """คำนวณจุดแวะต่อวัน (และทั้งทริปเป็น day = NULL) แล้วเก็บลง agent_stops"""
+    logs = [(r.get('poi_name'), r.get('action'), None, None, r.get('day_num')) for r in log_rows]
+    geoms = [(ft.get('target'), ft['geom'], int(ft.get('day') or 0)) for ft in features if isinstance(ft.get('geom'), dict)]
+
+    def _stops_for(day_logs, day_geoms):
+        plain_geoms = [(target, geom) for target, geom, _d in day_geoms]
+        return build_stops([l[:4] for l in day_logs], plain_geoms, polyline_points(plain_geoms), resolver)
+
+    payload = []
+    scopes = [(None, logs, geoms)]
+    for day in sorted({l[4] for l in logs} | {g[2] for g in geoms}):
+        scopes.append((day, [l for l in logs if l[4] == day], [g for g in geoms if g[2] == day]))
+    for day, day_logs, day_geoms in scopes:
+        for order, st in enumerate(_stops_for(day_logs, day_geoms)):
+            payload.append({'agent_id': agent_id, 'day': day, 'stop_order': order, **st})
+    if not payload:
+        return
+    conn.execute(text("""
+        INSERT INTO agent_stops(agent_id, day, stop_order, label, lat, lon, source)
+        VALUES (:agent_id, :day, :stop_order, :label, :lat, :lon, :source)
+    """), payload)
+
+
+def rebuild_day_index(conn, pid: int):
+    """สร้าง agent_days (วัน -> ช่วง id ของ log/route) ของจังหวัดนี้ ให้ API query รายวันได้ในครั้งเดียว"""
+    base = int(pid) * 1_000_000
+    conn.execute(text("""
+        INSERT INTO agent_days(agent_id, day, log_first_id, log_last_id, log_count, route_first_id, route_last_id, route_count)
+        SELECT COALESCE(l.agent_id, r.agent_id), COALESCE(l.day, r.day),
+               l.first_id, l.last_id, COALESCE(l.n, 0),
+               r.first_id, r.last_id, COALESCE(r.n, 0)
+        FROM (
+            SELECT agent_id, day_num AS day, min(id) AS first_id, max(id) AS last_id, count(*) AS n
+            FROM agent_logs WHERE agent_id BETWEEN :lo AND :hi GROUP BY agent_id, day_num
+        ) l
+        FULL JOIN (
+            SELECT agent_id, day, min(id) AS first_id, max(id) AS last_id, count(*) AS n
+            FROM agent_routes WHERE agent_id BETWEEN :lo AND :hi AND day IS NOT NULL GROUP BY agent_id, day
+        ) r ON r.agent_id = l.agent_id AND r.day = l.day
+    """), {'lo': base, 'hi': base + 999_999})
+
+
 def load_geo_features(path: str) -> Dict[int, List[Dict[str, Any]]]:
     """โหลดไฟล์/โฟลเดอร์ GeoJSON แล้วจัดกลุ่มตาม agent_id"""
     grouped: Dict[int, List[Dict[str, Any]]] = {}
@@ -262,10 +346,12 @@ def _convert_geometry(geom: Any):
 
 
 def _delete_scope(conn, pid: int):
-    """ลบ agent_logs/agent_routes ที่เป็นของจังหวัดนี้ (id อยู่ในช่วง)"""
+    """ลบ agent_logs/agent_stops/agent_days/agent_routes ที่เป็นของจังหวัดนี้ (id อยู่ในช่วง)"""
     base = int(pid) * 1_000_000
     hi = base + 999_999
     conn.execute(text('DELETE FROM agent_logs WHERE agent_id BETWEEN :lo AND :hi'), {'lo': base, 'hi': hi})
+    conn.execute(text('DELETE FROM agent_stops WHERE agent_id BETWEEN :lo AND :hi'), {'lo': base, 'hi': hi})
+    conn.execute(text('DELETE FROM agent_days WHERE agent_id BETWEEN :lo AND :hi'), {'lo': base, 'hi': hi})
     conn.execute(text('DELETE FROM agent_routes WHERE agent_id BETWEEN :lo AND :hi'), {'lo': base, 'hi': hi})
 
 
@@ -310,6 +396,8 @@ _wait_for_db(engine)
 
 with engine.connect() as conn:
     pid_map = {slug: pid for pid, slug in conn.execute(text('SELECT id, slug_en FROM provinces'))}
+    # POI ต้องถูก import ก่อน agent (ตามลำดับใน bootstrap) เพื่อให้ resolve จุดแวะได้
+    poi_resolver = load_poi_resolver(conn)
 
 for slug, prefix in PROVINCE_PREFIX.items():
     json_path = _find_agent_json(prefix)
@@ -330,9 +418,16 @@ for slug, prefix in PROVINCE_PREFIX.items():
             original_id = int(row.get('agent_id'))
             new_id = int(pid) * 1_000_000 + original_id
             upsert_agent(conn, new_id, row, pid)
-            insert_logs(conn, new_id, row.get('log') or [])
-            insert_routes(conn, new_id, geo_features.get(original_id, []))
+            log_rows = insert_logs(conn, new_id, row.get('log') or [])
+            features = normalize_route_days(geo_features.get(original_id, []))
+            insert_routes(conn, new_id, features)
+            insert_stops(conn, new_id, log_rows, features, poi_resolver)
             count += 1
             if count % 100 == 0:
                 print(f'  …{count} agents imported', flush=True)
+        rebuild_day_index(conn, pid)
     print(f'Upserted agents for {slug} {count}', flush=True)
+
+# แจ้ง API ให้ล้าง cache หลังนำเข้าครบทุกจังหวัด
+with engine.begin() as conn:
+    bump_data_version(conn)
@@ -13,6 +13,8 @@ if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
 from app.config import CSV_BASE_DIR, DATABASE_URL
+from app.cache import bump_data_version
+from app.textnorm import search_text
 
 engine = create_engine(DATABASE_URL)
 
@@ -109,11 +111,11 @@ with engine.begin() as conn:
     for r in df.to_dict(orient='records'):
         slug = r['province_slug']
         conn.execute(text("""
-            INSERT INTO cafes(id,name_th,name_en,lat,lon,province_id,open_hours_json)
-            VALUES (:id,:name_th,:name_en,:lat,:lon,:province_id,:open_hours_json)
+            INSERT INTO cafes(id,name_th,name_en,lat,lon,province_id,open_hours_json,search_text)
+            VALUES (:id,:name_th,:name_en,:lat,:lon,:province_id,:open_hours_json,:search_text)
             ON CONFLICT (id) DO UPDATE SET name_th=EXCLUDED.name_th, name_en=EXCLUDED.name_en,
               lat=EXCLUDED.lat, lon=EXCLUDED.lon, province_id=EXCLUDED.province_id,
-              open_hours_json=EXCLUDED.open_hours_json
+              open_hours_json=EXCLUDED.open_hours_json, search_text=EXCLUDED.search_text
         """), {
             'id': r['id'],
             'name_th': r['name_th'],
@@ -122,5 +124,7 @@ with engine.begin() as conn:
             'lon': float(r['lon']),
             'province_id': pid_cache[slug],
             'open_hours_json': None,
+            'search_text': search_text(r['name_th'], r.get('name_en')),
         })
+    bump_data_version(conn)
     print('Upserted cafes:', len(df))
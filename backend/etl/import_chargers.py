@@ -13,6 +13,8 @@ if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
 from app.config import CSV_BASE_DIR, DATABASE_URL
+from app.cache import bump_data_version
+from app.textnorm import search_text
 
 engine = create_engine(DATABASE_URL)
 
@@ -118,11 +120,12 @@ with engine.begin() as conn:
             capacity = r.get('capacity')
             capacity_val = int(capacity) if isinstance(capacity, (int, float)) and capacity == capacity else None
             conn.execute(text("""
-              INSERT INTO chargers(id,name,type,kw,capacity,lat,lon,province_id,brand,address)
-              VALUES (:id,:name,:type,:kw,:capacity,:lat,:lon,:province_id,:brand,:address)
+              INSERT INTO chargers(id,name,type,kw,capacity,lat,lon,province_id,brand,address,search_text)
+              VALUES (:id,:name,:type,:kw,:capacity,:lat,:lon,:province_id,:brand,:address,:search_text)
               ON CONFLICT (id) DO UPDATE SET 
                 name=EXCLUDED.name, type=EXCLUDED.type, kw=EXCLUDED.kw, capacity=EXCLUDED.capacity,
-                lat=EXCLUDED.lat, lon=EXCLUDED.lon, province_id=EXCLUDED.province_id, brand=EXCLUDED.brand, address=EXCLUDED.address
+                lat=EXCLUDED.lat, lon=EXCLUDED.lon, province_id=EXCLUDED.province_id, brand=EXCLUDED.brand, address=EXCLUDED.address,
+                search_text=EXCLUDED.search_text
             """), {
                 'id': r['id'],
                 'name': r['name'],
@@ -134,5 +137,7 @@ with engine.begin() as conn:
                 'province_id': pid,
                 'brand': r.get('brand') or '',
                 'address': r.get('address') or '',
+                'search_text': search_text(r['name'], r.get('brand'), r.get('address')),
             })
         print('Upserted chargers for', slug, len(rows))
+    bump_data_version(conn)
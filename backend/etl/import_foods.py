@@ -14,6 +14,9 @@ if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
 from app.config import CSV_BASE_DIR, DATABASE_URL
+from app.cache import bump_data_version
+from app.textnorm import search_text
+from app.hours import multirange_literal, week_ranges
 
 engine = create_engine(DATABASE_URL)
 
@@ -124,12 +127,14 @@ with engine.begin() as conn:
 
     for r in df.to_dict(orient='records'):
         slug = r['province_slug']
+        hours = r.get('open_hours_json')
         conn.execute(text("""
-            INSERT INTO foods(id,name_th,name_en,price_range,lat,lon,province_id,open_hours_json)
-            VALUES (:id,:name_th,:name_en,:price_range,:lat,:lon,:province_id,:open_hours_json)
+            INSERT INTO foods(id,name_th,name_en,price_range,lat,lon,province_id,open_hours_json,open_text,close_text,open_minutes,search_text)
+            VALUES (:id,:name_th,:name_en,:price_range,:lat,:lon,:province_id,:open_hours_json,:open_text,:close_text,CAST(:open_minutes AS int4multirange),:search_text)
             ON CONFLICT (id) DO UPDATE SET name_th=EXCLUDED.name_th, name_en=EXCLUDED.name_en,
               price_range=EXCLUDED.price_range, lat=EXCLUDED.lat, lon=EXCLUDED.lon, province_id=EXCLUDED.province_id,
-              open_hours_json=EXCLUDED.open_hours_json
+              open_hours_json=EXCLUDED.open_hours_json, open_text=EXCLUDED.open_text, close_text=EXCLUDED.close_text,
+              open_minutes=EXCLUDED.open_minutes, search_text=EXCLUDED.search_text
         """), {
             'id': r['id'],
             'name_th': r['name_th'],
@@ -138,6 +143,12 @@ with engine.begin() as conn:
             'lat': float(r['lat']),
             'lon': float(r['lon']),
             'province_id': pid_cache[slug],
-            'open_hours_json': json.dumps(r.get('open_hours_json')) if r.get('open_hours_json') else None,
+            'open_hours_json': json.dumps(hours) if hours else None,
+            'open_text': hours['open'] if hours else None,
+            'close_text': hours['close'] if hours else None,
+            # ช่วงนาทีของสัปดาห์ที่เปิด ให้ API กรอง open_at/open_now ใน SQL ได้โดยไม่ต้อง parse ทีละแถว
+            'open_minutes': multirange_literal(week_ranges(hours['open'], hours['close'])) if hours else None,
+            'search_text': search_text(r['name_th'], r.get('name_en')),
         })
+    bump_data_version(conn)
     print('Upserted foods:', len(df))
@@ -13,6 +13,8 @@ if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
 from app.config import CSV_BASE_DIR, DATABASE_URL, PROVINCE_SEED
+from app.cache import bump_data_version
+from app.textnorm import search_text
 
 engine = create_engine(DATABASE_URL)
 
@@ -205,18 +207,19 @@ with engine.begin() as conn:
             'nearby_location': row['nearby_location'],
             'type_th': row['type_th'],
             'region_th': row['region_th'],
+            'search_text': search_text(row['name_th'], row['name_en']),
         }
         conn.execute(text("""
             INSERT INTO attractions(
                 id,name_th,name_en,kind,lat,lon,province_id,source_id,address_th,province_th,
                 district_th,subdistrict_th,address_road,postcode,tel,email,start_end,hilight,reward,
                 suitable_duration,market_limitation,market_chance,traveler_pre,website,facebook,
-                instagram,tiktok,detail_th,nearby_location,type_th,region_th
+                instagram,tiktok,detail_th,nearby_location,type_th,region_th,search_text
             ) VALUES (
                 :id,:name_th,:name_en,:kind,:lat,:lon,:province_id,:source_id,:address_th,:province_th,
                 :district_th,:subdistrict_th,:address_road,:postcode,:tel,:email,:start_end,:hilight,:reward,
                 :suitable_duration,:market_limitation,:market_chance,:traveler_pre,:website,:facebook,
-                :instagram,:tiktok,:detail_th,:nearby_location,:type_th,:region_th
+                :instagram,:tiktok,:detail_th,:nearby_location,:type_th,:region_th,:search_text
             )
             ON CONFLICT (id) DO UPDATE SET
               name_th=EXCLUDED.name_th,
@@ -248,6 +251,8 @@ with engine.begin() as conn:
               detail_th=EXCLUDED.detail_th,
               nearby_location=EXCLUDED.nearby_location,
               type_th=EXCLUDED.type_th,
-              region_th=EXCLUDED.region_th
+              region_th=EXCLUDED.region_th,
+              search_text=EXCLUDED.search_text
         """), params)
+    bump_data_version(conn)
     print('Upserted attractions:', len(rows))
@@ -1,5 +1,6 @@
 """นำเข้ารายชื่อจังหวัดจากค่าคงที่ใน config ลงฐานข้อมูล"""
 from app.config import PROVINCE_SEED, DATABASE_URL
+from app.cache import bump_data_version
 from sqlalchemy import create_engine, text
 
 engine = create_engine(DATABASE_URL)
@@ -12,4 +13,5 @@ with engine.begin() as conn:
             VALUES (:slug, :name)
             ON CONFLICT (slug_en) DO UPDATE SET name_th = EXCLUDED.name_th
         """), { 'slug': slug, 'name': name })
+    bump_data_version(conn)
 print('Provinces upserted:', len(PROVINCE_SEED))
@@ -0,0 +1,23 @@
+"""
+รัน API หลาย worker ด้วย gunicorn + UvicornWorker โดยโหลดแอปและข้อมูลอ่านอย่างเดียวครั้งเดียวในโปรเซสแม่
+(preload_app + gc.freeze) worker แชร์หน่วยความจำชุดนั้นแบบ copy-on-write แทนที่จะถือคนละชุด
+
+    gunicorn -c gunicorn.conf.py app.main:app
+"""
+import os
+
+from app import preload
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+workers = int(os.getenv('WEB_CONCURRENCY', '2'))
+worker_class = 'uvicorn.workers.UvicornWorker'
+preload_app = True
+
+
+def when_ready(server):
+    # แอปถูก import แล้ว (preload_app) และยังไม่ fork worker
+    preload.freeze_for_fork()
+
+
+def post_fork(server, worker):
+    preload.after_fork([s.fileno() for s in worker.sockets])
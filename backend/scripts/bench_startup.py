@@ -0,0 +1,225 @@
+"""
+วัดต้นทุนตอนเริ่ม API: เวลา import แยกรายโมดูล (แบบ python -X importtime), เวลาจนถึง /api/health ตอบได้ครั้งแรก
+และ RSS หลัง warmup แล้วบันทึกผลเป็น JSON ไว้เทียบระหว่าง release
+
+    python scripts/bench_startup.py                      # รันครบทุกขั้น เขียน logs/bench_startup.json
+    python scripts/bench_startup.py --runs 5 --output /tmp/startup.json
+    python scripts/bench_startup.py --profile-startup    # เพิ่ม cProfile ของการ import + request แรก (ฟังก์ชันที่กินเวลาสุด)
+"""
+import argparse
+import json
+import os
+import platform
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Ensure project root (backend/) is on sys.path when running as a script
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+DEFAULT_OUTPUT = ROOT_DIR / 'logs' / 'bench_startup.json'
+# endpoint ที่ยิงหลัง health เพื่อให้ cache/lazy data ถูกโหลดก่อนวัด RSS
+WARMUP_PATHS = ['/api/provinces', '/api/attractions?limit=50', '/api/chargers?limit=50', '/api/food?limit=50']
+
+
+def _env() -> Dict[str, str]:
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [str(ROOT_DIR), env.get('PYTHONPATH')]))
+    return env
+
+
+def import_times(module: str) -> Dict[str, object]:
+    """import module ในโปรเซสใหม่ด้วย -X importtime แล้วคืนเวลารวมและรายโมดูล (ไมโครวินาที)"""
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=ROOT_DIR, env=_env(), capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f'import {module} failed:\n{proc.stderr[-2000:]}')
+    modules: List[Dict[str, object]] = []
+    for line in proc.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len('import time:'):].split('|', 2)
+            modules.append({'module': name.strip(), 'self_us': int(self_us), 'cumulative_us': int(cumulative_us)})
+        except ValueError:
+            continue
+    total = next((m['cumulative_us'] for m in reversed(modules) if m['module'] == module), None)
+    return {'module': module, 'total_us': total, 'modules': modules}
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def _rss_kb(pid: int) -> Optional[int]:
+    """RSS ของโปรเซสจาก /proc (Linux) None ถ้าอ่านไม่ได้"""
+    try:
+        with open(f'/proc/{pid}/status') as fh:
+            for line in fh:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1])
+    except OSError:
+        return None
+    return None
+
+
+def _get(url: str, timeout: float = 2.0) -> int:
+    with urllib.request.urlopen(url, timeout=timeout) as resp:
+        resp.read()
+        return resp.status
+
+
+def serve_once(timeout: float, warmup: int) -> Dict[str, object]:
+    """เปิด uvicorn หนึ่งโปรเซส วัดเวลาถึง /api/health ครั้งแรก แล้ว warmup และอ่าน RSS"""
+    port = _free_port()
+    base = f'http://127.0.0.1:{port}'
+    started = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, '-m', 'uvicorn', 'app.main:app', '--host', '127.0.0.1', '--port', str(port), '--log-level', 'warning'],
+        cwd=ROOT_DIR, env=_env(), stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+    )
+    try:
+        ready = None
+        while time.perf_counter() - started < timeout:
+            if proc.poll() is not None:
+                raise RuntimeError('uvicorn exited early:\n' + proc.stderr.read().decode(errors='replace')[-2000:])
+            try:
+                if _get(base + '/api/health', timeout=0.5) == 200:
+                    ready = time.perf_counter() - started
+                    break
+            except (urllib.error.URLError, ConnectionError, socket.timeout):
+                time.sleep(0.02)
+        if ready is None:
+            raise RuntimeError(f'/api/health not ready after {timeout}s')
+        rss_ready = _rss_kb(proc.pid)
+        warm_started = time.perf_counter()
+        for _ in range(warmup):
+            for path in WARMUP_PATHS:
+                try:
+                    _get(base + path, timeout=30)
+                except urllib.error.URLError:
+                    pass
+        return {
+            'health_ready_s': round(ready, 4),
+            'warmup_s': round(time.perf_counter() - warm_started, 4),
+            'rss_ready_kb': rss_ready,
+            'rss_warm_kb': _rss_kb(proc.pid),
+        }
+    finally:
+        proc.terminate()
+        try:
+            proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+
+def profile_startup(top: int) -> List[Dict[str, object]]:
+    """cProfile ของ import app.main + request /api/health แรก (ในโปรเซสใหม่) คืนฟังก์ชันที่ cumulative สูงสุด"""
+    code = f"""
+import cProfile, json, pstats, sys
+prof = cProfile.Profile()
+prof.enable()
+import app.main
+from fastapi.testclient import TestClient
+TestClient(app.main.app).get('/api/health')
+prof.disable()
+stats = pstats.Stats(prof)
+rows = []
+for (filename, line, func), (cc, nc, tt, ct, _callers) in stats.stats.items():
+    rows.append({{'function': f'{{filename}}:{{line}}({{func}})', 'calls': nc, 'tottime_s': round(tt, 6), 'cumtime_s': round(ct, 6)}})
+rows.sort(key=lambda r: r['cumtime_s'], reverse=True)
+json.dump(rows[:{int(top)}], sys.stdout)
+"""
+    proc = subprocess.run([sys.executable, '-c', code], cwd=ROOT_DIR, env=_env(), capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError('profile failed:\n' + proc.stderr[-2000:])
+    return json.loads(proc.stdout)
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=ROOT_DIR, capture_output=True, text=True, timeout=10)
+        return out.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def _summary(values: List[float]) -> Dict[str, float]:
+    return {'min': min(values), 'median': statistics.median(values), 'max': max(values)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--output', default=str(DEFAULT_OUTPUT), help='ไฟล์ JSON ผลลัพธ์')
+    parser.add_argument('--runs', type=int, default=3, help='จำนวนรอบ (รายงาน min/median/max)')
+    parser.add_argument('--module', action='append', help='โมดูลที่จะวัดเวลา import (ค่าเริ่มต้น app.main)')
+    parser.add_argument('--warmup', type=int, default=3, help='จำนวนรอบยิง endpoint หลัง health ก่อนวัด RSS')
+    parser.add_argument('--timeout', type=float, default=60.0, help='รอ /api/health ได้นานสุด (วินาที)')
+    parser.add_argument('--top', type=int, default=15, help='จำนวนโมดูล/ฟังก์ชันที่ช้าสุดที่จะแสดง')
+    parser.add_argument('--profile-startup', action='store_true', help='เพิ่ม cProfile ของการ import และ request แรก')
+    args = parser.parse_args()
+    runs = max(1, args.runs)
+
+    result: Dict[str, object] = {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'git_commit': _git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'database_url_set': bool(os.getenv('DATABASE_URL')),
+        'runs': runs,
+        'imports': {},
+    }
+
+    for module in args.module or ['app.main']:
+        samples = [import_times(module) for _ in range(runs)]
+        # รายโมดูลใช้รอบที่เป็น median ของเวลารวม ตัวเลขรวมรายงานทุกรอบ
+        samples.sort(key=lambda s: s['total_us'] or 0)
+        median = samples[len(samples) // 2]
+        slowest = sorted(median['modules'], key=lambda m: m['self_us'], reverse=True)[:args.top]
+        result['imports'][module] = {
+            'total_us': _summary([s['total_us'] or 0 for s in samples]),
+            'module_count': len(median['modules']),
+            'slowest_self': slowest,
+            'modules': median['modules'],
+        }
+
+    serves = [serve_once(args.timeout, args.warmup) for _ in range(runs)]
+    result['serve'] = {
+        key: _summary([s[key] for s in serves if s[key] is not None]) if any(s[key] is not None for s in serves) else None
+        for key in ('health_ready_s', 'warmup_s', 'rss_ready_kb', 'rss_warm_kb')
+    }
+    result['serve']['samples'] = serves
+
+    if args.profile_startup:
+        result['profile'] = profile_startup(args.top * 2)
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, ensure_ascii=False, indent=2), encoding='utf-8')
+
+    for module, info in result['imports'].items():
+        print(f"import {module}: median {info['total_us']['median'] / 1000:.1f} ms ({info['module_count']} modules)")
+        for m in info['slowest_self'][:5]:
+            print(f"  {m['self_us'] / 1000:8.1f} ms  {m['module']}")
+    serve = result['serve']
+    print(f"first /api/health: median {serve['health_ready_s']['median']:.3f} s")
+    if serve['rss_warm_kb']:
+        print(f"RSS after warmup: median {serve['rss_warm_kb']['median'] / 1024:.1f} MiB")
+    print('wrote', output)
+
+
+if __name__ == '__main__':
+    main()
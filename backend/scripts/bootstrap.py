@@ -55,6 +55,9 @@ def main():
     if run_etl:
         for script in ETL_SCRIPTS:
             run_step(script.stem, script)
+        # สร้าง vector tile ซูมต่ำไว้ก่อน (option เพราะใช้เวลาตามปริมาณข้อมูล)
+        if env_flag('SEED_TILES', default=False):
+            run_step('seed_tiles', ROOT / 'scripts' / 'seed_tiles.py')
     else:
         print("[bootstrap] Skipping ETL imports (RUN_BOOTSTRAP_ETL disabled)")
 
@@ -0,0 +1,30 @@
+"""สคริปต์สร้าง vector tile ซูมต่ำล่วงหน้าหลัง ETL (และลบ cache ของ data version เก่า)"""
+import sys
+from pathlib import Path
+
+# Ensure project root (backend/) is on sys.path when running as a script
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from sqlalchemy import create_engine, text
+
+from app import tiles
+from app.config import DATABASE_URL, TILE_SEED_MAX_ZOOM
+
+
+def main():
+    max_zoom = int(sys.argv[1]) if len(sys.argv) > 1 else TILE_SEED_MAX_ZOOM
+    engine = create_engine(DATABASE_URL)
+    with engine.connect() as conn:
+        version = conn.execute(text('SELECT version FROM data_version WHERE id = 1')).scalar()
+        if version is None:
+            print('No data version yet (run ETL first); tiles are not cached without one')
+            return
+        tiles.prune(version)
+        count = tiles.seed(conn, version, max_zoom)
+    print(f'Seeded {count} tiles (data version {version}, zoom 0-{max_zoom}) into {tiles.TILE_CACHE_DIR}')
+
+
+if __name__ == '__main__':
+    main()
@@ -135,6 +135,35 @@ CREATE TABLE IF NOT EXISTS agent_routes (
 CREATE INDEX IF NOT EXISTS agent_routes_agent_idx ON agent_routes(agent_id, day);
 CREATE INDEX IF NOT EXISTS agent_routes_geom_idx ON agent_routes USING GIST (geom);
 
+-- จุดแวะที่ import_agents.py คำนวณไว้ล่วงหน้า (day = NULL คือทั้งทริป, source = poi/route/log/start)
+CREATE TABLE IF NOT EXISTS agent_stops (
+  id BIGSERIAL PRIMARY KEY,
+  agent_id INT REFERENCES agents(id) ON DELETE CASCADE,
+  day INT,
+  stop_order INT NOT NULL,
+  label TEXT,
+  lat DOUBLE PRECISION NOT NULL,
+  lon DOUBLE PRECISION NOT NULL,
+  source TEXT
+);
+
+CREATE INDEX IF NOT EXISTS agent_stops_agent_day_idx ON agent_stops(agent_id, day, stop_order);
+
+-- ดัชนีรายวันของ agent: import_agents.py นับวันให้เป็นฐาน 1 แล้วเก็บช่วง id ของ log/route ต่อวัน
+CREATE TABLE IF NOT EXISTS agent_days (
+  agent_id INT REFERENCES agents(id) ON DELETE CASCADE,
+  day INT NOT NULL,
+  log_first_id BIGINT,
+  log_last_id BIGINT,
+  log_count INT NOT NULL DEFAULT 0,
+  route_first_id BIGINT,
+  route_last_id BIGINT,
+  route_count INT NOT NULL DEFAULT 0,
+  PRIMARY KEY (agent_id, day)
+);
+
+CREATE INDEX IF NOT EXISTS agent_logs_agent_day_idx ON agent_logs(agent_id, day_num, id);
+
 -- Routes aggregated from JSON/GeoJSON
 CREATE TABLE IF NOT EXISTS route_segments (
   id BIGSERIAL PRIMARY KEY,
@@ -167,3 +196,69 @@ CREATE INDEX IF NOT EXISTS route_geoms_from_to_idx
   ON route_geoms (province, lower(from_name), lower(to_name));
 CREATE INDEX IF NOT EXISTS route_geoms_geom_idx
   ON route_geoms USING GIST (geom);
+
+-- เลข version ของข้อมูล: สคริปต์ ETL จะเพิ่มค่าเมื่อนำเข้าเสร็จ ให้ API ล้าง cache
+CREATE TABLE IF NOT EXISTS data_version (
+  id INT PRIMARY KEY CHECK (id = 1),
+  version BIGINT NOT NULL DEFAULT 1,
+  updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+INSERT INTO data_version(id, version) VALUES (1, 1) ON CONFLICT (id) DO NOTHING;
+
+-- พิกัดแบบ geography ของ POI: generated column ที่ Postgres เติมเองทุกครั้งที่ ETL insert/upsert lat/lon
+-- ใช้กับ KNN (<->) ของ /api/nearby และตัวกรอง bbox/near ของ list endpoint
+ALTER TABLE attractions ADD COLUMN IF NOT EXISTS geog geography(Point, 4326)
+  GENERATED ALWAYS AS (CASE WHEN lat IS NOT NULL AND lon IS NOT NULL THEN geography(ST_SetSRID(ST_MakePoint(lon, lat), 4326)) END) STORED;
+ALTER TABLE foods ADD COLUMN IF NOT EXISTS geog geography(Point, 4326)
+  GENERATED ALWAYS AS (CASE WHEN lat IS NOT NULL AND lon IS NOT NULL THEN geography(ST_SetSRID(ST_MakePoint(lon, lat), 4326)) END) STORED;
+ALTER TABLE cafes ADD COLUMN IF NOT EXISTS geog geography(Point, 4326)
+  GENERATED ALWAYS AS (CASE WHEN lat IS NOT NULL AND lon IS NOT NULL THEN geography(ST_SetSRID(ST_MakePoint(lon, lat), 4326)) END) STORED;
+ALTER TABLE hotels ADD COLUMN IF NOT EXISTS geog geography(Point, 4326)
+  GENERATED ALWAYS AS (CASE WHEN lat IS NOT NULL AND lon IS NOT NULL THEN geography(ST_SetSRID(ST_MakePoint(lon, lat), 4326)) END) STORED;
+ALTER TABLE chargers ADD COLUMN IF NOT EXISTS geog geography(Point, 4326)
+  GENERATED ALWAYS AS (CASE WHEN lat IS NOT NULL AND lon IS NOT NULL THEN geography(ST_SetSRID(ST_MakePoint(lon, lat), 4326)) END) STORED;
+CREATE INDEX IF NOT EXISTS attractions_geog_gist ON attractions USING GIST (geog);
+CREATE INDEX IF NOT EXISTS foods_geog_gist ON foods USING GIST (geog);
+CREATE INDEX IF NOT EXISTS cafes_geog_gist ON cafes USING GIST (geog);
+CREATE INDEX IF NOT EXISTS hotels_geog_gist ON hotels USING GIST (geog);
+CREATE INDEX IF NOT EXISTS chargers_geog_gist ON chargers USING GIST (geog);
+
+-- ค้นหาชื่อแบบ search-as-you-type: search_text = ชื่อไทย|อังกฤษ ที่ normalize แล้ว (app/textnorm.py) เขียนโดย ETL
+-- ค่าเริ่มต้นของแถวเดิมคำนวณแบบประมาณใน SQL (lower + ตัดช่องว่าง/zero-width) จนกว่า ETL จะรันรอบใหม่
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+ALTER TABLE attractions ADD COLUMN IF NOT EXISTS search_text TEXT;
+ALTER TABLE foods ADD COLUMN IF NOT EXISTS search_text TEXT;
+ALTER TABLE cafes ADD COLUMN IF NOT EXISTS search_text TEXT;
+ALTER TABLE hotels ADD COLUMN IF NOT EXISTS search_text TEXT;
+ALTER TABLE chargers ADD COLUMN IF NOT EXISTS search_text TEXT;
+UPDATE attractions SET search_text = lower(regexp_replace(concat_ws('|', name_th, name_en), '[[:space:]\u200b\u200c\u200d\u2060\ufeff]', '', 'g')) WHERE search_text IS NULL;
+UPDATE foods SET search_text = lower(regexp_replace(concat_ws('|', name_th, name_en), '[[:space:]\u200b\u200c\u200d\u2060\ufeff]', '', 'g')) WHERE search_text IS NULL;
+UPDATE cafes SET search_text = lower(regexp_replace(concat_ws('|', name_th, name_en), '[[:space:]\u200b\u200c\u200d\u2060\ufeff]', '', 'g')) WHERE search_text IS NULL;
+UPDATE hotels SET search_text = lower(regexp_replace(concat_ws('|', name_th, name_en), '[[:space:]\u200b\u200c\u200d\u2060\ufeff]', '', 'g')) WHERE search_text IS NULL;
+UPDATE chargers SET search_text = lower(regexp_replace(concat_ws('|', name, brand, address), '[[:space:]\u200b\u200c\u200d\u2060\ufeff]', '', 'g')) WHERE search_text IS NULL;
+CREATE INDEX IF NOT EXISTS attractions_search_trgm ON attractions USING GIN (search_text gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS foods_search_trgm ON foods USING GIN (search_text gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS cafes_search_trgm ON cafes USING GIN (search_text gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS hotels_search_trgm ON hotels USING GIN (search_text gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS chargers_search_trgm ON chargers USING GIN (search_text gin_trgm_ops);
+
+-- keyset pagination ของ list endpoint (app/paging.py): เรียง (ชื่อ, id) ภายในจังหวัด และทั้งประเทศเมื่อไม่กรองจังหวัด
+-- ชื่อใช้ text_key = nullif(ชื่อ, '') COLLATE "C" (ชื่อว่างไปท้าย) และ id COLLATE "C" ให้ลำดับตรงกับ fallback demo ใน Python
+CREATE INDEX IF NOT EXISTS attractions_province_name_idx ON attractions(province_id, (nullif(name_th, '')) COLLATE "C", id COLLATE "C");
+CREATE INDEX IF NOT EXISTS foods_province_name_idx ON foods(province_id, (nullif(name_th, '')) COLLATE "C", id COLLATE "C");
+CREATE INDEX IF NOT EXISTS cafes_province_name_idx ON cafes(province_id, (nullif(name_th, '')) COLLATE "C", id COLLATE "C");
+CREATE INDEX IF NOT EXISTS hotels_province_name_idx ON hotels(province_id, (nullif(name_th, '')) COLLATE "C", id COLLATE "C");
+CREATE INDEX IF NOT EXISTS chargers_province_name_idx ON chargers(province_id, (nullif(name, '')) COLLATE "C", id COLLATE "C");
+CREATE INDEX IF NOT EXISTS attractions_name_idx ON attractions((nullif(name_th, '')) COLLATE "C", id COLLATE "C");
+CREATE INDEX IF NOT EXISTS foods_name_idx ON foods((nullif(name_th, '')) COLLATE "C", id COLLATE "C");
+CREATE INDEX IF NOT EXISTS cafes_name_idx ON cafes((nullif(name_th, '')) COLLATE "C", id COLLATE "C");
+CREATE INDEX IF NOT EXISTS hotels_name_idx ON hotels((nullif(name_th, '')) COLLATE "C", id COLLATE "C");
+CREATE INDEX IF NOT EXISTS chargers_name_idx ON chargers((nullif(name, '')) COLLATE "C", id COLLATE "C");
+
+-- เวลาเปิดปิดที่ ETL normalize แล้ว (app/hours.py): ข้อความ open/close และช่วงนาทีของสัปดาห์ (จันทร์ 00:00 = 0, เวลาไทย)
+-- กรอง open_at/open_now ด้วย open_minutes @> นาที (GiST); แถวเดิมได้ open_minutes เมื่อ ETL รันรอบถัดไป
+ALTER TABLE foods ADD COLUMN IF NOT EXISTS open_text TEXT;
+ALTER TABLE foods ADD COLUMN IF NOT EXISTS close_text TEXT;
+ALTER TABLE foods ADD COLUMN IF NOT EXISTS open_minutes int4multirange;
+UPDATE foods SET open_text = open_hours_json->>'open', close_text = open_hours_json->>'close' WHERE open_text IS NULL AND open_hours_json IS NOT NULL;
+CREATE INDEX IF NOT EXISTS foods_open_minutes_gist ON foods USING GIST (open_minutes);